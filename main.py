@@ -15,6 +15,7 @@ Edit config/base.yaml execution section to control:
   - Output directory
   - Export formats
   - (For single_scenario/annual_simulation) Specific shuttle/pump combination
+  - Profiling (execution.profile): per-case profiles in <output>/profiles/
 
 For single_scenario mode:
   - single_scenario_shuttle_cbm: Shuttle size in m3
@@ -44,6 +45,7 @@ from src import (
     run_yearly_simulation,
     run_single_case,
 )
+from src.profiling import profile_stage
 
 
 def main():
@@ -72,7 +74,8 @@ def main():
             # Single case mode - run ONE case specified in 'single_case'
             print(f"Running single case: {single_case}")
             config = load_config(single_case)
-            run_single_case(config, output_path)
+            with profile_stage(f"single_{single_case}", config, output_path):
+                run_single_case(config, output_path)
 
         elif run_mode == "all":
             # All cases mode - run ALL available cases automatically
@@ -80,7 +83,8 @@ def main():
             print(f"Running all {len(available_cases)} cases...")
             for case in available_cases:
                 config = load_config(case)
-                run_single_case(config, output_path)
+                with profile_stage(f"all_{case}", config, output_path):
+                    run_single_case(config, output_path)
 
         elif run_mode == "multiple":
             # Multiple specific cases - run cases listed in 'multi_cases'
@@ -89,7 +93,8 @@ def main():
             for case in multi_cases:
                 try:
                     config = load_config(case)
-                    run_single_case(config, output_path)
+                    with profile_stage(f"multiple_{case}", config, output_path):
+                        run_single_case(config, output_path)
                 except Exception as e:
                     print(f"Failed to run case {case}: {e}", file=sys.stderr)
 
@@ -111,7 +116,8 @@ def main():
 
             try:
                 config = load_config(single_case)
-                run_single_scenario(config, shuttle_size, pump_size, output_path)
+                with profile_stage(f"single_scenario_{single_case}", config, output_path):
+                    run_single_scenario(config, shuttle_size, pump_size, output_path)
             except Exception as e:
                 print(f"Failed to run single scenario: {e}", file=sys.stderr)
                 import traceback
@@ -139,7 +145,8 @@ def main():
 
             try:
                 config = load_config(single_case)
-                run_annual_simulation(config, shuttle_size, pump_size, simulation_year, output_path)
+                with profile_stage(f"annual_simulation_{single_case}", config, output_path):
+                    run_annual_simulation(config, shuttle_size, pump_size, simulation_year, output_path)
             except Exception as e:
                 print(f"Failed to run annual simulation: {e}", file=sys.stderr)
                 import traceback
@@ -163,7 +170,8 @@ def main():
 
             try:
                 config = load_config(single_case)
-                run_yearly_simulation(config, shuttle_size, pump_size, output_path)
+                with profile_stage(f"yearly_simulation_{single_case}", config, output_path):
+                    run_yearly_simulation(config, shuttle_size, pump_size, output_path)
             except Exception as e:
                 print(f"Failed to run yearly simulation: {e}", file=sys.stderr)
                 import traceback
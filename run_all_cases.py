@@ -7,6 +7,7 @@ Configuration is read from config/base.yaml execution settings:
   - multi_cases: list of cases (for "multiple" mode)
   - num_jobs: number of parallel workers
   - output_directory: output location
+  - profile: per-case cProfile/sampling output in <output>/profiles/
 
 Usage:
     python run_all_cases.py
@@ -23,6 +24,7 @@ import pandas as pd
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src import load_config, list_available_cases, BunkeringOptimizer
+from src.profiling import profile_stage
 
 
 def run_single_case(case_name: str, config: dict, output_dir: str) -> dict:
@@ -39,8 +41,10 @@ def run_single_case(case_name: str, config: dict, output_dir: str) -> dict:
     """
     try:
         print(f"[{case_name}] Starting optimization...")
-        optimizer = BunkeringOptimizer(config)
-        scenario_df, yearly_df = optimizer.solve()
+        # Profiled in the process that runs the case (worker or main)
+        with profile_stage(f"run_all_cases_{case_name}", config, output_dir):
+            optimizer = BunkeringOptimizer(config)
+            scenario_df, yearly_df = optimizer.solve()
 
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -12,6 +12,12 @@ Usage:
     python scripts/generate_paper_figures.py
     python scripts/generate_paper_figures.py --output results/paper_figures
     python scripts/generate_paper_figures.py --figures D1 D2 S1  # specific figures only
+    python scripts/generate_paper_figures.py --jobs 4            # render in 4 processes
+    python scripts/generate_paper_figures.py --force             # redraw even if up to date
+
+Only figures whose input data, drawing code or style settings changed
+since the last run are re-rendered (see figure_manifest.json in the
+output directory).
 """
 
 import sys
@@ -21,7 +27,8 @@ import argparse
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.paper_figures import PaperFigureGenerator
+from src.paper_figures import PaperFigureGenerator, FIGURE_METHODS
+from src.profiling import run_profiled
 
 
 def main():
@@ -43,6 +50,16 @@ def main():
         nargs="+",
         help="Specific figures to generate (e.g., D1 D2 S1). If not specified, all figures are generated."
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render all selected figures, even if their inputs are unchanged"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int, default=1,
+        help="Worker processes for parallel rendering (default: 1)"
+    )
 
     args = parser.parse_args()
 
@@ -64,67 +81,21 @@ def main():
         # Generate specific figures
         print(f"\nGenerating specific figures: {args.figures}")
 
-        figure_map = {
-            # Deterministic figures (D1-D12)
-            'D1': generator.fig_d1_npc_vs_shuttle,
-            'D2': generator.fig_d2_yearly_cost_evolution,
-            'D3': generator.fig_d3_yearly_fleet_demand,
-            'D4': generator.fig_d4_yearly_cycles,
-            'D5': generator.fig_d5_yearly_utilization,
-            'D6': generator.fig_d6_cost_breakdown,
-            'D7': generator.fig_d7_cycle_time,
-            'D8': generator.fig_d8_fleet_evolution,
-            'D9': generator.fig_d9_lco_comparison,
-            # D10 removed in v5 (redundant with D1)
-            'D11': generator.fig_d11_top_configurations,
-            'D12': generator.fig_d12_npc_heatmap,
-            # V5 combined figures
-            'V5_COST': generator.fig_v5_cost_lcoa,
-            'V5_FLEET': generator.fig_v5_fleet_demand,
-            # Stochastic figures (S1-S7)
-            'S1': generator.fig_s1_npc_boxplot,
-            'S2': generator.fig_s2_vss_evpi,
-            'S3': generator.fig_s3_mc_distribution,
-            'S4': generator.fig_s4_vessel_distribution,
-            'S5': generator.fig_s5_tornado,
-            'S6': generator.fig_s6_twoway_sensitivity,
-            'S7': generator.fig_s7_pump_sensitivity,
-            # New deterministic sensitivity figures (Fig7-Fig10, FigS4-S5)
-            'FIG7': generator.fig_7_tornado_deterministic,
-            'FIG8': generator.fig_8_fuel_price_sensitivity,
-            'FIG9': generator.fig_9_breakeven_distance,
-            'FIG10': generator.fig_10_demand_scenarios,
-            'FIGS4': generator.fig_s4_twoway_deterministic,
-            'FIGS5': generator.fig_s5_bunker_volume_sensitivity,
-            # Discount rate sensitivity figures (Fig11 only; Fig12 removed in v5)
-            'FIG11': generator.fig_11_discount_rate_sensitivity,
-            # FIG12 removed in v5 (3 identical overlapping lines)
-            # Yang & Lam DES comparison figures (Fig13-Fig14)
-            'FIG13': generator.fig_13_yang_lam_service_time,
-            'FIG14': generator.fig_14_yang_lam_sensitivity,
-            # Combined figures (C1-C4)
-            'C1': generator.fig_c1_det_vs_stoch,
-            'C2': generator.fig_c2_breakeven_distance,
-            'C3': generator.fig_c3_breakeven_demand,
-            'C4': generator.fig_c4_summary_dashboard,
-        }
-
+        fig_ids = []
         for fig_id in args.figures:
             fig_id_upper = fig_id.upper()
-            if fig_id_upper in figure_map:
-                try:
-                    figure_map[fig_id_upper](output_path)
-                except Exception as e:
-                    print(f"  [ERROR] {fig_id_upper}: {e}")
+            if fig_id_upper in FIGURE_METHODS:
+                fig_ids.append(fig_id_upper)
             else:
                 print(f"  [WARN] Unknown figure ID: {fig_id}")
-                print(f"         Available: {list(figure_map.keys())}")
+                print(f"         Available: {list(FIGURE_METHODS.keys())}")
+        generator.generate_figures(fig_ids, args.output, jobs=args.jobs, incremental=not args.force)
     else:
         # Generate all figures
-        generator.generate_all(args.output)
+        generator.generate_all(args.output, jobs=args.jobs, incremental=not args.force)
 
     print("\n[OK] Done!")
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, "generate_paper_figures")
@@ -12,7 +12,8 @@ New structure (results/preserved/):
   sensitivity/      - per-analysis subfolder (tornado/, fuel_price/, etc.)
   yang_lam/         - Yang & Lam comparison data + FIG13-14
   cross_cutting/    - figures spanning multiple analyses
-  _manifest.csv     - figure-to-data mapping
+  _manifest.csv     - figure-to-data mapping (from the figure manifest
+                      when available: exact input files and hashes)
 
 Also maintains:
   results/paper1_deterministic/  - legacy paper1 layout
@@ -29,6 +30,7 @@ Usage:
 
 import argparse
 import csv
+import json
 import shutil
 import sys
 from pathlib import Path
@@ -56,6 +58,9 @@ STOCH_DIRS = {
 }
 YANG_LAM_DIR = RESULTS_DIR / "yang_lam_des_comparison" / "data"
 
+# Written by generate_paper_figures.py: per-figure input and output hashes
+FIGURE_MANIFEST = FIGS_DIR / "figure_manifest.json"
+
 
 # Manifest entries: (figure_id, figure_pattern, data_source, analysis_type, description)
 MANIFEST_ENTRIES = [
@@ -206,34 +211,63 @@ def preserve_new_structure(figures_only=False):
     print("[OK] New structure preserved")
 
 
+def load_figure_manifest():
+    """Figure manifest written by the figure generator, or None."""
+    if not FIGURE_MANIFEST.exists():
+        return None
+    with open(FIGURE_MANIFEST, 'r', encoding='utf-8') as f:
+        return json.load(f).get('figures', {})
+
+
 def generate_manifest():
     """Generate _manifest.csv mapping figures to data sources."""
     manifest_path = PRESERVED_DIR / "_manifest.csv"
     rows = []
-
-    for fig_id, fig_pattern, data_source, analysis_type, description in MANIFEST_ENTRIES:
-        # Find actual figure files
-        fig_files = list(FIGS_DIR.glob(fig_pattern)) if FIGS_DIR.exists() else []
-        if fig_files:
-            for f in fig_files:
+    fieldnames = ['figure_id', 'figure_file', 'data_source', 'analysis_type', 'description']
+
+    figures = load_figure_manifest()
+    if figures is not None:
+        # Exact files each figure was rendered from, with content hashes
+        fieldnames += ['input_sha256', 'figure_sha256']
+        entries = {entry[0]: entry for entry in MANIFEST_ENTRIES}
+        for fig_id, record in sorted(figures.items()):
+            _, _, _, analysis_type, description = entries.get(fig_id, (fig_id, "", "", "", ""))
+            inputs = record.get('inputs', {})
+            for figure_file, figure_hash in sorted(record.get('outputs', {}).items()):
+                rows.append({
+                    'figure_id': fig_id,
+                    'figure_file': figure_file,
+                    'data_source': ';'.join(sorted(inputs)) or '(built-in data)',
+                    'analysis_type': analysis_type,
+                    'description': description,
+                    'input_sha256': ';'.join(inputs[name] for name in sorted(inputs)),
+                    'figure_sha256': figure_hash,
+                })
+        shutil.copy2(FIGURE_MANIFEST, PRESERVED_DIR / FIGURE_MANIFEST.name)
+    else:
+        for fig_id, fig_pattern, data_source, analysis_type, description in MANIFEST_ENTRIES:
+            # Find actual figure files
+            fig_files = list(FIGS_DIR.glob(fig_pattern)) if FIGS_DIR.exists() else []
+            if fig_files:
+                for f in fig_files:
+                    rows.append({
+                        'figure_id': fig_id,
+                        'figure_file': f.name,
+                        'data_source': data_source,
+                        'analysis_type': analysis_type,
+                        'description': description,
+                    })
+            else:
                 rows.append({
                     'figure_id': fig_id,
-                    'figure_file': f.name,
+                    'figure_file': '(not generated)',
                     'data_source': data_source,
                     'analysis_type': analysis_type,
                     'description': description,
                 })
-        else:
-            rows.append({
-                'figure_id': fig_id,
-                'figure_file': '(not generated)',
-                'data_source': data_source,
-                'analysis_type': analysis_type,
-                'description': description,
-            })
 
     with open(manifest_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['figure_id', 'figure_file', 'data_source', 'analysis_type', 'description'])
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(rows)
 
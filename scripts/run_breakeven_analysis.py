@@ -18,9 +18,19 @@ Outputs:
   results/sensitivity/breakeven_distance_yeosu.csv
   results/sensitivity/breakeven_distance_combined.csv
 
+The n_points scan gives the NPC curves for Fig9; crossovers are then
+refined with a root finder to --tolerance.
+
+The optimal-vs-optimal comparison uses the fixed OPTIMAL_SHUTTLES sizes;
+with --reoptimize each case is re-optimized over its full shuttle/pump
+grid at every distance and the optimal sizes are added to the CSVs.
+
 Usage:
     python scripts/run_breakeven_analysis.py
     python scripts/run_breakeven_analysis.py --n-points 30
+    python scripts/run_breakeven_analysis.py --method illinois --tolerance 0.01
+    python scripts/run_breakeven_analysis.py --reoptimize
+    python scripts/run_breakeven_analysis.py --service http://127.0.0.1:8765
 """
 
 import sys
@@ -33,6 +43,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config_loader import load_config
 from src.breakeven_analyzer import BreakevenAnalyzer
+from src.profiling import run_profiled
 
 # Optimal shuttle sizes per case (from deterministic results)
 OPTIMAL_SHUTTLES = {
@@ -44,6 +55,63 @@ OPTIMAL_SHUTTLES = {
 PUMP_SIZE = 500
 
 
+def find_breakeven(case2_id, args, verbose=True, client=None, shuttle_size=None,
+                   case1_shuttle_size=None, reoptimize=False):
+    """
+    Break-even distance of Case 1 vs case2_id, locally or through the optimization service.
+
+    Both cases use shuttle_size, unless case1_shuttle_size is given (then
+    shuttle_size is Case 2's); reoptimize searches each case's full grid.
+
+    Returns:
+        Tuple of (result DataFrame, break-even distance or None)
+    """
+    distance_range = (args.min_distance, args.max_distance)
+    options = {"n_points": args.n_points, "method": args.method, "tolerance": args.tolerance}
+
+    if client is not None:
+        result = client.breakeven(
+            "case_1", case2_id, parameter="distance", value_range=list(distance_range),
+            shuttle_size=shuttle_size, pump_size=PUMP_SIZE, reoptimize=reoptimize,
+            case1_shuttle_size=case1_shuttle_size, **options
+        )
+        return pd.DataFrame(result["records"]), result["breakeven_value"]
+
+    case1_config = load_config("case_1")
+    case2_config = load_config(case2_id)
+    if reoptimize:
+        analyzer = BreakevenAnalyzer(pump_size=PUMP_SIZE)
+        result = analyzer.find_breakeven_reoptimized(
+            case1_config=case1_config,
+            case2_config=case2_config,
+            parameter="distance",
+            value_range=distance_range,
+            verbose=verbose,
+            **options,
+        )
+    elif case1_shuttle_size is not None:
+        analyzer = BreakevenAnalyzer(pump_size=PUMP_SIZE)
+        result = analyzer.find_breakeven_distance_heterogeneous(
+            case1_config=case1_config,
+            case2_config=case2_config,
+            case1_shuttle_size=case1_shuttle_size,
+            case2_shuttle_size=shuttle_size,
+            distance_range=distance_range,
+            verbose=verbose,
+            **options,
+        )
+    else:
+        analyzer = BreakevenAnalyzer(shuttle_size=shuttle_size, pump_size=PUMP_SIZE)
+        result = analyzer.find_breakeven_distance(
+            case1_config=case1_config,
+            case2_config=case2_config,
+            distance_range=distance_range,
+            verbose=verbose,
+            **options,
+        )
+    return result.to_dataframe(), result.breakeven_value
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run break-even distance analysis for SCI paper"
@@ -64,13 +132,34 @@ def main():
         "--output", default="results/sensitivity",
         help="Output directory (default: results/sensitivity)"
     )
+    parser.add_argument(
+        "--method", choices=["brent", "illinois", "scan"], default="brent",
+        help="Crossover refinement: root finder or linear interpolation (default: brent)"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1,
+        help="Break-even tolerance in nm for root finders (default: 0.1)"
+    )
+    parser.add_argument(
+        "--reoptimize", action="store_true",
+        help="Re-optimize each case's shuttle/pump grid per distance for optimal-vs-optimal"
+    )
     parser.add_argument(
         "--quiet", action="store_true",
         help="Suppress detailed output"
     )
+    parser.add_argument(
+        "--service", default=None,
+        help="Run the searches in a running optimization service at this URL"
+    )
 
     args = parser.parse_args()
     verbose = not args.quiet
+    client = None
+    if args.service:
+        # Imported here: the service module loads every analyzer
+        from src.service import ServiceClient
+        client = ServiceClient(args.service)
 
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -79,66 +168,39 @@ def main():
     print("Break-even Distance Analysis")
     print("=" * 70)
     print(f"Distance range: {args.min_distance} - {args.max_distance} nm")
-    print(f"Points: {args.n_points}")
+    print(f"Points: {args.n_points} (method: {args.method}, tolerance: {args.tolerance} nm)")
     print(f"Output: {output_dir}")
     print("=" * 70)
 
-    # Load configs
-    case1_config = load_config("case_1")
-    case2_ulsan_config = load_config("case_2")
-    case2_yeosu_config = load_config("case_3")
-
-    all_results = []
-
     # Analysis 1: Case 1 vs Case 2 (Ulsan)
     print("\n--- Case 1 vs Case 2 (Ulsan) ---")
-    analyzer_ulsan = BreakevenAnalyzer(
-        shuttle_size=OPTIMAL_SHUTTLES['case_2'],
-        pump_size=PUMP_SIZE
+    df_ulsan, breakeven_ulsan = find_breakeven(
+        "case_2", args, verbose, client, shuttle_size=OPTIMAL_SHUTTLES['case_2']
     )
 
-    result_ulsan = analyzer_ulsan.find_breakeven_distance(
-        case1_config=case1_config,
-        case2_config=case2_ulsan_config,
-        distance_range=(args.min_distance, args.max_distance),
-        n_points=args.n_points,
-        verbose=verbose,
-    )
-
-    df_ulsan = result_ulsan.to_dataframe()
     df_ulsan['Comparison'] = 'Case1_vs_Ulsan'
     csv_path = output_dir / "breakeven_distance_ulsan.csv"
     df_ulsan.to_csv(csv_path, index=False)
     print(f"  [OK] Saved: {csv_path}")
 
-    if result_ulsan.breakeven_value:
-        print(f"  Break-even distance (Ulsan): {result_ulsan.breakeven_value:.1f} nm")
+    if breakeven_ulsan:
+        print(f"  Break-even distance (Ulsan): {breakeven_ulsan:.1f} nm")
     else:
         print(f"  No break-even found in range")
 
     # Analysis 2: Case 1 vs Case 3 (Yeosu)
     print("\n--- Case 1 vs Case 3 (Yeosu) ---")
-    analyzer_yeosu = BreakevenAnalyzer(
-        shuttle_size=OPTIMAL_SHUTTLES['case_3'],
-        pump_size=PUMP_SIZE
-    )
-
-    result_yeosu = analyzer_yeosu.find_breakeven_distance(
-        case1_config=case1_config,
-        case2_config=case2_yeosu_config,
-        distance_range=(args.min_distance, args.max_distance),
-        n_points=args.n_points,
-        verbose=verbose,
+    df_yeosu, breakeven_yeosu = find_breakeven(
+        "case_3", args, verbose, client, shuttle_size=OPTIMAL_SHUTTLES['case_3']
     )
 
-    df_yeosu = result_yeosu.to_dataframe()
     df_yeosu['Comparison'] = 'Case1_vs_Yeosu'
     csv_path = output_dir / "breakeven_distance_yeosu.csv"
     df_yeosu.to_csv(csv_path, index=False)
     print(f"  [OK] Saved: {csv_path}")
 
-    if result_yeosu.breakeven_value:
-        print(f"  Break-even distance (Yeosu): {result_yeosu.breakeven_value:.1f} nm")
+    if breakeven_yeosu:
+        print(f"  Break-even distance (Yeosu): {breakeven_yeosu:.1f} nm")
     else:
         print(f"  No break-even found in range")
 
@@ -158,18 +220,10 @@ def main():
 
     # Ulsan optimal-vs-optimal: Case 1 @ 1000 vs Case 2 @ 5000
     print("\n--- Optimal: Case 1 (1000 m3) vs Case 2 Ulsan (5000 m3) ---")
-    analyzer_opt_ulsan = BreakevenAnalyzer(pump_size=PUMP_SIZE)
-    result_opt_ulsan = analyzer_opt_ulsan.find_breakeven_distance_heterogeneous(
-        case1_config=case1_config,
-        case2_config=case2_ulsan_config,
-        case1_shuttle_size=OPTIMAL_SHUTTLES['case_1'],
-        case2_shuttle_size=OPTIMAL_SHUTTLES['case_2'],
-        distance_range=(args.min_distance, args.max_distance),
-        n_points=args.n_points,
-        verbose=verbose,
+    df_opt_ulsan, breakeven_opt_ulsan = find_breakeven(
+        "case_2", args, verbose, client, shuttle_size=OPTIMAL_SHUTTLES['case_2'],
+        case1_shuttle_size=OPTIMAL_SHUTTLES['case_1'], reoptimize=args.reoptimize
     )
-
-    df_opt_ulsan = result_opt_ulsan.to_dataframe()
     df_opt_ulsan['Comparison'] = 'Optimal_Case1_vs_Ulsan'
     csv_path = output_dir / "breakeven_distance_optimal_ulsan.csv"
     df_opt_ulsan.to_csv(csv_path, index=False)
@@ -177,18 +231,10 @@ def main():
 
     # Yeosu optimal-vs-optimal: Case 1 @ 1000 vs Case 3 @ 5000
     print("\n--- Optimal: Case 1 (1000 m3) vs Case 3 Yeosu (5000 m3) ---")
-    analyzer_opt_yeosu = BreakevenAnalyzer(pump_size=PUMP_SIZE)
-    result_opt_yeosu = analyzer_opt_yeosu.find_breakeven_distance_heterogeneous(
-        case1_config=case1_config,
-        case2_config=case2_yeosu_config,
-        case1_shuttle_size=OPTIMAL_SHUTTLES['case_1'],
-        case2_shuttle_size=OPTIMAL_SHUTTLES['case_3'],
-        distance_range=(args.min_distance, args.max_distance),
-        n_points=args.n_points,
-        verbose=verbose,
+    df_opt_yeosu, breakeven_opt_yeosu = find_breakeven(
+        "case_3", args, verbose, client, shuttle_size=OPTIMAL_SHUTTLES['case_3'],
+        case1_shuttle_size=OPTIMAL_SHUTTLES['case_1'], reoptimize=args.reoptimize
     )
-
-    df_opt_yeosu = result_opt_yeosu.to_dataframe()
     df_opt_yeosu['Comparison'] = 'Optimal_Case1_vs_Yeosu'
     csv_path = output_dir / "breakeven_distance_optimal_yeosu.csv"
     df_opt_yeosu.to_csv(csv_path, index=False)
@@ -206,24 +252,24 @@ def main():
     print("=" * 70)
     print("  Same-shuttle comparison:")
     print(f"    Case 1 vs Ulsan (5000 m3): ", end="")
-    if result_ulsan.breakeven_value:
-        print(f"{result_ulsan.breakeven_value:.1f} nm")
+    if breakeven_ulsan:
+        print(f"{breakeven_ulsan:.1f} nm")
     else:
         print("No crossover")
     print(f"    Case 1 vs Yeosu (10000 m3): ", end="")
-    if result_yeosu.breakeven_value:
-        print(f"{result_yeosu.breakeven_value:.1f} nm")
+    if breakeven_yeosu:
+        print(f"{breakeven_yeosu:.1f} nm")
     else:
         print("No crossover")
     print("  Optimal-vs-optimal comparison:")
     print(f"    Case 1 (2500 m3) vs Ulsan (5000 m3): ", end="")
-    if result_opt_ulsan.breakeven_value:
-        print(f"{result_opt_ulsan.breakeven_value:.1f} nm")
+    if breakeven_opt_ulsan:
+        print(f"{breakeven_opt_ulsan:.1f} nm")
     else:
         print("No crossover")
     print(f"    Case 1 (2500 m3) vs Yeosu (10000 m3): ", end="")
-    if result_opt_yeosu.breakeven_value:
-        print(f"{result_opt_yeosu.breakeven_value:.1f} nm")
+    if breakeven_opt_yeosu:
+        print(f"{breakeven_opt_yeosu:.1f} nm")
     else:
         print("No crossover")
     print("=" * 70)
@@ -231,4 +277,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, "run_breakeven_analysis")
@@ -18,10 +18,10 @@ Outputs:
 Usage:
     python scripts/run_demand_scenarios.py
     python scripts/run_demand_scenarios.py --cases case_1 case_2
+    python scripts/run_demand_scenarios.py --service http://127.0.0.1:8765
 """
 
 import sys
-import copy
 import argparse
 from pathlib import Path
 import pandas as pd
@@ -31,6 +31,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config_loader import load_config
 from src.optimizer import BunkeringOptimizer
+from src.profiling import run_profiled
 
 ALL_CASES = ['case_1', 'case_2', 'case_3']
 
@@ -42,21 +43,24 @@ DEMAND_SCENARIOS = {
 }
 
 
-def run_demand_scenario(case_id, scenario_name, scenario_params, verbose=True):
+def run_demand_scenario(case_id, scenario_name, scenario_params, verbose=True, client=None):
     """Run a single demand scenario and return optimal result."""
-    config = load_config(case_id)
-
     # Modify demand parameters
-    config["shipping"]["start_vessels"] = scenario_params["start_vessels"]
-    config["shipping"]["end_vessels"] = scenario_params["end_vessels"]
+    overrides = {
+        "shipping.start_vessels": scenario_params["start_vessels"],
+        "shipping.end_vessels": scenario_params["end_vessels"],
+    }
 
     if verbose:
         print(f"  {scenario_name}: {scenario_params['start_vessels']} -> "
               f"{scenario_params['end_vessels']} vessels")
 
-    # Run full optimization
-    optimizer = BunkeringOptimizer(config)
-    scenario_df, yearly_df = optimizer.solve()
+    # Run full optimization (locally or through the optimization service)
+    if client is not None:
+        from src.service import solve_case
+        scenario_df, yearly_df = solve_case(case_id, overrides, client)
+    else:
+        scenario_df, yearly_df = BunkeringOptimizer(load_config(case_id), overrides=overrides).solve()
 
     if scenario_df.empty:
         if verbose:
@@ -109,9 +113,18 @@ def main():
         "--quiet", action="store_true",
         help="Suppress detailed output"
     )
+    parser.add_argument(
+        "--service", default=None,
+        help="Submit solves to a running optimization service at this URL"
+    )
 
     args = parser.parse_args()
     verbose = not args.quiet
+    client = None
+    if args.service:
+        # Imported here: the service module loads every analyzer
+        from src.service import ServiceClient
+        client = ServiceClient(args.service)
 
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -131,7 +144,7 @@ def main():
 
         case_results = []
         for scenario_name, scenario_params in DEMAND_SCENARIOS.items():
-            result = run_demand_scenario(case_id, scenario_name, scenario_params, verbose)
+            result = run_demand_scenario(case_id, scenario_name, scenario_params, verbose, client)
             if result:
                 case_results.append(result)
                 all_results.append(result)
@@ -158,4 +171,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, "run_demand_scenarios")
@@ -19,17 +19,24 @@ Usage:
     python scripts/run_deterministic_sensitivity.py
     python scripts/run_deterministic_sensitivity.py --analyses fuel tornado
     python scripts/run_deterministic_sensitivity.py --cases case_1 case_2
+    python scripts/run_deterministic_sensitivity.py --service http://127.0.0.1:8765
+
+With --service the fuel price, tornado and bunker volume analyses run in a
+running optimization service (scripts/run_service.py); the two-way analysis
+has no service endpoint and always runs locally.
 """
 
 import sys
 import argparse
 from pathlib import Path
+import pandas as pd
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config_loader import load_config
 from src.sensitivity_analyzer import SensitivityAnalyzer
+from src.profiling import run_profiled
 
 # Optimal shuttle sizes per case (from deterministic results)
 OPTIMAL_SHUTTLES = {
@@ -42,8 +49,15 @@ ALL_CASES = ['case_1', 'case_2', 'case_3']
 PUMP_SIZE = 500  # Fixed pump rate for all analyses
 
 
-def run_fuel_price_sensitivity(case_ids, output_dir, verbose=True):
-    """A. Fuel price sensitivity: $300 - $1200/ton."""
+def run_fuel_price_sensitivity(case_ids, output_dir, verbose=True, reoptimize=False, client=None):
+    """
+    A. Fuel price sensitivity: $300 - $1200/ton.
+
+    By default the exact piecewise-linear NPC curve is computed parametrically
+    (a few solves per case) and breakpoints are added to the output points.
+    With reoptimize=True every price point is re-optimized instead.
+    With a service client the analysis runs in the optimization service.
+    """
     print("\n" + "=" * 70)
     print("[A] Fuel Price Sensitivity Analysis")
     print("=" * 70)
@@ -54,25 +68,43 @@ def run_fuel_price_sensitivity(case_ids, output_dir, verbose=True):
         config = load_config(case_id)
         shuttle = OPTIMAL_SHUTTLES.get(case_id, config["shuttle"]["available_sizes_cbm"][0])
 
-        analyzer = SensitivityAnalyzer(config, shuttle_size=shuttle, pump_size=PUMP_SIZE)
-
-        result = analyzer.analyze_parameter(
-            param_path="economy.fuel_price_usd_per_ton",
-            variations=fuel_prices,
-            param_name="Fuel_Price_USD_per_ton",
-            variation_type="absolute",
-            verbose=verbose,
-        )
+        if client is not None:
+            result = client.sensitivity(
+                case_id, "economy.fuel_price_usd_per_ton", fuel_prices,
+                shuttle_size=shuttle, pump_size=PUMP_SIZE,
+                variation_type="absolute", parametric=not reoptimize,
+            )
+            df = pd.DataFrame(result["records"])
+        else:
+            analyzer = SensitivityAnalyzer(config, shuttle_size=shuttle, pump_size=PUMP_SIZE)
+
+            if reoptimize:
+                result = analyzer.analyze_parameter(
+                    param_path="economy.fuel_price_usd_per_ton",
+                    variations=fuel_prices,
+                    param_name="Fuel_Price_USD_per_ton",
+                    variation_type="absolute",
+                    verbose=verbose,
+                )
+            else:
+                result = analyzer.analyze_parameter_parametric(
+                    param_path="economy.fuel_price_usd_per_ton",
+                    variations=fuel_prices,
+                    param_name="Fuel_Price_USD_per_ton",
+                    variation_type="absolute",
+                    include_breakpoints=True,
+                    verbose=verbose,
+                )
+            df = result.to_dataframe()
 
         # Save CSV
-        df = result.to_dataframe()
         csv_path = output_dir / f"fuel_price_{case_id}.csv"
         df.to_csv(csv_path, index=False)
         print(f"  [OK] Saved: {csv_path}")
 
 
-def run_tornado_analysis(case_ids, output_dir, verbose=True):
-    """B. Tornado diagram: 6 parameters +/-20%."""
+def run_tornado_analysis(case_ids, output_dir, verbose=True, client=None):
+    """B. Tornado diagram: 6 parameters +/-20% (in the service with a client)."""
     print("\n" + "=" * 70)
     print("[B] Tornado Diagram Analysis (+/-20%)")
     print("=" * 70)
@@ -90,23 +122,29 @@ def run_tornado_analysis(case_ids, output_dir, verbose=True):
         config = load_config(case_id)
         shuttle = OPTIMAL_SHUTTLES.get(case_id, config["shuttle"]["available_sizes_cbm"][0])
 
-        analyzer = SensitivityAnalyzer(config, shuttle_size=shuttle, pump_size=PUMP_SIZE)
-
-        result = analyzer.analyze_tornado(
-            params=tornado_params,
-            variation_pct=0.20,
-            verbose=verbose,
-        )
+        if client is not None:
+            result = client.tornado(
+                case_id, tornado_params, variation_pct=0.20, shuttle_size=shuttle, pump_size=PUMP_SIZE
+            )
+            df = pd.DataFrame(result["records"])
+        else:
+            analyzer = SensitivityAnalyzer(config, shuttle_size=shuttle, pump_size=PUMP_SIZE)
+
+            result = analyzer.analyze_tornado(
+                params=tornado_params,
+                variation_pct=0.20,
+                verbose=verbose,
+            )
+            df = result.to_dataframe()
 
         # Save CSV
-        df = result.to_dataframe()
         csv_path = output_dir / f"tornado_det_{case_id}.csv"
         df.to_csv(csv_path, index=False)
         print(f"  [OK] Saved: {csv_path}")
 
 
-def run_bunker_volume_sensitivity(case_ids, output_dir, verbose=True):
-    """C. Bunker volume sensitivity: 2500 - 10000 m3."""
+def run_bunker_volume_sensitivity(case_ids, output_dir, verbose=True, client=None):
+    """C. Bunker volume sensitivity: 2500 - 10000 m3 (in the service with a client)."""
     print("\n" + "=" * 70)
     print("[C] Bunker Volume Sensitivity Analysis")
     print("=" * 70)
@@ -117,18 +155,25 @@ def run_bunker_volume_sensitivity(case_ids, output_dir, verbose=True):
         config = load_config(case_id)
         shuttle = OPTIMAL_SHUTTLES.get(case_id, config["shuttle"]["available_sizes_cbm"][0])
 
-        analyzer = SensitivityAnalyzer(config, shuttle_size=shuttle, pump_size=PUMP_SIZE)
-
-        result = analyzer.analyze_parameter(
-            param_path="bunkering.bunker_volume_per_call_m3",
-            variations=volumes,
-            param_name="Bunker_Volume_m3",
-            variation_type="absolute",
-            verbose=verbose,
-        )
+        if client is not None:
+            result = client.sensitivity(
+                case_id, "bunkering.bunker_volume_per_call_m3", volumes,
+                shuttle_size=shuttle, pump_size=PUMP_SIZE, variation_type="absolute",
+            )
+            df = pd.DataFrame(result["records"])
+        else:
+            analyzer = SensitivityAnalyzer(config, shuttle_size=shuttle, pump_size=PUMP_SIZE)
+
+            result = analyzer.analyze_parameter(
+                param_path="bunkering.bunker_volume_per_call_m3",
+                variations=volumes,
+                param_name="Bunker_Volume_m3",
+                variation_type="absolute",
+                verbose=verbose,
+            )
+            df = result.to_dataframe()
 
         # Save CSV
-        df = result.to_dataframe()
         csv_path = output_dir / f"bunker_volume_{case_id}.csv"
         df.to_csv(csv_path, index=False)
         print(f"  [OK] Saved: {csv_path}")
@@ -185,9 +230,22 @@ def main():
         "--quiet", action="store_true",
         help="Suppress detailed output"
     )
+    parser.add_argument(
+        "--reoptimize", action="store_true",
+        help="Re-optimize every fuel price point instead of the parametric curve"
+    )
+    parser.add_argument(
+        "--service", default=None,
+        help="Run the analyses in a running optimization service at this URL"
+    )
 
     args = parser.parse_args()
     verbose = not args.quiet
+    client = None
+    if args.service:
+        # Imported here: the service module loads every analyzer
+        from src.service import ServiceClient
+        client = ServiceClient(args.service)
 
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -201,13 +259,13 @@ def main():
     print("=" * 70)
 
     if "fuel" in args.analyses:
-        run_fuel_price_sensitivity(args.cases, output_dir, verbose)
+        run_fuel_price_sensitivity(args.cases, output_dir, verbose, args.reoptimize, client)
 
     if "tornado" in args.analyses:
-        run_tornado_analysis(args.cases, output_dir, verbose)
+        run_tornado_analysis(args.cases, output_dir, verbose, client)
 
     if "bunker" in args.analyses:
-        run_bunker_volume_sensitivity(args.cases, output_dir, verbose)
+        run_bunker_volume_sensitivity(args.cases, output_dir, verbose, client)
 
     if "twoway" in args.analyses:
         # Two-way only for case_1 by default (expensive: 25 optimizations per case)
@@ -223,4 +281,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, "run_deterministic_sensitivity")
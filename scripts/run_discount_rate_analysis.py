@@ -21,6 +21,7 @@ Usage:
     python scripts/run_discount_rate_analysis.py
     python scripts/run_discount_rate_analysis.py --cases case_1 case_2
     python scripts/run_discount_rate_analysis.py --rates 0.0 0.03 0.05 0.08 0.10
+    python scripts/run_discount_rate_analysis.py --service http://127.0.0.1:8765
 """
 
 import sys
@@ -33,6 +34,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config_loader import load_config
 from src.optimizer import BunkeringOptimizer
+from src.profiling import run_profiled
 
 ALL_CASES = ['case_1', 'case_2', 'case_3']
 DEFAULT_RATES = [0.0, 0.05, 0.08]
@@ -50,16 +52,18 @@ CASE_SHORT = {
 }
 
 
-def run_single(case_id, discount_rate, verbose=True):
+def run_single(case_id, discount_rate, verbose=True, client=None):
     """Run optimization for a single case/rate combination."""
-    config = load_config(case_id)
-    config["economy"]["discount_rate"] = discount_rate
-
     if verbose:
         print(f"  r={discount_rate:.0%}: ", end="", flush=True)
 
-    optimizer = BunkeringOptimizer(config)
-    scenario_df, yearly_df = optimizer.solve()
+    # Locally or through the optimization service
+    overrides = {"economy.discount_rate": discount_rate}
+    if client is not None:
+        from src.service import solve_case
+        scenario_df, yearly_df = solve_case(case_id, overrides, client)
+    else:
+        scenario_df, yearly_df = BunkeringOptimizer(load_config(case_id), overrides=overrides).solve()
 
     if scenario_df.empty:
         if verbose:
@@ -198,9 +202,18 @@ def main():
         "--no-figures", action="store_true",
         help="Skip figure generation"
     )
+    parser.add_argument(
+        "--service", default=None,
+        help="Submit solves to a running optimization service at this URL"
+    )
 
     args = parser.parse_args()
     verbose = not args.quiet
+    client = None
+    if args.service:
+        # Imported here: the service module loads every analyzer
+        from src.service import ServiceClient
+        client = ServiceClient(args.service)
 
     output_dir = Path(args.output)
     data_dir = output_dir / "data"
@@ -224,7 +237,7 @@ def main():
         case_yearly_frames = []
 
         for rate in args.rates:
-            result, yearly_opt = run_single(case_id, rate, verbose)
+            result, yearly_opt = run_single(case_id, rate, verbose, client)
             if result:
                 all_results.append(result)
 
@@ -263,4 +276,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, "run_discount_rate_analysis")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Paper Pipeline - Regenerate all paper results incrementally.
+
+Runs the analysis scripts as pipeline stages:
+  deterministic_sensitivity, demand_scenarios, discount_rate, breakeven,
+  stochastic  (independent, run concurrently with --jobs)
+  figures     (after all analyses; only figures whose data changed)
+  preserve    (after figures)
+
+Every stage depends on the configs (config/*.yaml), the model code (src/)
+and its own script. A stage is skipped when none of its inputs changed
+since the last successful run and its outputs are untouched. State and
+logs are kept in results/.pipeline/.
+
+Usage:
+    python scripts/run_pipeline.py                 # run what is out of date
+    python scripts/run_pipeline.py --dry-run       # show the plan only
+    python scripts/run_pipeline.py --jobs 4        # concurrent stages
+    python scripts/run_pipeline.py --stages breakeven figures
+    python scripts/run_pipeline.py --force         # ignore saved state
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pipeline import Pipeline, Stage
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Inputs shared by every stage: configs and model code
+COMMON_INPUTS = ["config/*.yaml", "src/*.py"]
+
+# Data files behind the deterministic and stochastic figure families
+DETERMINISTIC_DATA = [
+    "results/MILP_*.csv",
+    "results/deterministic/*.csv",
+    "results/stochastic*/deterministic_*.csv",
+]
+STOCHASTIC_DATA = ["results/stochastic*/stochastic_*.csv"]
+
+# Figure ID (generate_paper_figures.py --figures) -> data files it reads.
+# Figures not listed here (S4, S6, C2, C3) only use built-in data and are
+# redrawn in full runs.
+FIGURE_INPUTS = {
+    **{fig_id: DETERMINISTIC_DATA for fig_id in (
+        "D1", "D2", "D3", "D4", "D5", "D45_CASES", "D6", "D7", "D8", "D9", "D11", "D12",
+        "V5_COST", "V5_FLEET",
+    )},
+    "S1": STOCHASTIC_DATA,
+    "S2": STOCHASTIC_DATA,
+    "S3": STOCHASTIC_DATA,
+    "S5": ["results/stochastic*/tornado_*.csv"],
+    "S7": ["results/sensitivity/pump_sensitivity_*.csv"],
+    "FIG7": ["results/sensitivity/tornado_det_*.csv"],
+    "FIG8": ["results/sensitivity/fuel_price_*.csv"],
+    "FIG9": ["results/sensitivity/breakeven_distance_*.csv"],
+    "FIG10": ["results/sensitivity/demand_scenarios_*.csv"],
+    "FIGS4": ["results/sensitivity/two_way_det_*.csv"],
+    "FIGS5": ["results/sensitivity/bunker_volume_*.csv"],
+    "FIG11": ["results/discount_rate_analysis/data/*.csv"],
+    "FIG13": ["results/yang_lam_des_comparison/data/*.csv"],
+    "FIG14": ["results/yang_lam_des_comparison/data/*.csv"],
+    "C1": DETERMINISTIC_DATA + STOCHASTIC_DATA,
+    "C4": DETERMINISTIC_DATA + STOCHASTIC_DATA,
+}
+
+ANALYSIS_STAGES = [
+    Stage(
+        "deterministic_sensitivity", "scripts/run_deterministic_sensitivity.py",
+        args=["--quiet"], inputs=COMMON_INPUTS,
+        outputs=[
+            "results/sensitivity/fuel_price_*.csv",
+            "results/sensitivity/tornado_det_*.csv",
+            "results/sensitivity/bunker_volume_*.csv",
+            "results/sensitivity/two_way_det_*.csv",
+        ],
+    ),
+    Stage(
+        "demand_scenarios", "scripts/run_demand_scenarios.py",
+        args=["--quiet"], inputs=COMMON_INPUTS,
+        outputs=["results/sensitivity/demand_scenarios_*.csv"],
+    ),
+    Stage(
+        "discount_rate", "scripts/run_discount_rate_analysis.py",
+        args=["--quiet", "--no-figures"], inputs=COMMON_INPUTS,
+        outputs=["results/discount_rate_analysis/data/*.csv"],
+    ),
+    Stage(
+        "breakeven", "scripts/run_breakeven_analysis.py",
+        args=["--quiet"], inputs=COMMON_INPUTS,
+        outputs=["results/sensitivity/breakeven_distance_*.csv"],
+    ),
+    Stage(
+        "stochastic", "scripts/run_stochastic_analysis.py",
+        args=["--quiet"], inputs=COMMON_INPUTS,
+        outputs=["results/stochastic/*.csv"],
+    ),
+]
+
+PAPER_STAGES = ANALYSIS_STAGES + [
+    Stage(
+        "figures", "scripts/generate_paper_figures.py",
+        inputs=COMMON_INPUTS,
+        outputs=["results/paper_figures/*.png", "results/paper_figures/*.pdf"],
+        depends_on=[stage.name for stage in ANALYSIS_STAGES],
+        targets=FIGURE_INPUTS,
+        target_arg="--figures",
+    ),
+    Stage(
+        "preserve", "scripts/preserve_paper_results.py",
+        inputs=["scripts/preserve_paper_results.py"],
+        outputs=["results/preserved/**/*"],
+        depends_on=[stage.name for stage in ANALYSIS_STAGES] + ["figures"],
+    ),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the paper analysis pipeline incrementally"
+    )
+    parser.add_argument(
+        "--stages", nargs="+", default=None,
+        choices=[stage.name for stage in PAPER_STAGES],
+        help="Stages to run (default: all)"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Stages to run concurrently (default: 1)"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Re-run selected stages even if up to date"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Show what would run and exit"
+    )
+
+    args = parser.parse_args()
+
+    pipeline = Pipeline(PAPER_STAGES, root=str(PROJECT_ROOT))
+
+    print("\n" + "=" * 70)
+    print("Paper Pipeline")
+    print("=" * 70)
+
+    if args.dry_run:
+        plans = pipeline.plan(force=args.force)
+        for name, (action, targets) in plans.items():
+            if args.stages and name not in args.stages:
+                continue
+            detail = f" ({' '.join(targets)})" if targets else ""
+            print(f"  {name:28s} {action}{detail}")
+        return
+
+    results = pipeline.run(only=args.stages, jobs=args.jobs, force=args.force)
+
+    print("\n" + "=" * 70)
+    print("Pipeline Summary")
+    print("=" * 70)
+    for result in results.values():
+        detail = f" ({' '.join(result.targets)})" if result.targets else ""
+        print(f"  {result.name:28s} {result.status:8s} {result.duration_s:7.1f}s{detail}")
+    print("=" * 70)
+
+    failed = [r.name for r in results.values() if r.status in ("failed", "blocked")]
+    if failed:
+        print(f"[WARN] Not completed: {failed}")
+        sys.exit(1)
+    print("[OK] Pipeline complete!")
+
+
+if __name__ == "__main__":
+    main()
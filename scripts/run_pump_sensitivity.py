@@ -22,6 +22,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.sensitivity_analyzer import analyze_pump_rate_sensitivity
+from src.profiling import run_profiled
 
 
 def main():
@@ -81,4 +82,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, "run_pump_sensitivity")
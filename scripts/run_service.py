@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Optimization Service - Long-lived local process with warm caches.
+
+Keeps parsed configs, analyzers and solve caches in memory so repeated
+script runs do not re-import, re-parse and re-solve. Scripts submit jobs
+with --service http://127.0.0.1:8765 (run_demand_scenarios.py,
+run_discount_rate_analysis.py, run_deterministic_sensitivity.py,
+run_breakeven_analysis.py, run_stochastic_analysis.py) or through
+src.service.ServiceClient. Caches are dropped when a config YAML changes.
+
+Endpoints (POST JSON to /<endpoint>):
+  optimize, sensitivity, tornado, breakeven, stochastic, status
+
+The service has no authentication; keep it bound to localhost.
+
+Usage:
+    python scripts/run_service.py
+    python scripts/run_service.py --port 9000
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.service import DEFAULT_HOST, DEFAULT_PORT, serve
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the local optimization service"
+    )
+    parser.add_argument(
+        "--host", default=DEFAULT_HOST,
+        help=f"Bind address (default: {DEFAULT_HOST})"
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT,
+        help=f"TCP port (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--config-dir", default="config",
+        help="Configuration directory (default: config)"
+    )
+
+    args = parser.parse_args()
+    serve(args.host, args.port, args.config_dir)
+
+
+if __name__ == "__main__":
+    main()
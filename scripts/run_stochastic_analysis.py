@@ -11,33 +11,38 @@ This script runs:
 Usage:
     python scripts/run_stochastic_analysis.py
     python scripts/run_stochastic_analysis.py --case case_1 --scenarios 100
+    python scripts/run_stochastic_analysis.py --service http://127.0.0.1:8765
+
+With --service the optimizations and sensitivities run in a running
+optimization service (scripts/run_service.py); the case comparison has no
+service endpoint and always runs locally.
 """
 
 import sys
 from pathlib import Path
 import argparse
+import pandas as pd
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src import (
     load_config,
-    load_stochastic_config,
-    VesselDistribution,
-    StochasticOptimizer,
     SensitivityAnalyzer,
     BreakevenAnalyzer,
     run_stochastic_optimization,
     run_sensitivity_analysis,
     run_breakeven_analysis,
 )
+from src.profiling import run_profiled
 
 
 def run_all_analyses(
     case_id: str = "case_1",
     n_scenarios: int = 100,
     output_dir: str = "results/stochastic",
-    verbose: bool = True
+    verbose: bool = True,
+    client=None
 ):
     """
     Run complete stochastic analysis suite.
@@ -47,6 +52,7 @@ def run_all_analyses(
         n_scenarios: Number of Monte Carlo scenarios
         output_dir: Output directory for results
         verbose: Print progress
+        client: ServiceClient to run the solves in (default: locally)
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -61,14 +67,15 @@ def run_all_analyses(
 
     # Load configurations
     config = load_config(case_id)
-    stoch_config = load_stochastic_config()
 
     # Get optimal shuttle/pump from deterministic run first
-    from src.optimizer import BunkeringOptimizer
-
     print("\n[1/4] Running deterministic optimization to find optimal config...")
-    det_optimizer = BunkeringOptimizer(config)
-    scenario_df, yearly_df = det_optimizer.solve()
+    if client is not None:
+        result = client.optimize(case_id)
+        scenario_df, yearly_df = pd.DataFrame(result["scenarios"]), pd.DataFrame(result["yearly"])
+    else:
+        from src.optimizer import BunkeringOptimizer
+        scenario_df, yearly_df = BunkeringOptimizer(config).solve()
 
     if scenario_df.empty:
         print("[ERROR] No feasible solutions found in deterministic run")
@@ -89,21 +96,22 @@ def run_all_analyses(
 
     # 2. Stochastic Optimization
     print("\n[2/4] Running stochastic optimization...")
-    stoch_result = run_stochastic_optimization(
-        case_id=case_id,
-        n_scenarios=n_scenarios,
-        output_dir=str(output_path),
-        verbose=verbose
-    )
+    if client is not None:
+        result = client.stochastic(case_id, n_scenarios=n_scenarios)
+        stoch_summary = result["summary"]
+        # Same files as run_stochastic_optimization(output_dir=...)
+        pd.DataFrame(result["records"]).to_csv(output_path / f"stochastic_scenarios_{case_id}.csv", index=False)
+        pd.DataFrame([stoch_summary]).to_csv(output_path / f"stochastic_summary_{case_id}.csv", index=False)
+    else:
+        stoch_summary = run_stochastic_optimization(
+            case_id=case_id,
+            n_scenarios=n_scenarios,
+            output_dir=str(output_path),
+            verbose=verbose
+        ).to_dict()
 
     # 3. Sensitivity Analysis
     print("\n[3/4] Running sensitivity analysis...")
-    sens_analyzer = SensitivityAnalyzer(
-        config,
-        shuttle_size=optimal_shuttle,
-        pump_size=optimal_pump
-    )
-
     # Define parameters for tornado
     tornado_params = [
         {"path": "economy.fuel_price_usd_per_ton", "name": "Fuel Price"},
@@ -112,17 +120,34 @@ def run_all_analyses(
         {"path": "bunkering.bunker_volume_per_call_m3", "name": "Bunker Volume"},
     ]
 
-    tornado_result = sens_analyzer.analyze_tornado(tornado_params, variation_pct=0.10, verbose=verbose)
-    tornado_result.to_dataframe().to_csv(output_path / f"tornado_{case_id}.csv", index=False)
+    fuel_variations = [-0.30, -0.20, -0.10, 0, 0.10, 0.20, 0.30]
 
-    # Single parameter sensitivity for fuel price
-    fuel_sens = sens_analyzer.analyze_parameter(
-        "economy.fuel_price_usd_per_ton",
-        variations=[-0.30, -0.20, -0.10, 0, 0.10, 0.20, 0.30],
-        param_name="Fuel Price",
-        verbose=verbose
-    )
-    fuel_sens.to_dataframe().to_csv(output_path / f"sensitivity_fuel_price_{case_id}.csv", index=False)
+    if client is not None:
+        pair = {"shuttle_size": optimal_shuttle, "pump_size": optimal_pump}
+        tornado_df = pd.DataFrame(client.tornado(case_id, tornado_params, variation_pct=0.10, **pair)["records"])
+        fuel_df = pd.DataFrame(
+            client.sensitivity(case_id, "economy.fuel_price_usd_per_ton", fuel_variations, **pair)["records"]
+        )
+    else:
+        sens_analyzer = SensitivityAnalyzer(
+            config,
+            shuttle_size=optimal_shuttle,
+            pump_size=optimal_pump
+        )
+        tornado_df = sens_analyzer.analyze_tornado(
+            tornado_params, variation_pct=0.10, verbose=verbose
+        ).to_dataframe()
+
+        # Single parameter sensitivity for fuel price
+        fuel_df = sens_analyzer.analyze_parameter(
+            "economy.fuel_price_usd_per_ton",
+            variations=fuel_variations,
+            param_name="Fuel Price",
+            verbose=verbose
+        ).to_dataframe()
+
+    tornado_df.to_csv(output_path / f"tornado_{case_id}.csv", index=False)
+    fuel_df.to_csv(output_path / f"sensitivity_fuel_price_{case_id}.csv", index=False)
 
     # 4. Break-even Analysis (if we have multiple cases)
     print("\n[4/4] Running break-even analysis...")
@@ -156,23 +181,22 @@ def run_all_analyses(
     print(f"  NPC (20-year): ${det_npc:.2f}M")
 
     print(f"\nStochastic Optimization:")
-    print(f"  Expected NPC: ${stoch_result.expected_npc:.2f}M")
-    print(f"  NPC Std Dev: ${stoch_result.npc_std:.2f}M")
-    print(f"  VSS: ${stoch_result.vss:.2f}M ({stoch_result.vss_percent:.1f}%)")
-    print(f"  EVPI: ${stoch_result.evpi:.2f}M ({stoch_result.evpi_percent:.1f}%)")
+    print(f"  Expected NPC: ${stoch_summary['Expected_NPC_USDm']:.2f}M")
+    print(f"  NPC Std Dev: ${stoch_summary['NPC_Std_USDm']:.2f}M")
+    print(f"  VSS: ${stoch_summary['VSS_USDm']:.2f}M ({stoch_summary['VSS_Percent']:.1f}%)")
+    print(f"  EVPI: ${stoch_summary['EVPI_USDm']:.2f}M ({stoch_summary['EVPI_Percent']:.1f}%)")
 
     print(f"\nSensitivity (Tornado) - Top impacts:")
-    for i, (param, swing) in enumerate(zip(tornado_result.parameters[:3], tornado_result.swings[:3]), 1):
-        pct = swing / tornado_result.base_npc * 100 if tornado_result.base_npc else 0
-        print(f"  {i}. {param}: ${swing:.2f}M ({pct:.1f}%)")
+    for i, row in enumerate(tornado_df.head(3).itertuples(index=False), 1):
+        print(f"  {i}. {row.Parameter}: ${row.Swing_USDm:.2f}M ({row.Swing_Pct:.1f}%)")
 
     print(f"\n[OK] All results saved to {output_path}")
     print("="*60)
 
     return {
         "deterministic_npc": det_npc,
-        "stochastic_result": stoch_result,
-        "tornado_result": tornado_result,
+        "stochastic_summary": stoch_summary,
+        "tornado": tornado_df,
         "optimal_shuttle": optimal_shuttle,
         "optimal_pump": optimal_pump,
     }
@@ -184,16 +208,26 @@ def main():
     parser.add_argument("--scenarios", type=int, default=100, help="Monte Carlo scenarios")
     parser.add_argument("--output", default="results/stochastic", help="Output directory")
     parser.add_argument("--quiet", action="store_true", help="Reduce output verbosity")
+    parser.add_argument(
+        "--service", default=None,
+        help="Run the solves in a running optimization service at this URL"
+    )
 
     args = parser.parse_args()
+    client = None
+    if args.service:
+        # Imported here: the service module loads every analyzer
+        from src.service import ServiceClient
+        client = ServiceClient(args.service)
 
     run_all_analyses(
         case_id=args.case,
         n_scenarios=args.scenarios,
         output_dir=args.output,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        client=client
     )
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, "run_stochastic_analysis")
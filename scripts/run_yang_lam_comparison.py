@@ -46,6 +46,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.shuttle_round_trip_calculator import ShuttleRoundTripCalculator
 from src.config_loader import load_config
+from src.profiling import run_profiled
 
 # ============================================================================
 # Yang & Lam (2023) Published Reference Data (Hardcoded Constants)
@@ -253,19 +254,18 @@ def compare_flow_rate_sensitivity(config):
         )
         base_service = base_result['time_per_vessel_at_destination_h']
 
-        service_times = []
-        for mult in multipliers:
-            flow = base_flow * mult
-            result = calc.calculate(
-                shuttle_size_m3=volume,
-                pump_size_m3ph=flow,
-                has_storage_at_busan=True,
-                num_vessels=1,
-                is_round_trip=False,
-            )
-            svc_time = result['time_per_vessel_at_destination_h']
-            service_times.append(svc_time)
+        # All flow rates in one vectorized pass
+        flows = base_flow * multipliers
+        sweep = calc.calculate_batch(
+            shuttle_size_m3=volume,
+            pump_size_m3ph=flows,
+            has_storage_at_busan=True,
+            num_vessels=1,
+            is_round_trip=False,
+        )
+        service_times = sweep['time_per_vessel_at_destination_h'].tolist()
 
+        for mult, flow, svc_time in zip(multipliers, flows, service_times):
             rows.append({
                 'Parameter_Set': set_name,
                 'Label': params['label'],
@@ -778,4 +778,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled(main, "run_yang_lam_comparison")
@@ -22,7 +22,7 @@ import time
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src import load_config, run_single_case, run_yearly_simulation
+from src import load_config, run_single_case, run_yearly_simulation, CalculationVerifier
 
 
 def verify_lco_consistency(case_id: str):
@@ -114,6 +114,15 @@ def verify_lco_consistency(case_id: str):
             print(f"\n[WARN] LCOAmmonia values differ by ${difference:.2f}/ton")
             print("This may indicate a calculation discrepancy.")
 
+        # Full grid: every feasible scenario against the vectorized simulation
+        grid_results = CalculationVerifier(config).verify_simulation_consistency(scenario_df)
+        grid_passed = sum(1 for r in grid_results if r.passed)
+        print(f"\nAll Scenarios ({len(grid_results)} pairs, 2% tolerance):")
+        print(f"  Consistent:         {grid_passed}/{len(grid_results)}")
+        for r in grid_results:
+            if not r.passed:
+                print(f"  {r}")
+
         # Step 6: Detailed year-by-year analysis
         print("\n" + "="*80)
         print("Year-by-Year LCOAmmonia Evolution")
@@ -154,6 +163,8 @@ def verify_lco_consistency(case_id: str):
             "difference": difference,
             "tolerance": tolerance,
             "match": match,
+            "grid_passed": grid_passed,
+            "grid_total": len(grid_results),
             "cumulative_supply_ton": cumulative_supply_ton,
             "cumulative_cost_usdm": cumulative_cost_usdm,
             "yearly_df": yearly_sim_df,
@@ -1,86 +1,159 @@
 """
 Green Corridor Bunkering Optimization Model
 MILP optimization for ammonia bunkering infrastructure planning at Busan Port
+
+Public names are loaded lazily on first attribute access, so importing the
+package (e.g. for a quick cycle-time query) does not pull in PuLP, pandas,
+matplotlib or the export libraries until they are needed.
 """
 
+import importlib
+
 __version__ = "2.2"
 __author__ = "Green Corridor Research Team"
 
-from .config_loader import ConfigLoader, load_config, list_available_cases
-from .optimizer import BunkeringOptimizer
-from .cost_calculator import CostCalculator
-from .utils import (
-    interpolate_mcr,
-    calculate_m3_per_voyage,
-    calculate_vessel_growth,
-    calculate_annual_demand,
-)
-
-# Runner functions - reusable execution logic
-from .runner import (
-    print_cycle_time_breakdown,
-    run_single_scenario,
-    run_annual_simulation,
-    run_yearly_simulation,
-    run_single_case,
-)
+# Submodule -> public names it provides
+_LAZY_IMPORTS = {
+    ".config_loader": ("ConfigLoader", "load_config", "list_available_cases"),
+    ".config_overlay": ("ConfigOverlay",),
+    ".optimizer": ("BunkeringOptimizer",),
+    ".batch_evaluator": ("BatchEvaluator",),
+    ".cost_calculator": ("CostCalculator",),
+    ".cost_tables": ("CostTables",),
+    ".cycle_time_calculator": ("CycleTimeCalculator",),
+    ".utils": (
+        "interpolate_mcr",
+        "calculate_m3_per_voyage",
+        "calculate_vessel_growth",
+        "calculate_annual_demand",
+    ),
+    # Runner functions - reusable execution logic
+    ".runner": (
+        "print_cycle_time_breakdown",
+        "run_single_scenario",
+        "run_annual_simulation",
+        "run_yearly_simulation",
+        "run_single_case",
+    ),
+    # Vectorized yearly simulation
+    ".yearly_simulation": ("YearlySimulationResult", "simulate_yearly"),
+    # Discrete-event operations simulation
+    ".operations_simulation": (
+        "OperationsSimulator",
+        "OperationsSimulationResult",
+        "simulate_operations",
+    ),
+    # Streaming call-level simulation trace
+    ".event_trace": ("TraceWriter", "TraceKPIAggregator", "read_trace"),
+    # Independent DES replications with confidence intervals
+    ".replication_manager": ("ReplicationManager", "ReplicationResult", "RunningStats"),
+    # Verification utilities
+    ".verification": (
+        "CalculationVerifier",
+        "VerificationResult",
+        "verify_case",
+        "verify_optimization_result",
+    ),
+    # Stochastic analysis - vessel distribution
+    ".vessel_distribution": (
+        "VesselType",
+        "DistributionScenario",
+        "MonteCarloScenario",
+        "VesselDistribution",
+        "load_stochastic_config",
+        "create_vessel_distribution",
+    ),
+    # Stochastic optimization
+    ".stochastic_optimizer": (
+        "StochasticOptimizer",
+        "StochasticResult",
+        "run_stochastic_optimization",
+    ),
+    # Sensitivity analysis
+    ".sensitivity_analyzer": (
+        "SensitivityAnalyzer",
+        "ParameterSensitivityResult",
+        "TornadoResult",
+        "TwoWaySensitivityResult",
+        "AnalyticSensitivityResult",
+        "run_sensitivity_analysis",
+    ),
+    # Global (variance-based) sensitivity analysis
+    ".global_sensitivity": (
+        "GlobalSensitivityAnalyzer",
+        "ParameterDistribution",
+        "SobolResult",
+        "run_global_sensitivity",
+    ),
+    # Surrogate models for what-if queries
+    ".surrogate": (
+        "GaussianProcess",
+        "NPCSurrogate",
+        "build_surrogates",
+    ),
+    # Break-even analysis
+    ".breakeven_analyzer": (
+        "BreakevenAnalyzer",
+        "BreakevenResult",
+        "CaseComparisonResult",
+        "DecisionMapResult",
+        "run_breakeven_analysis",
+    ),
+    # Paper figure generation
+    ".paper_figures": (
+        "PaperFigureGenerator",
+        "FigureResult",
+        "generate_paper_figures",
+    ),
+    ".results_catalog": ("ResultsCatalog", "CatalogEntry"),
+    # Local optimization service
+    ".service": (
+        "OptimizationService",
+        "ServiceClient",
+        "create_server",
+        "serve",
+    ),
+    # Incremental analysis pipeline
+    ".pipeline": (
+        "Pipeline",
+        "Stage",
+        "StageResult",
+    ),
+    # Per-stage profiling
+    ".profiling": ("profile_stage", "run_profiled"),
+}
 
-# Verification utilities
-from .verification import (
-    CalculationVerifier,
-    VerificationResult,
-    verify_case,
-    verify_optimization_result,
-)
+_NAME_TO_MODULE = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
 
-# Stochastic analysis - vessel distribution
-from .vessel_distribution import (
-    VesselType,
-    DistributionScenario,
-    MonteCarloScenario,
-    VesselDistribution,
-    load_stochastic_config,
-    create_vessel_distribution,
-)
 
-# Stochastic optimization
-from .stochastic_optimizer import (
-    StochasticOptimizer,
-    StochasticResult,
-    run_stochastic_optimization,
-)
+def __getattr__(name):
+    """Import the submodule providing ``name`` on first access."""
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Sensitivity analysis
-from .sensitivity_analyzer import (
-    SensitivityAnalyzer,
-    ParameterSensitivityResult,
-    TornadoResult,
-    TwoWaySensitivityResult,
-    run_sensitivity_analysis,
-)
 
-# Break-even analysis
-from .breakeven_analyzer import (
-    BreakevenAnalyzer,
-    BreakevenResult,
-    CaseComparisonResult,
-    run_breakeven_analysis,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_NAME_TO_MODULE))
 
-# Paper figure generation
-from .paper_figures import (
-    PaperFigureGenerator,
-    generate_paper_figures,
-)
 
 __all__ = [
     # Config
     "ConfigLoader",
     "load_config",
     "list_available_cases",
+    "ConfigOverlay",
     # Optimization
     "BunkeringOptimizer",
+    "BatchEvaluator",
     "CostCalculator",
+    "CostTables",
+    "CycleTimeCalculator",
     # Utils
     "interpolate_mcr",
     "calculate_m3_per_voyage",
@@ -92,6 +165,21 @@ __all__ = [
     "run_annual_simulation",
     "run_yearly_simulation",
     "run_single_case",
+    # Yearly Simulation
+    "YearlySimulationResult",
+    "simulate_yearly",
+    # Operations Simulation
+    "OperationsSimulator",
+    "OperationsSimulationResult",
+    "simulate_operations",
+    # Event Trace
+    "TraceWriter",
+    "TraceKPIAggregator",
+    "read_trace",
+    # Replications
+    "ReplicationManager",
+    "ReplicationResult",
+    "RunningStats",
     # Verification
     "CalculationVerifier",
     "VerificationResult",
@@ -113,13 +201,39 @@ __all__ = [
     "ParameterSensitivityResult",
     "TornadoResult",
     "TwoWaySensitivityResult",
+    "AnalyticSensitivityResult",
     "run_sensitivity_analysis",
+    # Global Sensitivity Analysis
+    "GlobalSensitivityAnalyzer",
+    "ParameterDistribution",
+    "SobolResult",
+    "run_global_sensitivity",
+    # Surrogate Models
+    "GaussianProcess",
+    "NPCSurrogate",
+    "build_surrogates",
     # Break-even Analysis
     "BreakevenAnalyzer",
     "BreakevenResult",
     "CaseComparisonResult",
+    "DecisionMapResult",
     "run_breakeven_analysis",
     # Paper Figures
     "PaperFigureGenerator",
+    "FigureResult",
     "generate_paper_figures",
+    "ResultsCatalog",
+    "CatalogEntry",
+    # Optimization Service
+    "OptimizationService",
+    "ServiceClient",
+    "create_server",
+    "serve",
+    # Analysis Pipeline
+    "Pipeline",
+    "Stage",
+    "StageResult",
+    # Profiling
+    "profile_stage",
+    "run_profiled",
 ]
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch Evaluator Module - Batched, parallel, cached NPC evaluation.
+
+Evaluates many config variations (dotted-path overrides on a shared base
+config) and shuttle/pump grids. Used by analyses that need thousands of
+optimizer evaluations (global sensitivity, surrogates, case comparison):
+
+- Results are cached by (shuttle, pump, overrides), so repeated points cost
+  nothing across batches.
+- Unique points of a batch are evaluated in a process pool; the base config
+  is sent to each worker once and variations are sent as small override dicts.
+- Each evaluation uses BunkeringOptimizer.evaluate_combination(), which takes
+  the closed-form minimal plan when it is provably optimal and the MILP
+  otherwise.
+
+Usage:
+    from src.batch_evaluator import BatchEvaluator
+    evaluator = BatchEvaluator(config, num_jobs=4)
+    results = evaluator.evaluate_batch(
+        [{"economy.fuel_price_usd_per_ton": p} for p in (500, 600, 700)],
+        shuttle_size=2500, pump_size=500,
+    )
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config_overlay import ConfigOverlay, _freeze
+from .optimizer import BunkeringOptimizer
+
+
+# Worker state (set once per process by _init_worker)
+_WORKER_CONFIG: Optional[Mapping] = None
+
+
+def _init_worker(base_config: Mapping) -> None:
+    """Store the shared base config in a worker process."""
+    global _WORKER_CONFIG
+    _WORKER_CONFIG = base_config
+
+
+def _evaluate_point(
+    base_config: Mapping,
+    shuttle_size: float,
+    pump_size: float,
+    overrides: Mapping[str, Any],
+    method: str
+) -> Tuple[float, float]:
+    """Evaluate one variation; infeasible or failed points give (inf, inf)."""
+    try:
+        optimizer = BunkeringOptimizer(ConfigOverlay(base_config, overrides))
+        result = optimizer.evaluate_combination(shuttle_size, pump_size, method)
+    except (ValueError, KeyError, ZeroDivisionError):
+        result = None
+    if result is None:
+        return float("inf"), float("inf")
+    return result["npc_usdm"], result["lco_usd_per_ton"]
+
+
+def _evaluate_chunk(tasks: List[Tuple[float, float, Dict[str, Any], str]]) -> List[Tuple[float, float]]:
+    """Evaluate a chunk of points in a worker process."""
+    return [_evaluate_point(_WORKER_CONFIG, *task) for task in tasks]
+
+
+class BatchEvaluator:
+    """
+    Cached, optionally parallel evaluator of NPC/LCO for config variations.
+
+    Args:
+        base_config: Base configuration (shared, never modified)
+        num_jobs: Worker processes (default: execution.num_jobs, 1 = serial)
+        method: Evaluation method passed to evaluate_combination()
+            ("auto", "milp" or "closed_form")
+        chunk_size: Points per task sent to a worker
+    """
+
+    def __init__(
+        self,
+        base_config: Mapping,
+        num_jobs: Optional[int] = None,
+        method: str = "auto",
+        chunk_size: int = 256
+    ):
+        self.base_config = base_config
+        if num_jobs is None:
+            num_jobs = base_config.get("execution", {}).get("num_jobs", 1)
+        self.num_jobs = max(1, int(num_jobs))
+        self.method = method
+        self.chunk_size = max(1, int(chunk_size))
+
+        self._cache: Dict[Tuple, Tuple[float, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(shuttle_size: float, pump_size: float, overrides: Mapping[str, Any]) -> Tuple:
+        """Cache key for one evaluation."""
+        return (
+            float(shuttle_size),
+            float(pump_size),
+            tuple(sorted((path, _freeze(value)) for path, value in overrides.items())),
+        )
+
+    def evaluate(
+        self,
+        overrides: Mapping[str, Any],
+        shuttle_size: float,
+        pump_size: float
+    ) -> Tuple[float, float]:
+        """
+        Evaluate a single variation.
+
+        Returns:
+            Tuple of (NPC in USD millions, LCO in USD/ton); inf if infeasible
+        """
+        npc, lco = self.evaluate_batch([overrides], shuttle_size, pump_size)[0]
+        return float(npc), float(lco)
+
+    def evaluate_batch(
+        self,
+        overrides_list: Sequence[Mapping[str, Any]],
+        shuttle_size: float,
+        pump_size: float
+    ) -> np.ndarray:
+        """
+        Evaluate many variations of the base config.
+
+        Args:
+            overrides_list: One dotted-path override mapping per point
+            shuttle_size: Shuttle size in m3
+            pump_size: Pump flow rate in m3/h
+
+        Returns:
+            Array of shape (n, 2) with NPC (USD millions) and LCO (USD/ton)
+            per point; inf for infeasible points
+        """
+        return self._evaluate_points([(shuttle_size, pump_size, ov) for ov in overrides_list])
+
+    def evaluate_grid(
+        self,
+        shuttle_sizes: Sequence[float],
+        pump_sizes: Sequence[float],
+        overrides: Optional[Mapping[str, Any]] = None
+    ) -> np.ndarray:
+        """
+        Evaluate every shuttle/pump combination of one config variation.
+
+        Args:
+            shuttle_sizes: Shuttle sizes in m3
+            pump_sizes: Pump flow rates in m3/h
+            overrides: Dotted-path overrides on the base config (default: none)
+
+        Returns:
+            Array of shape (n_shuttles, n_pumps, 2) with NPC (USD millions)
+            and LCO (USD/ton); inf for infeasible combinations
+        """
+        overrides = overrides or {}
+        points = [(shuttle, pump, overrides) for shuttle in shuttle_sizes for pump in pump_sizes]
+        results = self._evaluate_points(points)
+        return results.reshape(len(shuttle_sizes), len(pump_sizes), 2)
+
+    def _evaluate_points(
+        self,
+        points: Sequence[Tuple[float, float, Mapping[str, Any]]]
+    ) -> np.ndarray:
+        """Evaluate (shuttle, pump, overrides) points through the cache."""
+        keys = [self._key(shuttle, pump, ov) for shuttle, pump, ov in points]
+
+        # Unique uncached points, in first-seen order
+        pending: Dict[Tuple, Tuple[float, float, Dict[str, Any]]] = {}
+        for key, (shuttle, pump, overrides) in zip(keys, points):
+            if key not in self._cache and key not in pending:
+                pending[key] = (shuttle, pump, dict(overrides))
+        self.misses += len(pending)
+        self.hits += len(keys) - len(pending)
+
+        if pending:
+            tasks = [(shuttle, pump, ov, self.method) for shuttle, pump, ov in pending.values()]
+            for key, value in zip(pending, self._run(tasks)):
+                self._cache[key] = value
+
+        results = np.empty((len(keys), 2))
+        for i, key in enumerate(keys):
+            results[i] = self._cache[key]
+        return results
+
+    def _run(self, tasks: List[Tuple[float, float, Dict[str, Any], str]]) -> List[Tuple[float, float]]:
+        """Evaluate tasks serially or in a process pool."""
+        if self.num_jobs == 1 or len(tasks) <= self.chunk_size:
+            return [_evaluate_point(self.base_config, *task) for task in tasks]
+
+        # Plain dict for pickling (overlays would pickle their whole base anyway)
+        base = self.base_config
+        if isinstance(base, ConfigOverlay):
+            base = base.to_dict()
+
+        chunks = [tasks[i:i + self.chunk_size] for i in range(0, len(tasks), self.chunk_size)]
+        results: List[Tuple[float, float]] = []
+        with ProcessPoolExecutor(
+            max_workers=self.num_jobs,
+            initializer=_init_worker,
+            initargs=(base,)
+        ) as executor:
+            for chunk_result in executor.map(_evaluate_chunk, chunks):
+                results.extend(chunk_result)
+        return results
+
+    def cache_info(self) -> Dict[str, int]:
+        """Cache statistics (hits, misses, size)."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
@@ -7,6 +7,8 @@ This module provides:
 - Distance-based break-even analysis (Case 1 vs Case 2)
 - Demand-based break-even analysis
 - Vessel mix-based break-even analysis
+- Optimal-vs-optimal break-even with per-point grid re-optimization
+- Two-parameter decision maps (adaptive quadtree refinement)
 - Cross-case NPC comparison
 
 Key outputs for SCI papers:
@@ -22,13 +24,15 @@ Usage:
 
 import copy
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from .batch_evaluator import BatchEvaluator
 from .optimizer import BunkeringOptimizer
 from .config_loader import load_config
+from .config_overlay import ConfigOverlay, _freeze
 
 
 @dataclass
@@ -45,6 +49,13 @@ class BreakevenResult:
         case1_npcs: NPC values for case 1
         case2_npcs: NPC values for case 2
         case1_better_below: True if case1 is better below breakeven
+        crossings: All crossovers found in the range (ascending)
+        n_evaluations: Number of parameter values evaluated
+        case1_optima: Optimal (shuttle, pump) of case 1 per parameter value
+            (re-optimized searches only)
+        case2_optima: Optimal (shuttle, pump) of case 2 per parameter value
+        pair_evaluations: Shuttle/pump combinations evaluated (re-optimized
+            searches only)
     """
     parameter_name: str
     breakeven_value: Optional[float]
@@ -54,10 +65,15 @@ class BreakevenResult:
     case1_npcs: List[float] = field(default_factory=list)
     case2_npcs: List[float] = field(default_factory=list)
     case1_better_below: bool = True
+    crossings: List[float] = field(default_factory=list)
+    n_evaluations: int = 0
+    case1_optima: List[Tuple[Optional[float], Optional[float]]] = field(default_factory=list)
+    case2_optima: List[Tuple[Optional[float], Optional[float]]] = field(default_factory=list)
+    pair_evaluations: int = 0
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert to DataFrame for export."""
-        return pd.DataFrame({
+        df = pd.DataFrame({
             self.parameter_name: self.param_values,
             f"{self.case1_name}_NPC_USDm": self.case1_npcs,
             f"{self.case2_name}_NPC_USDm": self.case2_npcs,
@@ -65,6 +81,71 @@ class BreakevenResult:
             "Preferred_Case": [self.case1_name if c1 < c2 else self.case2_name
                              for c1, c2 in zip(self.case1_npcs, self.case2_npcs)],
         })
+        for name, optima in ((self.case1_name, self.case1_optima), (self.case2_name, self.case2_optima)):
+            if optima:
+                df[f"{name}_Shuttle_m3"] = [shuttle for shuttle, _ in optima]
+                df[f"{name}_Pump_m3ph"] = [pump for _, pump in optima]
+        return df
+
+
+@dataclass
+class DecisionMapResult:
+    """
+    Result from two-parameter decision boundary mapping.
+
+    Grid arrays are indexed [y, x] over the node grid.
+
+    Attributes:
+        x_parameter: Name of the parameter on the x axis
+        y_parameter: Name of the parameter on the y axis
+        case1_name: Name of first case
+        case2_name: Name of second case
+        x_values: Node values on the x axis
+        y_values: Node values on the y axis
+        preferred: Preferred case per node (1, 2, or 0 if neither is feasible)
+        difference: Case 1 minus Case 2 NPC per node (NaN where not evaluated)
+        evaluated: True where the node was optimized (others were filled)
+        boundary: Boundary polylines, each an array of (x, y) points
+        n_evaluations: Number of grid nodes evaluated
+        n_optimizations: Number of optimizer runs (both cases)
+    """
+    x_parameter: str
+    y_parameter: str
+    case1_name: str
+    case2_name: str
+    x_values: np.ndarray
+    y_values: np.ndarray
+    preferred: np.ndarray
+    difference: np.ndarray
+    evaluated: np.ndarray
+    boundary: List[np.ndarray] = field(default_factory=list)
+    n_evaluations: int = 0
+    n_optimizations: int = 0
+
+    @property
+    def dense_evaluations(self) -> int:
+        """Grid nodes a brute-force map at the same resolution would evaluate."""
+        return len(self.x_values) * len(self.y_values)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the region raster to a long-format DataFrame."""
+        xx, yy = np.meshgrid(self.x_values, self.y_values)
+        names = {0: "None", 1: self.case1_name, 2: self.case2_name}
+        return pd.DataFrame({
+            self.x_parameter: xx.ravel(),
+            self.y_parameter: yy.ravel(),
+            "Preferred_Case": [names[int(p)] for p in self.preferred.ravel()],
+            "Difference_USDm": self.difference.ravel(),
+            "Evaluated": self.evaluated.ravel(),
+        })
+
+    def boundary_dataframe(self) -> pd.DataFrame:
+        """Convert the boundary polylines to a DataFrame (one row per point)."""
+        rows = []
+        for segment_id, line in enumerate(self.boundary):
+            for x, y in line:
+                rows.append({"Segment": segment_id, self.x_parameter: x, self.y_parameter: y})
+        return pd.DataFrame(rows, columns=["Segment", self.x_parameter, self.y_parameter])
 
 
 @dataclass
@@ -99,6 +180,99 @@ class CaseComparisonResult:
         return pd.DataFrame(rows)
 
 
+class _GridOptimum:
+    """
+    Optimal shuttle/pump combination of one case along a varied parameter.
+
+    Every point is a full re-optimization over the case's size grid, made
+    cheap in two ways:
+
+    - Warm start: the optima of the nearest evaluated points are evaluated
+      first, giving a tight incumbent.
+    - Pruning (monotone parameters only): a combination's NPC never drops
+      when the parameter grows, so its NPC (or bound) at a smaller value is a
+      lower bound here. Combinations are tried in ascending bound order and
+      the rest are skipped once the bound reaches the incumbent.
+
+    Args:
+        config: Case configuration
+        monotone: True if NPC is non-decreasing in the parameter for every
+            combination (enables pruning)
+    """
+
+    def __init__(self, config: Dict, monotone: bool):
+        self.config = config
+        self.monotone = monotone
+        self.pairs = [
+            (float(shuttle), float(pump))
+            for shuttle in config["shuttle"]["available_sizes_cbm"]
+            for pump in config["pumps"]["available_flow_rates"]
+        ]
+        # Parameter value -> lower bound (or exact NPC) per combination
+        self._bounds: Dict[float, Dict[Tuple[float, float], float]] = {}
+        self._optima: Dict[float, Optional[Tuple[float, float]]] = {}
+        self._cache: Dict[Tuple, Tuple[float, float, Optional[Tuple[float, float]]]] = {}
+        self.pair_evaluations = 0
+
+    def optimum(
+        self,
+        value: float,
+        overrides: Dict[str, Any]
+    ) -> Tuple[float, float, Optional[Tuple[float, float]]]:
+        """
+        Optimal NPC, LCO and (shuttle, pump) at one parameter value.
+
+        Args:
+            value: Parameter value (orders the points for bounds and warm starts)
+            overrides: Config overrides for this value
+
+        Returns:
+            Tuple of (NPC in USD millions, LCO in USD/ton, (shuttle, pump));
+            (inf, inf, None) if no combination is feasible
+        """
+        key = tuple(sorted((path, _freeze(v)) for path, v in overrides.items()))
+        if key in self._cache:
+            return self._cache[key]
+
+        lower = {pair: -np.inf for pair in self.pairs}
+        if self.monotone:
+            for other, bounds in self._bounds.items():
+                if other <= value:
+                    for pair, bound in bounds.items():
+                        lower[pair] = max(lower[pair], bound)
+
+        # Warm start from the optima of the nearest evaluated points on each side
+        below = [v for v in self._optima if v <= value]
+        above = [v for v in self._optima if v > value]
+        warm = [self._optima[v] for v in (max(below, default=None), min(above, default=None))
+                if v is not None and self._optima[v] is not None]
+        order = list(dict.fromkeys(warm)) + sorted(
+            (pair for pair in self.pairs if pair not in warm), key=lambda pair: lower[pair]
+        )
+
+        optimizer = BunkeringOptimizer(ConfigOverlay(self.config, overrides))
+        best = (float("inf"), float("inf"), None)
+        bounds = dict(lower)
+        for pair in order:
+            if lower[pair] >= best[0]:
+                if pair in warm:
+                    continue
+                break
+            self.pair_evaluations += 1
+            result = optimizer.evaluate_combination(*pair)
+            if result is None:
+                bounds[pair] = np.inf
+                continue
+            bounds[pair] = result["npc_usdm"]
+            if result["npc_usdm"] < best[0]:
+                best = (result["npc_usdm"], result["lco_usd_per_ton"], pair)
+
+        self._bounds[value] = bounds
+        self._optima[value] = best[2]
+        self._cache[key] = best
+        return best
+
+
 class BreakevenAnalyzer:
     """
     Break-even analysis between different cases and configurations.
@@ -108,18 +282,59 @@ class BreakevenAnalyzer:
     - Finds break-even points for key parameters
     - Generates decision boundary data
 
+    Break-even search: a coarse scan of n_points brackets every sign change
+    of the NPC difference, then each bracket is refined with a root finder
+    ("brent" or "illinois") to the requested tolerance in the parameter's
+    own units. method="scan" keeps plain linear interpolation between scan
+    points. More scan points are only needed to detect multiple crossings.
+
+    Solves go through one cached BatchEvaluator per base config, so
+    repeated (config, shuttle, pump) points across analyses are solved once
+    and case grids are evaluated in a single batch.
+
     Args:
         shuttle_size: Fixed shuttle size for analysis (optional)
         pump_size: Fixed pump size for analysis (optional)
+        num_jobs: Worker processes for batched solves
+            (default: execution.num_jobs of each config)
     """
 
     def __init__(
         self,
         shuttle_size: Optional[float] = None,
-        pump_size: Optional[float] = None
+        pump_size: Optional[float] = None,
+        num_jobs: Optional[int] = None
     ):
         self.shuttle_size = shuttle_size
         self.pump_size = pump_size
+        self.num_jobs = num_jobs
+
+        # Shared solve service: evaluator per base config contents (keyed by
+        # the frozen config, as CostTables is) and loaded case configs
+        self._evaluators: Dict[Tuple, BatchEvaluator] = {}
+        self._case_configs: Dict[str, Dict] = {}
+
+    def _load_case(self, case_id: str) -> Dict:
+        """Load a case config once, so its solves share one evaluator cache."""
+        if case_id not in self._case_configs:
+            self._case_configs[case_id] = load_config(case_id)
+        return self._case_configs[case_id]
+
+    def _evaluator(self, config: Dict) -> Tuple[BatchEvaluator, Dict[str, Any]]:
+        """Shared evaluator for a config's base and the overrides on top of it."""
+        if isinstance(config, ConfigOverlay):
+            base, overrides = config.base, config.overrides
+        else:
+            base, overrides = config, {}
+        key = _freeze(base)
+        evaluator = self._evaluators.get(key)
+        if evaluator is None:
+            # Solve a snapshot, so later in-place edits of base cannot leak
+            # into the cached NPCs of these contents
+            snapshot = base.to_dict() if isinstance(base, ConfigOverlay) else copy.deepcopy(base)
+            evaluator = BatchEvaluator(snapshot, num_jobs=self.num_jobs)
+            self._evaluators[key] = evaluator
+        return evaluator, overrides
 
     def _run_optimization(
         self,
@@ -136,19 +351,8 @@ class BreakevenAnalyzer:
         shuttle = shuttle_size or self.shuttle_size or config["shuttle"]["available_sizes_cbm"][0]
         pump = pump_size or self.pump_size or config["pumps"]["available_flow_rates"][0]
 
-        optimizer = BunkeringOptimizer(config)
-        optimizer.shuttle_sizes = [shuttle]
-        optimizer.pump_sizes = [pump]
-
-        scenario_df, yearly_df = optimizer.solve()
-
-        if scenario_df.empty:
-            return float('inf'), float('inf')
-
-        npc = scenario_df['NPC_Total_USDm'].iloc[0]
-        lco = scenario_df.get('LCOAmmonia_USD_per_ton', pd.Series([0])).iloc[0]
-
-        return npc, lco
+        evaluator, overrides = self._evaluator(config)
+        return evaluator.evaluate(overrides, shuttle, pump)
 
     def find_breakeven_distance(
         self,
@@ -156,6 +360,8 @@ class BreakevenAnalyzer:
         case2_config: Dict,
         distance_range: Tuple[float, float] = (10, 100),
         n_points: int = 10,
+        method: str = "brent",
+        tolerance: float = 0.1,
         verbose: bool = True
     ) -> BreakevenResult:
         """
@@ -167,7 +373,9 @@ class BreakevenAnalyzer:
             case1_config: Case 1 configuration (typically with storage)
             case2_config: Case 2 configuration (direct supply)
             distance_range: Range of distances in nautical miles
-            n_points: Number of points to evaluate
+            n_points: Number of coarse scan points (detects multiple crossings)
+            method: "brent", "illinois" or "scan" (linear interpolation only)
+            tolerance: Break-even tolerance in nautical miles
             verbose: Print progress
 
         Returns:
@@ -184,56 +392,34 @@ class BreakevenAnalyzer:
             print(f"Case 2: {case2_name}")
             print(f"Distance range: {distance_range[0]} - {distance_range[1]} nm")
 
-        # Get base travel speed (assume 15 knots if not specified)
-        base_travel_time = case2_config["operations"]["travel_time_hours"]
-        base_distance = case2_config["operations"].get("distance_nm", 86)  # Default Yeosu
-        speed_knots = base_distance / base_travel_time if base_travel_time > 0 else 15.0
-
-        # Generate distance points
-        distances = np.linspace(distance_range[0], distance_range[1], n_points)
-
         # Case 1 NPC (constant - doesn't depend on distance)
         case1_npc, _ = self._run_optimization(case1_config)
-        case1_npcs = [case1_npc] * len(distances)
 
         if verbose:
             print(f"\n{case1_name} NPC (fixed): ${case1_npc:.2f}M")
 
-        # Case 2 NPCs (vary with distance)
-        case2_npcs = []
-
-        for dist in distances:
-            # Calculate travel time for this distance
-            travel_time = dist / speed_knots
-
-            # Modify config
-            modified_config = copy.deepcopy(case2_config)
-            modified_config["operations"]["travel_time_hours"] = travel_time
+        def evaluate(dist: float) -> Tuple[float, float]:
+            # Modify config (Case 2 NPC varies with distance)
+            _, overrides2 = self._case_overrides("distance", dist, case1_config, case2_config)
+            modified_config = ConfigOverlay(case2_config, overrides2)
 
             npc, _ = self._run_optimization(modified_config)
-            case2_npcs.append(npc)
 
             if verbose:
-                print(f"  Distance={dist:.0f}nm (travel={travel_time:.2f}h): ${npc:.2f}M")
-
-        # Find break-even point (where NPCs cross)
-        breakeven_distance = self._find_crossover(distances, case1_npcs, case2_npcs)
+                travel_time = overrides2["operations.travel_time_hours"]
+                print(f"  Distance={dist:.1f}nm (travel={travel_time:.2f}h): ${npc:.2f}M")
+            return case1_npc, npc
 
-        result = BreakevenResult(
-            parameter_name="Distance_nm",
-            breakeven_value=breakeven_distance,
-            case1_name=case1_name,
-            case2_name=case2_name,
-            param_values=list(distances),
-            case1_npcs=case1_npcs,
-            case2_npcs=case2_npcs,
-            case1_better_below=(case1_npc < case2_npcs[0]) if case2_npcs else True,
+        result = self._search_breakeven(
+            evaluate, distance_range, n_points, method, tolerance,
+            parameter_name="Distance_nm", case1_name=case1_name, case2_name=case2_name,
         )
+        breakeven_distance = result.breakeven_value
 
         if verbose:
             print(f"\nBreak-even distance: ", end="")
             if breakeven_distance is not None:
-                print(f"{breakeven_distance:.1f} nm")
+                print(f"{breakeven_distance:.1f} nm ({result.n_evaluations} evaluations)")
                 if result.case1_better_below:
                     print(f"  Below {breakeven_distance:.0f}nm: {case1_name} preferred")
                     print(f"  Above {breakeven_distance:.0f}nm: {case2_name} preferred")
@@ -254,6 +440,8 @@ class BreakevenAnalyzer:
         case2_shuttle_size: float,
         distance_range: Tuple[float, float] = (10, 200),
         n_points: int = 20,
+        method: str = "brent",
+        tolerance: float = 0.1,
         verbose: bool = True
     ) -> BreakevenResult:
         """
@@ -268,7 +456,9 @@ class BreakevenAnalyzer:
             case1_shuttle_size: Shuttle size for Case 1 (e.g., 2500 m3)
             case2_shuttle_size: Shuttle size for Case 2 (e.g., 10000 m3)
             distance_range: Range of distances in nautical miles
-            n_points: Number of points to evaluate
+            n_points: Number of coarse scan points (detects multiple crossings)
+            method: "brent", "illinois" or "scan" (linear interpolation only)
+            tolerance: Break-even tolerance in nautical miles
             verbose: Print progress
 
         Returns:
@@ -285,58 +475,39 @@ class BreakevenAnalyzer:
             print(f"Case 2: {case2_name} (shuttle={case2_shuttle_size} m3)")
             print(f"Distance range: {distance_range[0]} - {distance_range[1]} nm")
 
-        # Get base travel speed from case2 config
-        base_travel_time = case2_config["operations"]["travel_time_hours"]
-        base_distance = case2_config["operations"].get("distance_nm", 86)
-        speed_knots = base_distance / base_travel_time if base_travel_time > 0 else 15.0
-
-        # Generate distance points
-        distances = np.linspace(distance_range[0], distance_range[1], n_points)
-
         # Case 1 NPC (constant - uses its own optimal shuttle size)
         pump = self.pump_size or case1_config["pumps"]["available_flow_rates"][0]
         case1_npc, _ = self._run_optimization(
             case1_config, shuttle_size=case1_shuttle_size, pump_size=pump
         )
-        case1_npcs = [case1_npc] * len(distances)
 
         if verbose:
             print(f"\n{case1_name} NPC (fixed, {case1_shuttle_size} m3): ${case1_npc:.2f}M")
 
-        # Case 2 NPCs (vary with distance, using case2's optimal shuttle)
-        case2_npcs = []
-
-        for dist in distances:
-            travel_time = dist / speed_knots
-            modified_config = copy.deepcopy(case2_config)
-            modified_config["operations"]["travel_time_hours"] = travel_time
+        def evaluate(dist: float) -> Tuple[float, float]:
+            # Case 2 NPC varies with distance, using case2's optimal shuttle
+            _, overrides2 = self._case_overrides("distance", dist, case1_config, case2_config)
+            modified_config = ConfigOverlay(case2_config, overrides2)
 
             npc, _ = self._run_optimization(
                 modified_config, shuttle_size=case2_shuttle_size, pump_size=pump
             )
-            case2_npcs.append(npc)
 
             if verbose:
-                print(f"  Distance={dist:.0f}nm (travel={travel_time:.2f}h): ${npc:.2f}M")
-
-        # Find break-even point
-        breakeven_distance = self._find_crossover(distances, case1_npcs, case2_npcs)
+                travel_time = overrides2["operations.travel_time_hours"]
+                print(f"  Distance={dist:.1f}nm (travel={travel_time:.2f}h): ${npc:.2f}M")
+            return case1_npc, npc
 
-        result = BreakevenResult(
-            parameter_name="Distance_nm",
-            breakeven_value=breakeven_distance,
-            case1_name=case1_name,
-            case2_name=case2_name,
-            param_values=list(distances),
-            case1_npcs=case1_npcs,
-            case2_npcs=case2_npcs,
-            case1_better_below=(case1_npc < case2_npcs[0]) if case2_npcs else True,
+        result = self._search_breakeven(
+            evaluate, distance_range, n_points, method, tolerance,
+            parameter_name="Distance_nm", case1_name=case1_name, case2_name=case2_name,
         )
+        breakeven_distance = result.breakeven_value
 
         if verbose:
             print(f"\nBreak-even distance (optimal-vs-optimal): ", end="")
             if breakeven_distance is not None:
-                print(f"{breakeven_distance:.1f} nm")
+                print(f"{breakeven_distance:.1f} nm ({result.n_evaluations} evaluations)")
             else:
                 print("No crossover in range")
             print("="*60)
@@ -349,6 +520,8 @@ class BreakevenAnalyzer:
         case2_config: Dict,
         demand_range: Tuple[int, int] = (50, 500),
         n_points: int = 10,
+        method: str = "brent",
+        tolerance: float = 1.0,
         verbose: bool = True
     ) -> BreakevenResult:
         """
@@ -358,7 +531,10 @@ class BreakevenAnalyzer:
             case1_config: Case 1 configuration
             case2_config: Case 2 configuration
             demand_range: Range of annual vessel counts
-            n_points: Number of points to evaluate
+            n_points: Number of coarse scan points (detects multiple crossings)
+            method: "brent", "illinois" or "scan" (linear interpolation only)
+            tolerance: Break-even tolerance in vessels (values are rounded to
+                whole vessels, so tolerances below 1 have no effect)
             verbose: Print progress
 
         Returns:
@@ -375,53 +551,32 @@ class BreakevenAnalyzer:
             print(f"Case 2: {case2_name}")
             print(f"Vessel range: {demand_range[0]} - {demand_range[1]} vessels/year")
 
-        # Generate demand points (start vessels in 2030)
-        demands = np.linspace(demand_range[0], demand_range[1], n_points, dtype=int)
-
-        case1_npcs = []
-        case2_npcs = []
-
-        for demand in demands:
-            # Modify configs for this demand level
-            # Keep end_vessels proportional
-            end_factor = case1_config["shipping"]["end_vessels"] / case1_config["shipping"]["start_vessels"]
-
-            modified_config1 = copy.deepcopy(case1_config)
-            modified_config1["shipping"]["start_vessels"] = int(demand)
-            modified_config1["shipping"]["end_vessels"] = int(demand * end_factor)
-
-            modified_config2 = copy.deepcopy(case2_config)
-            modified_config2["shipping"]["start_vessels"] = int(demand)
-            modified_config2["shipping"]["end_vessels"] = int(demand * end_factor)
+        def evaluate(demand: float) -> Tuple[float, float]:
+            # Modify configs for this demand level (start vessels in 2030)
+            demand = int(demand)
+            overrides1, overrides2 = self._case_overrides("demand", demand, case1_config, case2_config)
+            modified_config1 = ConfigOverlay(case1_config, overrides1)
+            modified_config2 = ConfigOverlay(case2_config, overrides2)
 
             npc1, _ = self._run_optimization(modified_config1)
             npc2, _ = self._run_optimization(modified_config2)
 
-            case1_npcs.append(npc1)
-            case2_npcs.append(npc2)
-
             if verbose:
                 better = case1_name if npc1 < npc2 else case2_name
                 print(f"  Vessels={demand}: {case1_name}=${npc1:.2f}M, {case2_name}=${npc2:.2f}M -> {better}")
+            return npc1, npc2
 
-        # Find break-even point
-        breakeven_demand = self._find_crossover(demands, case1_npcs, case2_npcs)
-
-        result = BreakevenResult(
-            parameter_name="Annual_Vessels",
-            breakeven_value=breakeven_demand,
-            case1_name=case1_name,
-            case2_name=case2_name,
-            param_values=list(demands),
-            case1_npcs=case1_npcs,
-            case2_npcs=case2_npcs,
-            case1_better_below=(case1_npcs[0] < case2_npcs[0]) if case1_npcs and case2_npcs else True,
+        result = self._search_breakeven(
+            evaluate, demand_range, n_points, method, max(tolerance, 1.0),
+            parameter_name="Annual_Vessels", case1_name=case1_name, case2_name=case2_name,
+            integer=True,
         )
+        breakeven_demand = result.breakeven_value
 
         if verbose:
             print(f"\nBreak-even demand: ", end="")
             if breakeven_demand is not None:
-                print(f"{breakeven_demand:.0f} vessels/year")
+                print(f"{breakeven_demand:.0f} vessels/year ({result.n_evaluations} evaluations)")
             else:
                 print("No crossover in range")
             print("="*60)
@@ -434,6 +589,8 @@ class BreakevenAnalyzer:
         case2_config: Dict,
         large_share_range: Tuple[float, float] = (0.10, 0.50),
         n_points: int = 9,
+        method: str = "brent",
+        tolerance: float = 0.001,
         verbose: bool = True
     ) -> BreakevenResult:
         """
@@ -445,7 +602,9 @@ class BreakevenAnalyzer:
             case1_config: Case 1 configuration
             case2_config: Case 2 configuration
             large_share_range: Range of large vessel shares (0-1)
-            n_points: Number of points to evaluate
+            n_points: Number of coarse scan points (detects multiple crossings)
+            method: "brent", "illinois" or "scan" (linear interpolation only)
+            tolerance: Break-even tolerance as a share (0.001 = 0.1 pp)
             verbose: Print progress
 
         Returns:
@@ -462,97 +621,593 @@ class BreakevenAnalyzer:
             print(f"Case 2: {case2_name}")
             print(f"Large vessel share range: {large_share_range[0]:.0%} - {large_share_range[1]:.0%}")
 
-        # Vessel type volumes (from stochastic config defaults)
-        small_vol = 1500    # m3
-        medium_vol = 4000   # m3
-        large_vol = 10000   # m3
+        def evaluate(large_share: float) -> Tuple[float, float]:
+            # Modify configs with the mix-weighted bunker volume
+            overrides1, overrides2 = self._case_overrides(
+                "vessel_mix", large_share, case1_config, case2_config
+            )
+            modified_config1 = ConfigOverlay(case1_config, overrides1)
+            modified_config2 = ConfigOverlay(case2_config, overrides2)
 
-        # Generate share points
-        large_shares = np.linspace(large_share_range[0], large_share_range[1], n_points)
+            npc1, _ = self._run_optimization(modified_config1)
+            npc2, _ = self._run_optimization(modified_config2)
 
-        case1_npcs = []
-        case2_npcs = []
+            if verbose:
+                weighted_volume = overrides1["bunkering.bunker_volume_per_call_m3"]
+                print(f"  Large={large_share:.1%} (avg vol={weighted_volume:.0f}m3): "
+                      f"{case1_name}=${npc1:.2f}M, {case2_name}=${npc2:.2f}M")
+            return npc1, npc2
 
-        for large_share in large_shares:
-            # Calculate weighted average bunker volume
-            # Assume: small=30%*(1-large), medium=70%*(1-large), large=large
-            remaining = 1 - large_share
-            small_share = 0.30 * remaining
-            medium_share = 0.70 * remaining
+        result = self._search_breakeven(
+            evaluate, large_share_range, n_points, method, tolerance,
+            parameter_name="Large_Vessel_Share", case1_name=case1_name, case2_name=case2_name,
+        )
+        breakeven_share = result.breakeven_value
 
-            weighted_volume = (
-                small_share * small_vol +
-                medium_share * medium_vol +
-                large_share * large_vol
-            )
+        if verbose:
+            print(f"\nBreak-even large vessel share: ", end="")
+            if breakeven_share is not None:
+                print(f"{breakeven_share:.1%} ({result.n_evaluations} evaluations)")
+            else:
+                print("No crossover in range")
+            print("="*60)
 
-            # Modify configs
-            modified_config1 = copy.deepcopy(case1_config)
-            modified_config1["bunkering"]["bunker_volume_per_call_m3"] = weighted_volume
+        return result
 
-            modified_config2 = copy.deepcopy(case2_config)
-            modified_config2["bunkering"]["bunker_volume_per_call_m3"] = weighted_volume
+    # Parameters for which no combination's NPC decreases as the value grows
+    # (longer cycles, more calls), given a non-negative fuel price
+    MONOTONE_PARAMETERS = ("distance", "demand")
 
-            npc1, _ = self._run_optimization(modified_config1)
-            npc2, _ = self._run_optimization(modified_config2)
+    # Result column names of the named break-even parameters
+    PARAMETER_COLUMNS = {
+        "distance": "Distance_nm",
+        "demand": "Annual_Vessels",
+        "vessel_mix": "Large_Vessel_Share",
+    }
 
-            case1_npcs.append(npc1)
-            case2_npcs.append(npc2)
+    def find_breakeven_reoptimized(
+        self,
+        case1_config: Dict,
+        case2_config: Dict,
+        parameter: str = "distance",
+        value_range: Tuple[float, float] = (10, 200),
+        n_points: int = 3,
+        method: str = "brent",
+        tolerance: float = 0.1,
+        verbose: bool = True
+    ) -> BreakevenResult:
+        """
+        Break-even between the optimal configurations of two cases.
 
-            if verbose:
-                print(f"  Large={large_share:.0%} (avg vol={weighted_volume:.0f}m3): "
-                      f"{case1_name}=${npc1:.2f}M, {case2_name}=${npc2:.2f}M")
+        Unlike find_breakeven_distance (one shuttle for both cases) and
+        find_breakeven_distance_heterogeneous (sizes fixed up front), each
+        case is re-optimized over its full shuttle/pump grid at every
+        evaluated point, so the optimal sizes may change along the curve.
+        Warm starts and bound pruning (see _GridOptimum) keep the number of
+        combination evaluations well below a full grid per point.
 
-        # Find break-even point
-        breakeven_share = self._find_crossover(large_shares, case1_npcs, case2_npcs)
+        Args:
+            case1_config: Case 1 configuration
+            case2_config: Case 2 configuration
+            parameter: "distance", "demand", "vessel_mix" or a config path
+            value_range: (min, max) parameter range
+            n_points: Number of coarse scan points
+            method: "brent", "illinois" or "scan"
+            tolerance: Break-even tolerance in parameter units
+            verbose: Print progress
 
-        result = BreakevenResult(
-            parameter_name="Large_Vessel_Share",
-            breakeven_value=breakeven_share,
-            case1_name=case1_name,
-            case2_name=case2_name,
-            param_values=list(large_shares),
-            case1_npcs=case1_npcs,
-            case2_npcs=case2_npcs,
-            case1_better_below=(case1_npcs[0] < case2_npcs[0]) if case1_npcs and case2_npcs else True,
+        Returns:
+            BreakevenResult with the optimal (shuttle, pump) per evaluated value
+        """
+        case1_name = case1_config.get("case_name", "Case 1")
+        case2_name = case2_config.get("case_name", "Case 2")
+
+        searches = {}
+        for case, config in ((1, case1_config), (2, case2_config)):
+            monotone = (
+                parameter in self.MONOTONE_PARAMETERS
+                and config["economy"]["fuel_price_usd_per_ton"] >= 0
+            )
+            searches[case] = _GridOptimum(config, monotone)
+
+        if verbose:
+            print("\n" + "="*60)
+            print(f"Break-even {parameter} Analysis (re-optimized per point)")
+            print("="*60)
+            print(f"Case 1: {case1_name} ({len(searches[1].pairs)} combinations)")
+            print(f"Case 2: {case2_name} ({len(searches[2].pairs)} combinations)")
+            print(f"Range: {value_range[0]} - {value_range[1]}")
+
+        optima: Dict[float, Tuple] = {}
+
+        def evaluate(x: float) -> Tuple[float, float]:
+            overrides1, overrides2 = self._case_overrides(parameter, x, case1_config, case2_config)
+            npc1, _, pair1 = searches[1].optimum(x, overrides1)
+            npc2, _, pair2 = searches[2].optimum(x, overrides2)
+            optima[x] = (pair1, pair2)
+
+            if verbose:
+                print(f"  {parameter}={x:.3f}: {case1_name} ${npc1:.2f}M {pair1}, "
+                      f"{case2_name} ${npc2:.2f}M {pair2}")
+            return npc1, npc2
+
+        result = self._search_breakeven(
+            evaluate, value_range, n_points, method, tolerance,
+            parameter_name=self.PARAMETER_COLUMNS.get(parameter, parameter),
+            case1_name=case1_name, case2_name=case2_name,
+            integer=(parameter == "demand"),
         )
 
+        empty = (None, None)
+        result.case1_optima = [optima[x][0] or empty for x in result.param_values]
+        result.case2_optima = [optima[x][1] or empty for x in result.param_values]
+        result.pair_evaluations = searches[1].pair_evaluations + searches[2].pair_evaluations
+
         if verbose:
-            print(f"\nBreak-even large vessel share: ", end="")
-            if breakeven_share is not None:
-                print(f"{breakeven_share:.0%}")
+            dense = result.n_evaluations * (len(searches[1].pairs) + len(searches[2].pairs))
+            print(f"\nBreak-even {parameter}: ", end="")
+            if result.breakeven_value is not None:
+                print(f"{result.breakeven_value:.3f}")
             else:
                 print("No crossover in range")
+            print(f"[OK] {result.pair_evaluations} of {dense} combination evaluations "
+                  f"({result.n_evaluations} points)")
             print("="*60)
 
         return result
 
-    def _find_crossover(
+    def map_decision_boundary(
         self,
+        case1_config: Dict,
+        case2_config: Dict,
+        x_parameter: str = "distance",
+        x_range: Tuple[float, float] = (10, 100),
+        y_parameter: str = "demand",
+        y_range: Tuple[float, float] = (20, 100),
+        resolution: int = 64,
+        initial_cells: int = 4,
+        case1_shuttle_size: Optional[float] = None,
+        case2_shuttle_size: Optional[float] = None,
+        pump_size: Optional[float] = None,
+        case1_name: str = "Case 1",
+        case2_name: str = "Case 2",
+        verbose: bool = True
+    ) -> DecisionMapResult:
+        """
+        Map which case is preferred over two parameters by quadtree refinement.
+
+        Starts from an initial_cells x initial_cells grid and splits a cell
+        only when its corners disagree on the preferred case; cells with
+        agreeing corners are filled without further optimization. Cells are
+        split down to the final resolution, where the boundary is traced by
+        interpolating the NPC difference along cell edges. Features smaller
+        than an initial cell that do not touch any of its corners are not
+        resolved, so initial_cells sets the coarsest scale that is trusted.
+
+        Args:
+            case1_config: Case 1 configuration
+            case2_config: Case 2 configuration
+            x_parameter: "distance", "demand", "vessel_mix" or a config path
+            x_range: (min, max) on the x axis
+            y_parameter: "distance", "demand", "vessel_mix" or a config path
+            y_range: (min, max) on the y axis
+            resolution: Final cells per axis (initial_cells times a power of two)
+            initial_cells: Coarse cells per axis evaluated up front
+            case1_shuttle_size: Shuttle size for Case 1 (default: analyzer setting)
+            case2_shuttle_size: Shuttle size for Case 2 (default: analyzer setting)
+            pump_size: Pump flow rate (default: analyzer setting)
+            case1_name: Name of first case
+            case2_name: Name of second case
+            verbose: Print progress
+
+        Returns:
+            DecisionMapResult with the region raster and boundary polylines
+        """
+        if initial_cells < 1 or resolution < initial_cells or resolution % initial_cells:
+            raise ValueError("resolution must be initial_cells times a power of two")
+        step = resolution // initial_cells
+        if step & (step - 1):
+            raise ValueError("resolution must be initial_cells times a power of two")
+
+        if verbose:
+            print(f"\n{'='*60}")
+            print(f"Decision Map: {case1_name} vs {case2_name}")
+            print(f"{x_parameter} {x_range} x {y_parameter} {y_range}, {resolution}x{resolution} cells")
+            print(f"{'='*60}")
+
+        x_values = np.linspace(x_range[0], x_range[1], resolution + 1)
+        y_values = np.linspace(y_range[0], y_range[1], resolution + 1)
+        shape = (resolution + 1, resolution + 1)
+        preferred = np.zeros(shape, dtype=int)
+        difference = np.full(shape, np.nan)
+        evaluated = np.zeros(shape, dtype=bool)
+
+        # Per-case NPC cache (a case unaffected by one axis is optimized once per value of the other)
+        npc_cache: Dict[Tuple, float] = {}
+
+        def case_npc(case: int, overrides: Dict[str, Any]) -> float:
+            key = (case, tuple(sorted((path, _freeze(value)) for path, value in overrides.items())))
+            if key not in npc_cache:
+                config = case1_config if case == 1 else case2_config
+                shuttle = case1_shuttle_size if case == 1 else case2_shuttle_size
+                npc_cache[key], _ = self._run_optimization(
+                    ConfigOverlay(config, overrides) if overrides else config,
+                    shuttle_size=shuttle, pump_size=pump_size
+                )
+            return npc_cache[key]
+
+        def winner(i: int, j: int) -> int:
+            if not evaluated[j, i]:
+                x1, x2 = self._case_overrides(x_parameter, float(x_values[i]), case1_config, case2_config)
+                y1, y2 = self._case_overrides(y_parameter, float(y_values[j]), case1_config, case2_config)
+                npc1 = case_npc(1, {**x1, **y1})
+                npc2 = case_npc(2, {**x2, **y2})
+                if np.isinf(npc1) and np.isinf(npc2):
+                    preferred[j, i] = 0
+                else:
+                    preferred[j, i] = 1 if npc1 < npc2 else 2
+                    difference[j, i] = npc1 - npc2
+                evaluated[j, i] = True
+            return int(preferred[j, i])
+
+        # Refine cells (i0, j0, size) in node-index units
+        boundary_cells = []
+        cells = [(i * step, j * step, step) for j in range(initial_cells) for i in range(initial_cells)]
+        while cells:
+            i0, j0, size = cells.pop()
+            corners = {
+                winner(i0, j0), winner(i0 + size, j0),
+                winner(i0, j0 + size), winner(i0 + size, j0 + size),
+            }
+            if len(corners) == 1:
+                block = np.s_[j0:j0 + size + 1, i0:i0 + size + 1]
+                preferred[block] = np.where(evaluated[block], preferred[block], corners.pop())
+            elif size == 1:
+                boundary_cells.append((i0, j0))
+            else:
+                half = size // 2
+                cells.extend([
+                    (i0, j0, half), (i0 + half, j0, half),
+                    (i0, j0 + half, half), (i0 + half, j0 + half, half),
+                ])
+
+        boundary = self._trace_boundary(boundary_cells, x_values, y_values, preferred, difference)
+
+        result = DecisionMapResult(
+            x_parameter=x_parameter,
+            y_parameter=y_parameter,
+            case1_name=case1_name,
+            case2_name=case2_name,
+            x_values=x_values,
+            y_values=y_values,
+            preferred=preferred,
+            difference=difference,
+            evaluated=evaluated,
+            boundary=boundary,
+            n_evaluations=int(evaluated.sum()),
+            n_optimizations=len(npc_cache),
+        )
+
+        if verbose:
+            share = result.n_evaluations / result.dense_evaluations * 100
+            print(f"[OK] Evaluated {result.n_evaluations} of {result.dense_evaluations} grid nodes "
+                  f"({share:.1f}%), {result.n_optimizations} optimizations, "
+                  f"{len(boundary)} boundary segment(s)")
+
+        return result
+
+    @staticmethod
+    def _trace_boundary(
+        boundary_cells: List[Tuple[int, int]],
         x_values: np.ndarray,
-        y1_values: List[float],
-        y2_values: List[float]
-    ) -> Optional[float]:
-        """Find where two curves cross using linear interpolation."""
-        x = np.array(x_values)
-        y1 = np.array(y1_values)
-        y2 = np.array(y2_values)
-
-        # Calculate difference
-        diff = y1 - y2
-
-        # Look for sign change
-        for i in range(len(diff) - 1):
-            if diff[i] * diff[i + 1] < 0:
-                # Linear interpolation to find crossover
-                x0, x1 = x[i], x[i + 1]
-                d0, d1 = diff[i], diff[i + 1]
-
-                # x_cross where diff = 0
-                x_cross = x0 - d0 * (x1 - x0) / (d1 - d0)
-                return float(x_cross)
-
-        return None
+        y_values: np.ndarray,
+        preferred: np.ndarray,
+        difference: np.ndarray
+    ) -> List[np.ndarray]:
+        """
+        Trace boundary polylines through finest-level cells with mixed corners.
+
+        Each cell edge whose end nodes prefer different cases gets one
+        crossing point (linear interpolation of the NPC difference, midpoint
+        if either end is infeasible); the crossings of a cell are joined into
+        segments by class transition (a cell where three classes meet joins
+        its three boundaries at a junction point) and segments sharing an edge
+        or junction are chained into polylines.
+        """
+        points: Dict[Tuple, Tuple[float, float]] = {}
+
+        def crossing(a: Tuple[int, int], b: Tuple[int, int]) -> Optional[Tuple]:
+            (ia, ja), (ib, jb) = a, b
+            if preferred[ja, ia] == preferred[jb, ib]:
+                return None
+            key = (a, b)
+            if key not in points:
+                da, db = difference[ja, ia], difference[jb, ib]
+                t = da / (da - db) if np.isfinite(da) and np.isfinite(db) and da != db else 0.5
+                points[key] = (
+                    float(x_values[ia] + t * (x_values[ib] - x_values[ia])),
+                    float(y_values[ja] + t * (y_values[jb] - y_values[ja])),
+                )
+            return key
+
+        segments = []
+        for i, j in boundary_cells:
+            # Edges in counter-clockwise order: bottom, right, top, left
+            edges = [
+                ((i, j), (i + 1, j)), ((i + 1, j), (i + 1, j + 1)),
+                ((i, j + 1), (i + 1, j + 1)), ((i, j), (i, j + 1)),
+            ]
+            keys = [k for k in (crossing(a, b) for a, b in edges) if k is not None]
+            # Pair crossings of the same class transition, since a cell can mix
+            # infeasible nodes with both cases (consecutive crossings of one
+            # transition pair up, so saddle cells give two segments)
+            transitions: Dict[frozenset, List[Tuple]] = {}
+            for key in keys:
+                (ia, ja), (ib, jb) = key
+                transitions.setdefault(frozenset((preferred[ja, ia], preferred[jb, ib])), []).append(key)
+            unpaired = []
+            for group in transitions.values():
+                for k in range(0, len(group) - 1, 2):
+                    segments.append((group[k], group[k + 1]))
+                if len(group) % 2:
+                    unpaired.append(group[-1])
+            if len(unpaired) > 1:
+                # Three regions meet in the cell: join their boundaries at a junction
+                junction = ("junction", i, j)
+                points[junction] = tuple(float(v) for v in np.mean([points[k] for k in unpaired], axis=0))
+                segments.extend((key, junction) for key in unpaired)
+
+        adjacency: Dict[Tuple, List[int]] = {}
+        for idx, (a, b) in enumerate(segments):
+            adjacency.setdefault(a, []).append(idx)
+            adjacency.setdefault(b, []).append(idx)
+
+        # Open polylines start at dangling ends; what remains are closed loops
+        starts = [key for key, segs in adjacency.items() if len(segs) == 1] + list(adjacency)
+        used = set()
+        polylines = []
+        for start in starts:
+            for idx in adjacency[start]:
+                if idx in used:
+                    continue
+                chain, current, seg = [start], start, idx
+                while seg is not None:
+                    used.add(seg)
+                    a, b = segments[seg]
+                    current = b if a == current else a
+                    chain.append(current)
+                    seg = next((s for s in adjacency[current] if s not in used), None)
+                polylines.append(np.array([points[key] for key in chain]))
+
+        return polylines
+
+    @staticmethod
+    def _case_overrides(
+        axis: str,
+        value: float,
+        case1_config: Dict,
+        case2_config: Dict
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Config overrides for one break-even parameter value, per case.
+
+        Args:
+            axis: "distance" (nm, Case 2 travel time only), "demand" (start
+                vessels, end vessels kept proportional), "vessel_mix" (large
+                vessel share -> weighted bunker volume) or a config path
+                applied to both cases
+            value: Parameter value
+            case1_config: Case 1 configuration
+            case2_config: Case 2 configuration
+
+        Returns:
+            Tuple of (case 1 overrides, case 2 overrides)
+        """
+        if axis == "distance":
+            # Get base travel speed (assume 15 knots if not specified)
+            base_travel_time = case2_config["operations"]["travel_time_hours"]
+            base_distance = case2_config["operations"].get("distance_nm", 86)  # Default Yeosu
+            speed_knots = base_distance / base_travel_time if base_travel_time > 0 else 15.0
+            return {}, {"operations.travel_time_hours": value / speed_knots}
+
+        if axis == "demand":
+            # Keep end_vessels proportional
+            end_factor = case1_config["shipping"]["end_vessels"] / case1_config["shipping"]["start_vessels"]
+            overrides = {
+                "shipping.start_vessels": int(value),
+                "shipping.end_vessels": int(int(value) * end_factor),
+            }
+            return overrides, dict(overrides)
+
+        if axis == "vessel_mix":
+            # Vessel type volumes (from stochastic config defaults)
+            small_vol = 1500    # m3
+            medium_vol = 4000   # m3
+            large_vol = 10000   # m3
+
+            # Assume: small=30%*(1-large), medium=70%*(1-large), large=large
+            remaining = 1 - value
+            weighted_volume = (
+                0.30 * remaining * small_vol +
+                0.70 * remaining * medium_vol +
+                value * large_vol
+            )
+            overrides = {"bunkering.bunker_volume_per_call_m3": weighted_volume}
+            return overrides, dict(overrides)
+
+        return {axis: value}, {axis: value}
+
+    def _search_breakeven(
+        self,
+        evaluate: Callable[[float], Tuple[float, float]],
+        value_range: Tuple[float, float],
+        n_points: int,
+        method: str,
+        tolerance: float,
+        parameter_name: str,
+        case1_name: str,
+        case2_name: str,
+        integer: bool = False
+    ) -> BreakevenResult:
+        """
+        Coarse scan plus root finding on the NPC difference.
+
+        Args:
+            evaluate: Function mapping a parameter value to (case1 NPC, case2 NPC)
+            value_range: (low, high) parameter range
+            n_points: Coarse scan points (at least the two endpoints)
+            method: "brent", "illinois" or "scan"
+            tolerance: Crossover tolerance in parameter units
+            parameter_name: Column name for the parameter
+            case1_name: Name of first case
+            case2_name: Name of second case
+            integer: Round parameter values to integers before evaluating
+
+        Returns:
+            BreakevenResult with all evaluated points (sorted) and crossings
+        """
+        if method not in ("brent", "illinois", "scan"):
+            raise ValueError(f"Unknown break-even method: {method}")
+
+        evaluated: Dict[float, Tuple[float, float]] = {}
+
+        def difference(x: float) -> float:
+            if integer:
+                x = float(round(x))
+            if x not in evaluated:
+                evaluated[x] = evaluate(x)
+            npc1, npc2 = evaluated[x]
+            return npc1 - npc2
+
+        grid = np.linspace(value_range[0], value_range[1], max(2, n_points))
+        if integer:
+            grid = np.unique(np.round(grid))
+        diffs = [difference(float(x)) for x in grid]
+
+        crossings = []
+        for i in range(len(grid) - 1):
+            x0, x1, d0, d1 = float(grid[i]), float(grid[i + 1]), diffs[i], diffs[i + 1]
+            if d0 == 0:
+                crossings.append(x0)
+            elif d0 * d1 < 0:
+                if method == "scan":
+                    crossings.append(self._interpolate_crossing(x0, x1, d0, d1))
+                else:
+                    crossings.append(self._find_root(difference, x0, x1, d0, d1, tolerance, method))
+        if diffs and diffs[-1] == 0:
+            crossings.append(float(grid[-1]))
+
+        values = sorted(evaluated)
+        case1_npcs = [evaluated[x][0] for x in values]
+        case2_npcs = [evaluated[x][1] for x in values]
+
+        return BreakevenResult(
+            parameter_name=parameter_name,
+            breakeven_value=crossings[0] if crossings else None,
+            case1_name=case1_name,
+            case2_name=case2_name,
+            param_values=values,
+            case1_npcs=case1_npcs,
+            case2_npcs=case2_npcs,
+            case1_better_below=(case1_npcs[0] < case2_npcs[0]) if values else True,
+            crossings=crossings,
+            n_evaluations=len(values),
+        )
+
+    @staticmethod
+    def _interpolate_crossing(x0: float, x1: float, d0: float, d1: float) -> float:
+        """Linear interpolation of the zero of the difference between two points."""
+        if not (np.isfinite(d0) and np.isfinite(d1)):
+            return 0.5 * (x0 + x1)
+        return x0 - d0 * (x1 - x0) / (d1 - d0)
+
+    def _find_root(
+        self,
+        func: Callable[[float], float],
+        a: float,
+        b: float,
+        fa: float,
+        fb: float,
+        tolerance: float,
+        method: str = "brent",
+        max_iter: int = 100
+    ) -> float:
+        """
+        Refine a bracketed sign change of func to the given tolerance.
+
+        NPC differences are piecewise smooth with jumps where a fleet grows by
+        one shuttle; both methods keep a bracket, so they converge to the
+        zero or to the jump that changes the sign. Non-finite values
+        (infeasible points) fall back to bisection.
+
+        Args:
+            func: Function of the parameter (NPC difference)
+            a, b: Bracket with func(a) * func(b) < 0
+            fa, fb: func(a), func(b)
+            tolerance: Stop when the bracket is narrower than this
+            method: "brent" (Brent-Dekker) or "illinois" (modified regula falsi)
+            max_iter: Iteration limit
+
+        Returns:
+            Crossover estimate within tolerance of a sign change
+        """
+        if method == "illinois":
+            for _ in range(max_iter):
+                if abs(b - a) <= tolerance:
+                    break
+                if np.isfinite(fa) and np.isfinite(fb):
+                    x = (a * fb - b * fa) / (fb - fa)
+                else:
+                    x = 0.5 * (a + b)
+                fx = func(x)
+                if fx == 0:
+                    return x
+                if fx * fb < 0:
+                    a, fa = b, fb
+                else:
+                    # Retained endpoint: halve its value (Illinois step)
+                    fa *= 0.5
+                b, fb = x, fx
+            return self._interpolate_crossing(a, b, fa, fb)
+
+        # Brent-Dekker (inverse quadratic interpolation / secant / bisection)
+        c, fc = b, fb
+        d = e = b - a
+        for _ in range(max_iter):
+            if (fb > 0 and fc > 0) or (fb < 0 and fc < 0):
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+            tol1 = 2.0 * np.finfo(float).eps * abs(b) + 0.5 * tolerance
+            xm = 0.5 * (c - b)
+            if abs(xm) <= tol1 or fb == 0:
+                break
+            finite = np.isfinite(fa) and np.isfinite(fb) and np.isfinite(fc)
+            if finite and abs(e) >= tol1 and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    p = 2.0 * xm * s
+                    q = 1.0 - s
+                else:
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                    q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = xm
+            else:
+                d = e = xm
+            a, fa = b, fb
+            b += d if abs(d) > tol1 else np.copysign(tol1, xm)
+            fb = func(b)
+        return self._interpolate_crossing(b, c, fb, fc) if fb != 0 else b
 
     def compare_all_cases(
         self,
@@ -564,10 +1219,14 @@ class BreakevenAnalyzer:
         """
         Compare NPC across multiple cases.
 
+        Each case's shuttle x pump grid is solved in one batch through the
+        shared evaluator, so combinations already solved by this analyzer
+        are not solved again.
+
         Args:
             case_ids: List of case IDs to compare (default: all 3 cases)
-            shuttle_sizes: Shuttle sizes to test (default: from config)
-            pump_sizes: Pump sizes to test (default: from config)
+            shuttle_sizes: Shuttle sizes to test (default: each case's full list)
+            pump_sizes: Pump sizes to test (default: each case's full list)
             verbose: Print progress
 
         Returns:
@@ -588,7 +1247,7 @@ class BreakevenAnalyzer:
         # Load configs
         for case_id in case_ids:
             try:
-                configs[case_id] = load_config(case_id)
+                configs[case_id] = self._load_case(case_id)
             except Exception as e:
                 if verbose:
                     print(f"  [WARN] Could not load {case_id}: {e}")
@@ -596,46 +1255,42 @@ class BreakevenAnalyzer:
         if not configs:
             return result
 
-        # Use first config for shuttle/pump lists
-        first_config = list(configs.values())[0]
-
-        if shuttle_sizes is None:
-            shuttle_sizes = first_config["shuttle"]["available_sizes_cbm"][:3]  # Top 3
-        if pump_sizes is None:
-            pump_sizes = first_config["pumps"]["available_flow_rates"][:3]  # Top 3
-
-        result.shuttle_sizes = list(shuttle_sizes)
-        result.pump_sizes = list(pump_sizes)
+        grids = {
+            case_id: (
+                list(shuttle_sizes if shuttle_sizes is not None else config["shuttle"]["available_sizes_cbm"]),
+                list(pump_sizes if pump_sizes is not None else config["pumps"]["available_flow_rates"]),
+            )
+            for case_id, config in configs.items()
+        }
+        result.shuttle_sizes = sorted({s for shuttles, _ in grids.values() for s in shuttles})
+        result.pump_sizes = sorted({p for _, pumps in grids.values() for p in pumps})
 
-        # Run optimizations
+        # Run optimizations (one batch per case)
         for case_id, config in configs.items():
+            shuttles, pumps = grids[case_id]
+            evaluator, overrides = self._evaluator(config)
+            values = evaluator.evaluate_grid(shuttles, pumps, overrides)
+
             if verbose:
-                print(f"\n{case_id}:")
+                print(f"\n{case_id}: {len(shuttles)} x {len(pumps)} combinations")
 
-            best_npc = float('inf')
             best_config = {}
+            for i, shuttle in enumerate(shuttles):
+                for j, pump in enumerate(pumps):
+                    npc, lco = float(values[i, j, 0]), float(values[i, j, 1])
+                    result.npc_matrix[(case_id, shuttle, pump)] = npc
+
+                    if npc < best_config.get("npc", float('inf')):
+                        best_config = {
+                            "shuttle_size": shuttle,
+                            "pump_size": pump,
+                            "npc": npc,
+                            "lco": lco,
+                        }
 
-            for shuttle in shuttle_sizes:
-                for pump in pump_sizes:
-                    try:
-                        npc, lco = self._run_optimization(config, shuttle, pump)
-                        result.npc_matrix[(case_id, shuttle, pump)] = npc
-
-                        if npc < best_npc:
-                            best_npc = npc
-                            best_config = {
-                                "shuttle_size": shuttle,
-                                "pump_size": pump,
-                                "npc": npc,
-                                "lco": lco,
-                            }
-
-                        if verbose:
-                            print(f"  Shuttle={shuttle}, Pump={pump}: ${npc:.2f}M")
-
-                    except Exception as e:
-                        if verbose:
-                            print(f"  Shuttle={shuttle}, Pump={pump}: Failed - {e}")
+            if verbose:
+                feasible = int(np.isfinite(values[:, :, 0]).sum())
+                print(f"  Feasible: {feasible}/{len(shuttles) * len(pumps)}")
 
             result.optimal_by_case[case_id] = best_config
 
@@ -668,8 +1323,8 @@ class BreakevenAnalyzer:
         Returns:
             Dict with all analysis results
         """
-        case1_config = load_config(case1_id)
-        case2_config = load_config(case2_id)
+        case1_config = self._load_case(case1_id)
+        case2_config = self._load_case(case2_id)
 
         results = {}
 
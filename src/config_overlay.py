@@ -0,0 +1,225 @@
+"""
+Copy-on-write configuration overlays.
+
+A ConfigOverlay is a read-only view that layers dotted-path overrides
+(e.g. "economy.fuel_price_usd_per_ton") over an immutable base configuration
+dictionary. Sensitivity, break-even and stochastic analyses create one overlay
+per variation instead of deep-copying the full merged config, so each variation
+costs O(overrides) regardless of the size of the SFOC/MCR maps, pump lists and
+execution section.
+
+Overlays behave like nested dictionaries for reading (config["a"]["b"],
+config.get("a", {})), hash cheaply and compare by (base identity, overrides),
+which makes them usable as cache keys.
+
+Usage:
+    from src.config_overlay import ConfigOverlay
+    variant = ConfigOverlay(base_config, {"economy.fuel_price_usd_per_ton": 720.0})
+    optimizer = BunkeringOptimizer(variant)
+"""
+
+import copy
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts/lists into hashable tuples."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _set_path(target: Dict, path: str, value: Any) -> None:
+    """Set value in a plain nested dict using dot notation, creating levels."""
+    keys = path.split(".")
+    d = target
+    for key in keys[:-1]:
+        if key not in d or not isinstance(d[key], dict):
+            d[key] = {}
+        d = d[key]
+    d[keys[-1]] = value
+
+
+class ConfigOverlay(Mapping):
+    """
+    Read-only configuration view with dotted-path overrides.
+
+    The base mapping is shared, never copied and never modified. Sub-trees
+    without overrides are returned as the original base objects; sub-trees
+    containing overrides are returned as nested ConfigOverlay views.
+
+    Args:
+        base: Base configuration (plain dict or another ConfigOverlay)
+        overrides: Mapping of dotted config paths to replacement values
+    """
+
+    __slots__ = ("_base", "_overrides", "_by_key", "_views", "_hash")
+
+    def __init__(self, base: Mapping, overrides: Optional[Mapping[str, Any]] = None):
+        # Stack overlays flat: an overlay of an overlay shares the root base
+        if isinstance(base, ConfigOverlay):
+            merged = dict(base._overrides)
+            base = base._base
+        else:
+            merged = {}
+
+        for path, value in (overrides or {}).items():
+            self._apply(merged, path, value)
+
+        self._base = base
+        self._overrides = merged
+        self._hash = None
+        self._views: Dict[str, Any] = {}
+
+        # Group overrides by top-level key for O(1) lookups
+        # None marks an override of the top-level key itself
+        self._by_key: Dict[str, Dict[Optional[str], Any]] = {}
+        for path, value in merged.items():
+            head, _, rest = path.partition(".")
+            self._by_key.setdefault(head, {})[rest or None] = value
+
+    @staticmethod
+    def _apply(overrides: Dict[str, Any], path: str, value: Any) -> None:
+        """Insert one override, keeping the override set non-overlapping."""
+        if not path:
+            raise ValueError("Override path must be non-empty")
+
+        # A shorter path replaces every override beneath it
+        prefix = path + "."
+        for existing in [p for p in overrides if p.startswith(prefix)]:
+            del overrides[existing]
+
+        # A longer path below an existing override edits a copy of that value
+        for existing in list(overrides):
+            if path.startswith(existing + "."):
+                parent = overrides[existing]
+                if not isinstance(parent, Mapping):
+                    raise TypeError(
+                        f"Cannot override '{path}': '{existing}' is overridden "
+                        f"with a non-mapping value"
+                    )
+                parent = copy.deepcopy(dict(parent))
+                _set_path(parent, path[len(existing) + 1:], value)
+                overrides[existing] = parent
+                return
+
+        overrides[path] = value
+
+    # ========== MAPPING PROTOCOL ==========
+
+    def __getitem__(self, key: str) -> Any:
+        entries = self._by_key.get(key)
+        if entries is None:
+            return self._base[key]
+
+        if None in entries:
+            return entries[None]
+
+        view = self._views.get(key)
+        if view is None:
+            base_value = self._base.get(key, {})
+            if not isinstance(base_value, Mapping):
+                raise TypeError(
+                    f"Cannot apply overrides below '{key}': base value is not a mapping"
+                )
+            view = ConfigOverlay(base_value, entries)
+            self._views[key] = view
+        return view
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        for key in self._by_key:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._base) + sum(1 for key in self._by_key if key not in self._base)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._by_key or key in self._base
+
+    # ========== HASHING / EQUALITY ==========
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            frozen = tuple(sorted((p, _freeze(v)) for p, v in self._overrides.items()))
+            self._hash = hash((id(self._base), frozen))
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ConfigOverlay):
+            return self._base is other._base and self._overrides == other._overrides
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self) -> str:
+        return f"ConfigOverlay(overrides={self._overrides!r})"
+
+    # ========== OVERLAY API ==========
+
+    @property
+    def base(self) -> Mapping:
+        """Underlying (shared) base configuration."""
+        return self._base
+
+    @property
+    def overrides(self) -> Dict[str, Any]:
+        """Copy of the dotted-path overrides applied by this overlay."""
+        return dict(self._overrides)
+
+    def with_overrides(self, overrides: Mapping[str, Any]) -> "ConfigOverlay":
+        """
+        Return a new overlay with additional overrides on the same base.
+
+        Args:
+            overrides: Mapping of dotted config paths to replacement values
+
+        Returns:
+            New ConfigOverlay (this overlay is unchanged)
+        """
+        return ConfigOverlay(self, overrides)
+
+    def get_path(self, path: str, default: Any = None) -> Any:
+        """
+        Get value using dot notation.
+
+        Args:
+            path: Dotted config path (e.g., "operations.travel_time_hours")
+            default: Value returned when the path does not exist
+
+        Returns:
+            Value at path, or default
+        """
+        value: Any = self
+        for key in path.split("."):
+            if isinstance(value, Mapping) and key in value:
+                value = value[key]
+            else:
+                return default
+        return value
+
+    def copy(self) -> Dict[str, Any]:
+        """Shallow plain-dict copy (dict API compatibility)."""
+        return dict(self.items())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Materialize the overlay into an independent plain nested dict.
+
+        Returns:
+            Deep copy of the base with all overrides applied
+        """
+        result = copy.deepcopy(dict(self._base))
+        for path, value in self._overrides.items():
+            _set_path(result, path, copy.deepcopy(value))
+        return result
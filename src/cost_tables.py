@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cost Tables Module - Precomputed cost and cycle-time arrays per config.
+
+The optimizer, the yearly simulation and the verifier all need the same
+per-size quantities (shuttle CAPEX, pump power, bunkering CAPEX, fuel cost
+coefficients, cycle-time breakdowns, the annuity factor). CostTables
+computes them once for a configuration's shuttle x pump grid and serves
+them as arrays indexed by shuttle size and pump rate.
+
+- Tables are cached per config fingerprint (the frozen config contents),
+  so a mutated config or a different overlay gets its own table.
+- Values are identical to the scalar CostCalculator / CycleTimeCalculator
+  results; combinations outside the configured grid are calculated on
+  demand (index() returns None for them).
+- CostTables.invalidate() drops cached tables explicitly (one config or all).
+
+Usage:
+    from src.cost_tables import CostTables
+    tables = CostTables.for_config(config)
+    i, j = tables.index(2500, 500)
+    capex = tables.bunkering_capex[i, j]
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .config_overlay import _freeze
+from .cost_calculator import CostCalculator
+from .cycle_time_calculator import CycleTimeCalculator
+from .utils import interpolate_mcr, interpolate_sfoc, calculate_vessel_growth
+
+
+# Fingerprint -> CostTables (least recently used first)
+_TABLE_CACHE: "OrderedDict[Any, CostTables]" = OrderedDict()
+_TABLE_CACHE_SIZE = 32
+_TABLE_LOCK = threading.Lock()
+
+
+def config_fingerprint(config: Mapping) -> Any:
+    """Hashable fingerprint of a configuration's contents."""
+    return _freeze(config)
+
+
+class CostTables:
+    """
+    Cost and cycle-time arrays for one configuration.
+
+    Arrays are indexed [shuttle] for per-shuttle quantities, [pump] for
+    per-pump quantities and [shuttle, pump] for combinations, following
+    shuttle.available_sizes_cbm and pumps.available_flow_rates.
+
+    Args:
+        config: Configuration dictionary or ConfigOverlay
+    """
+
+    def __init__(self, config: Mapping):
+        self.config = config
+        self.fingerprint = config_fingerprint(config)
+
+        cost_calc = CostCalculator(config)
+        shuttle_sizes = list(config["shuttle"]["available_sizes_cbm"])
+        pump_sizes = list(config["pumps"]["available_flow_rates"])
+        self.shuttle_sizes = np.asarray(shuttle_sizes, dtype=float)
+        self.pump_sizes = np.asarray(pump_sizes, dtype=float)
+        self._shuttle_index = {float(s): i for i, s in enumerate(shuttle_sizes)}
+        self._pump_index = {float(p): j for j, p in enumerate(pump_sizes)}
+
+        # Per-shuttle quantities (scalar calculator calls, once per size)
+        sfoc_default = config["propulsion"]["sfoc_g_per_kwh"]
+        mcr_map = interpolate_mcr(config["shuttle"].get("mcr_map_kw", {}), shuttle_sizes)
+        sfoc_map = interpolate_sfoc(config.get("sfoc_map_g_per_kwh", {}), shuttle_sizes, sfoc_default)
+        self.mcr = np.array([mcr_map.get(int(s), 0) for s in shuttle_sizes], dtype=float)
+        self.sfoc = np.array([sfoc_map.get(int(s), sfoc_default) for s in shuttle_sizes], dtype=float)
+        self.shuttle_capex = np.array([cost_calc.calculate_shuttle_capex(s) for s in shuttle_sizes])
+        self.shuttle_fixed_opex = np.array([cost_calc.calculate_shuttle_fixed_opex(s) for s in shuttle_sizes])
+        self.shuttle_equipment_cost = np.array(
+            [cost_calc.calculate_shuttle_equipment_cost(s) for s in shuttle_sizes]
+        )
+
+        # Per-pump quantities
+        self.pump_power = np.array([cost_calc.calculate_pump_power(p) for p in pump_sizes])
+        self.pump_capex = np.array([cost_calc.calculate_pump_capex(p) for p in pump_sizes])
+
+        # Shuttle x pump quantities (same operations as the scalar methods)
+        self.bunkering_capex = self.shuttle_equipment_cost[:, None] + self.pump_capex[None, :]
+        self.bunkering_fixed_opex = self.bunkering_capex * config["bunkering"]["fixed_opex_ratio"]
+
+        # Fuel cost coefficients as used by the optimizer
+        has_storage = config["operations"].get("has_storage_at_busan", True)
+        travel_factor = 1.0 if has_storage else 2.0
+        travel_time = config["operations"]["travel_time_hours"]
+        fuel_price = config["economy"]["fuel_price_usd_per_ton"]
+        bunker_volume = config["bunkering"]["bunker_volume_per_call_m3"]
+        self.shuttle_fuel_cost_per_cycle = (
+            (self.mcr * self.sfoc * travel_factor * travel_time) / 1e6 * fuel_price
+        )
+        pumping_time_per_call = bunker_volume / self.pump_sizes
+        self.pump_fuel_cost_per_call = (
+            (self.pump_power[None, :] * pumping_time_per_call[None, :] * self.sfoc[:, None]) / 1e6
+            * fuel_price
+        )
+
+        # Cycle-time breakdown over the grid
+        self._cost_calc = cost_calc
+        self._cycle_calc = CycleTimeCalculator(config.get("case_id", "case_1"), config)
+        self.cycles = self._contended(self._cycle_calc.calculate_cycles(shuttle_sizes, pump_sizes))
+
+        # Site-level costs (zero when the component is disabled)
+        if config["tank_storage"]["enabled"]:
+            self.tank_capex = cost_calc.calculate_tank_capex()
+            self.tank_fixed_opex = cost_calc.calculate_tank_fixed_opex()
+            self.tank_variable_opex = cost_calc.calculate_tank_variable_opex()
+            self.tank_volume_m3 = cost_calc.calculate_tank_volume_m3()
+        else:
+            self.tank_capex = self.tank_fixed_opex = self.tank_variable_opex = 0.0
+            self.tank_volume_m3 = 0.0
+        if config["shore_supply"].get("enabled", False):
+            self.shore_pump_capex = cost_calc.calculate_shore_pump_capex()
+            self.shore_pump_fixed_opex = cost_calc.calculate_shore_pump_fixed_opex()
+            self.shore_pump_variable_opex_per_hr = cost_calc.calculate_shore_pump_variable_opex_per_hour()
+        else:
+            self.shore_pump_capex = self.shore_pump_fixed_opex = 0.0
+            self.shore_pump_variable_opex_per_hr = 0.0
+
+        self.annuity_factor = cost_calc.get_annuity_factor()
+
+        self._cycle_info_cache: Dict[Tuple[int, int], Dict] = {}
+
+    # ========== CACHE ==========
+
+    @classmethod
+    def for_config(cls, config: Mapping) -> "CostTables":
+        """
+        Get the (cached) tables for a configuration.
+
+        Args:
+            config: Configuration dictionary or ConfigOverlay
+
+        Returns:
+            CostTables shared by every caller with identical config contents
+        """
+        key = config_fingerprint(config)
+        with _TABLE_LOCK:
+            tables = _TABLE_CACHE.get(key)
+            if tables is not None:
+                _TABLE_CACHE.move_to_end(key)
+                return tables
+
+        tables = cls(config)
+        with _TABLE_LOCK:
+            _TABLE_CACHE[key] = tables
+            while len(_TABLE_CACHE) > _TABLE_CACHE_SIZE:
+                _TABLE_CACHE.popitem(last=False)
+        return tables
+
+    @staticmethod
+    def invalidate(config: Optional[Mapping] = None) -> int:
+        """
+        Drop cached tables.
+
+        Args:
+            config: Drop only the tables for this configuration's contents;
+                    None drops every cached table
+
+        Returns:
+            Number of tables removed
+        """
+        with _TABLE_LOCK:
+            if config is None:
+                removed = len(_TABLE_CACHE)
+                _TABLE_CACHE.clear()
+                return removed
+            return 1 if _TABLE_CACHE.pop(config_fingerprint(config), None) is not None else 0
+
+    @staticmethod
+    def cached_count() -> int:
+        """Number of tables currently cached."""
+        with _TABLE_LOCK:
+            return len(_TABLE_CACHE)
+
+    # ========== LOOKUP ==========
+
+    def index(self, shuttle_size: float, pump_size: float) -> Optional[Tuple[int, int]]:
+        """
+        Grid indices of a combination.
+
+        Returns:
+            (shuttle index, pump index), or None if either size is not in
+            the configured grid
+        """
+        i = self._shuttle_index.get(float(shuttle_size))
+        j = self._pump_index.get(float(pump_size))
+        if i is None or j is None:
+            return None
+        return i, j
+
+    def cycle_info(self, shuttle_size: float, pump_size: float) -> Dict:
+        """
+        Cycle-time breakdown in CycleTimeCalculator.calculate_single_cycle() form.
+
+        Uses the default vessels per trip (one for Case 1, full calls per
+        shuttle for direct supply). Combinations outside the grid are
+        calculated directly. With shore_supply.loading_arms set, the cycle
+        includes the expected shore loading wait at the design fleet.
+
+        Returns:
+            Dict with the calculate_single_cycle() keys
+        """
+        idx = self.index(shuttle_size, pump_size)
+        if idx is None:
+            num_vessels = int(self._cycle_calc.vessels_per_trip(shuttle_size))
+            if self._cycle_calc.shore_supply.loading_arms is None:
+                return self._cycle_calc.calculate_single_cycle(shuttle_size, pump_size, num_vessels)
+            cycles = self._contended(
+                self._cycle_calc.calculate_cycles([shuttle_size], [pump_size], num_vessels=[num_vessels])
+            )
+            return self._cycle_entry(cycles, (0, 0))
+
+        info = self._cycle_info_cache.get(idx)
+        if info is None:
+            info = self._cycle_entry(self.cycles, idx)
+            self._cycle_info_cache[idx] = info
+        # Callers may annotate the dict; hand out a copy
+        return dict(info)
+
+    @staticmethod
+    def _cycle_entry(cycles: Dict, idx: Tuple[int, int]) -> Dict:
+        """One combination of a calculate_cycles() result as scalars."""
+        return {
+            key: (value[idx].item() if isinstance(value, np.ndarray) else value)
+            for key, value in cycles.items()
+            if key not in ("shuttle_size_m3", "pump_size_m3ph")
+        }
+
+    def _contended(self, cycles: Dict) -> Dict:
+        """Cycles with the shore loading wait of the peak-year fleet."""
+        if self._cycle_calc.shore_supply.loading_arms is None:
+            return cycles
+        shipping = self.config["shipping"]
+        time_period = self.config["time_period"]
+        vessels = calculate_vessel_growth(
+            time_period["start_year"], time_period["end_year"],
+            shipping["start_vessels"], shipping["end_vessels"]
+        )
+        peak_calls = max(vessels.values()) * shipping["voyages_per_year"]
+        return self._cycle_calc.apply_shore_contention(
+            cycles, peak_calls, self.config["operations"]["max_annual_hours_per_vessel"]
+        )
+
+    def component_costs(self, shuttle_size: float, pump_size: float) -> Dict[str, float]:
+        """
+        Per-unit cost components of a combination.
+
+        Combinations outside the grid are calculated with CostCalculator.
+
+        Returns:
+            Dict with shuttle_capex, shuttle_fixed_opex, bunkering_capex,
+            bunkering_fixed_opex (USD) and pump_power (kW)
+        """
+        idx = self.index(shuttle_size, pump_size)
+        if idx is None:
+            cost_calc = self._cost_calc
+            return {
+                "shuttle_capex": cost_calc.calculate_shuttle_capex(shuttle_size),
+                "shuttle_fixed_opex": cost_calc.calculate_shuttle_fixed_opex(shuttle_size),
+                "bunkering_capex": cost_calc.calculate_bunkering_capex(shuttle_size, pump_size),
+                "bunkering_fixed_opex": cost_calc.calculate_bunkering_fixed_opex(shuttle_size, pump_size),
+                "pump_power": cost_calc.calculate_pump_power(pump_size),
+            }
+        i, j = idx
+        return {
+            "shuttle_capex": float(self.shuttle_capex[i]),
+            "shuttle_fixed_opex": float(self.shuttle_fixed_opex[i]),
+            "bunkering_capex": float(self.bunkering_capex[i, j]),
+            "bunkering_fixed_opex": float(self.bunkering_fixed_opex[i, j]),
+            "pump_power": float(self.pump_power[j]),
+        }
+
+    # ========== ANNUALIZATION ==========
+
+    def calculate_annualized_capex_yearly(self, asset_value: float) -> float:
+        """Annualized CAPEX (same as CostCalculator, with the cached annuity factor)."""
+        return asset_value / self.annuity_factor if self.annuity_factor > 0 else 0.0
+
+    def annualize_scenario_npc(self, npc_total: float) -> float:
+        """Annualized cost of an NPC (same as CostCalculator, with the cached annuity factor)."""
+        return npc_total / self.annuity_factor
@@ -15,6 +15,10 @@ Handles time structure calculations for all cases, including:
 """
 
 from typing import Dict, Optional
+
+import numpy as np
+
+from .shore_supply import ShoreSupply
 from .shuttle_round_trip_calculator import ShuttleRoundTripCalculator
 
 
@@ -28,8 +32,12 @@ class CycleTimeCalculator:
     - Case 3: Production-based (Yeosu) long-distance
     """
 
-    # Fixed shore supply pump rate (m³/h)
-    SHORE_PUMP_RATE_M3PH = 700.0
+    # Default shore supply pump rate (m³/h); the configured rate is
+    # shore_supply.pump_rate_m3ph (see ShoreSupply)
+    SHORE_PUMP_RATE_M3PH = ShoreSupply.STANDARD_PUMP_RATE_M3PH
+
+    # Calendar hours the shore terminal is open per year
+    TERMINAL_HOURS_PER_YEAR = 8760.0
 
     def __init__(self, case_type: str, config: Dict):
         """
@@ -57,8 +65,6 @@ class CycleTimeCalculator:
             setup_time_hours=self.setup_time_hours
         )
 
-        # Import ShoreSupply here to avoid circular imports
-        from .shore_supply import ShoreSupply
         self.shore_supply = ShoreSupply(config)
 
     def calculate_single_cycle(
@@ -130,6 +136,7 @@ class CycleTimeCalculator:
         return {
             # Individual time components (hours)
             'shore_loading': shore_loading,
+            'shore_wait': 0.0,
             'travel_outbound': shuttle_cycle['travel_outbound_h'],
             'travel_return': shuttle_cycle['travel_return_h'],
             'port_entry': shuttle_cycle['port_entry_h'],
@@ -160,6 +167,171 @@ class CycleTimeCalculator:
             'has_storage_at_busan': self.has_storage_at_busan,
         }
 
+    def vessels_per_trip(self, shuttle_size_m3):
+        """
+        Default number of vessels served per trip (scalar or array).
+
+        Case 1 serves one vessel per trip; direct-supply cases serve as many
+        full calls as fit in the shuttle (at least one).
+        """
+        if self.has_storage_at_busan:
+            return np.ones_like(np.asarray(shuttle_size_m3, dtype=float))
+        calls = np.floor_divide(np.asarray(shuttle_size_m3, dtype=float), self.bunker_volume_per_call_m3)
+        return np.maximum(1.0, calls)
+
+    def calculate_cycles(
+        self,
+        shuttle_sizes,
+        pump_sizes,
+        num_vessels=None,
+        as_dataframe: bool = False
+    ):
+        """
+        Vectorized calculate_single_cycle() over a shuttle x pump grid.
+
+        Evaluates the full Cartesian grid in one NumPy pass. Each element is
+        identical to calculate_single_cycle(shuttle, pump, num_vessels).
+
+        Args:
+            shuttle_sizes: Shuttle capacities in m³ (1-D)
+            pump_sizes: Bunkering pump flow rates in m³/h (1-D)
+            num_vessels: Vessels per trip - an int, an array with one value
+                per shuttle size, or None for vessels_per_trip()
+            as_dataframe: Return a long DataFrame (one row per combination)
+                instead of a dict of arrays
+
+        Returns:
+            Dict with the keys of calculate_single_cycle() plus
+            'shuttle_size_m3' and 'pump_size_m3ph'; numeric entries are
+            arrays of shape (len(shuttle_sizes), len(pump_sizes)).
+            With as_dataframe=True, a DataFrame with one column per key.
+        """
+        shuttle = np.asarray(shuttle_sizes, dtype=float).reshape(-1, 1)
+        pump = np.asarray(pump_sizes, dtype=float).reshape(1, -1)
+        if num_vessels is None:
+            vessels = self.vessels_per_trip(shuttle)
+        else:
+            vessels = np.asarray(num_vessels, dtype=float)
+            if vessels.ndim == 1:
+                vessels = vessels.reshape(-1, 1)
+
+        shuttle_cycle = self.shuttle_calculator.calculate_batch(
+            shuttle_size_m3=shuttle,
+            pump_size_m3ph=pump,
+            bunker_volume_per_call_m3=self.bunker_volume_per_call_m3,
+            num_vessels=vessels,
+            is_round_trip=True,
+            has_storage_at_busan=self.has_storage_at_busan
+        )
+        shuttle_grid = shuttle_cycle['shuttle_size_m3']
+
+        shore_loading = self.shore_supply.load_shuttle(shuttle_grid)
+        basic_cycle = shuttle_cycle['basic_cycle_duration_h']
+        cycle_duration = shore_loading + basic_cycle
+        trips_per_call = shuttle_cycle['trips_per_call']
+        call_duration = trips_per_call * cycle_duration
+
+        with np.errstate(divide="ignore"):
+            annual_cycles = np.where(cycle_duration > 0, 8000.0 / cycle_duration, 0.0)
+        annual_supply_m3 = annual_cycles * shuttle_grid
+        ships_per_year = annual_supply_m3 / self.bunker_volume_per_call_m3
+
+        cycles = {
+            'shuttle_size_m3': shuttle_grid,
+            'pump_size_m3ph': shuttle_cycle['pump_size_m3ph'],
+            'shore_loading': shore_loading,
+            'shore_wait': np.zeros_like(shore_loading),
+            'travel_outbound': shuttle_cycle['travel_outbound_h'],
+            'travel_return': shuttle_cycle['travel_return_h'],
+            'port_entry': shuttle_cycle['port_entry_h'],
+            'port_exit': shuttle_cycle['port_exit_h'],
+            'movement_per_vessel': shuttle_cycle['movement_per_vessel_h'],
+            'movement_total': shuttle_cycle['movement_total_h'],
+            'setup_inbound': shuttle_cycle['setup_inbound_h'],
+            'setup_outbound': shuttle_cycle['setup_outbound_h'],
+            'pumping_per_vessel': shuttle_cycle['pumping_per_vessel_h'],
+            'pumping_total': shuttle_cycle['pumping_total_h'],
+            'basic_cycle_duration': basic_cycle,
+            'cycle_duration': cycle_duration,
+            'call_duration': call_duration,
+            'trips_per_call': trips_per_call,
+            'vessels_per_trip': shuttle_cycle['vessels_per_trip'],
+            'annual_cycles': annual_cycles,
+            'annual_supply_m3': annual_supply_m3,
+            'ships_per_year': ships_per_year,
+            'case_type': self.case_type,
+            'has_storage_at_busan': self.has_storage_at_busan,
+        }
+
+        if not as_dataframe:
+            return cycles
+
+        import pandas as pd
+        return pd.DataFrame({
+            key: value.ravel() if isinstance(value, np.ndarray) else value
+            for key, value in cycles.items()
+        })
+
+    def apply_shore_contention(self, cycles: Dict, annual_calls: float, max_annual_hours: float) -> Dict:
+        """
+        Add the expected shore loading wait to a calculate_cycles() result.
+
+        Without shore_supply.loading_arms the cycles are returned unchanged.
+        Otherwise the wait is evaluated at each combination's design fleet:
+        the smallest fleet that covers annual_calls within max_annual_hours
+        per shuttle once its own loading wait is added (the fleet only grows
+        over the horizon, so this is the largest wait the plan meets). The
+        fixed point is found by iterating over fleet sizes for the whole
+        grid at once. Combinations whose trips exceed the arms' annual
+        loading capacity get an infinite wait.
+
+        Args:
+            cycles: Result of calculate_cycles()
+            annual_calls: Design (peak) annual vessel calls
+            max_annual_hours: Working hours per shuttle and year
+
+        Returns:
+            New dict with 'shore_wait' and 'design_fleet' set and the
+            cycle-derived entries recomputed
+        """
+        shore = self.shore_supply
+        if shore.loading_arms is None:
+            return cycles
+
+        shuttle = cycles['shuttle_size_m3']
+        base_cycle = cycles['shore_loading'] + cycles['basic_cycle_duration']
+        trips_per_call = cycles['trips_per_call']
+        trips = annual_calls * trips_per_call
+        busy_fraction = max_annual_hours / self.TERMINAL_HOURS_PER_YEAR
+        saturated = trips * cycles['shore_loading'] >= shore.loading_arms * self.TERMINAL_HOURS_PER_YEAR
+
+        fleet = np.maximum(np.ceil(trips * base_cycle / max_annual_hours - 1e-9), 1.0)
+        wait = np.zeros_like(base_cycle)
+        for _ in range(1000):
+            wait = shore.fleet_loading_wait(fleet, shuttle, base_cycle, busy_fraction)
+            need = np.maximum(np.ceil(trips * (base_cycle + wait) / max_annual_hours - 1e-9), 1.0)
+            grow = (need > fleet) & ~saturated
+            if not grow.any():
+                break
+            fleet = np.where(grow, need, fleet)
+        wait = np.where(saturated, np.inf, wait)
+
+        cycle_duration = base_cycle + wait
+        with np.errstate(divide="ignore"):
+            annual_cycles = np.where(cycle_duration > 0, 8000.0 / cycle_duration, 0.0)
+        annual_supply_m3 = annual_cycles * shuttle
+
+        contended = dict(cycles)
+        contended.update({
+            'shore_wait': wait,
+            'design_fleet': np.where(saturated, np.nan, fleet),
+            'cycle_duration': cycle_duration,
+            'call_duration': trips_per_call * cycle_duration,
+            'annual_cycles': annual_cycles,
+            'annual_supply_m3': annual_supply_m3,
+            'ships_per_year': annual_supply_m3 / self.bunker_volume_per_call_m3,
+        })
+        return contended
 
     def calculate_shore_loading_time(self, shuttle_size_m3: float) -> float:
         """
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Event Trace Module - Streaming call-level trace of operations simulations.
+
+A 21-year simulation at 500 vessels x 12 voyages produces over a million
+call records per replication, too many to hold as Python rows. Records are
+instead buffered in a fixed-size NumPy record array (CALL_DTYPE) and
+flushed chunk by chunk:
+
+- "parquet": one row group per chunk (pyarrow)
+- "arrow": Arrow IPC file, one record batch per chunk (pyarrow)
+- "npy": directory of part-NNNNN.npy chunk files (NumPy only)
+- "auto": parquet when pyarrow is installed, else npy
+
+read_trace() iterates a trace chunk by chunk in any of these formats, and
+TraceKPIAggregator computes the per-year KPIs of simulate_operations()
+incrementally from such chunks, with memory independent of trace length
+(wait percentiles from log-spaced histograms, 1% relative resolution).
+
+Usage:
+    from src.event_trace import TraceWriter, TraceKPIAggregator, read_trace
+    with TraceWriter("results/trace.parquet") as trace:
+        simulate_operations(config, yearly_df, 2500, 500, seed=42, trace=trace)
+    kpis = TraceKPIAggregator(wait_target_hours=12.0)
+    for chunk in read_trace("results/trace.parquet"):
+        kpis.consume(chunk)
+    df = kpis.to_dataframe()
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .operations_simulation import HOURS_PER_YEAR
+
+
+# One record per vessel call
+CALL_DTYPE = np.dtype([
+    ("year", np.int32),
+    ("call", np.int32),
+    ("arrival_h", np.float64),
+    ("volume_m3", np.float64),
+    ("wait_h", np.float64),
+    ("turnaround_h", np.float64),
+])
+
+TRACE_FORMATS = ("auto", "parquet", "arrow", "npy")
+
+
+def _require_pyarrow(fmt: str):
+    """Import pyarrow for the parquet/arrow formats."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            f"Trace format '{fmt}' requires pyarrow (pip install pyarrow); use format='npy' instead"
+        ) from None
+    return pyarrow
+
+
+def _resolve_format(path: Path, fmt: str) -> str:
+    """Pick the concrete format for "auto" (suffix, then pyarrow availability)."""
+    if fmt not in TRACE_FORMATS:
+        raise ValueError(f"Unknown trace format '{fmt}' (expected one of {TRACE_FORMATS})")
+    if fmt != "auto":
+        return fmt
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return "parquet"
+    if suffix in (".arrow", ".feather", ".ipc"):
+        return "arrow"
+    if not suffix and path.is_dir():
+        return "npy"
+    try:
+        import pyarrow  # noqa: F401
+        return "parquet"
+    except ImportError:
+        return "npy"
+
+
+class TraceWriter:
+    """
+    Buffered writer of call records to a chunked columnar file.
+
+    Args:
+        path: Output file (parquet/arrow) or directory (npy)
+        format: "auto", "parquet", "arrow" or "npy"
+        chunk_rows: Records per flushed chunk (buffer size)
+        dtype: Record dtype (default: CALL_DTYPE)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        format: str = "auto",
+        chunk_rows: int = 65536,
+        dtype: np.dtype = CALL_DTYPE
+    ):
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be positive, got {chunk_rows}")
+        self.path = Path(path)
+        self.format = _resolve_format(self.path, format)
+        self.dtype = np.dtype(dtype)
+        self.chunk_rows = int(chunk_rows)
+        self.rows = 0
+        self.chunks = 0
+
+        self._buffer = np.empty(self.chunk_rows, dtype=self.dtype)
+        self._filled = 0
+        self._writer = None
+        self._closed = False
+
+        if self.format == "npy":
+            self.path.mkdir(parents=True, exist_ok=True)
+            for stale in self.path.glob("part-*.npy"):
+                stale.unlink()
+        else:
+            pa = _require_pyarrow(self.format)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._schema = pa.schema([(name, pa.from_numpy_dtype(self.dtype[name])) for name in self.dtype.names])
+
+    def append(self, records: Optional[np.ndarray] = None, **columns) -> None:
+        """
+        Add records, given as a record array or as equally long column arrays.
+
+        Args:
+            records: Structured array with this writer's dtype
+            **columns: One array (or scalar) per field; missing fields are 0
+        """
+        if self._closed:
+            raise ValueError(f"Trace {self.path} is closed")
+        if records is None:
+            lengths = [np.size(value) for value in columns.values() if np.ndim(value)]
+            records = np.zeros(max(lengths, default=1), dtype=self.dtype)
+            for name, value in columns.items():
+                records[name] = value
+        elif records.dtype != self.dtype:
+            raise ValueError(f"Record dtype {records.dtype} does not match trace dtype {self.dtype}")
+
+        start = 0
+        while start < len(records):
+            take = min(self.chunk_rows - self._filled, len(records) - start)
+            self._buffer[self._filled:self._filled + take] = records[start:start + take]
+            self._filled += take
+            start += take
+            if self._filled == self.chunk_rows:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered records as one chunk."""
+        if not self._filled:
+            return
+        chunk = self._buffer[:self._filled]
+        if self.format == "npy":
+            np.save(self.path / f"part-{self.chunks:05d}.npy", chunk)
+        else:
+            self._write_arrow(chunk)
+        self.rows += self._filled
+        self.chunks += 1
+        self._filled = 0
+
+    def _write_arrow(self, chunk: np.ndarray) -> None:
+        """Write one chunk as a parquet row group or an IPC record batch."""
+        pa = _require_pyarrow(self.format)
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(chunk[name]) for name in self.dtype.names], schema=self._schema
+        )
+        if self._writer is None:
+            if self.format == "parquet":
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(str(self.path), self._schema)
+            else:
+                import pyarrow.ipc as ipc
+                self._writer = ipc.new_file(str(self.path), self._schema)
+        if self.format == "parquet":
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        """Flush the remaining records and close the file."""
+        if self._closed:
+            return
+        self.flush()
+        if self.format != "npy":
+            if self._writer is None:
+                # Empty trace: still write a readable file with the schema
+                self._write_arrow(self._buffer[:0])
+            self._writer.close()
+            self._writer = None
+        self._closed = True
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def read_trace(
+    path: Union[str, Path],
+    format: str = "auto",
+    dtype: np.dtype = CALL_DTYPE
+) -> Iterator[np.ndarray]:
+    """
+    Iterate a trace written by TraceWriter chunk by chunk.
+
+    Args:
+        path: Trace file or directory
+        format: "auto", "parquet", "arrow" or "npy"
+        dtype: Record dtype of the yielded chunks
+
+    Yields:
+        Structured arrays of records, one per stored chunk
+    """
+    path = Path(path)
+    fmt = _resolve_format(path, format)
+    dtype = np.dtype(dtype)
+
+    if fmt == "npy":
+        for part in sorted(path.glob("part-*.npy")):
+            yield np.load(part)
+        return
+
+    _require_pyarrow(fmt)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        source = pq.ParquetFile(str(path))
+        batches = (source.read_row_group(i) for i in range(source.num_row_groups))
+    else:
+        import pyarrow.ipc as ipc
+        source = ipc.open_file(str(path))
+        batches = (source.get_batch(i) for i in range(source.num_record_batches))
+    for batch in batches:
+        chunk = np.empty(batch.num_rows, dtype=dtype)
+        for name in dtype.names:
+            chunk[name] = batch.column(name).to_numpy()
+        yield chunk
+
+
+class TraceKPIAggregator:
+    """
+    Per-year call KPIs accumulated from trace chunks.
+
+    Sums, maxima and log-spaced wait histograms per year; percentiles are
+    accurate to the histogram's relative resolution.
+
+    Args:
+        wait_target_hours: Adds a Service_Level column for this target
+        resolution: Relative width of the wait histogram bins
+        min_wait_hours: Waits up to this value share the first bin
+    """
+
+    def __init__(
+        self,
+        wait_target_hours: Optional[float] = None,
+        resolution: float = 0.01,
+        min_wait_hours: float = 0.01
+    ):
+        if resolution <= 0 or min_wait_hours <= 0:
+            raise ValueError("resolution and min_wait_hours must be positive")
+        self.wait_target_hours = wait_target_hours
+        self.min_wait_hours = float(min_wait_hours)
+        self._log_growth = np.log1p(resolution)
+        self._years: Dict[int, Dict[str, float]] = {}
+        self._histograms: Dict[int, np.ndarray] = {}
+
+    def _bins(self, waits: np.ndarray) -> np.ndarray:
+        """Histogram bin of each wait (0 = at most min_wait_hours)."""
+        with np.errstate(divide="ignore"):
+            scaled = np.log(np.maximum(waits, self.min_wait_hours) / self.min_wait_hours)
+        return np.ceil(scaled / self._log_growth).astype(np.int64)
+
+    def consume(self, chunk: np.ndarray) -> None:
+        """Add a chunk of call records."""
+        if not len(chunk):
+            return
+        order = np.argsort(chunk["year"], kind="stable")
+        years, starts = np.unique(chunk["year"][order], return_index=True)
+        for year, rows in zip(years.tolist(), np.split(order, starts[1:])):
+            waits = chunk["wait_h"][rows]
+            turnaround = chunk["turnaround_h"][rows]
+            totals = self._years.setdefault(year, {
+                "calls": 0, "wait": 0.0, "max_wait": 0.0, "turnaround": 0.0,
+                "completed": 0, "on_target": 0,
+            })
+            totals["calls"] += len(rows)
+            totals["wait"] += float(waits.sum())
+            totals["max_wait"] = max(totals["max_wait"], float(waits.max()))
+            totals["turnaround"] += float(turnaround.sum())
+            totals["completed"] += int(np.count_nonzero(chunk["arrival_h"][rows] + turnaround <= HOURS_PER_YEAR))
+            if self.wait_target_hours is not None:
+                totals["on_target"] += int(np.count_nonzero(waits <= self.wait_target_hours))
+
+            counts = np.bincount(self._bins(waits))
+            histogram = self._histograms.get(year, np.zeros(0, dtype=np.int64))
+            if len(counts) > len(histogram):
+                histogram = np.pad(histogram, (0, len(counts) - len(histogram)))
+            histogram[:len(counts)] += counts
+            self._histograms[year] = histogram
+
+    def consume_all(self, chunks: Sequence[np.ndarray]) -> "TraceKPIAggregator":
+        """Add every chunk of an iterable (e.g. read_trace()); returns self."""
+        for chunk in chunks:
+            self.consume(chunk)
+        return self
+
+    def wait_quantile(self, year: int, q: float) -> float:
+        """Approximate wait quantile of one year (geometric bin center)."""
+        histogram = self._histograms[year]
+        rank = q * (histogram.sum() - 1)
+        index = int(np.searchsorted(np.cumsum(histogram), rank, side="right"))
+        if index == 0:
+            return min(self.min_wait_hours, self._years[year]["max_wait"])
+        center = self.min_wait_hours * np.exp((index - 0.5) * self._log_growth)
+        return float(min(center, self._years[year]["max_wait"]))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Per-year KPI table (columns as in OperationsSimulationResult.to_dataframe).
+
+        Returns:
+            DataFrame with one row per year
+        """
+        rows = []
+        for year in sorted(self._years):
+            totals = self._years[year]
+            calls = totals["calls"]
+            row = {
+                "Year": year,
+                "Calls": calls,
+                "Mean_Wait_Hours": totals["wait"] / calls,
+                "P95_Wait_Hours": self.wait_quantile(year, 0.95),
+                "Max_Wait_Hours": totals["max_wait"],
+                "Mean_Turnaround_Hours": totals["turnaround"] / calls,
+                "Completed_In_Year": totals["completed"] / calls,
+            }
+            if self.wait_target_hours is not None:
+                row["Service_Level"] = totals["on_target"] / calls
+            rows.append(row)
+        return pd.DataFrame(rows)
@@ -4,10 +4,12 @@ Creates multi-sheet workbook with scenario summary and yearly results.
 """
 
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.utils import get_column_letter
 
@@ -15,6 +17,9 @@ from openpyxl.utils import get_column_letter
 class ExcelExporter:
     """Export MILP results to Excel workbook."""
 
+    # Yearly tables with at least this many rows are streamed (write-only mode)
+    STREAMING_ROW_THRESHOLD = 10000
+
     def __init__(self, config: Dict):
         """
         Initialize Excel exporter.
@@ -30,7 +35,9 @@ class ExcelExporter:
         self,
         scenario_df: pd.DataFrame,
         yearly_df: pd.DataFrame,
-        output_path: Path = None
+        output_path: Path = None,
+        streaming: Optional[bool] = None,
+        include_time_breakdown: bool = True
     ) -> Path:
         """
         Export results to Excel file.
@@ -39,17 +46,21 @@ class ExcelExporter:
             scenario_df: Scenario summary DataFrame
             yearly_df: Yearly results DataFrame
             output_path: Output directory (default: results/)
+            streaming: Use the write-only exporter (default: when yearly_df
+                has at least STREAMING_ROW_THRESHOLD rows)
+            include_time_breakdown: Add the Time Breakdown sheet
 
         Returns:
             Path to created Excel file
         """
-        if output_path is None:
-            output_path = Path("results")
-
-        output_path.mkdir(parents=True, exist_ok=True)
+        if streaming is None:
+            streaming = len(yearly_df) >= self.STREAMING_ROW_THRESHOLD
+        if streaming:
+            return self.export_results_streaming(
+                scenario_df, yearly_df, output_path, include_time_breakdown=include_time_breakdown
+            )
 
-        filename = f"MILP_results_{self.case_id}.xlsx"
-        filepath = output_path / filename
+        filepath = self._output_file(output_path)
 
         # Create workbook
         wb = Workbook()
@@ -57,7 +68,8 @@ class ExcelExporter:
 
         # Add sheets
         self._add_summary_sheet(wb, scenario_df)
-        self._add_time_breakdown_sheet(wb, scenario_df)
+        if include_time_breakdown:
+            self._add_time_breakdown_sheet(wb, scenario_df)
         self._add_yearly_sheet(wb, yearly_df)
         self._add_config_sheet(wb)
 
@@ -67,6 +79,58 @@ class ExcelExporter:
 
         return filepath
 
+    def export_results_streaming(
+        self,
+        scenario_df: pd.DataFrame,
+        yearly_df: pd.DataFrame,
+        output_path: Path = None,
+        include_time_breakdown: bool = True
+    ) -> Path:
+        """
+        Export results to Excel file in openpyxl write-only mode.
+
+        Rows are written straight to the file instead of being held as cell
+        objects, so memory stays flat for large yearly tables. Cell values and
+        formatting match export_results; per-column formats are registered
+        once as named styles.
+
+        Args:
+            scenario_df: Scenario summary DataFrame
+            yearly_df: Yearly results DataFrame
+            output_path: Output directory (default: results/)
+            include_time_breakdown: Add the Time Breakdown sheet
+
+        Returns:
+            Path to created Excel file
+        """
+        filepath = self._output_file(output_path)
+
+        wb = Workbook(write_only=True)
+        for style in self._named_styles():
+            wb.add_named_style(style)
+
+        # Sheet order follows creation order, as in the in-memory export
+        self._stream_summary_sheet(wb, scenario_df)
+        self._stream_yearly_sheet(wb, yearly_df)
+        self._stream_config_sheet(wb)
+        if include_time_breakdown:
+            self._stream_time_breakdown_sheet(wb, scenario_df)
+
+        wb.save(filepath)
+        print(f"Excel export completed: {filepath}")
+
+        return filepath
+
+    def _output_file(self, output_path: Optional[Path]) -> Path:
+        """Create the output directory and return the workbook path."""
+        if output_path is None:
+            output_path = Path("results")
+
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        filename = f"MILP_results_{self.case_id}.xlsx"
+        return output_path / filename
+
     def _add_summary_sheet(self, wb: Workbook, scenario_df: pd.DataFrame) -> None:
         """
         Add scenario summary sheet.
@@ -196,14 +260,7 @@ class ExcelExporter:
 
         # Time components
         basic_cycle = optimal.get("Basic_Cycle_Duration_hr", 0)
-        components = [
-            ("육상 적재", optimal.get("Shore_Loading_hr", 0)),
-            ("편도 항해", optimal.get("Travel_Outbound_hr", 0)),
-            ("호스 연결", optimal.get("Setup_Inbound_hr", 0)),
-            ("펌핑", optimal.get("Pumping_Per_Vessel_hr", 0)),
-            ("호스 분리", optimal.get("Setup_Outbound_hr", 0)),
-            ("복귀 항해", optimal.get("Travel_Return_hr", 0)),
-        ]
+        components = self._time_components(optimal)
 
         row = 11
         total_hours = 0
@@ -241,12 +298,7 @@ class ExcelExporter:
         ws.cell(row=row, column=1).font = Font(bold=True, size=11)
 
         row += 1
-        metrics = [
-            ("연간 최대 항차", optimal["Annual_Cycles_Max"], "회"),
-            ("연간 공급 용량", optimal["Annual_Supply_m3"], "m³"),
-            ("시간 활용도", optimal["Time_Utilization_Ratio_percent"], "%"),
-            ("선박당 일정", 365 / optimal["Annual_Cycles_Max"] if optimal["Annual_Cycles_Max"] > 0 else 0, "일"),
-        ]
+        metrics = self._operating_metrics(optimal)
 
         for name, value, unit in metrics:
             ws.cell(row=row, column=1).value = name
@@ -329,7 +381,258 @@ class ExcelExporter:
         ws.cell(row=row, column=1).font = Font(bold=True)
         ws.cell(row=row, column=2).font = Font(bold=True)
 
-        params = [
+        params = self._config_params()
+
+        for idx, (param, value) in enumerate(params, row + 1):
+            ws.cell(row=idx, column=1).value = param
+            ws.cell(row=idx, column=2).value = value
+            ws.cell(row=idx, column=2).alignment = Alignment(horizontal="right")
+
+        ws.column_dimensions["A"].width = 30
+        ws.column_dimensions["B"].width = 25
+
+    # ========== STREAMING (WRITE-ONLY) SHEETS ==========
+
+    @staticmethod
+    def _named_styles() -> List[NamedStyle]:
+        """Named styles shared by the streamed sheets."""
+        def header(name: str, color: str) -> NamedStyle:
+            return NamedStyle(
+                name=name,
+                font=Font(bold=True, color="FFFFFF"),
+                fill=PatternFill(start_color=color, end_color=color, fill_type="solid"),
+                alignment=Alignment(horizontal="center"),
+            )
+
+        top_fill = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")
+        return [
+            NamedStyle(name="title", font=Font(size=14, bold=True),
+                       alignment=Alignment(horizontal="center", vertical="center")),
+            header("summary_header", "366092"),
+            header("yearly_header", "4472C4"),
+            header("time_header", "70AD47"),
+            # Data styles keep the workbook default font, like unstyled cells
+            NamedStyle(name="text_center", font=DEFAULT_FONT, alignment=Alignment(horizontal="center")),
+            NamedStyle(name="number", font=DEFAULT_FONT, number_format="0.00",
+                       alignment=Alignment(horizontal="right")),
+            NamedStyle(name="top_text_center", font=DEFAULT_FONT, alignment=Alignment(horizontal="center"),
+                       fill=top_fill),
+            NamedStyle(name="top_number", font=DEFAULT_FONT, number_format="0.00",
+                       alignment=Alignment(horizontal="right"), fill=top_fill),
+        ]
+
+    @staticmethod
+    def _cell(ws, value: Any = None, style: str = None, **attrs) -> WriteOnlyCell:
+        """Write-only cell with an optional named style and direct attributes."""
+        cell = WriteOnlyCell(ws, value=value)
+        if style is not None:
+            cell.style = style
+        for name, attr in attrs.items():
+            setattr(cell, name, attr)
+        return cell
+
+    def _stream_rows(self, ws, df: pd.DataFrame, styles: List[str], start_row: int = 0) -> None:
+        """
+        Append DataFrame rows using one reusable template cell per column.
+
+        Args:
+            ws: Write-only worksheet
+            df: Data to write (no index, no header)
+            styles: Named style for each column
+            start_row: Number of leading rows styled "top_" + style
+        """
+        templates = [self._cell(ws, style=style) for style in styles]
+        top = [self._cell(ws, style=f"top_{style}") for style in styles] if start_row else templates
+
+        for row_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False)):
+            cells = top if row_idx < start_row else templates
+            for cell, value in zip(cells, row):
+                cell.value = value
+            # Rows are serialized on append, so the template cells can be reused
+            ws.append(cells)
+
+    def _stream_summary_sheet(self, wb: Workbook, scenario_df: pd.DataFrame) -> None:
+        """
+        Stream scenario summary sheet.
+
+        Args:
+            wb: Write-only workbook
+            scenario_df: Scenario DataFrame
+        """
+        ws = wb.create_sheet("Summary")
+
+        ws.column_dimensions["A"].width = 15
+        ws.column_dimensions["B"].width = 15
+        for col in ["C", "D", "E", "F", "G", "H", "I", "J"]:
+            ws.column_dimensions[col].width = 18
+
+        ws.merged_cells.add("A1:J1")
+        ws.row_dimensions[1].height = 25
+        ws.append([self._cell(ws, f"Scenario Summary - {self.case_name}", "title")])
+        ws.append([])
+
+        # Sort by NPC
+        df_sorted = scenario_df.sort_values("NPC_Total_USDm").copy()
+
+        headers = df_sorted.columns.tolist()
+        ws.append([self._cell(ws, header, "summary_header") for header in headers])
+
+        # NPC and following columns are numeric; top 3 scenarios highlighted
+        styles = ["number" if col_idx >= 3 else "text_center" for col_idx in range(1, len(headers) + 1)]
+        self._stream_rows(ws, df_sorted, styles, start_row=3)
+
+        # Statistics
+        ws.append([])
+        ws.append([self._cell(ws, "Statistics", font=Font(bold=True))])
+        ws.append(["Total Scenarios:", len(scenario_df)])
+        for label, value in [
+            ("Best NPC (M USD):", df_sorted["NPC_Total_USDm"].min()),
+            ("Worst NPC (M USD):", df_sorted["NPC_Total_USDm"].max()),
+            ("Average NPC (M USD):", df_sorted["NPC_Total_USDm"].mean()),
+        ]:
+            ws.append([label, self._cell(ws, value, number_format="0.00")])
+
+    def _stream_yearly_sheet(self, wb: Workbook, yearly_df: pd.DataFrame) -> None:
+        """
+        Stream yearly results sheet.
+
+        Args:
+            wb: Write-only workbook
+            yearly_df: Yearly results DataFrame
+        """
+        ws = wb.create_sheet("Yearly Results")
+
+        headers = yearly_df.columns.tolist()
+        for col in range(1, len(headers) + 1):
+            ws.column_dimensions[get_column_letter(col)].width = 16
+        ws.freeze_panes = "A4"
+
+        ws.merged_cells.add("A1:H1")
+        ws.row_dimensions[1].height = 25
+        ws.append([self._cell(ws, f"Yearly Results - {self.case_name}", "title")])
+        ws.append([])
+
+        ws.append([self._cell(ws, header, "yearly_header") for header in headers])
+
+        styles = ["number" if col_idx > 3 else "text_center" for col_idx in range(1, len(headers) + 1)]
+        self._stream_rows(ws, yearly_df, styles)
+
+    def _stream_config_sheet(self, wb: Workbook) -> None:
+        """
+        Stream configuration sheet.
+
+        Args:
+            wb: Write-only workbook
+        """
+        ws = wb.create_sheet("Configuration")
+
+        ws.column_dimensions["A"].width = 30
+        ws.column_dimensions["B"].width = 25
+
+        ws.merged_cells.add("A1:B1")
+        ws.append([self._cell(ws, f"Configuration - {self.case_name}", font=Font(size=12, bold=True))])
+        ws.append([])
+
+        bold = Font(bold=True)
+        ws.append([self._cell(ws, "Parameter", font=bold), self._cell(ws, "Value", font=bold)])
+
+        right = Alignment(horizontal="right")
+        for param, value in self._config_params():
+            ws.append([param, self._cell(ws, value, alignment=right)])
+
+    def _stream_time_breakdown_sheet(self, wb: Workbook, scenario_df: pd.DataFrame) -> None:
+        """
+        Stream time breakdown sheet for optimal scenario.
+
+        Args:
+            wb: Write-only workbook
+            scenario_df: Scenario DataFrame
+        """
+        ws = wb.create_sheet("Time Breakdown")
+
+        ws.column_dimensions["A"].width = 30
+        ws.column_dimensions["B"].width = 18
+        ws.column_dimensions["C"].width = 12
+
+        # Find optimal scenario (minimum NPC)
+        optimal = scenario_df.loc[scenario_df["NPC_Total_USDm"].idxmin()]
+        bold = Font(bold=True)
+
+        ws.merged_cells.add("A1:C1")
+        ws.row_dimensions[1].height = 20
+        ws.append([self._cell(ws, "【최적 시나리오 시간 분석】", font=Font(size=12, bold=True))])
+        ws.append([])
+
+        # Case and scenario info
+        ws.append(["Case", self.case_name])
+        ws.append(["Shuttle Size (m³)", int(optimal["Shuttle_Size_cbm"])])
+        ws.append(["Pump Size (m³/h)", int(optimal["Pump_Size_m3ph"])])
+        ws.append(["NPC (M USD)", self._cell(ws, optimal["NPC_Total_USDm"], number_format="0.00")])
+        ws.append(["LCOA (USD/ton)",
+                   self._cell(ws, optimal.get("LCOAmmonia_USD_per_ton", 0), number_format="0.00")])
+        ws.append([])
+
+        # Time breakdown table
+        ws.merged_cells.add("A9:C9")
+        ws.append([self._cell(ws, "1회 왕복 운항 시간 분해 (Time Breakdown)", font=Font(bold=True, size=11))])
+        ws.append([self._cell(ws, header, "time_header") for header in ["시간 구성 요소", "시간 (h)", "비율 (%)"]])
+
+        basic_cycle = optimal.get("Basic_Cycle_Duration_hr", 0)
+        for name, hours in self._time_components(optimal):
+            percentage = (hours / basic_cycle) * 100 if basic_cycle > 0 else 0
+            ws.append([
+                name,
+                self._cell(ws, round(hours, 2), number_format="0.00"),
+                self._cell(ws, round(percentage, 1), number_format="0.0\\%",
+                           alignment=Alignment(horizontal="right")),
+            ])
+
+        # Total
+        ws.append([
+            self._cell(ws, "【총 사이클 시간】", font=bold),
+            self._cell(ws, optimal["Cycle_Duration_hr"], font=bold, number_format="0.00"),
+            self._cell(ws, "100%", font=bold),
+        ])
+
+        # Operating metrics
+        ws.append([])
+        ws.append(["기본 사이클 (육상 제외)",
+                   self._cell(ws, optimal.get("Basic_Cycle_Duration_hr", 0), number_format="0.00")])
+        ws.append([])
+        ws.append([self._cell(ws, "연간 운영 지표", font=Font(bold=True, size=11))])
+
+        for name, value, unit in self._operating_metrics(optimal):
+            if isinstance(value, float):
+                value = self._cell(ws, round(value, 2), number_format="0.00")
+            ws.append([name, value, unit])
+
+    # ========== SHARED SHEET CONTENT ==========
+
+    @staticmethod
+    def _time_components(optimal: pd.Series) -> List[Tuple[str, float]]:
+        """Round-trip time components of the optimal scenario."""
+        return [
+            ("육상 적재", optimal.get("Shore_Loading_hr", 0)),
+            ("편도 항해", optimal.get("Travel_Outbound_hr", 0)),
+            ("호스 연결", optimal.get("Setup_Inbound_hr", 0)),
+            ("펌핑", optimal.get("Pumping_Per_Vessel_hr", 0)),
+            ("호스 분리", optimal.get("Setup_Outbound_hr", 0)),
+            ("복귀 항해", optimal.get("Travel_Return_hr", 0)),
+        ]
+
+    @staticmethod
+    def _operating_metrics(optimal: pd.Series) -> List[Tuple[str, Any, str]]:
+        """Annual operating metrics of the optimal scenario."""
+        return [
+            ("연간 최대 항차", optimal["Annual_Cycles_Max"], "회"),
+            ("연간 공급 용량", optimal["Annual_Supply_m3"], "m³"),
+            ("시간 활용도", optimal["Time_Utilization_Ratio_percent"], "%"),
+            ("선박당 일정", 365 / optimal["Annual_Cycles_Max"] if optimal["Annual_Cycles_Max"] > 0 else 0, "일"),
+        ]
+
+    def _config_params(self) -> List[Tuple[str, Any]]:
+        """Key configuration parameters for the Configuration sheet."""
+        return [
             ("Case Name", self.config.get("case_name", "Unknown")),
             ("Case ID", self.config.get("case_id", "unknown")),
             ("Time Period", f"{self.config['time_period']['start_year']}-{self.config['time_period']['end_year']}"),
@@ -343,11 +646,3 @@ class ExcelExporter:
             ("Start Vessels", self.config['shipping']['start_vessels']),
             ("End Vessels", self.config['shipping']['end_vessels']),
         ]
-
-        for idx, (param, value) in enumerate(params, row + 1):
-            ws.cell(row=idx, column=1).value = param
-            ws.cell(row=idx, column=2).value = value
-            ws.cell(row=idx, column=2).alignment = Alignment(horizontal="right")
-
-        ws.column_dimensions["A"].width = 30
-        ws.column_dimensions["B"].width = 25
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Operations Simulation Module - Discrete-event simulation of shuttle bunkering.
+
+Replays a yearly fleet plan (MILP per-year results: Total_Shuttles and
+Annual_Calls per year) against stochastic vessel arrival streams and
+measures what the deterministic cycle-time model cannot: vessel waiting
+times, service levels and queueing at the shore loading berths and at the
+vessels themselves.
+
+Model (one independent year at a time, all shuttles idle and empty at shore):
+    - Vessel calls arrive as a Poisson stream over the year (the planned
+      number of calls at uniformly distributed times); bunkering volumes are
+      sampled from a VesselDistribution scenario, or fixed at
+      bunkering.bunker_volume_per_call_m3.
+    - An idle shuttle is dispatched to the oldest open demand. Case 1
+      (has_storage_at_busan) serves one vessel per trip; Case 2/3 carry as
+      many queued calls as fit in the shuttle. A call larger than the
+      shuttle is released to the next shuttle once the previous one starts
+      bunkering it, so shuttles arrive in sequence rather than all at once.
+    - Trip: shore loading (ShoreSupply.load_shuttle of the carried volume,
+      optionally limited to shore_berths concurrent loadings), outbound
+      travel (+ port entry), per vessel movement + setup + pumping + setup,
+      port exit + return travel. Timings come from CycleTimeCalculator, so a
+      trip with a full shuttle takes exactly the deterministic cycle_duration.
+    - A vessel is bunkered by one shuttle at a time; other shuttles wait
+      alongside.
+
+The event loop is a binary heap of (time, seq, kind, shuttle) tuples with
+pre-sorted arrivals merged in outside the heap.
+
+Per-call records can be streamed to a chunked columnar file by passing an
+event_trace.TraceWriter as trace.
+
+Usage:
+    from src.operations_simulation import simulate_operations
+    result = simulate_operations(config, yearly_df, 2500, 500,
+                                 distribution=dist, scenario_name="balanced", seed=42)
+    df = result.to_dataframe(wait_target_hours=12.0)
+"""
+
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cycle_time_calculator import CycleTimeCalculator
+
+
+# Calendar hours over which the year's vessel calls arrive
+HOURS_PER_YEAR = 8760.0
+
+# Event kinds
+_LOADED, _ALONGSIDE, _LEG_DONE, _RETURNED = range(4)
+
+# Output columns -> field
+_COLUMNS = [
+    ("Year", "year"),
+    ("Shuttles", "shuttles"),
+    ("Calls", "calls"),
+    ("Trips", "trips"),
+    ("Events", "events"),
+    ("Mean_Wait_Hours", "mean_wait"),
+    ("P95_Wait_Hours", "p95_wait"),
+    ("Max_Wait_Hours", "max_wait"),
+    ("Mean_Turnaround_Hours", "mean_turnaround"),
+    ("Mean_Shore_Wait_Hours", "mean_shore_wait"),
+    ("Shuttle_Utilization", "shuttle_utilization"),
+    ("Completed_In_Year", "completed_in_year"),
+]
+
+
+@dataclass
+class OperationsSimulationResult:
+    """
+    Per-year KPIs of one simulated fleet plan.
+
+    Attributes:
+        shuttle_size: Shuttle size (m3)
+        pump_size: Bunkering pump rate (m3/h)
+        years: Simulated years
+        fields: KPI name -> array with one value per year
+        waits: Per-year arrays of vessel waiting times (hours, arrival to
+            start of bunkering)
+        elapsed_s: Wall-clock simulation time (seconds)
+    """
+    shuttle_size: float
+    pump_size: float
+    years: np.ndarray
+    fields: Dict[str, np.ndarray]
+    waits: List[np.ndarray] = field(repr=False)
+    elapsed_s: float = 0.0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.fields[name]
+
+    @property
+    def events(self) -> int:
+        """Total number of processed events."""
+        return int(self.fields["events"].sum())
+
+    def service_level(self, wait_target_hours: float) -> np.ndarray:
+        """Per-year share of calls whose bunkering started within the target wait."""
+        return np.array([
+            float(np.mean(waits <= wait_target_hours)) if len(waits) else 1.0
+            for waits in self.waits
+        ])
+
+    def to_dataframe(self, wait_target_hours: Optional[float] = None) -> pd.DataFrame:
+        """
+        Per-year KPI table.
+
+        Args:
+            wait_target_hours: Adds a Service_Level column for this target
+
+        Returns:
+            DataFrame with one row per year
+        """
+        df = pd.DataFrame({column: self.fields[name] for column, name in _COLUMNS})
+        df.insert(0, "Pump_Size_m3ph", self.pump_size)
+        df.insert(0, "Shuttle_Size_cbm", self.shuttle_size)
+        if wait_target_hours is not None:
+            df["Service_Level"] = self.service_level(wait_target_hours)
+        return df
+
+
+class OperationsSimulator:
+    """
+    Event-driven simulator for one shuttle size / pump rate.
+
+    Args:
+        config: Configuration dictionary
+        shuttle_size: Shuttle size (m3)
+        pump_size: Bunkering pump rate (m3/h)
+        shore_berths: Concurrent shuttle loadings at shore (default:
+            shore_supply.loading_arms; None there = unlimited)
+    """
+
+    def __init__(
+        self,
+        config: Dict,
+        shuttle_size: float,
+        pump_size: float,
+        shore_berths: Optional[int] = None
+    ):
+        if shuttle_size <= 0 or pump_size <= 0:
+            raise ValueError(f"Invalid shuttle/pump size: {shuttle_size}, {pump_size}")
+        calculator = CycleTimeCalculator(config.get("case_id", "case_1"), config)
+        if shore_berths is None:
+            shore_berths = calculator.shore_supply.loading_arms
+        if shore_berths is not None and shore_berths < 1:
+            raise ValueError(f"shore_berths must be at least 1, got {shore_berths}")
+
+        self.config = config
+        self.shuttle_size = float(shuttle_size)
+        self.pump_size = float(pump_size)
+        self.shore_berths = shore_berths
+
+        cycle = calculator.calculate_single_cycle(self.shuttle_size, self.pump_size)
+        self.has_storage = calculator.has_storage_at_busan
+        self.bunker_volume = calculator.bunker_volume_per_call_m3
+        self.loading_rate = calculator.shore_supply.pump_rate_m3ph
+        self.loading_fixed = calculator.shore_supply.fixed_time_hours
+        self.outbound = cycle["travel_outbound"] + cycle["port_entry"]
+        self.inbound = cycle["port_exit"] + cycle["travel_return"]
+        self.leg_fixed = cycle["movement_per_vessel"] + cycle["setup_inbound"] + cycle["setup_outbound"]
+
+    def run_year(
+        self,
+        n_shuttles: int,
+        arrival_times: np.ndarray,
+        volumes: np.ndarray,
+        trace: Any = None,
+        year: int = 0
+    ) -> Tuple[Dict[str, float], np.ndarray]:
+        """
+        Simulate one year of vessel calls with a fixed fleet.
+
+        Args:
+            n_shuttles: Fleet size
+            arrival_times: Sorted call arrival times (hours)
+            volumes: Bunkering volume per call (m3)
+            trace: TraceWriter receiving one record per call (optional)
+            year: Year written to the trace records
+
+        Returns:
+            (KPI dict, per-call waiting times in hours)
+        """
+        n_calls = len(arrival_times)
+        if n_calls and n_shuttles < 1:
+            raise ValueError(f"No shuttles to serve {n_calls} calls")
+
+        heap: List[Tuple[float, int, int, int]] = []
+        push = heapq.heappush
+        pop = heapq.heappop
+        seq = itertools.count()
+
+        shuttle_size = self.shuttle_size
+        inv_pump = 1.0 / self.pump_size
+        inv_loading = 1.0 / self.loading_rate
+        loading_fixed = self.loading_fixed
+        outbound, inbound, leg_fixed = self.outbound, self.inbound, self.leg_fixed
+        max_legs = 1 if self.has_storage else n_calls + 1
+
+        arrivals = arrival_times.tolist()
+        unassigned = volumes.astype(float).tolist()
+        open_legs = [0] * n_calls
+        first_start = [-1.0] * n_calls
+        done = [0.0] * n_calls
+        vessel_busy = [False] * n_calls
+        alongside: Dict[int, deque] = {}
+        demand: List[int] = []  # heap of call indices (oldest first)
+
+        idle = list(range(n_shuttles - 1, -1, -1))
+        legs: List[List[Tuple[int, float]]] = [[] for _ in range(n_shuttles)]
+        leg_pos = [0] * n_shuttles
+        trip_start = [0.0] * n_shuttles
+        berths_free = self.shore_berths if self.shore_berths is not None else n_shuttles
+        shore_queue = deque()
+
+        events = trips = 0
+        busy_hours = shore_wait = 0.0
+
+        def dispatch(t: float) -> None:
+            nonlocal berths_free
+            while idle and demand:
+                s = idle.pop()
+                capacity = shuttle_size
+                trip = []
+                while demand and capacity > 0 and len(trip) < max_legs:
+                    v = pop(demand)
+                    remaining = unassigned[v]
+                    if remaining <= capacity:
+                        q = remaining
+                        unassigned[v] = 0.0
+                    else:
+                        # The rest is released when this leg starts bunkering
+                        q = capacity
+                        unassigned[v] = remaining - capacity
+                    capacity -= q
+                    open_legs[v] += 1
+                    trip.append((v, q))
+                legs[s] = trip
+                leg_pos[s] = 0
+                trip_start[s] = t
+                load_time = (shuttle_size - capacity) * inv_loading + loading_fixed
+                if berths_free:
+                    berths_free -= 1
+                    push(heap, (t + load_time, next(seq), _LOADED, s))
+                else:
+                    shore_queue.append((s, t, load_time))
+
+        def start_leg(t: float, s: int) -> None:
+            v, q = legs[s][leg_pos[s]]
+            if vessel_busy[v]:
+                alongside.setdefault(v, deque()).append(s)
+                return
+            vessel_busy[v] = True
+            if first_start[v] < 0:
+                first_start[v] = t
+            push(heap, (t + leg_fixed + q * inv_pump, next(seq), _LEG_DONE, s))
+            if unassigned[v]:
+                push(demand, v)
+                dispatch(t)
+
+        i = 0
+        t = 0.0
+        while True:
+            if i < n_calls and (not heap or arrivals[i] <= heap[0][0]):
+                # Simultaneous calls are queued together before dispatching
+                t = arrivals[i]
+                while i < n_calls and arrivals[i] == t:
+                    push(demand, i)
+                    i += 1
+                    events += 1
+                dispatch(t)
+                continue
+            if not heap:
+                break
+
+            t, _, kind, s = pop(heap)
+            events += 1
+            if kind == _LOADED:
+                if shore_queue:
+                    s2, requested, load_time = shore_queue.popleft()
+                    shore_wait += t - requested
+                    push(heap, (t + load_time, next(seq), _LOADED, s2))
+                else:
+                    berths_free += 1
+                push(heap, (t + outbound, next(seq), _ALONGSIDE, s))
+            elif kind == _ALONGSIDE:
+                start_leg(t, s)
+            elif kind == _LEG_DONE:
+                v, q = legs[s][leg_pos[s]]
+                vessel_busy[v] = False
+                open_legs[v] -= 1
+                if not open_legs[v] and not unassigned[v]:
+                    done[v] = t
+                waiting = alongside.get(v)
+                if waiting:
+                    start_leg(t, waiting.popleft())
+                    if not waiting:
+                        del alongside[v]
+                leg_pos[s] += 1
+                if leg_pos[s] < len(legs[s]):
+                    start_leg(t, s)
+                else:
+                    push(heap, (t + inbound, next(seq), _RETURNED, s))
+            else:
+                busy_hours += t - trip_start[s]
+                trips += 1
+                idle.append(s)
+                dispatch(t)
+
+        waits = np.asarray(first_start) - arrival_times
+        turnaround = np.asarray(done) - arrival_times
+        if trace is not None and n_calls:
+            trace.append(
+                year=year,
+                call=np.arange(n_calls),
+                arrival_h=arrival_times,
+                volume_m3=volumes,
+                wait_h=waits,
+                turnaround_h=turnaround,
+            )
+        horizon = max(HOURS_PER_YEAR, t)
+        stats = {
+            "shuttles": n_shuttles,
+            "calls": n_calls,
+            "trips": trips,
+            "events": events,
+            "mean_wait": float(waits.mean()) if n_calls else 0.0,
+            "p95_wait": float(np.percentile(waits, 95)) if n_calls else 0.0,
+            "max_wait": float(waits.max()) if n_calls else 0.0,
+            "mean_turnaround": float(turnaround.mean()) if n_calls else 0.0,
+            "mean_shore_wait": shore_wait / trips if trips else 0.0,
+            "shuttle_utilization": busy_hours / (n_shuttles * horizon) if n_shuttles else 0.0,
+            "completed_in_year": float(np.mean(np.asarray(done) <= HOURS_PER_YEAR)) if n_calls else 1.0,
+        }
+        return stats, waits
+
+
+def fleet_plan(
+    yearly_df: pd.DataFrame,
+    shuttle_size: Optional[float] = None,
+    pump_size: Optional[float] = None
+) -> pd.DataFrame:
+    """
+    Year, Total_Shuttles and Annual_Calls of one (shuttle, pump) plan.
+
+    Args:
+        yearly_df: MILP per-year results (one or more scenarios)
+        shuttle_size: Shuttle size to select (optional for a single scenario)
+        pump_size: Pump rate to select (optional for a single scenario)
+
+    Returns:
+        Plan sorted by year
+    """
+    plan = yearly_df
+    if shuttle_size is not None and "Shuttle_Size_cbm" in plan:
+        plan = plan[plan["Shuttle_Size_cbm"] == shuttle_size]
+    if pump_size is not None and "Pump_Size_m3ph" in plan:
+        plan = plan[plan["Pump_Size_m3ph"] == pump_size]
+    if plan.empty:
+        raise ValueError(f"No yearly plan for shuttle {shuttle_size} m3 / pump {pump_size} m3/h")
+    if plan["Year"].duplicated().any():
+        raise ValueError("Yearly plan has several scenarios; pass shuttle_size and pump_size")
+    return plan.sort_values("Year")[["Year", "Total_Shuttles", "Annual_Calls"]].reset_index(drop=True)
+
+
+def simulate_operations(
+    config: Dict,
+    yearly_df: pd.DataFrame,
+    shuttle_size: Optional[float] = None,
+    pump_size: Optional[float] = None,
+    distribution: Any = None,
+    scenario_name: Optional[str] = None,
+    seed: Any = None,
+    shore_berths: Optional[int] = None,
+    trace: Any = None
+) -> OperationsSimulationResult:
+    """
+    Replay a yearly fleet plan against stochastic vessel arrivals.
+
+    Args:
+        config: Configuration dictionary
+        yearly_df: MILP per-year results (Year, Total_Shuttles, Annual_Calls)
+        shuttle_size: Shuttle size (m3); inferred for a single-scenario plan
+        pump_size: Pump rate (m3/h); inferred for a single-scenario plan
+        distribution: VesselDistribution for call volumes (None = fixed
+            bunker_volume_per_call_m3)
+        scenario_name: Distribution scenario (default: the distribution's default)
+        seed: Seed, SeedSequence or Generator for np.random.default_rng
+        shore_berths: Concurrent shuttle loadings at shore (default:
+            shore_supply.loading_arms)
+        trace: event_trace.TraceWriter receiving one record per call (optional)
+
+    Returns:
+        OperationsSimulationResult with one KPI row per year
+    """
+    plan = fleet_plan(yearly_df, shuttle_size, pump_size)
+    if shuttle_size is None:
+        shuttle_size = float(yearly_df["Shuttle_Size_cbm"].iloc[0])
+    if pump_size is None:
+        pump_size = float(yearly_df["Pump_Size_m3ph"].iloc[0])
+
+    simulator = OperationsSimulator(config, shuttle_size, pump_size, shore_berths)
+    rng = np.random.default_rng(seed)
+    if distribution is not None and scenario_name is None:
+        scenario_name = distribution.default_scenario_name
+
+    started = time.perf_counter()
+    rows: Dict[str, List[float]] = {name: [] for _, name in _COLUMNS}
+    waits = []
+    for year, n_shuttles, calls in plan.itertuples(index=False):
+        n_calls = int(round(calls))
+        arrivals = np.sort(rng.uniform(0.0, HOURS_PER_YEAR, n_calls))
+        if distribution is None:
+            volumes = np.full(n_calls, simulator.bunker_volume)
+        else:
+            volumes = distribution.sample_call_volumes(scenario_name, n_calls, rng=rng)
+
+        stats, year_waits = simulator.run_year(int(n_shuttles), arrivals, volumes, trace, int(year))
+        stats["year"] = int(year)
+        for name in rows:
+            rows[name].append(stats[name])
+        waits.append(year_waits)
+
+    return OperationsSimulationResult(
+        shuttle_size=float(shuttle_size),
+        pump_size=float(pump_size),
+        years=plan["Year"].to_numpy(),
+        fields={name: np.asarray(values) for name, values in rows.items()},
+        waits=waits,
+        elapsed_s=time.perf_counter() - started,
+    )
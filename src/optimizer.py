@@ -4,17 +4,20 @@ Adapted from MILPmodel_v17_250811.py
 """
 
 from math import ceil
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import pandas as pd
 import pulp
 import numpy as np
 
 from .config_loader import ConfigLoader
+from .config_overlay import ConfigOverlay
 from .cost_calculator import CostCalculator
+from .cost_tables import CostTables
 from .cycle_time_calculator import CycleTimeCalculator
 from .fleet_sizing_calculator import FleetSizingCalculator
 from .shore_supply import ShoreSupply
 from .utils import (
+    calculate_shuttle_capex,
     interpolate_mcr,
     interpolate_sfoc,
     calculate_m3_per_voyage,
@@ -27,16 +30,21 @@ from .utils import (
 class BunkeringOptimizer:
     """MILP optimizer for bunkering infrastructure planning."""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Mapping, overrides: Optional[Dict[str, Any]] = None):
         """
         Initialize optimizer with configuration.
 
         Args:
-            config: Configuration dictionary from ConfigLoader
+            config: Configuration dictionary from ConfigLoader, or a ConfigOverlay
+            overrides: Optional dotted-path overrides layered over config
+                       (e.g., {"economy.fuel_price_usd_per_ton": 720.0})
         """
+        if overrides:
+            config = ConfigOverlay(config, overrides)
         self.config = config
         self.cost_calc = CostCalculator(config)
         self.fleet_calc = FleetSizingCalculator(config)
+        self._tables = None
 
         # Extract key parameters
         self._setup_parameters()
@@ -134,6 +142,13 @@ class BunkeringOptimizer:
         self.cycle_calc = CycleTimeCalculator(self.config.get("case_id", "case_1"), self.config)
         self.shore_supply = ShoreSupply(self.config)
 
+    @property
+    def tables(self) -> CostTables:
+        """Precomputed cost/cycle tables for this config (built on first use, shared per fingerprint)."""
+        if self._tables is None:
+            self._tables = CostTables.for_config(self.config)
+        return self._tables
+
     def solve(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Solve optimization problem for all shuttle/pump combinations.
@@ -177,24 +192,55 @@ class BunkeringOptimizer:
             shuttle_size: Shuttle size in m3
             pump_size: Pump flow rate in m3/h
         """
+        coeffs = self._prepare_combination(shuttle_size, pump_size)
+        if coeffs is None:
+            return  # Skip infeasible combination
+
+        prob, variables = self._build_problem(coeffs)
+
+        # Solve
+        prob.solve(pulp.PULP_CBC_CMD(msg=0))
+
+        status = pulp.LpStatus[prob.status]
+        if status != "Optimal":
+            return  # Skip infeasible solutions
+
+        # Extract and store results
+        self._extract_results(
+            shuttle_size, pump_size,
+            variables["x"], variables["N"], variables["y"],
+            variables["x_tank"], variables["N_tank"],
+            coeffs["call_duration"], coeffs["cycle_duration"],
+            coeffs["shuttle_fuel_cost_per_cycle"], coeffs["pump_fuel_cost_per_call"],
+            coeffs["shuttle_capex"], coeffs["shuttle_fixed_opex"],
+            coeffs["bunk_capex"], coeffs["bunk_fixed_opex"],
+            coeffs["trips_per_call"],
+            coeffs["cycle_info"]  # Pass complete time breakdown
+        )
+
+    def _prepare_combination(self, shuttle_size: float, pump_size: float) -> Optional[Dict]:
+        """
+        Pre-screen a shuttle/pump combination and compute its model coefficients.
+
+        Args:
+            shuttle_size: Shuttle size in m3
+            pump_size: Pump flow rate in m3/h
+
+        Returns:
+            Dict of timing and cost coefficients, or None if the combination
+            is screened out (no MCR or call duration limit exceeded)
+        """
         # Pre-screening calculations
         shuttle_size_int = int(shuttle_size)
-        pump_size_int = int(pump_size)
 
         # Get MCR value
         mcr = self.mcr_map.get(shuttle_size_int, 0)
         if mcr == 0:
-            return  # Skip if MCR not available
-
-        # Use CycleTimeCalculator to get complete timing breakdown
-        # Determine number of vessels per trip for Case 2
-        if self.has_storage_at_busan:
-            num_vessels = 1  # Case 1: Not used
-        else:
-            # Case 2: Calculate vessels per trip based on shuttle size
-            num_vessels = max(1, int(shuttle_size // self.bunker_volume_per_call_m3))
+            return None  # Skip if MCR not available
 
-        cycle_info = self.cycle_calc.calculate_single_cycle(shuttle_size, pump_size, num_vessels)
+        # Complete timing breakdown from the precomputed tables (Case 2 serves
+        # as many vessels per trip as fit in the shuttle)
+        cycle_info = self.tables.cycle_info(shuttle_size, pump_size)
 
         # Extract timing information
         call_duration = cycle_info["call_duration"]
@@ -203,18 +249,98 @@ class BunkeringOptimizer:
 
         # Check call duration constraint
         if call_duration > self.max_call_hours:
-            return  # Skip infeasible combination
+            return None  # Skip infeasible combination
+
+        idx = self.tables.index(shuttle_size, pump_size)
+        if idx is not None:
+            i, j = idx
+            tables = self.tables
+            shuttle_fuel_cost_per_cycle = float(tables.shuttle_fuel_cost_per_cycle[i])
+            pump_fuel_cost_per_call = float(tables.pump_fuel_cost_per_call[i, j])
+            shuttle_capex = float(tables.shuttle_capex[i])
+            shuttle_fixed_opex = float(tables.shuttle_fixed_opex[i])
+            bunk_capex = float(tables.bunkering_capex[i, j])
+            bunk_fixed_opex = float(tables.bunkering_fixed_opex[i, j])
+        else:
+            (shuttle_fuel_cost_per_cycle, pump_fuel_cost_per_call, shuttle_capex,
+             shuttle_fixed_opex, bunk_capex, bunk_fixed_opex) = self._combination_costs(shuttle_size, pump_size)
 
+        # Tank costs (only if tank is enabled AND shore_supply cost is enabled)
+        if self.tank_enabled and self.shore_supply_enabled:
+            tank_capex = self.tank_capex
+            tank_fixed_opex = self.tank_fixed_opex
+            tank_variable_opex = self.tank_variable_opex
+        else:
+            tank_capex = tank_fixed_opex = tank_variable_opex = 0.0
+
+        # Shore supply pump costs (only if shore_supply cost is enabled)
+        # NOTE: Shore supply TIME is always included in cycle calculations
+        # Only the COST is controlled by shore_supply.enabled
+        if self.shore_supply_enabled:
+            shore_pump_capex = self.shore_pump_capex
+            shore_pump_fixed_opex = self.shore_pump_fixed_opex
+        else:
+            shore_pump_capex = shore_pump_fixed_opex = 0.0
+
+        return {
+            "shuttle_size": shuttle_size,
+            "pump_size": pump_size,
+            "cycle_info": cycle_info,
+            "call_duration": call_duration,
+            "cycle_duration": cycle_duration,
+            "trips_per_call": trips_per_call,
+            "shuttle_fuel_cost_per_cycle": shuttle_fuel_cost_per_cycle,
+            "pump_fuel_cost_per_call": pump_fuel_cost_per_call,
+            "shuttle_capex": shuttle_capex,
+            "shuttle_fixed_opex": shuttle_fixed_opex,
+            "bunk_capex": bunk_capex,
+            "bunk_fixed_opex": bunk_fixed_opex,
+            "tank_capex": tank_capex,
+            "tank_fixed_opex": tank_fixed_opex,
+            "tank_variable_opex": tank_variable_opex,
+            "shore_pump_capex": shore_pump_capex,
+            "shore_pump_fixed_opex": shore_pump_fixed_opex,
+        }
+
+    def _combination_costs(self, shuttle_size: float, pump_size: float) -> Tuple[float, ...]:
+        """
+        Scalar cost coefficients for a combination outside the precomputed tables.
+
+        Returns:
+            Tuple of (shuttle fuel cost per cycle, pump fuel cost per call,
+            shuttle CAPEX, shuttle fixed OPEX, bunkering CAPEX, bunkering fixed OPEX)
+        """
+        shuttle_fuel_per_cycle, pump_fuel_per_call = self._fuel_per_event(shuttle_size, pump_size)
+        shuttle_fuel_cost_per_cycle = shuttle_fuel_per_cycle * self.fuel_price
+        pump_fuel_cost_per_call = pump_fuel_per_call * self.fuel_price
+
+        # Cost components
+        shuttle_capex = self.cost_calc.calculate_shuttle_capex(shuttle_size)
+        shuttle_fixed_opex = self.cost_calc.calculate_shuttle_fixed_opex(shuttle_size)
+        bunk_capex = self.cost_calc.calculate_bunkering_capex(shuttle_size, pump_size)
+        bunk_fixed_opex = self.cost_calc.calculate_bunkering_fixed_opex(shuttle_size, pump_size)
+
+        return (shuttle_fuel_cost_per_cycle, pump_fuel_cost_per_call, shuttle_capex,
+                shuttle_fixed_opex, bunk_capex, bunk_fixed_opex)
+
+    def _fuel_per_event(self, shuttle_size: float, pump_size: float) -> Tuple[float, float]:
+        """
+        Fuel consumption of one combination, independent of the fuel price.
+
+        Returns:
+            Tuple of (shuttle fuel per cycle, pump fuel per call) in tons
+        """
         # Get SFOC for this shuttle size (v4: MCR-based SFOC map)
+        shuttle_size_int = int(shuttle_size)
+        mcr = self.mcr_map.get(shuttle_size_int, 0)
         sfoc = self.sfoc_map.get(shuttle_size_int, self.sfoc_default)
 
-        # Calculate fuel costs using timing from cycle calculator
+        # Calculate fuel using timing from cycle calculator
         # For Case 1: One-way travel; Case 2: Round-trip travel
         travel_factor = 1.0 if self.has_storage_at_busan else 2.0
         shuttle_fuel_per_cycle = (mcr * sfoc * travel_factor * self.travel_time_hours) / 1e6
-        shuttle_fuel_cost_per_cycle = shuttle_fuel_per_cycle * self.fuel_price
 
-        # Pump fuel cost based on pumping time per bunkering call
+        # Pump fuel based on pumping time per bunkering call
         # Both Case 1 and Case 2: One bunkering call = one pumping event = 5000 m³
         # The difference is in how many shuttle trips are needed:
         # - Case 1: Multiple shuttle trips for one call (shuttle < bunker_volume)
@@ -226,33 +352,37 @@ class BunkeringOptimizer:
                                                                    self.config["propulsion"]["pump_delta_pressure_bar"],
                                                                    self.config["propulsion"]["pump_efficiency"]) *
                              pumping_time_hr_call * sfoc) / 1e6
-        pump_fuel_cost_per_call = pump_fuel_per_call * self.fuel_price
 
-        # Cost components
-        shuttle_capex = self.cost_calc.calculate_shuttle_capex(shuttle_size)
-        shuttle_fixed_opex = self.cost_calc.calculate_shuttle_fixed_opex(shuttle_size)
-        bunk_capex = self.cost_calc.calculate_bunkering_capex(shuttle_size, pump_size)
-        bunk_fixed_opex = self.cost_calc.calculate_bunkering_fixed_opex(shuttle_size, pump_size)
+        return shuttle_fuel_per_cycle, pump_fuel_per_call
 
-        # Tank costs (only if tank is enabled AND shore_supply cost is enabled)
-        if self.tank_enabled and self.shore_supply_enabled:
-            tank_capex = self.tank_capex
-            tank_fixed_opex = self.tank_fixed_opex
-            tank_variable_opex = self.tank_variable_opex
-        else:
-            tank_capex = tank_fixed_opex = tank_variable_opex = 0.0
+    def _build_problem(self, coeffs: Dict) -> Tuple[pulp.LpProblem, Dict]:
+        """
+        Build the MILP for one combination from its prepared coefficients.
 
-        # Shore supply pump costs (only if shore_supply cost is enabled)
-        # NOTE: Shore supply TIME is always included in cycle calculations
-        # Only the COST is controlled by shore_supply.enabled
-        if self.shore_supply_enabled:
-            shore_pump_capex = self.shore_pump_capex
-            shore_pump_fixed_opex = self.shore_pump_fixed_opex
-        else:
-            shore_pump_capex = shore_pump_fixed_opex = 0.0
+        Args:
+            coeffs: Coefficients from _prepare_combination()
+
+        Returns:
+            Tuple of (LpProblem, dict of variable dicts keyed by
+            "x", "N", "y", "x_tank", "N_tank")
+        """
+        shuttle_size = coeffs["shuttle_size"]
+        trips_per_call = coeffs["trips_per_call"]
+        cycle_duration = coeffs["cycle_duration"]
+        shuttle_fuel_cost_per_cycle = coeffs["shuttle_fuel_cost_per_cycle"]
+        pump_fuel_cost_per_call = coeffs["pump_fuel_cost_per_call"]
+        shuttle_capex = coeffs["shuttle_capex"]
+        shuttle_fixed_opex = coeffs["shuttle_fixed_opex"]
+        bunk_capex = coeffs["bunk_capex"]
+        bunk_fixed_opex = coeffs["bunk_fixed_opex"]
+        tank_capex = coeffs["tank_capex"]
+        tank_fixed_opex = coeffs["tank_fixed_opex"]
+        tank_variable_opex = coeffs["tank_variable_opex"]
+        shore_pump_capex = coeffs["shore_pump_capex"]
+        shore_pump_fixed_opex = coeffs["shore_pump_fixed_opex"]
 
         # Build MILP model
-        prob = pulp.LpProblem(f"Bunkering_{shuttle_size_int}_{pump_size_int}", pulp.LpMinimize)
+        prob = pulp.LpProblem(f"Bunkering_{int(shuttle_size)}_{int(coeffs['pump_size'])}", pulp.LpMinimize)
 
         # Decision variables
         x = pulp.LpVariable.dicts("NewShuttles", self.years, lowBound=0, cat='Integer')
@@ -317,10 +447,10 @@ class BunkeringOptimizer:
             # Case 2: Each call ALSO delivers bunker_volume_per_call (5000 m³)
             #         (shuttle may serve multiple vessels per trip, but y[t] counts calls, not trips)
             # UNIFIED LOGIC: Both use bunker_volume_per_call
-            prob += y[t] * self.bunker_volume_per_call_m3 >= self.annual_demand[t]
+            prob += y[t] * self.bunker_volume_per_call_m3 >= self.annual_demand[t], f"Demand_{t}"
 
             # Working time capacity
-            prob += y[t] * trips_per_call * cycle_duration <= N[t] * self.max_annual_hours
+            prob += y[t] * trips_per_call * cycle_duration <= N[t] * self.max_annual_hours, f"WorkingTime_{t}"
 
             # Tank capacity (if both tank and shore_supply costs are enabled)
             # CRITICAL: Tank constraint must respect shore_supply.enabled flag
@@ -330,27 +460,591 @@ class BunkeringOptimizer:
                 prob += N[t] * shuttle_size * self.tank_safety_factor <= tank_capacity
 
             # Fleet sizing note:
-            # Working time constraint (line 280) is the binding constraint for fleet sizing.
+            # Working time constraint is the binding constraint for fleet sizing.
             # This ensures consistency with main.py's annual_simulation, which uses:
             #   required_shuttles = ceil((annual_calls × trips_per_call × cycle_duration) / max_annual_hours)
             # Removed daily peak constraint to match the proven baseline (annual_simulation)
 
-        # Solve
+        variables = {"x": x, "N": N, "y": y, "x_tank": x_tank, "N_tank": N_tank}
+        return prob, variables
+
+    def evaluate_combination(
+        self,
+        shuttle_size: float,
+        pump_size: float,
+        method: str = "auto"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        NPC and LCO of the optimal plan for one combination, without storing results.
+
+        Intended for analyses that need many evaluations of a single pair
+        (global sensitivity, surrogates). Values are not rounded.
+
+        With non-negative objective coefficients the MILP optimum is the minimal
+        plan: calls exactly meet demand, the fleet is the running maximum of the
+        required shuttles and tanks follow the fleet. method="auto" uses that
+        closed form in this case and the MILP otherwise.
+
+        Args:
+            shuttle_size: Shuttle size in m3
+            pump_size: Pump flow rate in m3/h
+            method: "auto", "milp" or "closed_form"
+
+        Returns:
+            Dict with npc_usdm, lco_usd_per_ton and fleet (by year),
+            or None if the combination is infeasible
+        """
+        if method not in ("auto", "milp", "closed_form"):
+            raise ValueError(f"Unknown method: {method}")
+
+        coeffs = self._prepare_combination(shuttle_size, pump_size)
+        if coeffs is None:
+            return None
+
+        use_milp = method == "milp" or (
+            method == "auto" and min(self._objective_coefficients(coeffs).values()) < 0
+        )
+        if use_milp:
+            prob, variables = self._build_problem(coeffs)
+            prob.solve(pulp.PULP_CBC_CMD(msg=0))
+            if pulp.LpStatus[prob.status] != "Optimal":
+                return None
+            solution = {
+                name: {t: (var.varValue or 0.0) for t, var in variables[name].items()}
+                for name in variables
+            }
+        else:
+            solution = self._minimal_plan(coeffs)
+            if solution is None:
+                return None
+
+        npc = self._reported_npc(coeffs, solution)
+        total_supply_ton = (
+            sum(solution["y"].values()) * self.bunker_volume_per_call_m3
+            * self.config["ammonia"]["density_storage_ton_m3"]
+        )
+        return {
+            "npc_usdm": npc / 1e6,
+            "lco_usd_per_ton": npc / total_supply_ton if total_supply_ton > 0 else 0.0,
+            "fleet": {t: round(v) for t, v in solution["N"].items()},
+        }
+
+    def _minimal_plan(self, coeffs: Dict) -> Optional[Dict[str, Dict[int, float]]]:
+        """
+        Minimal feasible plan (optimal when all cost coefficients are >= 0).
+
+        Same rule as the yearly simulation: required shuttles are
+        ceil(calls x trips x cycle hours / max annual hours), never decreasing.
+        """
+        hours_per_call = coeffs["trips_per_call"] * coeffs["cycle_duration"]
+        tank_active = self.tank_enabled and self.shore_supply_enabled
+        solution = {name: {} for name in ("x", "N", "y", "x_tank", "N_tank")}
+        fleet = tanks = 0
+
+        for t in self.years:
+            calls = self.annual_demand[t] / self.bunker_volume_per_call_m3
+            need = calls * hours_per_call
+            if need > 0:
+                if self.max_annual_hours <= 0:
+                    return None
+                required = ceil(need / self.max_annual_hours - 1e-9)
+            else:
+                required = 0
+            new_shuttles = max(required - fleet, 0)
+            fleet += new_shuttles
+
+            new_tanks = 0
+            if tank_active and fleet > 0:
+                if self.tank_volume_m3 <= 0:
+                    return None
+                required_tanks = ceil(
+                    fleet * coeffs["shuttle_size"] * self.tank_safety_factor / self.tank_volume_m3 - 1e-9
+                )
+                new_tanks = max(required_tanks - tanks, 0)
+                tanks += new_tanks
+
+            solution["x"][t] = float(new_shuttles)
+            solution["N"][t] = float(fleet)
+            solution["y"][t] = calls
+            solution["x_tank"][t] = float(new_tanks)
+            solution["N_tank"][t] = float(tanks)
+        return solution
+
+    # Parameters that enter the model linearly through cost coefficients or
+    # the working-time capacity, supported by analyze_lp_sensitivity()
+    LINEAR_PARAMETERS = (
+        "economy.fuel_price_usd_per_ton",
+        "shuttle.ref_capex_usd",
+        "shuttle.equipment_ratio",
+        "shuttle.fixed_opex_ratio",
+        "bunkering.fixed_opex_ratio",
+        "propulsion.pump_power_cost_usd_per_kw",
+        "operations.max_annual_hours_per_vessel",
+    )
+
+    def analyze_lp_sensitivity(
+        self,
+        shuttle_size: float,
+        pump_size: float,
+        parameters: Optional[List[str]] = None
+    ) -> Optional[Dict]:
+        """
+        Dual-based sensitivity analysis for one shuttle/pump combination.
+
+        Solves the MILP once, fixes all integer variables (fleet and tank
+        counts) at their optimal values and re-solves the remaining LP to obtain
+        shadow prices and reduced costs. These are combined with the linear
+        dependence of the cost coefficients on each parameter to give exact
+        local derivatives of the reported NPC and the parameter interval over
+        which the optimal fleet plan stays optimal.
+
+        Derivatives are the solved plan's values times the analytic gradients
+        of the cost coefficients (_coefficient_gradients()); no re-solves or
+        perturbed cost tables are needed.
+
+        Ranging rules:
+        - Cost parameters do not change the feasible set; the plan stays
+          optimal while no reduced cost of the fixed fleet/tank variables and
+          no demand shadow price changes sign (_reduced_cost_range()).
+        - max_annual_hours_per_vessel scales the working-time capacity; the plan
+          stays optimal while every year's fleet is still feasible and no year
+          could drop one shuttle (from working-time slacks).
+
+        Args:
+            shuttle_size: Shuttle size in m3
+            pump_size: Pump flow rate in m3/h
+            parameters: Config paths to analyze (default: LINEAR_PARAMETERS)
+
+        Returns:
+            Dict with shadow prices, slacks, reduced costs and per-parameter
+            derivatives/validity ranges, or None if infeasible
+        """
+        if parameters is None:
+            parameters = list(self.LINEAR_PARAMETERS)
+        unsupported = [p for p in parameters if p not in self.LINEAR_PARAMETERS]
+        if unsupported:
+            raise ValueError(f"Parameters do not enter the model linearly: {unsupported}")
+
+        coeffs = self._prepare_combination(shuttle_size, pump_size)
+        if coeffs is None:
+            return None
+
+        prob, variables = self._build_problem(coeffs)
+        prob.solve(pulp.PULP_CBC_CMD(msg=0))
+        if pulp.LpStatus[prob.status] != "Optimal":
+            return None
+
+        # Fix integer decisions and re-solve the LP relaxation for duals
+        for name in ("x", "N", "x_tank", "N_tank"):
+            for var in variables[name].values():
+                value = round(var.varValue or 0.0)
+                var.cat = pulp.LpContinuous
+                var.lowBound = value
+                var.upBound = value
         prob.solve(pulp.PULP_CBC_CMD(msg=0))
+        if pulp.LpStatus[prob.status] != "Optimal":
+            return None
+
+        solution = {
+            name: {t: (var.varValue or 0.0) for t, var in variables[name].items()}
+            for name in variables
+        }
+
+        shadow_prices = {
+            "demand": {t: prob.get_constraint_by_name(f"Demand_{t}").pi for t in self.years},
+            "working_time": {t: prob.get_constraint_by_name(f"WorkingTime_{t}").pi for t in self.years},
+        }
+        slacks = {
+            "working_time": {t: prob.get_constraint_by_name(f"WorkingTime_{t}").slack for t in self.years},
+        }
+        reduced_costs = {
+            name: {t: (variables[name][t].dj or 0.0) for t in self.years}
+            for name in ("x", "N", "y", "x_tank", "N_tank")
+        }
+
+        base_npc = self._reported_npc(coeffs, solution)
+        discount = {
+            t: 1.0 / ((1.0 + self.discount_rate) ** (t - self.start_year)) for t in self.years
+        }
+
+        results = {}
+        for path in parameters:
+            base_value = self._get_config_path(path)
+            # Every coefficient is linear in the parameter, so the fixed plan's
+            # NPC and objective move by solution values x coefficient gradients
+            gradient = self._coefficient_gradients(coeffs, path)
+            derivative = self._reported_npc(gradient, solution)
+            objective_gradient = self._objective_coefficients(gradient)
+            objective_derivative = sum(
+                discount[t] * objective_gradient[name] * solution[name][t]
+                for name in objective_gradient for t in self.years
+            )
+            if path == "operations.max_annual_hours_per_vessel":
+                # Constraint-side parameter: each working-time row gains N[t]
+                # hours of capacity per unit, valued at its shadow price
+                objective_derivative += sum(
+                    shadow_prices["working_time"][t] * solution["N"][t] for t in self.years
+                )
+                valid_range = self._working_time_range(solution, slacks["working_time"], base_value)
+            else:
+                valid_range = self._reduced_cost_range(
+                    objective_gradient, discount, shadow_prices, reduced_costs, base_value
+                )
 
-        status = pulp.LpStatus[prob.status]
-        if status != "Optimal":
-            return  # Skip infeasible solutions
+            results[path] = {
+                "base_value": base_value,
+                "derivative_usdm_per_unit": derivative / 1e6,
+                "objective_derivative_usd_per_unit": objective_derivative,
+                "elasticity": (derivative * base_value / base_npc) if base_npc else 0.0,
+                "valid_range": valid_range,
+            }
+
+        return {
+            "shuttle_size": int(shuttle_size),
+            "pump_size": int(pump_size),
+            "npc_usdm": base_npc / 1e6,
+            "fleet": solution["N"],
+            "annual_calls": solution["y"],
+            "shadow_prices": shadow_prices,
+            "slacks": slacks,
+            "reduced_costs": reduced_costs,
+            "parameters": results,
+        }
+
+    def _get_config_path(self, path: str) -> Any:
+        """Get value from config using dot notation."""
+        value = self.config
+        for key in path.split("."):
+            value = value[key]
+        return value
+
+    def _objective_coefficients(self, coeffs: Dict) -> Dict[str, float]:
+        """
+        Undiscounted MILP objective coefficient per unit of each decision variable.
 
-        # Extract and store results
-        self._extract_results(
-            shuttle_size, pump_size, x, N, y, x_tank, N_tank,
-            call_duration, cycle_duration,
-            shuttle_fuel_cost_per_cycle, pump_fuel_cost_per_call,
-            shuttle_capex, shuttle_fixed_opex, bunk_capex, bunk_fixed_opex,
-            trips_per_call,
-            cycle_info  # Pass complete time breakdown
+        The y coefficient includes shuttle fuel for trips_per_call cycles.
+        """
+        tank_active = self.tank_enabled and self.shore_supply_enabled
+        return {
+            "x": coeffs["shuttle_capex"] + coeffs["bunk_capex"],
+            "N": coeffs["shuttle_fixed_opex"] + coeffs["bunk_fixed_opex"],
+            "y": (coeffs["shuttle_fuel_cost_per_cycle"] * coeffs["trips_per_call"]
+                  + coeffs["pump_fuel_cost_per_call"]),
+            "x_tank": coeffs["tank_capex"] if tank_active else 0.0,
+            "N_tank": (coeffs["tank_fixed_opex"] + coeffs["tank_variable_opex"]) if tank_active else 0.0,
+        }
+
+    def _reported_npc(self, coeffs: Dict, solution: Dict[str, Dict[int, float]]) -> float:
+        """
+        NPC in USD as reported by _extract_results() for a fixed solution.
+
+        Uses annualized CAPEX on owned assets plus fixed and variable OPEX.
+        """
+        annuity_factor = self.tables.annuity_factor
+        tank_active = self.tank_enabled and self.shore_supply_enabled
+        npc = 0.0
+        for t in self.years:
+            disc_factor = 1.0 / ((1.0 + self.discount_rate) ** (t - self.start_year))
+            N_val = solution["N"][t]
+            y_val = solution["y"][t]
+            asset_value = N_val * (coeffs["shuttle_capex"] + coeffs["bunk_capex"])
+            year_cost = (
+                (asset_value / annuity_factor if annuity_factor > 0 else 0.0)
+                + (coeffs["shuttle_fixed_opex"] + coeffs["bunk_fixed_opex"]) * N_val
+                + coeffs["shuttle_fuel_cost_per_cycle"] * y_val * coeffs["trips_per_call"]
+                + coeffs["pump_fuel_cost_per_call"] * y_val
+            )
+            if tank_active:
+                N_tank_val = solution["N_tank"][t]
+                year_cost += (
+                    (N_tank_val * coeffs["tank_capex"] / annuity_factor if annuity_factor > 0 else 0.0)
+                    + (coeffs["tank_fixed_opex"] + coeffs["tank_variable_opex"]) * N_tank_val
+                )
+            npc += disc_factor * year_cost
+        return npc
+
+    # Cost coefficients of a prepared combination (see _prepare_combination())
+    COST_COEFFICIENTS = (
+        "shuttle_fuel_cost_per_cycle", "pump_fuel_cost_per_call",
+        "shuttle_capex", "shuttle_fixed_opex", "bunk_capex", "bunk_fixed_opex",
+        "tank_capex", "tank_fixed_opex", "tank_variable_opex",
+        "shore_pump_capex", "shore_pump_fixed_opex",
+    )
+
+    def _coefficient_gradients(self, coeffs: Dict, path: str) -> Dict:
+        """
+        Derivatives of a combination's cost coefficients with respect to one parameter.
+
+        Chain rule through the CostCalculator formulas. Returns a copy of coeffs
+        with every cost coefficient replaced by its derivative, so it can be
+        passed to _reported_npc() and _objective_coefficients().
+        """
+        shuttle_size = coeffs["shuttle_size"]
+        pump_size = coeffs["pump_size"]
+        shuttle_opex_ratio = self.config["shuttle"]["fixed_opex_ratio"]
+        bunk_opex_ratio = self.config["bunkering"]["fixed_opex_ratio"]
+
+        gradient = dict(coeffs)
+        gradient.update({key: 0.0 for key in self.COST_COEFFICIENTS})
+        if path == "economy.fuel_price_usd_per_ton":
+            (gradient["shuttle_fuel_cost_per_cycle"],
+             gradient["pump_fuel_cost_per_call"]) = self._fuel_per_event(shuttle_size, pump_size)
+        elif path == "shuttle.ref_capex_usd":
+            shuttle = self.config["shuttle"]
+            unit_capex = calculate_shuttle_capex(
+                shuttle_size, 1.0, shuttle["ref_size_cbm"], shuttle["capex_scaling_exponent"]
+            )
+            gradient["shuttle_capex"] = unit_capex
+            gradient["shuttle_fixed_opex"] = unit_capex * shuttle_opex_ratio
+            gradient["bunk_capex"] = unit_capex * shuttle["equipment_ratio"]
+            gradient["bunk_fixed_opex"] = gradient["bunk_capex"] * bunk_opex_ratio
+        elif path == "shuttle.equipment_ratio":
+            gradient["bunk_capex"] = coeffs["shuttle_capex"]
+            gradient["bunk_fixed_opex"] = coeffs["shuttle_capex"] * bunk_opex_ratio
+        elif path == "shuttle.fixed_opex_ratio":
+            gradient["shuttle_fixed_opex"] = coeffs["shuttle_capex"]
+        elif path == "bunkering.fixed_opex_ratio":
+            gradient["bunk_fixed_opex"] = coeffs["bunk_capex"]
+        elif path == "propulsion.pump_power_cost_usd_per_kw":
+            pump_power = self.cost_calc.calculate_pump_power(pump_size)
+            gradient["bunk_capex"] = pump_power
+            gradient["bunk_fixed_opex"] = pump_power * bunk_opex_ratio
+        # operations.max_annual_hours_per_vessel enters no cost coefficient
+        return gradient
+
+    def _reduced_cost_range(
+        self,
+        objective_gradient: Dict[str, float],
+        discount: Dict[int, float],
+        shadow_prices: Dict[str, Dict[int, float]],
+        reduced_costs: Dict[str, Dict[int, float]],
+        base_value: float
+    ) -> Tuple[float, float]:
+        """
+        Cost-parameter interval over which the fixed-integer LP stays optimal.
+
+        With the integers fixed by their bounds, the inventory rows carry no
+        dual, so each reduced cost and each demand shadow price is linear in
+        the parameter: r(p) = r0 + disc * g * (p - p0). The interval ends where
+        the first of them changes sign.
+        """
+        terms = []
+        for t, disc in discount.items():
+            for name in ("x", "N", "x_tank", "N_tank"):
+                terms.append((reduced_costs[name][t], disc * objective_gradient[name]))
+            terms.append((
+                shadow_prices["demand"][t],
+                disc * objective_gradient["y"] / self.bunker_volume_per_call_m3,
+            ))
+
+        low, high = float("-inf"), float("inf")
+        for value, slope in terms:
+            if abs(slope) < 1e-12:
+                continue
+            root = round(base_value - value / slope, 9)
+            if slope > 0:
+                low = max(low, root)
+            else:
+                high = min(high, root)
+        return low, high
+
+    def _working_time_range(
+        self,
+        solution: Dict[str, Dict[int, float]],
+        slacks: Dict[int, float],
+        base_value: float
+    ) -> Tuple[float, float]:
+        """
+        Interval of max_annual_hours over which the fleet plan stays optimal.
+
+        From the working-time slacks s = N * H - required hours: the lower bound
+        keeps every year feasible (s >= 0), the upper bound is the first value
+        at which some year could run one shuttle fewer (plan changes there).
+        """
+        low, high = 0.0, float("inf")
+        running_max_need = 0.0
+        for t in self.years:
+            fleet = round(solution["N"][t])
+            need = fleet * base_value - slacks[t]
+            running_max_need = max(running_max_need, need)
+            if fleet > 0:
+                low = max(low, base_value - slacks[t] / fleet)
+            if fleet > 1:
+                high = min(high, running_max_need / (fleet - 1))
+        return low, high
+
+    def parametric_npc_curve(
+        self,
+        shuttle_size: float,
+        pump_size: float,
+        parameter: str,
+        value_low: float,
+        value_high: float
+    ) -> Optional[List[Dict]]:
+        """
+        Exact piecewise-linear NPC curve over a cost-parameter interval.
+
+        For a fixed shuttle/pump, a cost parameter only scales objective
+        coefficients, so each fleet plan's cost is linear in the parameter and
+        the optimal objective is the lower envelope of those lines (concave,
+        piecewise linear). Breakpoints are found by bisecting that envelope
+        (Eisner-Severance): solve at both ends, intersect the two plans' lines,
+        solve at the intersection and recurse only if a cheaper plan appears.
+        A curve with k linear pieces costs 2k - 1 solves.
+
+        Args:
+            shuttle_size: Shuttle size in m3
+            pump_size: Pump flow rate in m3/h
+            parameter: Cost parameter path (LINEAR_PARAMETERS, except
+                operations.max_annual_hours_per_vessel)
+            value_low: Lower end of the parameter interval
+            value_high: Upper end of the parameter interval
+
+        Returns:
+            List of pieces ordered by parameter value, each with value range,
+            NPC/LCO at both ends, NPC slope and fleet plan; None if any solve is
+            infeasible
+        """
+        if (parameter not in self.LINEAR_PARAMETERS
+                or parameter == "operations.max_annual_hours_per_vessel"):
+            raise ValueError(f"'{parameter}' is not a linear cost parameter")
+        if value_low > value_high:
+            raise ValueError("value_low must not exceed value_high")
+
+        low = self._solve_plan_at(shuttle_size, pump_size, parameter, value_low)
+        high = self._solve_plan_at(shuttle_size, pump_size, parameter, value_high)
+        if low is None or high is None:
+            return None
+
+        pieces = self._bisect_envelope(shuttle_size, pump_size, parameter, low, high)
+        if pieces is None:
+            return None
+
+        # Merge neighbouring pieces that share a plan
+        merged = [pieces[0]]
+        for piece in pieces[1:]:
+            if piece[2]["key"] == merged[-1][2]["key"]:
+                merged[-1] = (merged[-1][0], piece[1], piece[2])
+            else:
+                merged.append(piece)
+
+        density = self.config["ammonia"]["density_storage_ton_m3"]
+        curve = []
+        for start, end, plan in merged:
+            npc_start = self._plan_npc_at(shuttle_size, pump_size, parameter, start, plan)
+            npc_end = self._plan_npc_at(shuttle_size, pump_size, parameter, end, plan)
+            supply_ton = sum(plan["solution"]["y"].values()) * self.bunker_volume_per_call_m3 * density
+            curve.append({
+                "value_low": start,
+                "value_high": end,
+                "npc_low_usdm": npc_start / 1e6,
+                "npc_high_usdm": npc_end / 1e6,
+                "npc_slope_usdm_per_unit": ((npc_end - npc_start) / (end - start) / 1e6
+                                            if end > start else 0.0),
+                "lco_low_usd_per_ton": npc_start / supply_ton if supply_ton > 0 else 0.0,
+                "lco_high_usd_per_ton": npc_end / supply_ton if supply_ton > 0 else 0.0,
+                "fleet": {t: round(v) for t, v in plan["solution"]["N"].items()},
+            })
+        return curve
+
+    def _solve_plan_at(
+        self,
+        shuttle_size: float,
+        pump_size: float,
+        parameter: str,
+        value: float
+    ) -> Optional[Dict]:
+        """Solve the MILP with parameter set to value and return its plan."""
+        optimizer = BunkeringOptimizer(ConfigOverlay(self.config, {parameter: value}))
+        coeffs = optimizer._prepare_combination(shuttle_size, pump_size)
+        if coeffs is None:
+            return None
+        prob, variables = optimizer._build_problem(coeffs)
+        prob.solve(pulp.PULP_CBC_CMD(msg=0))
+        if pulp.LpStatus[prob.status] != "Optimal":
+            return None
+
+        solution = {
+            name: {t: (var.varValue or 0.0) for t, var in variables[name].items()}
+            for name in variables
+        }
+        key = tuple(
+            (name, tuple(round(v, 6) for v in solution[name].values()))
+            for name in sorted(solution)
         )
+        return {"value": value, "objective": pulp.value(prob.objective),
+                "solution": solution, "key": key}
+
+    def _plan_objective_at(
+        self,
+        shuttle_size: float,
+        pump_size: float,
+        parameter: str,
+        value: float,
+        plan: Dict
+    ) -> float:
+        """MILP objective of a fixed plan with parameter set to value."""
+        optimizer = BunkeringOptimizer(ConfigOverlay(self.config, {parameter: value}))
+        coeffs = optimizer._prepare_combination(shuttle_size, pump_size)
+        prob, variables = optimizer._build_problem(coeffs)
+        for name, values in plan["solution"].items():
+            for t, v in values.items():
+                variables[name][t].varValue = v
+        return pulp.value(prob.objective)
+
+    def _plan_npc_at(
+        self,
+        shuttle_size: float,
+        pump_size: float,
+        parameter: str,
+        value: float,
+        plan: Dict
+    ) -> float:
+        """Reported NPC (USD) of a fixed plan with parameter set to value."""
+        optimizer = BunkeringOptimizer(ConfigOverlay(self.config, {parameter: value}))
+        coeffs = optimizer._prepare_combination(shuttle_size, pump_size)
+        return optimizer._reported_npc(coeffs, plan["solution"])
+
+    def _bisect_envelope(
+        self,
+        shuttle_size: float,
+        pump_size: float,
+        parameter: str,
+        low: Dict,
+        high: Dict
+    ) -> Optional[List[Tuple[float, float, Dict]]]:
+        """Recursive step of parametric_npc_curve() between two solved plans."""
+        if low["key"] == high["key"] or high["value"] <= low["value"]:
+            return [(low["value"], high["value"], low)]
+
+        # Objective lines of both plans across [low, high]
+        low_at_high = self._plan_objective_at(shuttle_size, pump_size, parameter, high["value"], low)
+        high_at_low = self._plan_objective_at(shuttle_size, pump_size, parameter, low["value"], high)
+        span = high["value"] - low["value"]
+        slope_low = (low_at_high - low["objective"]) / span
+        slope_high = (high["objective"] - high_at_low) / span
+
+        tolerance = 1e-9 * max(1.0, abs(low["objective"]), abs(high["objective"]))
+        if abs(slope_low - slope_high) * span <= tolerance:
+            # Parallel lines, both optimal at their ends: the plans tie throughout
+            return [(low["value"], high["value"], low)]
+
+        crossing = low["value"] + (high_at_low - low["objective"]) / (slope_low - slope_high)
+        crossing = min(max(round(crossing, 9), low["value"]), high["value"])
+        crossing_objective = low["objective"] + slope_low * (crossing - low["value"])
+
+        middle = self._solve_plan_at(shuttle_size, pump_size, parameter, crossing)
+        if middle is None:
+            return None
+        if middle["objective"] >= crossing_objective - tolerance:
+            # No plan beats both lines at the crossing: it is a breakpoint
+            return [(low["value"], crossing, low), (crossing, high["value"], high)]
+
+        left = self._bisect_envelope(shuttle_size, pump_size, parameter, low, middle)
+        right = self._bisect_envelope(shuttle_size, pump_size, parameter, middle, high)
+        if left is None or right is None:
+            return None
+        return left + right
 
     def _extract_results(self,
                         shuttle_size: float, pump_size: float,
@@ -392,9 +1086,9 @@ class BunkeringOptimizer:
                 total_tank_asset = N_tank_val * self.tank_capex
 
             # Convert to annualized CAPEX (same methodology as yearly_simulation)
-            annualized_shuttle_capex = self.cost_calc.calculate_annualized_capex_yearly(total_shuttle_asset)
-            annualized_bunk_capex = self.cost_calc.calculate_annualized_capex_yearly(total_bunk_asset)
-            annualized_tank_capex = self.cost_calc.calculate_annualized_capex_yearly(total_tank_asset)
+            annualized_shuttle_capex = self.tables.calculate_annualized_capex_yearly(total_shuttle_asset)
+            annualized_bunk_capex = self.tables.calculate_annualized_capex_yearly(total_bunk_asset)
+            annualized_tank_capex = self.tables.calculate_annualized_capex_yearly(total_tank_asset)
 
             # Accumulate annualized CAPEX
             npc_shuttle_cap += disc_factor * annualized_shuttle_capex
@@ -428,7 +1122,7 @@ class BunkeringOptimizer:
                 )
 
         # Calculate annualized costs and LCOAmmonia
-        annuity_factor = self.cost_calc.get_annuity_factor()
+        annuity_factor = self.tables.annuity_factor
 
         # Calculate total supply over 20 years for LCOAmmonia
         # NOTE: y[t] represents annual vessel bunkering calls for BOTH cases
@@ -451,10 +1145,10 @@ class BunkeringOptimizer:
         npc_total_fopex = npc_shuttle_fop + npc_bunk_fop + npc_tank_fop
         npc_total_vopex = npc_shuttle_vop + npc_bunk_vop + npc_tank_vop
 
-        annualized_total = self.cost_calc.annualize_scenario_npc(npc_total)
-        annualized_capex = self.cost_calc.annualize_scenario_npc(npc_total_capex)
-        annualized_fopex = self.cost_calc.annualize_scenario_npc(npc_total_fopex)
-        annualized_vopex = self.cost_calc.annualize_scenario_npc(npc_total_vopex)
+        annualized_total = self.tables.annualize_scenario_npc(npc_total)
+        annualized_capex = self.tables.annualize_scenario_npc(npc_total_capex)
+        annualized_fopex = self.tables.annualize_scenario_npc(npc_total_fopex)
+        annualized_vopex = self.tables.annualize_scenario_npc(npc_total_vopex)
 
         # Calculate additional time metrics
         # NOTE: These are THEORETICAL MAXIMUMS for a single shuttle at 100% utilization
@@ -475,6 +1169,8 @@ class BunkeringOptimizer:
 
             # ===== TIME BREAKDOWN (HOURS) =====
             "Shore_Loading_hr": round(cycle_info.get("shore_loading", 0), 4),
+            **({"Shore_Wait_hr": round(cycle_info["shore_wait"], 4)}
+               if self.shore_supply.loading_arms is not None else {}),
             "Travel_Outbound_hr": round(cycle_info.get("travel_outbound", 0), 4),
             "Travel_Return_hr": round(cycle_info.get("travel_return", 0), 4),
             "Setup_Inbound_hr": round(cycle_info.get("setup_inbound", 0), 4),
@@ -582,9 +1278,9 @@ class BunkeringOptimizer:
                     total_tank_asset_usd = N_tank_val * self.tank_capex
 
             # Calculate annualized CAPEX (consistent across years for owned assets)
-            annualized_shuttle_capex_usd = self.cost_calc.calculate_annualized_capex_yearly(total_shuttle_asset_usd)
-            annualized_pump_capex_usd = self.cost_calc.calculate_annualized_capex_yearly(total_pump_asset_usd)
-            annualized_tank_capex_usd = self.cost_calc.calculate_annualized_capex_yearly(total_tank_asset_usd)
+            annualized_shuttle_capex_usd = self.tables.calculate_annualized_capex_yearly(total_shuttle_asset_usd)
+            annualized_pump_capex_usd = self.tables.calculate_annualized_capex_yearly(total_pump_asset_usd)
+            annualized_tank_capex_usd = self.tables.calculate_annualized_capex_yearly(total_tank_asset_usd)
             annualized_total_capex_usd = annualized_shuttle_capex_usd + annualized_pump_capex_usd + annualized_tank_capex_usd
 
             # Total Year Cost = Annualized CAPEX + Total OPEX (consistent with yearly_simulation)
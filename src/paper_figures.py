@@ -11,6 +11,10 @@ Figure Categories:
     S1-S7: Stochastic Results
     C1-C4: Combined Analysis
 
+Result files are located through a ResultsCatalog (one scan of the
+results tree) and each dataset is read on first use, so rendering a
+single figure only loads the data that figure needs.
+
 Usage:
     from src.paper_figures import PaperFigureGenerator
     gen = PaperFigureGenerator("results/")
@@ -23,9 +27,21 @@ import matplotlib.pyplot as plt
 from matplotlib import rcParams
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import contextlib
+import hashlib
+import inspect
+import io
 import json
+import matplotlib
+import multiprocessing
+import re
+import time
 import warnings
 
+from .results_catalog import ResultsCatalog
+
 # Suppress matplotlib warnings
 warnings.filterwarnings('ignore', category=UserWarning)
 
@@ -56,6 +72,15 @@ COLORS = {
     'case_2': '#2ca02c', # Green
 }
 
+CASE_IDS = ['case_1', 'case_2', 'case_3']
+
+# Stochastic result directory of each case (relative to the results directory)
+STOCH_DIRS = {
+    'case_1': 'stochastic',
+    'case_3': 'stochastic_case3',
+    'case_2': 'stochastic_case2',
+}
+
 CASE_LABELS = {
     'case_1': 'Case 1: Busan Storage',
     'case_3': 'Case 3: Yeosu Direct',
@@ -89,6 +114,187 @@ Y_LIMITS_FLEET = {
     'case_2': 15,
 }
 
+# Figure ID -> generator method
+FIGURE_METHODS = {
+    # Deterministic figures (D1-D12)
+    'D1': 'fig_d1_npc_vs_shuttle',
+    'D2': 'fig_d2_yearly_cost_evolution',
+    'D3': 'fig_d3_yearly_fleet_demand',
+    'D4': 'fig_d4_yearly_cycles',
+    'D5': 'fig_d5_yearly_utilization',
+    'D45_CASES': 'generate_case_specific_figures',
+    'D6': 'fig_d6_cost_breakdown',
+    'D7': 'fig_d7_cycle_time',
+    'D8': 'fig_d8_fleet_evolution',
+    'D9': 'fig_d9_lco_comparison',
+    # D10 removed in v5 (redundant with D1)
+    'D11': 'fig_d11_top_configurations',
+    'D12': 'fig_d12_npc_heatmap',
+    # V5 combined figures
+    'V5_COST': 'fig_v5_cost_lcoa',
+    'V5_FLEET': 'fig_v5_fleet_demand',
+    # Stochastic figures (S1-S7)
+    'S1': 'fig_s1_npc_boxplot',
+    'S2': 'fig_s2_vss_evpi',
+    'S3': 'fig_s3_mc_distribution',
+    'S4': 'fig_s4_vessel_distribution',
+    'S5': 'fig_s5_tornado',
+    'S6': 'fig_s6_twoway_sensitivity',
+    'S7': 'fig_s7_pump_sensitivity',
+    # Deterministic sensitivity figures (Fig7-Fig10, FigS4-S5)
+    'FIG7': 'fig_7_tornado_deterministic',
+    'FIG8': 'fig_8_fuel_price_sensitivity',
+    'FIG9': 'fig_9_breakeven_distance',
+    'FIG10': 'fig_10_demand_scenarios',
+    'FIGS4': 'fig_s4_twoway_deterministic',
+    'FIGS5': 'fig_s5_bunker_volume_sensitivity',
+    # Discount rate sensitivity (Fig11 only; Fig12 removed in v5)
+    'FIG11': 'fig_11_discount_rate_sensitivity',
+    # Yang & Lam DES comparison (Fig13-Fig14)
+    'FIG13': 'fig_13_yang_lam_service_time',
+    'FIG14': 'fig_14_yang_lam_sensitivity',
+    # Combined figures (C1-C4)
+    'C1': 'fig_c1_det_vs_stoch',
+    'C2': 'fig_c2_breakeven_distance',
+    'C3': 'fig_c3_breakeven_demand',
+    'C4': 'fig_c4_summary_dashboard',
+}
+
+# generate_all() groups: (header, required data, warning if missing, figure IDs)
+FIGURE_GROUPS = [
+    ("[1/3] Generating Deterministic Figures (D1-D12)...", "deterministic",
+     "No deterministic data available",
+     ['D1', 'D2', 'D3', 'D4', 'D5', 'D45_CASES', 'D6', 'D7', 'D8', 'D9', 'D11', 'D12',
+      'V5_COST', 'V5_FLEET']),
+    ("[2/3] Generating Stochastic Figures (S1-S7)...", "stochastic",
+     "No stochastic data available",
+     ['S1', 'S2', 'S3', 'S4', 'S5', 'S6']),
+    # S7 uses separate sensitivity data
+    (None, None, None, ['S7']),
+    ("[2.5/3] Generating Deterministic Sensitivity Figures (Fig7-10, FigS4-S5)...", None, None,
+     ['FIG7', 'FIG8', 'FIG9', 'FIG10', 'FIGS4', 'FIGS5']),
+    ("[2.6/3] Generating Discount Rate Figures (Fig11)...", None, None, ['FIG11']),
+    ("[2.7/3] Generating Yang & Lam Comparison Figures (Fig13-14)...", None, None,
+     ['FIG13', 'FIG14']),
+    ("[3/3] Generating Combined Figures (C1-C4)...", "combined",
+     "Need both deterministic and stochastic data",
+     ['C1', 'C2', 'C3', 'C4']),
+]
+
+
+# Dataset -> files it is loaded from (glob patterns relative to the results directory)
+DATASET_FILES = {
+    'det_scenarios': [
+        'MILP_scenario_summary_*.csv',
+        'deterministic/MILP_scenario_summary_*.csv',
+        'deterministic/scenarios_*.csv',
+        'stochastic*/deterministic_scenarios_*.csv',
+    ],
+    'det_yearly': [
+        'MILP_per_year_results_*.csv',
+        'deterministic/MILP_per_year_results_*.csv',
+        'deterministic/yearly_*.csv',
+        'stochastic*/deterministic_yearly_*.csv',
+    ],
+    'stoch_summary': ['stochastic*/stochastic_summary_*.csv'],
+    'stoch_scenarios': ['stochastic*/stochastic_scenarios_*.csv'],
+    'tornado': ['stochastic*/tornado_*.csv'],
+    'pump_sensitivity': ['sensitivity/pump_sensitivity_*.csv'],
+    'tornado_det': ['sensitivity/tornado_det_*.csv'],
+    'fuel_price': ['sensitivity/fuel_price_*.csv'],
+    'breakeven_distance': ['sensitivity/breakeven_distance_ulsan.csv', 'sensitivity/breakeven_distance_yeosu.csv'],
+    'breakeven_distance_optimal': ['sensitivity/breakeven_distance_optimal_*.csv'],
+    'demand_scenarios': ['sensitivity/demand_scenarios_*.csv'],
+    'bunker_volume': ['sensitivity/bunker_volume_*.csv'],
+    'two_way_det': ['sensitivity/two_way_det_*.csv'],
+    'discount_rate': ['discount_rate_analysis/data/discount_rate_*.csv'],
+    'yang_lam': ['yang_lam_des_comparison/data/*.csv'],
+}
+
+# Dataset -> PaperFigureGenerator loader method
+DATASET_LOADERS = {
+    'det_scenarios': '_load_deterministic_scenarios',
+    'det_yearly': '_load_deterministic_yearly',
+    'stoch_summary': '_load_stochastic_summary',
+    'stoch_scenarios': '_load_stochastic_scenarios',
+    'tornado': '_load_tornado_data',
+    'pump_sensitivity': '_load_pump_sensitivity_data',
+    'tornado_det': '_load_deterministic_tornado',
+    'fuel_price': '_load_fuel_price_sensitivity',
+    'breakeven_distance': '_load_breakeven_distance',
+    'breakeven_distance_optimal': '_load_breakeven_distance_optimal',
+    'demand_scenarios': '_load_demand_scenarios',
+    'bunker_volume': '_load_bunker_volume_sensitivity',
+    'two_way_det': '_load_two_way_det',
+    'discount_rate': '_load_discount_rate_data',
+    'yang_lam': '_load_yang_lam_data',
+}
+
+# Figure ID -> datasets it reads (figures without data use built-in values)
+FIGURE_DATASETS = {
+    'D1': ['det_scenarios'],
+    'D2': ['det_scenarios', 'det_yearly'],
+    'D3': ['det_scenarios', 'det_yearly'],
+    'D4': ['det_scenarios', 'det_yearly'],
+    'D5': ['det_scenarios', 'det_yearly'],
+    'D45_CASES': ['det_yearly'],
+    'D6': ['det_scenarios'],
+    'D7': ['det_scenarios'],
+    'D8': ['det_scenarios', 'det_yearly'],
+    'D9': ['det_scenarios'],
+    'D11': ['det_scenarios'],
+    'D12': ['det_scenarios'],
+    'V5_COST': ['det_scenarios'],
+    'V5_FLEET': ['det_scenarios', 'det_yearly'],
+    'S1': ['stoch_summary', 'stoch_scenarios'],
+    'S2': ['stoch_summary'],
+    'S3': ['stoch_scenarios'],
+    'S4': [],
+    'S5': ['det_scenarios', 'tornado'],
+    'S6': ['det_scenarios'],
+    'S7': ['pump_sensitivity'],
+    'FIG7': ['det_scenarios', 'tornado_det'],
+    'FIG8': ['fuel_price'],
+    'FIG9': ['breakeven_distance', 'breakeven_distance_optimal'],
+    'FIG10': ['demand_scenarios'],
+    'FIGS4': ['two_way_det'],
+    'FIGS5': ['bunker_volume'],
+    'FIG11': ['discount_rate'],
+    'FIG13': ['yang_lam'],
+    'FIG14': ['yang_lam'],
+    'C1': ['det_scenarios', 'stoch_summary'],
+    'C2': ['det_scenarios'],
+    'C3': ['det_scenarios'],
+    'C4': ['det_scenarios', 'det_yearly', 'stoch_summary', 'tornado'],
+}
+
+# Input/code/output hashes of the rendered figures, kept in the output directory
+FIGURE_MANIFEST = "figure_manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class FigureResult:
+    """
+    Outcome of rendering one figure.
+
+    Attributes:
+        fig_id: Figure ID (key of FIGURE_METHODS)
+        duration_s: Render time in seconds (0 when skipped)
+        error: Error message if rendering failed
+        outputs: Files written, relative to the output directory
+        skipped: True if the figure was up to date and not re-rendered
+    """
+    fig_id: str
+    duration_s: float
+    error: Optional[str] = None
+    outputs: List[str] = field(default_factory=list)
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class PaperFigureGenerator:
     """
@@ -106,21 +312,50 @@ class PaperFigureGenerator:
         """
         self.results_dir = Path(results_dir)
         self.det_dir = self.results_dir / "deterministic"
-        self.stoch_dirs = {
-            'case_1': self.results_dir / "stochastic",
-            'case_3': self.results_dir / "stochastic_case3",
-            'case_2': self.results_dir / "stochastic_case2",
-        }
+        self.stoch_dirs = {case_id: self.results_dir / name for case_id, name in STOCH_DIRS.items()}
 
         # Apply paper style
         rcParams.update(PAPER_STYLE)
 
-        # Load data
-        self.det_scenarios = self._load_deterministic_scenarios()
-        self.det_yearly = self._load_deterministic_yearly()
-        self.stoch_summary = self._load_stochastic_summary()
-        self.stoch_scenarios = self._load_stochastic_scenarios()
-        self.tornado_data = self._load_tornado_data()
+        # Files written by the figure being rendered; file hash memo
+        self._saved: List[str] = []
+        self._hash_cache: Dict[Tuple[str, int, int], str] = {}
+
+        # Result files are indexed once; datasets load on first access
+        self.catalog = ResultsCatalog(str(self.results_dir))
+
+    # =========================================================================
+    # Datasets (loaded lazily through the results catalog)
+    # =========================================================================
+
+    def _dataset(self, name: str) -> Dict[str, pd.DataFrame]:
+        """A dataset (key of DATASET_LOADERS), loaded on first access."""
+        return self.catalog.dataset(name, getattr(self, DATASET_LOADERS[name]))
+
+    def load_datasets(self, names: List[str]) -> None:
+        """Load datasets up front (e.g. before forking render workers)."""
+        for name in names:
+            self._dataset(name)
+
+    @property
+    def det_scenarios(self) -> Dict[str, pd.DataFrame]:
+        return self._dataset('det_scenarios')
+
+    @property
+    def det_yearly(self) -> Dict[str, pd.DataFrame]:
+        return self._dataset('det_yearly')
+
+    @property
+    def stoch_summary(self) -> Dict[str, pd.DataFrame]:
+        return self._dataset('stoch_summary')
+
+    @property
+    def stoch_scenarios(self) -> Dict[str, pd.DataFrame]:
+        return self._dataset('stoch_scenarios')
+
+    @property
+    def tornado_data(self) -> Dict[str, pd.DataFrame]:
+        return self._dataset('tornado')
 
     def _load_deterministic_scenarios(self) -> Dict[str, pd.DataFrame]:
         """Load deterministic scenario results.
@@ -132,23 +367,14 @@ class PaperFigureGenerator:
         """
         data = {}
         for case_id in ['case_1', 'case_2', 'case_3']:
-            path = None
-            # Priority 1: main.py output (MILP_scenario_summary_*)
-            milp_path = self.results_dir / f"MILP_scenario_summary_{case_id}.csv"
-            if milp_path.exists():
-                path = milp_path
-            # Priority 1.5: deterministic directory (MILP_scenario_summary_*)
-            elif (self.det_dir / f"MILP_scenario_summary_{case_id}.csv").exists():
-                path = self.det_dir / f"MILP_scenario_summary_{case_id}.csv"
-            # Priority 2: deterministic directory (legacy)
-            elif (self.det_dir / f"scenarios_{case_id}.csv").exists():
-                path = self.det_dir / f"scenarios_{case_id}.csv"
-            # Priority 3: stochastic directory fallback
-            elif (self.stoch_dirs[case_id] / f"deterministic_scenarios_{case_id}.csv").exists():
-                path = self.stoch_dirs[case_id] / f"deterministic_scenarios_{case_id}.csv"
-
-            if path and path.exists():
-                data[case_id] = pd.read_csv(path)
+            path = self.catalog.first([
+                "MILP_scenario_summary",                            # main.py output
+                "deterministic/MILP_scenario_summary",              # deterministic directory
+                "deterministic/scenarios",                          # legacy
+                f"{STOCH_DIRS[case_id]}/deterministic_scenarios",   # stochastic fallback
+            ], case_id)
+            if path:
+                data[case_id] = self.catalog.read_csv(path)
                 print(f"  [OK] Loaded {case_id} deterministic scenarios")
             else:
                 print(f"  [WARN] Missing {case_id} deterministic scenarios")
@@ -164,61 +390,52 @@ class PaperFigureGenerator:
         """
         data = {}
         for case_id in ['case_1', 'case_2', 'case_3']:
-            path = None
-            # Priority 1: main.py output (MILP_per_year_results_*)
-            milp_path = self.results_dir / f"MILP_per_year_results_{case_id}.csv"
-            if milp_path.exists():
-                path = milp_path
-            # Priority 1.5: deterministic directory (MILP_per_year_results_*)
-            elif (self.det_dir / f"MILP_per_year_results_{case_id}.csv").exists():
-                path = self.det_dir / f"MILP_per_year_results_{case_id}.csv"
-            # Priority 2: deterministic directory (legacy)
-            elif (self.det_dir / f"yearly_{case_id}.csv").exists():
-                path = self.det_dir / f"yearly_{case_id}.csv"
-            # Priority 3: stochastic directory fallback
-            elif (self.stoch_dirs[case_id] / f"deterministic_yearly_{case_id}.csv").exists():
-                path = self.stoch_dirs[case_id] / f"deterministic_yearly_{case_id}.csv"
-
-            if path and path.exists():
-                data[case_id] = pd.read_csv(path)
+            path = self.catalog.first([
+                "MILP_per_year_results",
+                "deterministic/MILP_per_year_results",
+                "deterministic/yearly",
+                f"{STOCH_DIRS[case_id]}/deterministic_yearly",
+            ], case_id)
+            if path:
+                data[case_id] = self.catalog.read_csv(path)
         return data
 
     def _load_stochastic_summary(self) -> Dict[str, pd.DataFrame]:
         """Load stochastic summary results."""
         data = {}
-        for case_id, stoch_dir in self.stoch_dirs.items():
-            path = stoch_dir / f"stochastic_summary_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path)
+        for case_id, stoch_dir in STOCH_DIRS.items():
+            path = self.catalog.find(f"{stoch_dir}/stochastic_summary", case_id)
+            if path:
+                data[case_id] = self.catalog.read_csv(path)
                 print(f"  [OK] Loaded {case_id} stochastic summary")
         return data
 
     def _load_stochastic_scenarios(self) -> Dict[str, pd.DataFrame]:
         """Load Monte Carlo scenario results."""
-        data = {}
-        for case_id, stoch_dir in self.stoch_dirs.items():
-            path = stoch_dir / f"stochastic_scenarios_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path)
-        return data
+        return self._load_per_case({case_id: f"{stoch_dir}/stochastic_scenarios"
+                                    for case_id, stoch_dir in STOCH_DIRS.items()})
 
     def _load_tornado_data(self) -> Dict[str, pd.DataFrame]:
         """Load tornado diagram data."""
+        return self._load_per_case({case_id: f"{stoch_dir}/tornado"
+                                    for case_id, stoch_dir in STOCH_DIRS.items()})
+
+    def _load_per_case(self, analyses: Dict[str, str], **kwargs) -> Dict[str, pd.DataFrame]:
+        """Load one file per case (case ID -> catalog analysis name)."""
         data = {}
-        for case_id, stoch_dir in self.stoch_dirs.items():
-            path = stoch_dir / f"tornado_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path)
+        for case_id, analysis in analyses.items():
+            path = self.catalog.find(analysis, case_id)
+            if path:
+                data[case_id] = self.catalog.read_csv(path, **kwargs)
         return data
 
     def _load_pump_sensitivity_data(self) -> Dict[str, pd.DataFrame]:
         """Load pump rate sensitivity data for S7 figure."""
         data = {}
-        sensitivity_dir = self.results_dir / "sensitivity"
         for case_id in ['case_1', 'case_2', 'case_3']:
-            path = sensitivity_dir / f"pump_sensitivity_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path)
+            path = self.catalog.find("sensitivity/pump_sensitivity", case_id)
+            if path:
+                data[case_id] = self.catalog.read_csv(path)
                 print(f"  [OK] Loaded {case_id} pump sensitivity data")
             else:
                 print(f"  [WARN] Missing {case_id} pump sensitivity data")
@@ -226,77 +443,38 @@ class PaperFigureGenerator:
 
     def _load_fuel_price_sensitivity(self) -> Dict[str, pd.DataFrame]:
         """Load fuel price sensitivity data for Fig8."""
-        data = {}
-        sensitivity_dir = self.results_dir / "sensitivity"
-        for case_id in ['case_1', 'case_2', 'case_3']:
-            path = sensitivity_dir / f"fuel_price_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path)
-        return data
+        return self._load_per_case({case_id: "sensitivity/fuel_price" for case_id in CASE_IDS})
 
     def _load_deterministic_tornado(self) -> Dict[str, pd.DataFrame]:
         """Load deterministic tornado data for Fig7."""
-        data = {}
-        sensitivity_dir = self.results_dir / "sensitivity"
-        for case_id in ['case_1', 'case_2', 'case_3']:
-            path = sensitivity_dir / f"tornado_det_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path)
-        return data
+        return self._load_per_case({case_id: "sensitivity/tornado_det" for case_id in CASE_IDS})
 
     def _load_breakeven_distance(self) -> Dict[str, pd.DataFrame]:
         """Load breakeven distance data for Fig9."""
-        data = {}
-        sensitivity_dir = self.results_dir / "sensitivity"
-        for name in ['ulsan', 'yeosu']:
-            path = sensitivity_dir / f"breakeven_distance_{name}.csv"
-            if path.exists():
-                data[name] = pd.read_csv(path)
-        return data
+        return self._load_per_case({name: "sensitivity/breakeven_distance" for name in ['ulsan', 'yeosu']})
 
     def _load_breakeven_distance_optimal(self) -> Dict[str, pd.DataFrame]:
         """Load optimal-vs-optimal breakeven distance data for Fig9 overlay."""
-        data = {}
-        sensitivity_dir = self.results_dir / "sensitivity"
-        for name in ['ulsan', 'yeosu']:
-            path = sensitivity_dir / f"breakeven_distance_optimal_{name}.csv"
-            if path.exists():
-                data[name] = pd.read_csv(path)
-        return data
+        return self._load_per_case({name: "sensitivity/breakeven_distance_optimal"
+                                    for name in ['ulsan', 'yeosu']})
 
     def _load_demand_scenarios(self) -> Dict[str, pd.DataFrame]:
         """Load demand scenario data for Fig10."""
-        data = {}
-        sensitivity_dir = self.results_dir / "sensitivity"
-        for case_id in ['case_1', 'case_2', 'case_3']:
-            path = sensitivity_dir / f"demand_scenarios_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path)
+        data = self._load_per_case({case_id: "sensitivity/demand_scenarios" for case_id in CASE_IDS})
         # Also try summary file
-        summary_path = sensitivity_dir / "demand_scenarios_summary.csv"
-        if summary_path.exists():
-            data['summary'] = pd.read_csv(summary_path)
+        summary_path = self.catalog.find("sensitivity/demand_scenarios_summary")
+        if summary_path:
+            data['summary'] = self.catalog.read_csv(summary_path)
         return data
 
     def _load_bunker_volume_sensitivity(self) -> Dict[str, pd.DataFrame]:
         """Load bunker volume sensitivity data for FigS5."""
-        data = {}
-        sensitivity_dir = self.results_dir / "sensitivity"
-        for case_id in ['case_1', 'case_2', 'case_3']:
-            path = sensitivity_dir / f"bunker_volume_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path)
-        return data
+        return self._load_per_case({case_id: "sensitivity/bunker_volume" for case_id in CASE_IDS})
 
     def _load_two_way_det(self) -> Dict[str, pd.DataFrame]:
         """Load deterministic two-way sensitivity data for FigS4."""
-        data = {}
-        sensitivity_dir = self.results_dir / "sensitivity"
-        for case_id in ['case_1', 'case_2', 'case_3']:
-            path = sensitivity_dir / f"two_way_det_{case_id}.csv"
-            if path.exists():
-                data[case_id] = pd.read_csv(path, index_col=0)
-        return data
+        return self._load_per_case({case_id: "sensitivity/two_way_det" for case_id in CASE_IDS},
+                                   index_col=0)
 
     def _get_optimal(self, case_id: str) -> Dict[str, Any]:
         """Get optimal configuration for a case."""
@@ -374,7 +552,7 @@ class PaperFigureGenerator:
             ax.legend(loc='upper left', fontsize=11, framealpha=0.9)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D1_npc_vs_shuttle.png', bbox_inches='tight')
+        self._savefig(output_path / 'D1_npc_vs_shuttle.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D1: Total Cost vs Shuttle Size")
 
@@ -424,7 +602,7 @@ class PaperFigureGenerator:
             ax.grid(True, alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D2_yearly_cost_evolution.png', bbox_inches='tight')
+        self._savefig(output_path / 'D2_yearly_cost_evolution.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D2: Yearly Cost Evolution")
 
@@ -483,7 +661,7 @@ class PaperFigureGenerator:
             ax.legend(lines1 + lines2, labels1 + labels2, loc='upper left', fontsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D3_yearly_fleet_demand.png', bbox_inches='tight')
+        self._savefig(output_path / 'D3_yearly_fleet_demand.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D3: Yearly Fleet & Demand Evolution")
 
@@ -520,7 +698,7 @@ class PaperFigureGenerator:
         ax.grid(True, alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D4_yearly_cycles.png', bbox_inches='tight')
+        self._savefig(output_path / 'D4_yearly_cycles.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D4: Annual Cycles")
 
@@ -560,7 +738,7 @@ class PaperFigureGenerator:
         ax.grid(True, alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D5_yearly_utilization.png', bbox_inches='tight')
+        self._savefig(output_path / 'D5_yearly_utilization.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D5: Utilization Rate")
 
@@ -606,7 +784,7 @@ class PaperFigureGenerator:
         ax.grid(True, alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / f'D4_{case_label}.png', bbox_inches='tight')
+        self._savefig(output_path / f'D4_{case_label}.png', bbox_inches='tight')
         plt.close()
         print(f"  [OK] D4_{case_label}: Annual Cycles")
 
@@ -653,7 +831,7 @@ class PaperFigureGenerator:
         ax.grid(True, alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / f'D5_{case_label}.png', bbox_inches='tight')
+        self._savefig(output_path / f'D5_{case_label}.png', bbox_inches='tight')
         plt.close()
         print(f"  [OK] D5_{case_label}: Utilization Rate")
 
@@ -736,7 +914,7 @@ class PaperFigureGenerator:
             axes[idx].set_title(CASE_SHORT[case_id], fontweight='bold')
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D12_npc_heatmaps.png', bbox_inches='tight')
+        self._savefig(output_path / 'D12_npc_heatmaps.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D12: NPC Heatmaps (legacy)")
 
@@ -791,7 +969,7 @@ class PaperFigureGenerator:
         ax.grid(axis='y', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D6_cost_breakdown.png', bbox_inches='tight')
+        self._savefig(output_path / 'D6_cost_breakdown.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D6: Cost Breakdown")
 
@@ -842,7 +1020,7 @@ class PaperFigureGenerator:
         ax.grid(axis='y', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D7_cycle_time.png', bbox_inches='tight')
+        self._savefig(output_path / 'D7_cycle_time.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D7: Cycle Time")
 
@@ -877,7 +1055,7 @@ class PaperFigureGenerator:
         ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D8_fleet_evolution.png', bbox_inches='tight')
+        self._savefig(output_path / 'D8_fleet_evolution.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D8: Fleet Evolution")
 
@@ -907,7 +1085,7 @@ class PaperFigureGenerator:
         ax.set_ylim(0, max(lcos) * 1.2)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D9_lco_comparison.png', bbox_inches='tight')
+        self._savefig(output_path / 'D9_lco_comparison.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D9: LCO Comparison")
 
@@ -937,7 +1115,7 @@ class PaperFigureGenerator:
         ax.set_ylim(0, max(npcs) * 1.15)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D10_case_npc_comparison.png', bbox_inches='tight')
+        self._savefig(output_path / 'D10_case_npc_comparison.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D10: Case NPC Comparison")
 
@@ -969,7 +1147,7 @@ class PaperFigureGenerator:
                              f'${v:.1f}M', va='center', fontsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'D11_top_configurations.png', bbox_inches='tight')
+        self._savefig(output_path / 'D11_top_configurations.png', bbox_inches='tight')
         plt.close()
         print("  [OK] D11: Top Configurations")
 
@@ -1053,7 +1231,7 @@ class PaperFigureGenerator:
         ax2.tick_params(axis='both', labelsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'V5_cost_lcoa.png', bbox_inches='tight')
+        self._savefig(output_path / 'V5_cost_lcoa.png', bbox_inches='tight')
         plt.close()
         print("  [OK] V5: Cost Breakdown + LCOA Comparison")
 
@@ -1138,7 +1316,7 @@ class PaperFigureGenerator:
         ax2.tick_params(axis='both', labelsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'V5_fleet_demand.png', bbox_inches='tight')
+        self._savefig(output_path / 'V5_fleet_demand.png', bbox_inches='tight')
         plt.close()
         print("  [OK] V5: Fleet Evolution + Demand/Supply")
 
@@ -1196,7 +1374,7 @@ class PaperFigureGenerator:
         ax.grid(axis='y', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'S1_npc_boxplot.png', bbox_inches='tight')
+        self._savefig(output_path / 'S1_npc_boxplot.png', bbox_inches='tight')
         plt.close()
         print("  [OK] S1: NPC Box Plot")
 
@@ -1246,7 +1424,7 @@ class PaperFigureGenerator:
         ax2.grid(axis='y', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'S2_vss_evpi.png', bbox_inches='tight')
+        self._savefig(output_path / 'S2_vss_evpi.png', bbox_inches='tight')
         plt.close()
         print("  [OK] S2: VSS/EVPI")
 
@@ -1286,7 +1464,7 @@ class PaperFigureGenerator:
             ax.grid(axis='y', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'S3_mc_distribution.png', bbox_inches='tight')
+        self._savefig(output_path / 'S3_mc_distribution.png', bbox_inches='tight')
         plt.close()
         print("  [OK] S3: MC Distribution")
 
@@ -1319,7 +1497,7 @@ class PaperFigureGenerator:
                                fontweight='bold')
 
         plt.tight_layout()
-        plt.savefig(output_path / 'S4_vessel_distribution.png', bbox_inches='tight')
+        self._savefig(output_path / 'S4_vessel_distribution.png', bbox_inches='tight')
         plt.close()
         print("  [OK] S4: Vessel Distribution")
 
@@ -1363,7 +1541,7 @@ class PaperFigureGenerator:
             ax.grid(axis='x', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'S5_tornado.png', bbox_inches='tight')
+        self._savefig(output_path / 'S5_tornado.png', bbox_inches='tight')
         plt.close()
         print("  [OK] S5: Tornado Diagram")
 
@@ -1417,7 +1595,7 @@ class PaperFigureGenerator:
                              ha='center', va='center', fontsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'S6_twoway_sensitivity.png', bbox_inches='tight')
+        self._savefig(output_path / 'S6_twoway_sensitivity.png', bbox_inches='tight')
         plt.close()
         print("  [OK] S6: Two-Way Sensitivity")
 
@@ -1428,7 +1606,7 @@ class PaperFigureGenerator:
         Vertical dashed line at 500 m3/h indicates the fixed rate used in main analysis.
         """
         # Load pump sensitivity data
-        pump_data = self._load_pump_sensitivity_data()
+        pump_data = self._dataset('pump_sensitivity')
 
         if not pump_data:
             print("  [WARN] S7: No pump sensitivity data available")
@@ -1483,7 +1661,7 @@ class PaperFigureGenerator:
             ax.set_xlim(50, 1600)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'S7_pump_sensitivity.png', bbox_inches='tight')
+        self._savefig(output_path / 'S7_pump_sensitivity.png', bbox_inches='tight')
         plt.close()
         print("  [OK] S7: Pump Rate Sensitivity")
 
@@ -1493,7 +1671,7 @@ class PaperFigureGenerator:
 
     def fig_7_tornado_deterministic(self, output_path: Path) -> None:
         """Fig7: Tornado diagram from deterministic sensitivity (+/-20%)."""
-        tornado_data = self._load_deterministic_tornado()
+        tornado_data = self._dataset('tornado_det')
 
         if not tornado_data:
             print("  [WARN] Fig7: No deterministic tornado data available")
@@ -1546,13 +1724,13 @@ class PaperFigureGenerator:
             ax.grid(axis='x', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'Fig7_tornado_deterministic.png', bbox_inches='tight')
+        self._savefig(output_path / 'Fig7_tornado_deterministic.png', bbox_inches='tight')
         plt.close()
         print("  [OK] Fig7: Tornado Diagram (Deterministic)")
 
     def fig_8_fuel_price_sensitivity(self, output_path: Path) -> None:
         """Fig8: Fuel price sensitivity - LCO vs fuel price for all cases."""
-        fuel_data = self._load_fuel_price_sensitivity()
+        fuel_data = self._dataset('fuel_price')
 
         if not fuel_data:
             print("  [WARN] Fig8: No fuel price sensitivity data available")
@@ -1601,13 +1779,13 @@ class PaperFigureGenerator:
         ax2.tick_params(axis='both', labelsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'Fig8_fuel_price_sensitivity.png', bbox_inches='tight')
+        self._savefig(output_path / 'Fig8_fuel_price_sensitivity.png', bbox_inches='tight')
         plt.close()
         print("  [OK] Fig8: Fuel Price Sensitivity")
 
     def fig_9_breakeven_distance(self, output_path: Path) -> None:
         """Fig9: Break-even distance analysis - Case 1 vs Case 2 NPC curves."""
-        breakeven_data = self._load_breakeven_distance()
+        breakeven_data = self._dataset('breakeven_distance')
 
         if not breakeven_data:
             print("  [WARN] Fig9: No breakeven distance data available")
@@ -1668,7 +1846,7 @@ class PaperFigureGenerator:
                        linestyle='--', label='Case 1: Busan Storage (fixed NPC)')
 
         # --- Optimal-vs-optimal overlay (dashed curves) ---
-        optimal_data = self._load_breakeven_distance_optimal()
+        optimal_data = self._dataset('breakeven_distance_optimal')
         opt_case1_npc_val = None
 
         if optimal_data:
@@ -1732,13 +1910,13 @@ class PaperFigureGenerator:
         ax.set_ylim(0, None)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'Fig9_breakeven_distance.png', bbox_inches='tight')
+        self._savefig(output_path / 'Fig9_breakeven_distance.png', bbox_inches='tight')
         plt.close()
         print("  [OK] Fig9: Break-even Distance")
 
     def fig_10_demand_scenarios(self, output_path: Path) -> None:
         """Fig10: Demand scenario comparison - grouped bar chart."""
-        demand_data = self._load_demand_scenarios()
+        demand_data = self._dataset('demand_scenarios')
 
         # Prefer summary file
         if 'summary' in demand_data:
@@ -1808,13 +1986,13 @@ class PaperFigureGenerator:
         ax2.tick_params(axis='both', labelsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'Fig10_demand_scenarios.png', bbox_inches='tight')
+        self._savefig(output_path / 'Fig10_demand_scenarios.png', bbox_inches='tight')
         plt.close()
         print("  [OK] Fig10: Demand Scenarios")
 
     def fig_s4_twoway_deterministic(self, output_path: Path) -> None:
         """FigS4: Two-way sensitivity heatmap (actual optimization, not synthetic)."""
-        twoway_data = self._load_two_way_det()
+        twoway_data = self._dataset('two_way_det')
 
         if not twoway_data:
             print("  [WARN] FigS4: No two-way deterministic data available")
@@ -1864,13 +2042,13 @@ class PaperFigureGenerator:
                             fontsize=11, color=text_color)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'FigS4_twoway_deterministic.png', bbox_inches='tight')
+        self._savefig(output_path / 'FigS4_twoway_deterministic.png', bbox_inches='tight')
         plt.close()
         print("  [OK] FigS4: Two-Way Sensitivity (Deterministic)")
 
     def fig_s5_bunker_volume_sensitivity(self, output_path: Path) -> None:
         """FigS5: Bunker volume sensitivity - NPC and LCO vs bunker volume."""
-        volume_data = self._load_bunker_volume_sensitivity()
+        volume_data = self._dataset('bunker_volume')
 
         if not volume_data:
             print("  [WARN] FigS5: No bunker volume sensitivity data available")
@@ -1923,7 +2101,7 @@ class PaperFigureGenerator:
             lambda x, p: f'{x/1000:.1f}k' if x >= 1000 else f'{x:.0f}'))
 
         plt.tight_layout()
-        plt.savefig(output_path / 'FigS5_bunker_volume_sensitivity.png', bbox_inches='tight')
+        self._savefig(output_path / 'FigS5_bunker_volume_sensitivity.png', bbox_inches='tight')
         plt.close()
         print("  [OK] FigS5: Bunker Volume Sensitivity")
 
@@ -1973,7 +2151,7 @@ class PaperFigureGenerator:
         ax.grid(axis='y', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'C1_det_vs_stoch.png', bbox_inches='tight')
+        self._savefig(output_path / 'C1_det_vs_stoch.png', bbox_inches='tight')
         plt.close()
         print("  [OK] C1: Det vs Stoch")
 
@@ -2034,7 +2212,7 @@ class PaperFigureGenerator:
         ax.set_ylim(0, max(npc_vals) * 1.1)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'C2_breakeven_distance.png', bbox_inches='tight')
+        self._savefig(output_path / 'C2_breakeven_distance.png', bbox_inches='tight')
         plt.close()
         print("  [OK] C2: Break-even Distance")
 
@@ -2062,7 +2240,7 @@ class PaperFigureGenerator:
         ax.grid(True, alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'C3_breakeven_demand.png', bbox_inches='tight')
+        self._savefig(output_path / 'C3_breakeven_demand.png', bbox_inches='tight')
         plt.close()
         print("  [OK] C3: Break-even Demand")
 
@@ -2169,7 +2347,7 @@ class PaperFigureGenerator:
         fig.suptitle('Green Corridor Ammonia Bunkering Analysis Summary',
                     fontsize=16, fontweight='bold', y=0.98)
 
-        plt.savefig(output_path / 'C4_summary_dashboard.png', bbox_inches='tight')
+        self._savefig(output_path / 'C4_summary_dashboard.png', bbox_inches='tight')
         plt.close()
         print("  [OK] C4: Summary Dashboard")
 
@@ -2180,21 +2358,20 @@ class PaperFigureGenerator:
     def _load_discount_rate_data(self) -> Dict[str, pd.DataFrame]:
         """Load discount rate analysis data for Fig11/Fig12."""
         data = {}
-        dr_dir = self.results_dir / "discount_rate_analysis" / "data"
         # Comparison summary
-        comparison_path = dr_dir / "discount_rate_comparison.csv"
-        if comparison_path.exists():
-            data['comparison'] = pd.read_csv(comparison_path)
+        comparison_path = self.catalog.find("discount_rate_analysis/data/discount_rate_comparison")
+        if comparison_path:
+            data['comparison'] = self.catalog.read_csv(comparison_path)
         # Yearly data per case
         for case_id in ['case_1', 'case_2', 'case_3']:
-            yearly_path = dr_dir / f"discount_rate_yearly_{case_id}.csv"
-            if yearly_path.exists():
-                data[f'yearly_{case_id}'] = pd.read_csv(yearly_path)
+            yearly_path = self.catalog.find("discount_rate_analysis/data/discount_rate_yearly", case_id)
+            if yearly_path:
+                data[f'yearly_{case_id}'] = self.catalog.read_csv(yearly_path)
         return data
 
     def fig_11_discount_rate_sensitivity(self, output_path: Path) -> None:
         """Fig11: Discount rate sensitivity - NPC/LCO vs discount rate for all cases."""
-        dr_data = self._load_discount_rate_data()
+        dr_data = self._dataset('discount_rate')
 
         if 'comparison' not in dr_data:
             print("  [WARN] Fig11: No discount rate comparison data available")
@@ -2247,13 +2424,13 @@ class PaperFigureGenerator:
         ax2.tick_params(axis='both', labelsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'Fig11_discount_rate_sensitivity.png', bbox_inches='tight')
+        self._savefig(output_path / 'Fig11_discount_rate_sensitivity.png', bbox_inches='tight')
         plt.close()
         print("  [OK] Fig11: Discount Rate Sensitivity")
 
     def fig_12_discount_rate_fleet(self, output_path: Path) -> None:
         """Fig12: Fleet expansion timeline under different discount rates."""
-        dr_data = self._load_discount_rate_data()
+        dr_data = self._dataset('discount_rate')
 
         # Need yearly data for at least one case
         yearly_keys = [k for k in dr_data if k.startswith('yearly_')]
@@ -2307,7 +2484,7 @@ class PaperFigureGenerator:
             ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
 
         plt.tight_layout()
-        plt.savefig(output_path / 'Fig12_discount_rate_fleet.png', bbox_inches='tight')
+        self._savefig(output_path / 'Fig12_discount_rate_fleet.png', bbox_inches='tight')
         plt.close()
         print("  [OK] Fig12: Fleet Expansion Timeline")
 
@@ -2318,18 +2495,16 @@ class PaperFigureGenerator:
     def _load_yang_lam_data(self) -> Dict[str, pd.DataFrame]:
         """Load Yang & Lam comparison data for Fig13/Fig14."""
         data = {}
-        yl_dir = self.results_dir / "yang_lam_des_comparison" / "data"
-
         for name in ['service_time_comparison', 'flow_rate_sensitivity_comparison',
                      'sensitivity_summary_comparison']:
-            path = yl_dir / f"{name}.csv"
-            if path.exists():
-                data[name] = pd.read_csv(path)
+            path = self.catalog.find(f"yang_lam_des_comparison/data/{name}")
+            if path:
+                data[name] = self.catalog.read_csv(path)
         return data
 
     def fig_13_yang_lam_service_time(self, output_path: Path) -> None:
         """Fig13: Yang & Lam DES vs MILP service time comparison (2 panels)."""
-        yl_data = self._load_yang_lam_data()
+        yl_data = self._dataset('yang_lam')
 
         if 'service_time_comparison' not in yl_data:
             print("  [WARN] Fig13: No Yang & Lam service time data available")
@@ -2403,13 +2578,13 @@ class PaperFigureGenerator:
         ax2.tick_params(axis='both', labelsize=11)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'Fig13_yang_lam_service_time.png', bbox_inches='tight')
+        self._savefig(output_path / 'Fig13_yang_lam_service_time.png', bbox_inches='tight')
         plt.close()
         print("  [OK] Fig13: Yang & Lam Service Time Comparison")
 
     def fig_14_yang_lam_sensitivity(self, output_path: Path) -> None:
         """Fig14: Yang & Lam DES vs MILP sensitivity comparison (2 panels)."""
-        yl_data = self._load_yang_lam_data()
+        yl_data = self._dataset('yang_lam')
 
         has_flow = 'flow_rate_sensitivity_comparison' in yl_data
         has_sens = 'sensitivity_summary_comparison' in yl_data
@@ -2496,20 +2671,200 @@ class PaperFigureGenerator:
                      ha='center', va='center', fontsize=14)
 
         plt.tight_layout()
-        plt.savefig(output_path / 'Fig14_yang_lam_sensitivity.png', bbox_inches='tight')
+        self._savefig(output_path / 'Fig14_yang_lam_sensitivity.png', bbox_inches='tight')
         plt.close()
         print("  [OK] Fig14: Yang & Lam Sensitivity Comparison")
 
+    # =========================================================================
+    # Figure Manifest (incremental regeneration)
+    # =========================================================================
+
+    def _savefig(self, path: Path, **kwargs) -> None:
+        """Save the current figure and record the file for the manifest."""
+        plt.savefig(path, **kwargs)
+        self._saved.append(Path(path).name)
+
+    def _hash_file(self, path: Path) -> str:
+        """SHA-256 of a file, memoized by (path, mtime, size)."""
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        cached = self._hash_cache.get(key)
+        if cached is None:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            cached = self._hash_cache[key] = digest.hexdigest()
+        return cached
+
+    def dataset_hashes(self, dataset: str) -> Dict[str, str]:
+        """Hashes of a dataset's files, by results-relative path."""
+        return {rel_path: self._hash_file(self.catalog.path(rel_path))
+                for rel_path in self.catalog.match(DATASET_FILES[dataset])}
+
+    def figure_fingerprint(self, fig_id: str) -> Dict[str, Any]:
+        """
+        Fingerprint of everything a figure is drawn from.
+
+        Args:
+            fig_id: Figure ID (key of FIGURE_METHODS)
+
+        Returns:
+            Dict with "inputs" (file -> hash of its declared datasets),
+            "code" (hash of the figure method and the methods it calls)
+            and "style" (hash of the style settings)
+        """
+        inputs = {}
+        for dataset in FIGURE_DATASETS[fig_id]:
+            inputs.update(self.dataset_hashes(dataset))
+        return {"inputs": inputs, "code": _code_hash(FIGURE_METHODS[fig_id]), "style": _style_hash()}
+
+    def _load_manifest(self, output_path: Path) -> Dict[str, Dict]:
+        path = output_path / FIGURE_MANIFEST
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest.get("figures", {})
+        return {}
+
+    def _save_manifest(self, output_path: Path, figures: Dict[str, Dict]) -> None:
+        path = output_path / FIGURE_MANIFEST
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "figures": figures}, f, indent=2, sort_keys=True)
+        tmp_path.replace(path)
+
+    def _is_current(self, entry: Optional[Dict], fingerprint: Dict[str, Any], output_path: Path) -> bool:
+        """True if a manifest entry matches the fingerprint and its files are untouched."""
+        if entry is None or any(entry.get(key) != value for key, value in fingerprint.items()):
+            return False
+        for name, digest in entry.get("outputs", {}).items():
+            path = output_path / name
+            if not path.is_file() or self._hash_file(path) != digest:
+                return False
+        return True
+
     # =========================================================================
     # Main Generation Method
     # =========================================================================
 
-    def generate_all(self, output_dir: str = "results/paper_figures") -> None:
+    def generate_figures(self, fig_ids: List[str], output_dir: str = "results/paper_figures",
+                         jobs: int = 1, incremental: bool = False) -> Dict[str, FigureResult]:
+        """
+        Generate selected figures, optionally in parallel.
+
+        With jobs > 1, figures are rendered in a pool of forked worker
+        processes (Agg backend) that share the already-loaded data. Output
+        files are the same as a serial run.
+
+        Every rendered figure is recorded in the output directory's
+        manifest (FIGURE_MANIFEST) with the hashes of its input files,
+        code, style settings and outputs. With incremental=True, figures
+        whose record still matches are skipped.
+
+        Args:
+            fig_ids: Figure IDs (keys of FIGURE_METHODS), in output order
+            output_dir: Output directory for figures
+            jobs: Number of worker processes (1 = render in this process)
+            incremental: Skip figures that are up to date
+
+        Returns:
+            Dictionary mapping figure ID to its FigureResult
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        unknown = [fig_id for fig_id in fig_ids if fig_id not in FIGURE_METHODS]
+        if unknown:
+            raise ValueError(f"Unknown figure IDs: {unknown}")
+
+        if jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            print("  [WARN] Parallel rendering needs the 'fork' start method; rendering serially")
+            jobs = 1
+
+        manifest = self._load_manifest(output_path)
+        fingerprints = {fig_id: self.figure_fingerprint(fig_id) for fig_id in fig_ids}
+        skipped = {}
+        if incremental:
+            for fig_id in fig_ids:
+                entry = manifest.get(fig_id)
+                if self._is_current(entry, fingerprints[fig_id], output_path):
+                    skipped[fig_id] = FigureResult(fig_id=fig_id, duration_s=0.0,
+                                                   outputs=sorted(entry.get("outputs", {})), skipped=True)
+            if skipped:
+                print(f"  [OK] Up to date, skipped: {list(skipped)}")
+        to_render = [fig_id for fig_id in fig_ids if fig_id not in skipped]
+
+        results = {}
+        if jobs <= 1 or len(to_render) <= 1:
+            for fig_id in to_render:
+                results[fig_id] = self._render_figure(fig_id, output_path)
+        else:
+            # Load the data once here; forked workers share it
+            self.load_datasets(list(dict.fromkeys(
+                name for fig_id in to_render for name in FIGURE_DATASETS[fig_id]
+            )))
+            global _WORKER_GENERATOR
+            _WORKER_GENERATOR = self
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(jobs, len(to_render)),
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=_init_figure_worker,
+                ) as pool:
+                    rendered = pool.map(_render_in_worker, to_render, [str(output_path)] * len(to_render))
+                    # Worker output is replayed in figure order
+                    for result, log in rendered:
+                        print(log, end="")
+                        results[result.fig_id] = result
+            finally:
+                _WORKER_GENERATOR = None
+
+        # Record rendered figures; failed ones are dropped so they re-render
+        for fig_id, result in results.items():
+            if result.ok:
+                manifest[fig_id] = dict(
+                    fingerprints[fig_id],
+                    outputs={name: self._hash_file(output_path / name)
+                             for name in result.outputs if (output_path / name).is_file()},
+                )
+            else:
+                manifest.pop(fig_id, None)
+                print(f"  [ERROR] {result.fig_id}: {result.error}")
+        if results:
+            self._save_manifest(output_path, manifest)
+
+        results.update(skipped)
+        return {fig_id: results[fig_id] for fig_id in fig_ids}
+
+    def _render_figure(self, fig_id: str, output_path: Path) -> FigureResult:
+        """Render one figure, recording its duration and any error."""
+        start = time.perf_counter()
+        error = None
+        self._saved = []
+        try:
+            getattr(self, FIGURE_METHODS[fig_id])(output_path)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            plt.close("all")
+        return FigureResult(fig_id=fig_id, duration_s=time.perf_counter() - start, error=error,
+                            outputs=list(dict.fromkeys(self._saved)))
+
+    def generate_all(self, output_dir: str = "results/paper_figures",
+                     jobs: int = 1, incremental: bool = False) -> Dict[str, FigureResult]:
         """
         Generate all paper figures.
 
         Args:
             output_dir: Output directory for figures
+            jobs: Number of worker processes (1 = serial)
+            incremental: Only re-render figures whose inputs, code or style
+                changed (see generate_figures)
+
+        Returns:
+            Dictionary mapping figure ID to its FigureResult
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -2518,78 +2873,43 @@ class PaperFigureGenerator:
         print("Paper Figure Generation")
         print("=" * 60)
         print(f"Output directory: {output_path}")
+        if jobs > 1:
+            print(f"Parallel workers: {jobs}")
         print("=" * 60)
 
-        # Deterministic Figures (D1-D12)
-        print("\n[1/3] Generating Deterministic Figures (D1-D12)...")
-        if self.det_scenarios:
-            self.fig_d1_npc_vs_shuttle(output_path)
-            self.fig_d2_yearly_cost_evolution(output_path)
-            self.fig_d3_yearly_fleet_demand(output_path)
-            self.fig_d4_yearly_cycles(output_path)
-            self.fig_d5_yearly_utilization(output_path)
-            # Case-specific D4/D5 figures with multiple shuttle sizes
-            self.generate_case_specific_figures(output_path)
-            self.fig_d6_cost_breakdown(output_path)
-            self.fig_d7_cycle_time(output_path)
-            self.fig_d8_fleet_evolution(output_path)
-            self.fig_d9_lco_comparison(output_path)
-            # fig_d10_case_npc_comparison removed in v5 (redundant with D1)
-            self.fig_d11_top_configurations(output_path)
-            self.fig_d12_npc_heatmap(output_path)
-            # V5 combined figures
-            self.fig_v5_cost_lcoa(output_path)
-            self.fig_v5_fleet_demand(output_path)
-        else:
-            print("  [WARN] No deterministic data available")
+        start = time.perf_counter()
+        available = {
+            "deterministic": bool(self.det_scenarios),
+            "stochastic": bool(self.stoch_summary),
+            "combined": bool(self.det_scenarios and self.stoch_summary),
+        }
 
-        # Stochastic Figures
-        print("\n[2/3] Generating Stochastic Figures (S1-S7)...")
-        if self.stoch_summary:
-            self.fig_s1_npc_boxplot(output_path)
-            self.fig_s2_vss_evpi(output_path)
-            self.fig_s3_mc_distribution(output_path)
-            self.fig_s4_vessel_distribution(output_path)
-            self.fig_s5_tornado(output_path)
-            self.fig_s6_twoway_sensitivity(output_path)
-        else:
-            print("  [WARN] No stochastic data available")
-
-        # S7 can be generated independently (uses separate sensitivity data)
-        self.fig_s7_pump_sensitivity(output_path)
-
-        # New Deterministic Sensitivity Figures (Fig7-Fig10, FigS4-S5)
-        print("\n[2.5/3] Generating Deterministic Sensitivity Figures (Fig7-10, FigS4-S5)...")
-        self.fig_7_tornado_deterministic(output_path)
-        self.fig_8_fuel_price_sensitivity(output_path)
-        self.fig_9_breakeven_distance(output_path)
-        self.fig_10_demand_scenarios(output_path)
-        self.fig_s4_twoway_deterministic(output_path)
-        self.fig_s5_bunker_volume_sensitivity(output_path)
-
-        # Discount Rate Sensitivity Figures (Fig11 only; Fig12 removed in v5 - 3 identical lines)
-        print("\n[2.6/3] Generating Discount Rate Figures (Fig11)...")
-        self.fig_11_discount_rate_sensitivity(output_path)
-        # fig_12_discount_rate_fleet removed in v5 (3 overlapping lines)
-
-        # Yang & Lam DES Comparison Figures (Fig13-Fig14)
-        print("\n[2.7/3] Generating Yang & Lam Comparison Figures (Fig13-14)...")
-        self.fig_13_yang_lam_service_time(output_path)
-        self.fig_14_yang_lam_sensitivity(output_path)
-
-        # Combined Figures
-        print("\n[3/3] Generating Combined Figures (C1-C4)...")
-        if self.det_scenarios and self.stoch_summary:
-            self.fig_c1_det_vs_stoch(output_path)
-            self.fig_c2_breakeven_distance(output_path)
-            self.fig_c3_breakeven_demand(output_path)
-            self.fig_c4_summary_dashboard(output_path)
-        else:
-            print("  [WARN] Need both deterministic and stochastic data")
+        # Serial runs print each group as it renders; parallel runs print
+        # the group messages first and the figures' output afterwards
+        results = {}
+        fig_ids = []
+        for header, requires, warning, group_ids in FIGURE_GROUPS:
+            if header:
+                print(f"\n{header}")
+            if requires and not available[requires]:
+                print(f"  [WARN] {warning}")
+                continue
+            if jobs > 1:
+                fig_ids.extend(group_ids)
+            else:
+                results.update(self.generate_figures(group_ids, output_dir, incremental=incremental))
+        if jobs > 1:
+            print("\nRendering figures...")
+            results = self.generate_figures(fig_ids, output_dir, jobs=jobs, incremental=incremental)
 
         # Summary
+        failed = [fig_id for fig_id, result in results.items() if not result.ok]
+        skipped = [fig_id for fig_id, result in results.items() if result.skipped]
         print("\n" + "=" * 60)
-        print("[OK] Figure generation complete!")
+        if failed:
+            print(f"[WARN] Figure generation finished with errors: {failed}")
+        else:
+            print("[OK] Figure generation complete!")
         print("=" * 60)
 
         # List generated files
@@ -2598,7 +2918,79 @@ class PaperFigureGenerator:
         print(f"\nGenerated files:")
         print(f"  PNG: {len(png_files)} files")
         print(f"  PDF: {len(pdf_files)} files")
+        if skipped:
+            print(f"  Up to date (not re-rendered): {len(skipped)} figures")
         print(f"\nLocation: {output_path}")
+        print(f"Time: {time.perf_counter() - start:.1f}s")
+
+        return results
+
+
+# ============================================================================
+# Code and Style Fingerprints
+# ============================================================================
+
+_CODE_HASHES: Dict[str, str] = {}
+
+
+def _method_closure(name: str) -> List[str]:
+    """A generator method and every generator method it calls, in call order."""
+    seen = []
+    pending = [name]
+    while pending:
+        current = pending.pop(0)
+        if current in seen:
+            continue
+        seen.append(current)
+        source = inspect.getsource(getattr(PaperFigureGenerator, current))
+        for called in re.findall(r"self\.(\w+)\(", source):
+            if callable(getattr(PaperFigureGenerator, called, None)):
+                pending.append(called)
+    return seen
+
+
+def _code_hash(method_name: str) -> str:
+    """Hash of a figure method's source and the methods it calls."""
+    if method_name not in _CODE_HASHES:
+        digest = hashlib.sha256()
+        for name in _method_closure(method_name):
+            digest.update(inspect.getsource(getattr(PaperFigureGenerator, name)).encode("utf-8"))
+        _CODE_HASHES[method_name] = digest.hexdigest()
+    return _CODE_HASHES[method_name]
+
+
+def _style_hash() -> str:
+    """Hash of the shared style settings and the matplotlib version."""
+    style = {
+        "paper_style": PAPER_STYLE,
+        "colors": COLORS,
+        "case_labels": CASE_LABELS,
+        "case_short": CASE_SHORT,
+        "y_limits": [Y_LIMITS_NPC, Y_LIMITS_YEARLY_COST, Y_LIMITS_FLEET],
+        "matplotlib": matplotlib.__version__,
+    }
+    return hashlib.sha256(json.dumps(style, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# Parallel Rendering
+# ============================================================================
+
+# Generator shared with forked workers (set by generate_figures)
+_WORKER_GENERATOR: Optional[PaperFigureGenerator] = None
+
+
+def _init_figure_worker() -> None:
+    """Worker setup: render off-screen."""
+    plt.switch_backend("Agg")
+
+
+def _render_in_worker(fig_id: str, output_dir: str) -> Tuple[FigureResult, str]:
+    """Render one figure in a worker; returns its result and captured output."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = _WORKER_GENERATOR._render_figure(fig_id, Path(output_dir))
+    return result, buffer.getvalue()
 
 
 # ============================================================================
@@ -2606,16 +2998,21 @@ class PaperFigureGenerator:
 # ============================================================================
 
 def generate_paper_figures(results_dir: str = "results",
-                          output_dir: str = "results/paper_figures") -> None:
+                          output_dir: str = "results/paper_figures",
+                          jobs: int = 1) -> Dict[str, FigureResult]:
     """
     Convenience function to generate all paper figures.
 
     Args:
         results_dir: Directory containing result CSV files
         output_dir: Output directory for figures
+        jobs: Number of worker processes (1 = serial)
+
+    Returns:
+        Dictionary mapping figure ID to its FigureResult
     """
     generator = PaperFigureGenerator(results_dir)
-    generator.generate_all(output_dir)
+    return generator.generate_all(output_dir, jobs=jobs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pipeline Module - Dependency-aware runner for the analysis scripts.
+
+Each stage is a script with declared inputs (configs, code, upstream
+results) and outputs. Content hashes of all input and output files are
+stored after every successful run, so a stage is:
+
+- skipped when no input changed and its outputs are untouched,
+- re-run in full when code, configs, arguments or its outputs changed,
+- re-run for a subset of targets (e.g. figures) when only data files
+  mapped to those targets changed.
+
+Because upstream outputs are hashed, a stage that re-runs but writes
+identical results does not invalidate its dependents. Independent stages
+run concurrently as subprocesses.
+
+Usage:
+    from src.pipeline import Pipeline, Stage
+    pipeline = Pipeline([
+        Stage("sensitivity", "scripts/run_deterministic_sensitivity.py",
+              inputs=["config/*.yaml", "src/*.py"],
+              outputs=["results/sensitivity/fuel_price_*.csv"]),
+    ])
+    pipeline.run(jobs=4)
+"""
+
+import fnmatch
+import hashlib
+import json
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class Stage:
+    """
+    One pipeline stage.
+
+    Attributes:
+        name: Stage name
+        script: Python script, relative to the pipeline root
+        args: Script arguments
+        inputs: Glob patterns of input files (the script is always an input)
+        outputs: Glob patterns of output files
+        depends_on: Names of stages whose outputs are inputs of this stage
+        targets: Target ID -> glob patterns of the data it depends on; when
+            only such files changed, just the affected targets are rebuilt
+        target_arg: Argument that selects targets (e.g. "--figures")
+    """
+    name: str
+    script: str
+    args: List[str] = field(default_factory=list)
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    depends_on: List[str] = field(default_factory=list)
+    targets: Dict[str, List[str]] = field(default_factory=dict)
+    target_arg: Optional[str] = None
+
+
+@dataclass
+class StageResult:
+    """
+    Outcome of one stage in a pipeline run.
+
+    Attributes:
+        name: Stage name
+        status: "skipped", "ran", "partial", "failed" or "blocked"
+        targets: Targets rebuilt by a partial run
+        changed: Input files that changed since the last run
+        duration_s: Wall time in seconds
+        returncode: Script exit code (None if not run)
+    """
+    name: str
+    status: str
+    targets: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    duration_s: float = 0.0
+    returncode: Optional[int] = None
+
+
+class Pipeline:
+    """
+    Dependency-aware, incremental, concurrent stage runner.
+
+    Args:
+        stages: Stage definitions (names must be unique)
+        root: Project root; scripts run with it as working directory
+        state_path: Hash state file (default: results/.pipeline/state.json)
+        log_dir: Per-stage logs (default: results/.pipeline/logs)
+        python: Interpreter for the scripts (default: the current one)
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        root: str = ".",
+        state_path: Optional[str] = None,
+        log_dir: Optional[str] = None,
+        python: Optional[str] = None
+    ):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names")
+        for stage in stages:
+            unknown = [dep for dep in stage.depends_on if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages: {unknown}")
+        self._check_acyclic()
+
+        self.root = Path(root).resolve()
+        pipeline_dir = self.root / "results" / ".pipeline"
+        self.state_path = Path(state_path) if state_path else pipeline_dir / "state.json"
+        self.log_dir = Path(log_dir) if log_dir else pipeline_dir / "logs"
+        self.python = python or sys.executable
+
+        self._lock = threading.Lock()
+        self._hash_cache: Dict[Tuple[str, int, int], str] = {}
+
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if stage dependencies contain a cycle."""
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through stage {name}")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    # ------------------------------------------------------------------
+    # File hashing and state
+    # ------------------------------------------------------------------
+
+    def _hash_file(self, path: Path) -> str:
+        """SHA-256 of a file, memoized by (path, mtime, size)."""
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._hash_cache.get(key)
+        if cached is None:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            cached = digest.hexdigest()
+            with self._lock:
+                self._hash_cache[key] = cached
+        return cached
+
+    def _glob_hashes(self, patterns: Sequence[str]) -> Dict[str, str]:
+        """Hashes of all files matching the patterns, by root-relative path."""
+        hashes = {}
+        for pattern in patterns:
+            for path in sorted(self.root.glob(pattern)):
+                if path.is_file():
+                    hashes[path.relative_to(self.root).as_posix()] = self._hash_file(path)
+        return hashes
+
+    def _input_patterns(self, stage: Stage) -> List[str]:
+        """Declared inputs plus the script and the outputs of dependencies."""
+        patterns = [stage.script] + list(stage.inputs)
+        for dep in stage.depends_on:
+            patterns.extend(self.stages[dep].outputs)
+        patterns.extend(p for globs in stage.targets.values() for p in globs)
+        return list(dict.fromkeys(patterns))
+
+    def _load_state(self) -> Dict[str, Dict]:
+        if self.state_path.exists():
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {}
+
+    def _save_state(self, state: Dict[str, Dict]) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        tmp_path.replace(self.state_path)
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def _plan_stage(
+        self,
+        stage: Stage,
+        previous: Optional[Dict],
+        force: bool = False
+    ) -> Tuple[str, List[str], List[str], Dict[str, str]]:
+        """
+        Decide what a stage needs to do given the current files.
+
+        Returns:
+            Tuple of (action, targets, changed input files, current input
+            hashes); action is "run", "partial" or "skip"
+        """
+        inputs = self._glob_hashes(self._input_patterns(stage))
+        if force or previous is None or previous.get("args") != stage.args:
+            return "run", [], sorted(inputs), inputs
+
+        old_inputs = previous.get("inputs", {})
+        changed = sorted(
+            path for path in set(inputs) | set(old_inputs)
+            if inputs.get(path) != old_inputs.get(path)
+        )
+
+        # Outputs deleted or modified since the last run
+        outputs = self._glob_hashes(stage.outputs)
+        for path, digest in previous.get("outputs", {}).items():
+            if outputs.get(path) != digest:
+                return "run", [], changed, inputs
+
+        if not changed:
+            return "skip", [], [], inputs
+
+        if stage.targets and stage.target_arg:
+            targets = []
+            for path in changed:
+                matched = [
+                    target for target, globs in stage.targets.items()
+                    if any(fnmatch.fnmatch(path, pattern) for pattern in globs)
+                ]
+                if not matched:
+                    return "run", [], changed, inputs
+                targets.extend(matched)
+            return "partial", sorted(set(targets)), changed, inputs
+
+        return "run", [], changed, inputs
+
+    def plan(self, force: bool = False) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Plan every stage against the current files (dry run).
+
+        Stages downstream of a stage that will run are reported as "run"
+        when their plan is "skip", since their inputs may still change.
+
+        Returns:
+            Dict mapping stage name to (action, targets)
+        """
+        state = self._load_state()
+        plans: Dict[str, Tuple[str, List[str]]] = {}
+        for name in self._topological_order():
+            stage = self.stages[name]
+            action, targets, _, _ = self._plan_stage(stage, state.get(name), force)
+            if action == "skip" and any(plans[dep][0] != "skip" for dep in stage.depends_on):
+                action = "run"
+            plans[name] = (action, targets)
+        return plans
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+
+        def visit(name: str) -> None:
+            if name in order:
+                return
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _execute(
+        self,
+        stage: Stage,
+        state: Dict[str, Dict],
+        force: bool,
+        verbose: bool
+    ) -> StageResult:
+        """Plan and run one stage; updates state on success."""
+        with self._lock:
+            previous = state.get(stage.name)
+        action, targets, changed, inputs = self._plan_stage(stage, previous, force)
+
+        if action == "skip":
+            if verbose:
+                print(f"  [OK] {stage.name}: up to date")
+            return StageResult(stage.name, "skipped")
+
+        command = [self.python, stage.script] + list(stage.args)
+        if action == "partial":
+            command += [stage.target_arg] + targets
+        if verbose:
+            detail = f" (targets: {' '.join(targets)})" if targets else ""
+            print(f"  [RUN] {stage.name}{detail}")
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        start = time.time()
+        with open(self.log_dir / f"{stage.name}.log", "w", encoding="utf-8") as log:
+            completed = subprocess.run(
+                command, cwd=self.root, stdout=log, stderr=subprocess.STDOUT
+            )
+        duration = time.time() - start
+
+        if completed.returncode != 0:
+            if verbose:
+                print(f"  [WARN] {stage.name} failed (exit {completed.returncode}, "
+                      f"log: {self.log_dir / (stage.name + '.log')})")
+            return StageResult(stage.name, "failed", targets, changed, duration, completed.returncode)
+
+        outputs = self._glob_hashes(stage.outputs)
+        with self._lock:
+            state[stage.name] = {
+                "args": list(stage.args),
+                "inputs": inputs,
+                "outputs": outputs,
+                "completed": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "duration_s": round(duration, 2),
+            }
+            self._save_state(state)
+
+        if verbose:
+            print(f"  [OK] {stage.name} ({duration:.1f}s)")
+        status = "partial" if action == "partial" else "ran"
+        return StageResult(stage.name, status, targets, changed, duration, 0)
+
+    def run(
+        self,
+        only: Optional[Sequence[str]] = None,
+        jobs: int = 1,
+        force: bool = False,
+        verbose: bool = True
+    ) -> Dict[str, StageResult]:
+        """
+        Run all (or the selected) stages, respecting dependencies.
+
+        A stage is planned only once its dependencies finished, so it sees
+        their fresh outputs. Dependencies outside `only` are treated as done.
+
+        Args:
+            only: Stage names to run (default: all)
+            jobs: Maximum stages running at the same time
+            force: Re-run selected stages even if up to date
+            verbose: Print progress
+
+        Returns:
+            Dict mapping stage name to StageResult, in completion order
+        """
+        selected = list(only) if only else self._topological_order()
+        unknown = [name for name in selected if name not in self.stages]
+        if unknown:
+            raise ValueError(f"Unknown stages: {unknown}")
+
+        state = self._load_state()
+        results: Dict[str, StageResult] = {}
+        pending = [name for name in self._topological_order() if name in selected]
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            while pending or running:
+                for name in list(pending):
+                    deps = [dep for dep in self.stages[name].depends_on if dep in selected]
+                    if any(results.get(dep) and results[dep].status in ("failed", "blocked") for dep in deps):
+                        results[name] = StageResult(name, "blocked")
+                        pending.remove(name)
+                        if verbose:
+                            print(f"  [WARN] {name}: skipped, a dependency failed")
+                    elif all(dep in results for dep in deps):
+                        pending.remove(name)
+                        future = executor.submit(self._execute, self.stages[name], state, force, verbose)
+                        running[future] = name
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name] = future.result()
+
+        return results
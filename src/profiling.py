@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profiling Module - Optional per-stage profiling of entry points.
+
+Controlled by execution.profile in config/base.yaml:
+    null / false   : off (one dict lookup per stage)
+    "cprofile"     : deterministic cProfile
+    "sampling"     : stack sampling every execution.profile_interval_ms
+                     from a background thread (lower overhead, no deps)
+
+Each profiled stage writes to <output_directory>/profiles/:
+    <stage>.prof       cProfile stats (pstats / snakeviz), cprofile mode only
+    <stage>.collapsed  "frame;frame;frame value" lines for flame graphs
+                       (flamegraph.pl, speedscope, inferno)
+
+Collapsed stacks from cProfile are reconstructed from its caller/callee
+edges, splitting each function's time over its callers in proportion to
+the time each caller spent in it; values are microseconds. Sampling
+values are sample counts.
+
+Usage:
+    from src.profiling import profile_stage, run_profiled
+    with profile_stage("single_case_1", config, output_path):
+        run_single_case(config, output_path)
+
+    if __name__ == "__main__":
+        run_profiled(main, "run_breakeven_analysis")
+"""
+
+import cProfile
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+PROFILE_MODES = ("cprofile", "sampling")
+
+# Limits of the cProfile call-graph walk
+_MAX_DEPTH = 200
+_MIN_TIME_US = 1.0
+
+# Set while a stage is being profiled (nested stages are covered by the outer one)
+_ACTIVE = False
+
+
+def profile_settings(config: Mapping) -> Optional[Dict[str, Any]]:
+    """
+    Profiling settings from execution.profile.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        {"mode", "interval_s"} or None when profiling is off
+
+    Raises:
+        ValueError: Unknown profile mode
+    """
+    execution = config.get("execution", {})
+    mode = execution.get("profile")
+    if mode is None or mode is False or str(mode).lower() in ("", "off", "none", "false"):
+        return None
+    mode = "cprofile" if mode is True else str(mode).lower()
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown execution.profile '{mode}' (expected one of {PROFILE_MODES} or null)")
+    return {"mode": mode, "interval_s": float(execution.get("profile_interval_ms", 5)) / 1000.0}
+
+
+def _frame_label(filename: str, line: int, name: str) -> str:
+    """Flame graph frame name (';' separates frames)."""
+    if filename == "~":
+        label = name
+    else:
+        label = f"{name} ({Path(filename).name}:{line})"
+    return label.replace(";", ",")
+
+
+def collapsed_from_stats(stats: pstats.Stats) -> Dict[str, float]:
+    """
+    Collapsed stacks (microseconds) reconstructed from cProfile caller edges.
+
+    Args:
+        stats: Profile statistics
+
+    Returns:
+        "root;...;leaf" -> self time in microseconds
+    """
+    entries = stats.stats
+    children = defaultdict(list)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, edge_ct) in callers.items():
+            children[caller].append((func, edge_ct))
+    roots = [func for func, (_, _, _, _, callers) in entries.items() if not callers]
+
+    stacks: Dict[str, float] = defaultdict(float)
+
+    def walk(func: Tuple, path: Tuple, names: str, time_s: float) -> None:
+        _, _, tt, ct, _ = entries[func]
+        share = time_s / ct if ct > 0 else 0.0
+        self_us = tt * share * 1e6
+        if self_us >= _MIN_TIME_US:
+            stacks[names] += self_us
+        if len(path) >= _MAX_DEPTH:
+            return
+        for child, edge_ct in children.get(func, ()):
+            child_s = edge_ct * share
+            if child in path or child_s * 1e6 < _MIN_TIME_US:
+                continue
+            walk(child, path + (child,), f"{names};{_frame_label(*child)}", child_s)
+
+    for root in roots:
+        walk(root, (root,), _frame_label(*root), entries[root][3])
+    return dict(stacks)
+
+
+class SamplingProfiler:
+    """
+    Background-thread stack sampler of one thread.
+
+    Args:
+        interval_s: Sampling interval (seconds)
+        thread_id: Thread to sample (default: the calling thread)
+    """
+
+    def __init__(self, interval_s: float = 0.005, thread_id: Optional[int] = None):
+        self.interval_s = interval_s
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        labels: Dict[Any, str] = {}
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = _frame_label(code.co_filename, code.co_firstlineno, code.co_name)
+                stack.append(label)
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def write_collapsed(stacks: Mapping[str, float], path: Path) -> None:
+    """Write collapsed stacks, one "stack value" line each (largest first)."""
+    lines = [
+        f"{stack} {int(round(value))}"
+        for stack, value in sorted(stacks.items(), key=lambda item: -item[1])
+        if round(value) > 0
+    ]
+    path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+
+@contextmanager
+def profile_stage(
+    stage: str,
+    config: Mapping,
+    output_dir: Optional[Any] = None
+) -> Iterator[None]:
+    """
+    Profile the enclosed block when execution.profile is set.
+
+    Args:
+        stage: Stage name (used for the output file names)
+        config: Configuration dictionary (execution.profile settings)
+        output_dir: Results directory (default: execution.output_directory)
+    """
+    global _ACTIVE
+    settings = profile_settings(config)
+    if settings is None or _ACTIVE:
+        yield
+        return
+
+    if output_dir is None:
+        output_dir = config.get("execution", {}).get("output_directory", "results")
+    directory = Path(output_dir) / "profiles"
+    name = re.sub(r"[^\w.-]+", "_", stage)
+
+    _ACTIVE = True
+    started = time.perf_counter()
+    if settings["mode"] == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            _ACTIVE = False
+            directory.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(directory / f"{name}.prof"))
+            write_collapsed(collapsed_from_stats(pstats.Stats(profiler)), directory / f"{name}.collapsed")
+            print(f"[OK] Profile ({time.perf_counter() - started:.1f}s): {directory / name}.prof/.collapsed")
+    else:
+        sampler = SamplingProfiler(settings["interval_s"])
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            _ACTIVE = False
+            directory.mkdir(parents=True, exist_ok=True)
+            write_collapsed(sampler.samples, directory / f"{name}.collapsed")
+            print(f"[OK] Profile ({sum(sampler.samples.values())} samples): {directory / name}.collapsed")
+
+
+def run_profiled(
+    func: Callable,
+    stage: str,
+    config: Optional[Mapping] = None,
+    output_dir: Optional[Any] = None
+) -> Any:
+    """
+    Call a script's main() inside profile_stage().
+
+    Args:
+        func: Entry point (called without arguments)
+        stage: Stage name
+        config: Configuration (default: base config from the project's
+            config directory; profiling is disabled with a warning when it
+            cannot be loaded)
+        output_dir: Results directory (default: execution.output_directory)
+
+    Returns:
+        func's return value
+    """
+    if config is None:
+        from .config_loader import load_config
+        # Scripts may be started from any directory
+        config_dir = Path(__file__).resolve().parents[1] / "config"
+        try:
+            config = load_config(config_dir=str(config_dir))
+        except FileNotFoundError as e:
+            print(f"[WARN] Profiling disabled for {stage}: {e}")
+            config = {}
+    with profile_stage(stage, config, output_dir):
+        return func()
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Replication Manager Module - Independent DES replications with confidence intervals.
+
+Runs simulate_operations() many times for one (shuttle, pump) fleet plan
+until the per-year KPIs are estimated to the requested precision:
+
+- Replication seeds are children of one SeedSequence (default:
+  sampling.random_seed), spawned batch by batch, so replication k always
+  gets the same stream regardless of batching or worker count.
+- Replications run in fixed-size chunks, serially or in a process pool; the
+  config, plan and distribution are sent to each worker once.
+- KPIs are aggregated online (Welford mean/variance per KPI and year);
+  chunks are merged in order, so serial and parallel runs give identical
+  results and memory does not grow with the number of replications.
+- After each batch, the Student-t half-widths of the target KPIs are
+  compared with the relative/absolute precision targets; the run stops
+  when all are met or max_replications is reached.
+
+Usage:
+    from src.replication_manager import ReplicationManager
+    manager = ReplicationManager(config, yearly_df, 2500, 500,
+                                 distribution=dist, wait_target_hours=12.0)
+    result = manager.run(relative_precision=0.05, max_replications=500)
+    df = result.to_dataframe()
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from math import cos, pi, sin, sqrt, tan
+from statistics import NormalDist
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config_overlay import ConfigOverlay
+from .operations_simulation import _COLUMNS, fleet_plan, simulate_operations
+
+
+# Replicated KPIs (fields of OperationsSimulationResult; Year/Shuttles/Calls are fixed by the plan)
+REPLICATED_KPIS = tuple(name for _, name in _COLUMNS if name not in ("year", "shuttles", "calls"))
+
+# Output column per KPI
+_KPI_COLUMNS = dict((name, column) for column, name in _COLUMNS)
+_KPI_COLUMNS["service_level"] = "Service_Level"
+
+# Worker state (set once per process by _init_worker)
+_WORKER_STATE: Optional[Dict[str, Any]] = None
+
+
+def t_quantile(probability: float, dof: float) -> float:
+    """
+    Student-t quantile.
+
+    Exact for integer dof < 30 (bisection on the closed-form CDF), where the
+    normal-based expansion runs low (about 11% at dof=1) and would narrow the
+    intervals of short runs. Above that, Cornish-Fisher expansion around the
+    normal quantile, within 1e-6 relative at the usual confidence levels.
+    dof < 1 gives inf.
+    """
+    if dof < 1:
+        return float("inf")
+    if dof < 30 and float(dof).is_integer():
+        return _t_quantile_exact(probability, int(dof))
+    z = NormalDist().inv_cdf(probability)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / dof + g2 / dof ** 2 + g3 / dof ** 3 + g4 / dof ** 4
+
+
+def _t_quantile_exact(probability: float, dof: int) -> float:
+    """Student-t quantile for integer dof, bisecting on t = sqrt(dof) * tan(theta)."""
+    if probability < 0.5:
+        return -_t_quantile_exact(1.0 - probability, dof)
+    if probability >= 1.0:
+        return float("inf")
+    target = 2.0 * probability - 1.0
+    low, high = 0.0, pi / 2
+    for _ in range(64):
+        theta = (low + high) / 2
+        if _t_central_probability(theta, dof) < target:
+            low = theta
+        else:
+            high = theta
+    return sqrt(dof) * tan((low + high) / 2)
+
+
+def _t_central_probability(theta: float, dof: int) -> float:
+    """P(|T| <= sqrt(dof) * tan(theta)) for integer dof (Abramowitz & Stegun 26.7.3/4)."""
+    cos2 = cos(theta) ** 2
+    if dof % 2:
+        if dof == 1:
+            return 2 * theta / pi
+        term = total = cos(theta)
+        for k in range(1, (dof - 1) // 2):
+            term *= 2 * k / (2 * k + 1) * cos2
+            total += term
+        return 2 / pi * (theta + sin(theta) * total)
+    term = total = 1.0
+    for k in range(1, dof // 2):
+        term *= (2 * k - 1) / (2 * k) * cos2
+        total += term
+    return sin(theta) * total
+
+
+class RunningStats:
+    """
+    Online mean and variance (Welford) of equally shaped arrays.
+
+    Args:
+        shape: Shape of each observation
+    """
+
+    def __init__(self, shape: Tuple[int, ...]):
+        self.count = 0
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add one observation."""
+        self.count += 1
+        delta = values - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (values - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Add all observations of another accumulator (Chan et al.)."""
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / total)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * (self.count * other.count / total)
+        self.count = total
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Sample variance (NaN for fewer than two observations)."""
+        if self.count < 2:
+            return np.full(self.mean.shape, np.nan)
+        return self.m2 / (self.count - 1)
+
+    def half_width(self, confidence: float = 0.95) -> np.ndarray:
+        """Half-width of the Student-t confidence interval of the mean."""
+        if self.count < 2:
+            return np.full(self.mean.shape, np.inf)
+        quantile = t_quantile(0.5 + confidence / 2, self.count - 1)
+        return quantile * np.sqrt(self.variance / self.count)
+
+
+@dataclass
+class ReplicationResult:
+    """
+    Per-year KPI estimates from independent replications of one fleet plan.
+
+    Attributes:
+        shuttle_size: Shuttle size (m3)
+        pump_size: Bunkering pump rate (m3/h)
+        plan: Year, Total_Shuttles and Annual_Calls of the replayed plan
+        kpis: KPI names (rows of mean/std/half_width)
+        mean: Mean per KPI and year
+        std: Standard deviation across replications per KPI and year
+        half_width: Confidence interval half-width per KPI and year
+        replications: Number of replications run
+        converged: Whether all precision targets were met
+        confidence: Confidence level of the intervals
+        elapsed_s: Wall-clock time (seconds)
+    """
+    shuttle_size: float
+    pump_size: float
+    plan: pd.DataFrame = field(repr=False)
+    kpis: Tuple[str, ...]
+    mean: np.ndarray = field(repr=False)
+    std: np.ndarray = field(repr=False)
+    half_width: np.ndarray = field(repr=False)
+    replications: int
+    converged: bool
+    confidence: float = 0.95
+    elapsed_s: float = 0.0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.mean[self.kpis.index(name)]
+
+    def interval(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-year (low, high) confidence interval of a KPI."""
+        i = self.kpis.index(name)
+        return self.mean[i] - self.half_width[i], self.mean[i] + self.half_width[i]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Per-year table of KPI means and confidence interval half-widths.
+
+        Returns:
+            DataFrame with one row per year (<KPI> and <KPI>_CI columns)
+        """
+        df = self.plan.rename(columns={"Total_Shuttles": "Shuttles", "Annual_Calls": "Calls"}).copy()
+        df.insert(0, "Pump_Size_m3ph", self.pump_size)
+        df.insert(0, "Shuttle_Size_cbm", self.shuttle_size)
+        for i, name in enumerate(self.kpis):
+            column = _KPI_COLUMNS[name]
+            df[column] = self.mean[i]
+            df[f"{column}_CI"] = self.half_width[i]
+        df["Replications"] = self.replications
+        return df
+
+
+def _init_worker(state: Dict[str, Any]) -> None:
+    """Store the shared simulation inputs in a worker process."""
+    global _WORKER_STATE
+    _WORKER_STATE = state
+
+
+def _replicate(state: Mapping[str, Any], seeds: Sequence[np.random.SeedSequence]) -> RunningStats:
+    """Run one replication per seed and aggregate the KPIs."""
+    kpis = state["kpis"]
+    stats = RunningStats((len(kpis), len(state["plan"])))
+    for seed in seeds:
+        result = simulate_operations(
+            state["config"],
+            state["plan"],
+            state["shuttle_size"],
+            state["pump_size"],
+            distribution=state["distribution"],
+            scenario_name=state["scenario_name"],
+            seed=seed,
+            shore_berths=state["shore_berths"],
+        )
+        values = [
+            result.service_level(state["wait_target_hours"]) if name == "service_level" else result[name]
+            for name in kpis
+        ]
+        stats.update(np.asarray(values, dtype=float))
+    return stats
+
+
+def _replicate_chunk(seeds: Sequence[np.random.SeedSequence]) -> RunningStats:
+    """Run a chunk of replications in a worker process."""
+    return _replicate(_WORKER_STATE, seeds)
+
+
+class ReplicationManager:
+    """
+    Independent replications of one fleet plan until the KPIs are precise enough.
+
+    Args:
+        config: Configuration dictionary
+        yearly_df: MILP per-year results (Year, Total_Shuttles, Annual_Calls)
+        shuttle_size: Shuttle size (m3); inferred for a single-scenario plan
+        pump_size: Pump rate (m3/h); inferred for a single-scenario plan
+        distribution: VesselDistribution for call volumes (None = fixed volume)
+        scenario_name: Distribution scenario (default: the distribution's default)
+        seed: Root seed (default: sampling.random_seed of the distribution,
+            else of config, else 42)
+        shore_berths: Concurrent shuttle loadings at shore
+        wait_target_hours: Adds a service_level KPI for this wait target
+        num_jobs: Worker processes (default: execution.num_jobs, 1 = serial)
+        chunk_size: Replications per task sent to a worker
+    """
+
+    def __init__(
+        self,
+        config: Mapping,
+        yearly_df: pd.DataFrame,
+        shuttle_size: Optional[float] = None,
+        pump_size: Optional[float] = None,
+        distribution: Any = None,
+        scenario_name: Optional[str] = None,
+        seed: Optional[int] = None,
+        shore_berths: Optional[int] = None,
+        wait_target_hours: Optional[float] = None,
+        num_jobs: Optional[int] = None,
+        chunk_size: int = 5
+    ):
+        self.plan = fleet_plan(yearly_df, shuttle_size, pump_size)
+        if shuttle_size is None:
+            shuttle_size = float(yearly_df["Shuttle_Size_cbm"].iloc[0])
+        if pump_size is None:
+            pump_size = float(yearly_df["Pump_Size_m3ph"].iloc[0])
+        if distribution is not None and scenario_name is None:
+            scenario_name = distribution.default_scenario_name
+        if seed is None:
+            if distribution is not None:
+                seed = distribution.random_seed
+            else:
+                seed = config.get("sampling", {}).get("random_seed", 42)
+        if num_jobs is None:
+            num_jobs = config.get("execution", {}).get("num_jobs", 1)
+
+        # Plain dict for pickling
+        self.config = config.to_dict() if isinstance(config, ConfigOverlay) else config
+        self.shuttle_size = float(shuttle_size)
+        self.pump_size = float(pump_size)
+        self.distribution = distribution
+        self.scenario_name = scenario_name
+        self.seed = seed
+        self.shore_berths = shore_berths
+        self.wait_target_hours = wait_target_hours
+        self.num_jobs = max(1, int(num_jobs))
+        self.chunk_size = max(1, int(chunk_size))
+
+        self.kpis = REPLICATED_KPIS + (("service_level",) if wait_target_hours is not None else ())
+
+    def run(
+        self,
+        min_replications: int = 10,
+        max_replications: int = 1000,
+        batch_size: int = 20,
+        confidence: float = 0.95,
+        relative_precision: Optional[float] = 0.05,
+        absolute_precision: Optional[Mapping[str, float]] = None,
+        target_kpis: Optional[Sequence[str]] = None
+    ) -> ReplicationResult:
+        """
+        Run replications in batches until the precision targets are met.
+
+        A KPI meets its target in a year when the confidence interval
+        half-width is at most relative_precision × |mean| or its
+        absolute_precision, whichever is larger.
+
+        Args:
+            min_replications: Replications before the first stopping check (>= 2)
+            max_replications: Upper limit on replications
+            batch_size: Replications between stopping checks
+            confidence: Confidence level of the intervals
+            relative_precision: Target half-width relative to the mean
+            absolute_precision: Target half-width per KPI (KPI units)
+            target_kpis: KPIs that must meet the targets (default: mean_wait,
+                plus service_level with a wait target)
+
+        Returns:
+            ReplicationResult with per-year means and confidence intervals
+        """
+        if not 2 <= min_replications <= max_replications:
+            raise ValueError(
+                f"Need 2 <= min_replications <= max_replications, got {min_replications}, {max_replications}"
+            )
+        if not 0 < confidence < 1:
+            raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+        absolute_precision = dict(absolute_precision or {})
+        if target_kpis is None:
+            target_kpis = ("mean_wait",) + (("service_level",) if self.wait_target_hours is not None else ())
+        unknown = set(target_kpis) - set(self.kpis)
+        if unknown:
+            raise ValueError(f"Unknown target KPIs: {sorted(unknown)} (available: {list(self.kpis)})")
+        rows = [self.kpis.index(name) for name in target_kpis]
+        tolerance = np.array([absolute_precision.get(name, 0.0) for name in target_kpis])[:, None]
+
+        state = {
+            "config": self.config,
+            "plan": self.plan,
+            "shuttle_size": self.shuttle_size,
+            "pump_size": self.pump_size,
+            "distribution": self.distribution,
+            "scenario_name": self.scenario_name,
+            "shore_berths": self.shore_berths,
+            "wait_target_hours": self.wait_target_hours,
+            "kpis": self.kpis,
+        }
+        root = np.random.SeedSequence(self.seed)
+        stats = RunningStats((len(self.kpis), len(self.plan)))
+        converged = False
+
+        started = time.perf_counter()
+        executor = None
+        if self.num_jobs > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.num_jobs,
+                initializer=_init_worker,
+                initargs=(state,)
+            )
+        try:
+            while stats.count < max_replications:
+                target = min_replications if not stats.count else stats.count + batch_size
+                seeds = root.spawn(min(target, max_replications) - stats.count)
+                chunks = [seeds[i:i + self.chunk_size] for i in range(0, len(seeds), self.chunk_size)]
+                if executor is None:
+                    results = (_replicate(state, chunk) for chunk in chunks)
+                else:
+                    results = executor.map(_replicate_chunk, chunks)
+                for chunk_stats in results:
+                    stats.merge(chunk_stats)
+
+                half_width = stats.half_width(confidence)[rows]
+                allowed = np.abs(stats.mean[rows]) * (relative_precision or 0.0)
+                if np.all(half_width <= np.maximum(allowed, tolerance)):
+                    converged = True
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return ReplicationResult(
+            shuttle_size=self.shuttle_size,
+            pump_size=self.pump_size,
+            plan=self.plan,
+            kpis=self.kpis,
+            mean=stats.mean,
+            std=np.sqrt(stats.variance),
+            half_width=stats.half_width(confidence),
+            replications=stats.count,
+            converged=converged,
+            confidence=confidence,
+            elapsed_s=time.perf_counter() - started,
+        )
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Results Catalog Module - One-pass index of the result files.
+
+Scans the results tree once and indexes every result file by
+(analysis, case):
+
+    MILP_scenario_summary_case_1.csv            -> ("MILP_scenario_summary", "case_1")
+    sensitivity/fuel_price_case_2.csv           -> ("sensitivity/fuel_price", "case_2")
+    sensitivity/breakeven_distance_ulsan.csv    -> ("sensitivity/breakeven_distance", "ulsan")
+    discount_rate_analysis/data/discount_rate_comparison.csv
+        -> ("discount_rate_analysis/data/discount_rate_comparison", None)
+
+Lookups are dictionary hits instead of exists() probes, and CSV reads and
+derived datasets are memoized, so each file is read at most once.
+
+Usage:
+    from src.results_catalog import ResultsCatalog
+    catalog = ResultsCatalog("results")
+    path = catalog.first(["MILP_scenario_summary", "deterministic/scenarios"], "case_1")
+    df = catalog.read_csv(path)
+"""
+
+import fnmatch
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+# Trailing case token of a file stem (case IDs and break-even routes)
+_CASE_SUFFIX = re.compile(r"_(case_\d+|ulsan|yeosu)$")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """
+    One indexed result file.
+
+    Attributes:
+        analysis: Relative directory and file stem without the case token
+        case: Case token (e.g. "case_1", "ulsan"), or None
+        path: Path relative to the results directory (POSIX)
+    """
+    analysis: str
+    case: Optional[str]
+    path: str
+
+
+class ResultsCatalog:
+    """
+    Index of the files under a results directory.
+
+    Args:
+        results_dir: Results directory to scan
+        suffixes: File suffixes to index (default: CSV only)
+    """
+
+    def __init__(self, results_dir: str, suffixes: Sequence[str] = (".csv",)):
+        self.results_dir = Path(results_dir)
+        self.suffixes = tuple(suffixes)
+        self._frames: Dict[Tuple, pd.DataFrame] = {}
+        self._datasets: Dict[str, Any] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-scan the results directory and drop memoized data."""
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._index: Dict[Tuple[str, Optional[str]], str] = {}
+        self._frames.clear()
+        self._datasets.clear()
+
+        if not self.results_dir.is_dir():
+            return
+        for root, dirs, files in os.walk(self.results_dir):
+            # Skip tool state such as .pipeline/
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            rel_root = Path(root).relative_to(self.results_dir).as_posix()
+            for name in sorted(files):
+                stem, suffix = os.path.splitext(name)
+                if suffix not in self.suffixes:
+                    continue
+                rel_path = name if rel_root == "." else f"{rel_root}/{name}"
+                match = _CASE_SUFFIX.search(stem)
+                case = match.group(1) if match else None
+                if match:
+                    stem = stem[:match.start()]
+                analysis = stem if rel_root == "." else f"{rel_root}/{stem}"
+                entry = CatalogEntry(analysis=analysis, case=case, path=rel_path)
+                self._entries[rel_path] = entry
+                self._index.setdefault((analysis, case), rel_path)
+
+    # ========== LOOKUP ==========
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def exists(self, rel_path: str) -> bool:
+        """True if the file was found by the scan."""
+        return rel_path in self._entries
+
+    def find(self, analysis: str, case: Optional[str] = None) -> Optional[str]:
+        """Relative path of an (analysis, case) file, or None."""
+        return self._index.get((analysis, case))
+
+    def first(self, analyses: Sequence[str], case: Optional[str] = None) -> Optional[str]:
+        """First existing file among analyses in priority order, or None."""
+        for analysis in analyses:
+            path = self.find(analysis, case)
+            if path is not None:
+                return path
+        return None
+
+    def entries(self, analysis: Optional[str] = None) -> List[CatalogEntry]:
+        """Indexed files, optionally restricted to one analysis."""
+        return [entry for entry in self._entries.values()
+                if analysis is None or entry.analysis == analysis]
+
+    def match(self, patterns: Sequence[str]) -> List[str]:
+        """Relative paths matching any of the glob patterns, sorted."""
+        return sorted(path for path in self._entries
+                      if any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns))
+
+    # ========== LOADING ==========
+
+    def path(self, rel_path: str) -> Path:
+        """Absolute path of an indexed file."""
+        return self.results_dir / rel_path
+
+    def read_csv(self, rel_path: str, **kwargs) -> pd.DataFrame:
+        """
+        Read an indexed CSV file once.
+
+        Args:
+            rel_path: Path relative to the results directory
+            **kwargs: Passed to pandas.read_csv
+
+        Returns:
+            The memoized DataFrame (shared between callers; do not modify)
+        """
+        key = (rel_path, tuple(sorted(kwargs.items())))
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = pd.read_csv(self.path(rel_path), **kwargs)
+        return frame
+
+    def dataset(self, name: str, loader: Callable[[], Any]) -> Any:
+        """
+        Build a named dataset on first access.
+
+        Args:
+            name: Dataset name
+            loader: Builds the dataset (called once)
+
+        Returns:
+            The memoized dataset
+        """
+        if name not in self._datasets:
+            self._datasets[name] = loader()
+        return self._datasets[name]
+
+    def is_loaded(self, name: str) -> bool:
+        """True if a named dataset has been built."""
+        return name in self._datasets
@@ -17,16 +17,13 @@ Functions:
 import sys
 from pathlib import Path
 import time
-import pandas as pd
 from math import ceil
 
 from .cycle_time_calculator import CycleTimeCalculator
-from .cost_calculator import CostCalculator
+from .cost_tables import CostTables
 from .fleet_sizing_calculator import FleetSizingCalculator
-from .optimizer import BunkeringOptimizer
-from .export_excel import ExcelExporter
-from .export_docx import WordExporter
 from .utils import calculate_vessel_growth, calculate_annual_demand
+from .yearly_simulation import simulate_yearly
 
 
 def print_cycle_time_breakdown(cycle_info, config, shuttle_size_cbm, pump_size_m3ph):
@@ -180,6 +177,7 @@ def run_single_scenario(config, shuttle_size_cbm, pump_size_m3ph, output_path):
                 "Ships_Per_Year": [ships_per_year],
                 "Time_Utilization_Ratio_percent": [time_utilization],
             }
+            import pandas as pd
             scenario_df = pd.DataFrame(scenario_data)
 
             scenario_file = output_path / f"MILP_scenario_single_{case_id}_{shuttle_size_cbm}_{pump_size_m3ph}.csv"
@@ -227,8 +225,7 @@ def run_annual_simulation(config, shuttle_size_cbm, pump_size_m3ph, simulation_y
 
         # Initialize calculators
         case_id = config.get("case_id", "unknown")
-        cycle_calculator = CycleTimeCalculator(case_id, config)
-        cost_calculator = CostCalculator(config)
+        tables = CostTables.for_config(config)
 
         # Get configuration parameters
         start_year = config["time_period"]["start_year"]
@@ -260,12 +257,8 @@ def run_annual_simulation(config, shuttle_size_cbm, pump_size_m3ph, simulation_y
         else:
             num_vessels = max(1, int(shuttle_size_cbm // bunker_volume))
 
-        # Calculate cycle time
-        cycle_info = cycle_calculator.calculate_single_cycle(
-            shuttle_size_m3=shuttle_size_cbm,
-            pump_size_m3ph=pump_size_m3ph,
-            num_vessels=num_vessels
-        )
+        # Cycle time from the precomputed tables
+        cycle_info = tables.cycle_info(shuttle_size_cbm, pump_size_m3ph)
 
         # Display single round-trip cycle time breakdown
         print_cycle_time_breakdown(cycle_info, config, shuttle_size_cbm, pump_size_m3ph)
@@ -303,11 +296,12 @@ def run_annual_simulation(config, shuttle_size_cbm, pump_size_m3ph, simulation_y
         cycles_per_shuttle = annual_cycles / required_shuttles if required_shuttles > 0 else 0
 
         # Calculate costs
-        shuttle_capex = cost_calculator.calculate_shuttle_capex(shuttle_size_cbm)
-        bunkering_capex = cost_calculator.calculate_bunkering_capex(shuttle_size_cbm, pump_size_m3ph)
+        costs = tables.component_costs(shuttle_size_cbm, pump_size_m3ph)
+        shuttle_capex = costs["shuttle_capex"]
+        bunkering_capex = costs["bunkering_capex"]
 
-        shuttle_fixed_opex = cost_calculator.calculate_shuttle_fixed_opex(shuttle_size_cbm)
-        bunkering_fixed_opex = cost_calculator.calculate_bunkering_fixed_opex(shuttle_size_cbm, pump_size_m3ph)
+        shuttle_fixed_opex = costs["shuttle_fixed_opex"]
+        bunkering_fixed_opex = costs["bunkering_fixed_opex"]
 
         total_shuttle_capex = shuttle_capex * required_shuttles
         total_bunkering_capex = bunkering_capex * required_shuttles
@@ -322,12 +316,12 @@ def run_annual_simulation(config, shuttle_size_cbm, pump_size_m3ph, simulation_y
         shore_supply_enabled = config.get("shore_supply", {}).get("enabled", False)
         if shore_supply_enabled:
             if config.get("tank_storage", {}).get("enabled", False):
-                tank_capex = cost_calculator.calculate_tank_capex()
-                tank_fixed_opex = cost_calculator.calculate_tank_fixed_opex()
+                tank_capex = tables.tank_capex
+                tank_fixed_opex = tables.tank_fixed_opex
                 total_capex += tank_capex
 
-            shore_pump_capex = cost_calculator.calculate_shore_pump_capex()
-            shore_pump_fixed_opex = cost_calculator.calculate_shore_pump_fixed_opex()
+            shore_pump_capex = tables.shore_pump_capex
+            shore_pump_fixed_opex = tables.shore_pump_fixed_opex
             total_capex += shore_pump_capex
 
         # Annual OPEX
@@ -348,7 +342,7 @@ def run_annual_simulation(config, shuttle_size_cbm, pump_size_m3ph, simulation_y
             shuttle_fuel_cost_per_cycle = shuttle_fuel_per_cycle * fuel_price
             shuttle_fuel_annual = shuttle_fuel_cost_per_cycle * annual_cycles
 
-        pump_power = cost_calculator.calculate_pump_power(pump_size_m3ph)
+        pump_power = costs["pump_power"]
         sfoc = config["propulsion"]["sfoc_g_per_kwh"]
         fuel_price = config["economy"]["fuel_price_usd_per_ton"]
 
@@ -359,7 +353,7 @@ def run_annual_simulation(config, shuttle_size_cbm, pump_size_m3ph, simulation_y
 
         tank_variable_opex = 0
         if shore_supply_enabled and config.get("tank_storage", {}).get("enabled", False):
-            tank_variable_opex = cost_calculator.calculate_tank_variable_opex()
+            tank_variable_opex = tables.tank_variable_opex
 
         total_variable_opex = shuttle_fuel_annual + pump_fuel_annual + tank_variable_opex
         total_opex = total_fixed_opex + total_variable_opex
@@ -398,6 +392,7 @@ def run_annual_simulation(config, shuttle_size_cbm, pump_size_m3ph, simulation_y
                 "Value": [simulation_year, shuttle_size_cbm, pump_size_m3ph, required_shuttles,
                          demand_m3, total_capex/1e6, total_opex/1e6]
             }
+            import pandas as pd
             result_df = pd.DataFrame(result_data)
             result_df.to_csv(result_file, index=False, encoding="utf-8-sig")
             print(f"\n[OK] Results saved to: {result_file}")
@@ -449,189 +444,9 @@ def run_yearly_simulation(config, shuttle_size_cbm, pump_size_m3ph, output_path)
         print(f"Pump: {pump_size_m3ph} m3/h")
         print("="*60)
 
-        # Initialize calculators
-        cycle_calculator = CycleTimeCalculator(case_id, config)
-        cost_calculator = CostCalculator(config)
-        fleet_calc = FleetSizingCalculator(config)
-
-        # Get config parameters
-        start_year = config["time_period"]["start_year"]
-        end_year = config["time_period"]["end_year"]
-        years = range(start_year, end_year + 1)
-        max_annual_hours = config["operations"]["max_annual_hours_per_vessel"]
-
-        start_vessels = config["shipping"]["start_vessels"]
-        end_vessels = config["shipping"]["end_vessels"]
-        voyages_per_year = config["shipping"]["voyages_per_year"]
-        bunker_volume = config["bunkering"]["bunker_volume_per_call_m3"]
-        has_storage_at_busan = config["operations"].get("has_storage_at_busan", True)
-        shore_supply_enabled = config.get("shore_supply", {}).get("enabled", False)
-
-        # Calculate demand for all years
-        vessel_growth = calculate_vessel_growth(start_year, end_year, start_vessels, end_vessels)
-        annual_demand_dict = calculate_annual_demand(vessel_growth, bunker_volume, voyages_per_year)
-
-        # Calculate cycle time once
-        if has_storage_at_busan:
-            num_vessels_per_trip = 1
-        else:
-            num_vessels_per_trip = max(1, int(shuttle_size_cbm // bunker_volume))
-
-        cycle_info = cycle_calculator.calculate_single_cycle(
-            shuttle_size_m3=shuttle_size_cbm,
-            pump_size_m3ph=pump_size_m3ph,
-            num_vessels=num_vessels_per_trip
-        )
-        cycle_duration = cycle_info['cycle_duration']
-        trips_per_call = cycle_info.get('trips_per_call', 1)
-
-        # Pre-calculate cost components
-        shuttle_capex = cost_calculator.calculate_shuttle_capex(shuttle_size_cbm)
-        bunk_capex = cost_calculator.calculate_bunkering_capex(shuttle_size_cbm, pump_size_m3ph)
-        shuttle_fixed_opex = cost_calculator.calculate_shuttle_fixed_opex(shuttle_size_cbm)
-        bunk_fixed_opex = cost_calculator.calculate_bunkering_fixed_opex(shuttle_size_cbm, pump_size_m3ph)
-
-        tank_capex = cost_calculator.calculate_tank_capex() if config["tank_storage"]["enabled"] and shore_supply_enabled else 0
-        tank_fixed_opex = cost_calculator.calculate_tank_fixed_opex() if config["tank_storage"]["enabled"] and shore_supply_enabled else 0
-        tank_variable_opex = cost_calculator.calculate_tank_variable_opex() if config["tank_storage"]["enabled"] and shore_supply_enabled else 0
-
-        mcr = config["shuttle"]["mcr_map_kw"].get(int(shuttle_size_cbm), 0)
-        sfoc = config["propulsion"]["sfoc_g_per_kwh"]
-        fuel_price = config["economy"]["fuel_price_usd_per_ton"]
-        travel_time_hours = config["operations"]["travel_time_hours"]
-        travel_factor = 1.0 if has_storage_at_busan else 2.0
-        shuttle_fuel_per_cycle = (mcr * sfoc * travel_factor * travel_time_hours) / 1e6
-        shuttle_fuel_cost_per_cycle = shuttle_fuel_per_cycle * fuel_price
-
-        pump_power = cost_calculator.calculate_pump_power(pump_size_m3ph)
-        pumping_time_hr_call = bunker_volume / pump_size_m3ph
-        pump_fuel_per_event = (pump_power * pumping_time_hr_call * sfoc) / 1e6
-        pump_fuel_cost_per_event = pump_fuel_per_event * fuel_price
-
-        yearly_results = []
-        total_shuttles = 0
-        tank_purchased = False
-
-        # Track cumulative supply for LCOAmmonia calculation
-        cumulative_supply_m3 = 0.0
-        cumulative_supply_ton = 0.0
-        cumulative_annualized_capex = 0.0
-        cumulative_opex = 0.0
-
-        density_storage = config["ammonia"]["density_storage_ton_m3"]
-
-        for year in years:
-            demand_m3 = annual_demand_dict[year]
-            annual_calls = demand_m3 / bunker_volume if bunker_volume > 0 else 0
-
-            required_shuttles = fleet_calc.calculate_required_shuttles_working_time_only(
-                annual_calls, trips_per_call, cycle_duration
-            )
-
-            new_shuttles = max(0, required_shuttles - total_shuttles)
-            total_shuttles = required_shuttles
-
-            new_tank = 0
-            if config["tank_storage"]["enabled"] and shore_supply_enabled and not tank_purchased and new_shuttles > 0:
-                new_tank = 1
-                tank_purchased = True
-
-            disc_factor = 1.0  # No discounting applied
-
-            capex_shuttle_usd = disc_factor * shuttle_capex * new_shuttles
-            capex_pump_usd = disc_factor * bunk_capex * new_shuttles
-            capex_tank_usd = disc_factor * tank_capex * new_tank
-            capex_total_usd = capex_shuttle_usd + capex_pump_usd + capex_tank_usd
-
-            fopex_shuttle_usd = disc_factor * shuttle_fixed_opex * total_shuttles
-            fopex_pump_usd = disc_factor * bunk_fixed_opex * total_shuttles
-            fopex_tank_usd = disc_factor * tank_fixed_opex if tank_purchased else 0
-            fopex_total_usd = fopex_shuttle_usd + fopex_pump_usd + fopex_tank_usd
-
-            if has_storage_at_busan:
-                total_trips = annual_calls * trips_per_call
-            else:
-                vessels_per_trip = num_vessels_per_trip if num_vessels_per_trip > 0 else 1
-                total_trips = ceil(annual_calls / vessels_per_trip)
-
-            vopex_shuttle_usd = disc_factor * shuttle_fuel_cost_per_cycle * total_trips
-            vopex_pump_usd = disc_factor * pump_fuel_cost_per_event * annual_calls
-            vopex_tank_usd = disc_factor * tank_variable_opex if tank_purchased else 0
-            vopex_total_usd = vopex_shuttle_usd + vopex_pump_usd + vopex_tank_usd
-
-            total_year_cost_usd = capex_total_usd + fopex_total_usd + vopex_total_usd
-
-            total_shuttle_asset_usd = total_shuttles * shuttle_capex
-            total_pump_asset_usd = total_shuttles * bunk_capex
-            total_tank_asset_usd = tank_capex if tank_purchased else 0
-
-            annualized_shuttle_capex_usd = cost_calculator.calculate_annualized_capex_yearly(total_shuttle_asset_usd)
-            annualized_pump_capex_usd = cost_calculator.calculate_annualized_capex_yearly(total_pump_asset_usd)
-            annualized_tank_capex_usd = cost_calculator.calculate_annualized_capex_yearly(total_tank_asset_usd)
-            annualized_total_capex_usd = annualized_shuttle_capex_usd + annualized_pump_capex_usd + annualized_tank_capex_usd
-
-            supply_m3 = annual_calls * bunker_volume
-            cycles_available = total_shuttles * (max_annual_hours / cycle_duration) if cycle_duration > 0 else 0
-            utilization_rate = (total_trips / cycles_available) if cycles_available > 0 else 0
-
-            total_hours_needed = total_trips * cycle_duration
-            total_hours_available = total_shuttles * max_annual_hours
-            hours_per_shuttle_used = total_hours_needed / total_shuttles if total_shuttles > 0 else 0
-            cycles_per_shuttle = total_trips / total_shuttles if total_shuttles > 0 else 0
-            time_per_vessel_call = cycle_duration * trips_per_call
-
-            # Calculate cumulative values for LCOAmmonia
-            cumulative_supply_m3 += supply_m3
-            cumulative_supply_ton += supply_m3 * density_storage
-
-            annualized_total_cost_usd = annualized_total_capex_usd + fopex_total_usd + vopex_total_usd
-            cumulative_annualized_capex += annualized_total_capex_usd
-            cumulative_opex += fopex_total_usd + vopex_total_usd
-
-            lco_ammonia_to_date = (cumulative_annualized_capex + cumulative_opex) / cumulative_supply_ton if cumulative_supply_ton > 0 else 0.0
-
-            yearly_results.append({
-                "Shuttle_Size_cbm": int(shuttle_size_cbm), "Pump_Size_m3ph": int(pump_size_m3ph), "Year": year,
-                "New_Shuttles": new_shuttles, "Total_Shuttles": total_shuttles,
-                "Cycle_Duration_Hours": round(cycle_duration, 2),
-                "Shore_Loading_Hours": round(cycle_info['shore_loading'], 2),
-                "Pumping_Per_Trip_Hours": round(cycle_info['pumping_per_vessel'], 2),
-                "Travel_Outbound_Hours": round(cycle_info['travel_outbound'], 4),
-                "Travel_Return_Hours": round(cycle_info['travel_return'], 4),
-                "Setup_Total_Hours": round(cycle_info['setup_inbound'] + cycle_info['setup_outbound'], 4),
-                "Trips_Per_Call": round(float(trips_per_call), 4),
-                "Vessels_Per_Trip": round(float(num_vessels_per_trip), 4),
-                "Time_Per_Vessel_Call_Hours": round(time_per_vessel_call, 2),
-                "Annual_Calls": round(annual_calls, 1),
-                "Annual_Cycles": total_trips,
-                "Supply_m3": supply_m3,
-                "Demand_m3": demand_m3,
-                "Cycles_Available": round(cycles_available, 1),
-                "Utilization_Rate": round(utilization_rate, 4),
-                "Total_Hours_Needed": round(total_hours_needed, 0),
-                "Total_Hours_Available": round(total_hours_available, 0),
-                "Hours_Per_Shuttle_Used": round(hours_per_shuttle_used, 0),
-                "Cycles_Per_Shuttle": round(cycles_per_shuttle, 1),
-                "CAPEX_Shuttle_USDm": capex_shuttle_usd / 1e6, "CAPEX_Pump_USDm": capex_pump_usd / 1e6,
-                "CAPEX_Tank_USDm": capex_tank_usd / 1e6, "CAPEX_Total_USDm": capex_total_usd / 1e6,
-                "FixedOPEX_Shuttle_USDm": fopex_shuttle_usd / 1e6, "FixedOPEX_Pump_USDm": fopex_pump_usd / 1e6,
-                "FixedOPEX_Tank_USDm": fopex_tank_usd / 1e6, "FixedOPEX_Total_USDm": fopex_total_usd / 1e6,
-                "VariableOPEX_Shuttle_USDm": vopex_shuttle_usd / 1e6, "VariableOPEX_Pump_USDm": vopex_pump_usd / 1e6,
-                "VariableOPEX_Tank_USDm": vopex_tank_usd / 1e6, "VariableOPEX_Total_USDm": vopex_total_usd / 1e6,
-                "Total_OPEX_USDm": (fopex_total_usd + vopex_total_usd) / 1e6,
-                "Annualized_CAPEX_Shuttle_USDm": annualized_shuttle_capex_usd / 1e6,
-                "Annualized_CAPEX_Pump_USDm": annualized_pump_capex_usd / 1e6,
-                "Annualized_CAPEX_Tank_USDm": annualized_tank_capex_usd / 1e6,
-                "Annualized_CAPEX_Total_USDm": annualized_total_capex_usd / 1e6,
-                "Total_Year_Cost_USDm": (annualized_total_capex_usd + fopex_total_usd + vopex_total_usd) / 1e6,
-                "Cumulative_Supply_m3": round(cumulative_supply_m3, 0),
-                "Cumulative_Supply_ton": round(cumulative_supply_ton, 2),
-                "Cumulative_Cost_USDm": round((cumulative_annualized_capex + cumulative_opex) / 1e6, 2),
-                "LCOAmmonia_USD_per_ton": round(lco_ammonia_to_date, 2),
-                "Discount_Factor": disc_factor,
-            })
-
-        result_df = pd.DataFrame(yearly_results)
+        # All years at once (vectorized engine, one shuttle/pump pair)
+        simulation = simulate_yearly(config, pairs=[(shuttle_size_cbm, pump_size_m3ph)])
+        result_df = simulation.to_dataframe()
 
         timestamp = int(time.time())
         output_filename = f"yearly_simulation_{case_id}_{int(shuttle_size_cbm)}_{int(pump_size_m3ph)}_{timestamp}.csv"
@@ -676,7 +491,8 @@ def run_single_case(config, output_path):
         print(f"Case ID: {config.get('case_id', 'unknown')}")
         print("="*60)
 
-        # Run optimization
+        # Run optimization (PuLP and pandas are only needed from here on)
+        from .optimizer import BunkeringOptimizer
         optimizer = BunkeringOptimizer(config)
         scenario_df, yearly_df = optimizer.solve()
 
@@ -701,6 +517,7 @@ def run_single_case(config, output_path):
         # Excel export
         if export_config.get("excel", False):
             try:
+                from .export_excel import ExcelExporter
                 exporter = ExcelExporter(config)
                 excel_file = exporter.export_results(scenario_df, yearly_df, output_path)
                 print(f"[OK] Excel export: {excel_file}")
@@ -710,6 +527,7 @@ def run_single_case(config, output_path):
         # Word export
         if export_config.get("docx", False):
             try:
+                from .export_docx import WordExporter
                 exporter = WordExporter(config)
                 docx_file = exporter.export_report(scenario_df, yearly_df, output_path)
                 print(f"[OK] Word export: {docx_file}")
@@ -7,6 +7,7 @@ This module provides:
 - Single parameter sensitivity analysis
 - Multi-parameter tornado diagrams
 - Two-way sensitivity analysis
+- Analytic (dual-based) derivatives and validity ranges for linear parameters
 - Automatic parameter variation and result collection
 
 Key outputs for SCI papers:
@@ -20,7 +21,7 @@ Usage:
     result = analyzer.analyze_parameter("economy.fuel_price_usd_per_ton", [-0.2, -0.1, 0, 0.1, 0.2])
 """
 
-import copy
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any, Callable
 import pandas as pd
@@ -29,6 +30,7 @@ from pathlib import Path
 
 from .optimizer import BunkeringOptimizer
 from .config_loader import load_config
+from .config_overlay import ConfigOverlay
 
 
 @dataclass
@@ -45,6 +47,8 @@ class ParameterSensitivityResult:
         npcs: Corresponding NPC values (USD millions)
         lcos: Corresponding LCO values (USD/ton)
         elasticity: Price elasticity at base (% NPC change / % param change)
+        breakpoints: Parameter values where the optimal plan changes
+            (parametric analysis only)
     """
     parameter_path: str
     parameter_name: str
@@ -56,6 +60,7 @@ class ParameterSensitivityResult:
     elasticity: float = 0.0
     base_npc: float = 0.0
     base_lco: float = 0.0
+    breakpoints: List[float] = field(default_factory=list)
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert to DataFrame for export."""
@@ -127,6 +132,50 @@ class TwoWaySensitivityResult:
         return df
 
 
+@dataclass
+class AnalyticSensitivityResult:
+    """
+    Result from dual-based (fixed-integer LP) sensitivity analysis.
+
+    Attributes:
+        parameter_path: Config path (e.g., "economy.fuel_price_usd_per_ton")
+        parameter_name: Human-readable name
+        base_value: Original parameter value
+        base_npc: Base case NPC (USD millions)
+        derivative: Exact local derivative dNPC/dparam (USD millions per unit)
+        elasticity: % NPC change / % parameter change at base
+        valid_low: Lower end of the interval where the optimal plan is unchanged
+        valid_high: Upper end of that interval
+    """
+    parameter_path: str
+    parameter_name: str
+    base_value: float
+    base_npc: float
+    derivative: float
+    elasticity: float
+    valid_low: float
+    valid_high: float
+
+    def npc_at(self, value: float) -> Optional[float]:
+        """NPC (USD millions) at value, or None outside the validity range."""
+        if not (self.valid_low <= value <= self.valid_high):
+            return None
+        return self.base_npc + self.derivative * (value - self.base_value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for export."""
+        return {
+            "Parameter": self.parameter_name,
+            "Parameter_Path": self.parameter_path,
+            "Base_Value": self.base_value,
+            "Base_NPC_USDm": self.base_npc,
+            "dNPC_dParam_USDm_per_unit": self.derivative,
+            "Elasticity": self.elasticity,
+            "Valid_Range_Low": self.valid_low,
+            "Valid_Range_High": self.valid_high,
+        }
+
+
 class SensitivityAnalyzer:
     """
     Systematic sensitivity analysis for bunkering optimization.
@@ -159,13 +208,14 @@ class SensitivityAnalyzer:
         # Cache base result
         self._base_npc = None
         self._base_lco = None
+        self._lp_sensitivity = None
 
     def _get_nested_value(self, config: Dict, path: str) -> Any:
         """Get value from nested config using dot notation."""
         keys = path.split(".")
         value = config
         for key in keys:
-            if isinstance(value, dict) and key in value:
+            if isinstance(value, Mapping) and key in value:
                 value = value[key]
             else:
                 raise KeyError(f"Path '{path}' not found in config")
@@ -181,6 +231,31 @@ class SensitivityAnalyzer:
             d = d[key]
         d[keys[-1]] = value
 
+    def _variation_overrides(self, param_path: str, base_value: Any, new_value: Any) -> Dict[str, Any]:
+        """
+        Build dotted-path overrides for one parameter variation.
+
+        Args:
+            param_path: Config path being varied
+            base_value: Original parameter value
+            new_value: Varied parameter value
+
+        Returns:
+            Dict of overrides for ConfigOverlay
+        """
+        overrides = {param_path: new_value}
+
+        # Propagate SFOC variation to the size-dependent SFOC map
+        if param_path == "propulsion.sfoc_g_per_kwh" and base_value != 0:
+            scale_factor = new_value / base_value
+            sfoc_map = self.base_config.get("sfoc_map_g_per_kwh", {})
+            if sfoc_map:
+                overrides["sfoc_map_g_per_kwh"] = {
+                    k: v * scale_factor for k, v in sfoc_map.items()
+                }
+
+        return overrides
+
     def _run_optimization(
         self,
         config: Dict,
@@ -210,6 +285,107 @@ class SensitivityAnalyzer:
 
         return npc, lco
 
+    def get_lp_sensitivity(self) -> Optional[Dict]:
+        """Get or calculate dual-based sensitivities for the analyzed pair."""
+        if self._lp_sensitivity is None:
+            optimizer = BunkeringOptimizer(self.base_config)
+            self._lp_sensitivity = optimizer.analyze_lp_sensitivity(
+                self.shuttle_size, self.pump_size
+            )
+        return self._lp_sensitivity
+
+    def analyze_parameter_analytic(
+        self,
+        param_path: str,
+        param_name: Optional[str] = None,
+        verbose: bool = True
+    ) -> AnalyticSensitivityResult:
+        """
+        Exact local sensitivity for a linearly entering parameter.
+
+        Uses one MILP solve plus one fixed-integer LP re-solve for the whole
+        set of linear parameters (cached), instead of two extra optimizations
+        per parameter for a finite-difference elasticity.
+
+        Args:
+            param_path: Config path in BunkeringOptimizer.LINEAR_PARAMETERS
+            param_name: Human-readable name (default: last path component)
+            verbose: Print result
+
+        Returns:
+            AnalyticSensitivityResult with derivative, elasticity and validity range
+        """
+        if param_path not in BunkeringOptimizer.LINEAR_PARAMETERS:
+            raise ValueError(
+                f"'{param_path}' is not a linear parameter; use analyze_parameter() instead"
+            )
+        if param_name is None:
+            param_name = param_path.split(".")[-1]
+
+        lp_result = self.get_lp_sensitivity()
+        if lp_result is None:
+            raise ValueError(
+                f"No feasible solution for shuttle={self.shuttle_size}, pump={self.pump_size}"
+            )
+
+        info = lp_result["parameters"][param_path]
+        result = AnalyticSensitivityResult(
+            parameter_path=param_path,
+            parameter_name=param_name,
+            base_value=info["base_value"],
+            base_npc=lp_result["npc_usdm"],
+            derivative=info["derivative_usdm_per_unit"],
+            elasticity=info["elasticity"],
+            valid_low=info["valid_range"][0],
+            valid_high=info["valid_range"][1],
+        )
+
+        if verbose:
+            print(f"  {param_name}: dNPC/dx={result.derivative:.6g} USDm/unit, "
+                  f"elasticity={result.elasticity:.4f}, "
+                  f"valid=[{result.valid_low:.6g}, {result.valid_high:.6g}]")
+
+        return result
+
+    def analyze_linear_parameters(
+        self,
+        params: Optional[List[Dict]] = None,
+        verbose: bool = True
+    ) -> pd.DataFrame:
+        """
+        Analytic sensitivities for all linear parameters from a single solve.
+
+        Args:
+            params: List of dicts with "path" and optional "name" keys
+                    (default: all BunkeringOptimizer.LINEAR_PARAMETERS)
+            verbose: Print progress
+
+        Returns:
+            DataFrame with one row per parameter
+        """
+        if params is None:
+            params = [{"path": p} for p in BunkeringOptimizer.LINEAR_PARAMETERS]
+
+        if verbose:
+            print("\n" + "="*60)
+            print("Analytic (Dual-Based) Sensitivity Analysis")
+            print("="*60)
+            print(f"Shuttle: {self.shuttle_size} m3, Pump: {self.pump_size} m3/h")
+
+        rows = []
+        for param_info in params:
+            result = self.analyze_parameter_analytic(
+                param_info["path"],
+                param_name=param_info.get("name"),
+                verbose=verbose
+            )
+            rows.append(result.to_dict())
+
+        if verbose:
+            print("="*60)
+
+        return pd.DataFrame(rows)
+
     def get_base_result(self) -> Tuple[float, float]:
         """Get or calculate base case NPC and LCO."""
         if self._base_npc is None:
@@ -259,18 +435,11 @@ class SensitivityAnalyzer:
             else:
                 new_value = var  # absolute value
 
-            # Create modified config
-            modified_config = copy.deepcopy(self.base_config)
-            self._set_nested_value(modified_config, param_path, new_value)
-
-            # Propagate SFOC variation to the size-dependent SFOC map
-            if param_path == "propulsion.sfoc_g_per_kwh" and base_value != 0:
-                scale_factor = new_value / base_value
-                sfoc_map = modified_config.get("sfoc_map_g_per_kwh", {})
-                if sfoc_map:
-                    modified_config["sfoc_map_g_per_kwh"] = {
-                        k: v * scale_factor for k, v in sfoc_map.items()
-                    }
+            # Create modified config (copy-on-write overlay, base is shared)
+            modified_config = ConfigOverlay(
+                self.base_config,
+                self._variation_overrides(param_path, base_value, new_value)
+            )
 
             # Run optimization
             npc, lco = self._run_optimization(modified_config)
@@ -309,6 +478,108 @@ class SensitivityAnalyzer:
             base_lco=base_lco,
         )
 
+    def analyze_parameter_parametric(
+        self,
+        param_path: str,
+        variations: List[float],
+        param_name: Optional[str] = None,
+        variation_type: str = "relative",
+        include_breakpoints: bool = False,
+        verbose: bool = True
+    ) -> ParameterSensitivityResult:
+        """
+        Analyze a linear cost parameter from its exact parametric NPC curve.
+
+        Same inputs and output as analyze_parameter(), but NPC/LCO at every
+        requested value are read off the piecewise-linear curve from
+        BunkeringOptimizer.parametric_npc_curve(), which needs 2k - 1 solves
+        for k linear pieces instead of one solve per value.
+
+        Args:
+            param_path: Cost parameter path (e.g., "economy.fuel_price_usd_per_ton")
+            variations: List of variations (-0.2 = -20%, 0.1 = +10%, etc.)
+            param_name: Human-readable name (default: param_path)
+            variation_type: "relative" (multiply) or "absolute" (add/replace)
+            include_breakpoints: Also report values at interior breakpoints so
+                that straight lines through the points reproduce the curve
+            verbose: Print progress
+
+        Returns:
+            ParameterSensitivityResult with all results and curve breakpoints
+        """
+        if param_name is None:
+            param_name = param_path.split(".")[-1]
+
+        base_value = self._get_nested_value(self.base_config, param_path)
+        if variation_type == "relative":
+            values = [base_value * (1 + var) for var in variations]
+        else:
+            values = list(variations)
+
+        optimizer = BunkeringOptimizer(self.base_config)
+        curve = optimizer.parametric_npc_curve(
+            self.shuttle_size, self.pump_size, param_path,
+            min(values + [base_value]), max(values + [base_value])
+        )
+        if curve is None:
+            raise ValueError(
+                f"No feasible solution for shuttle={self.shuttle_size}, pump={self.pump_size}"
+            )
+
+        def evaluate(value: float) -> Tuple[float, float, float]:
+            for piece in curve:
+                if value <= piece["value_high"]:
+                    break
+            width = piece["value_high"] - piece["value_low"]
+            frac = (value - piece["value_low"]) / width if width > 0 else 0.0
+            npc = piece["npc_low_usdm"] + frac * (piece["npc_high_usdm"] - piece["npc_low_usdm"])
+            lco = piece["lco_low_usd_per_ton"] + frac * (
+                piece["lco_high_usd_per_ton"] - piece["lco_low_usd_per_ton"]
+            )
+            return npc, lco, piece["npc_slope_usdm_per_unit"]
+
+        breakpoints = [piece["value_low"] for piece in curve[1:]]
+        if include_breakpoints:
+            lo, hi = min(values), max(values)
+            extra = [b for b in breakpoints if lo < b < hi and b not in values]
+            if extra:
+                points = sorted(
+                    list(zip(values, variations))
+                    + [(b, b / base_value - 1 if variation_type == "relative" else b)
+                       for b in extra]
+                )
+                values = [value for value, _ in points]
+                variations = [var for _, var in points]
+
+        base_npc, base_lco, base_slope = evaluate(base_value)
+        npcs, lcos = [], []
+        for value in values:
+            npc, lco, _ = evaluate(value)
+            npcs.append(npc)
+            lcos.append(lco)
+
+        if verbose:
+            print(f"\nParametric sensitivity: {param_name}")
+            print(f"  Base value: {base_value}")
+            print(f"  Linear pieces: {len(curve)}, breakpoints: {breakpoints}")
+            for value, npc in zip(values, npcs):
+                pct_change = (npc - base_npc) / base_npc * 100 if base_npc else 0
+                print(f"  value={value:.2f}, NPC=${npc:.2f}M ({pct_change:+.1f}%)")
+
+        return ParameterSensitivityResult(
+            parameter_path=param_path,
+            parameter_name=param_name,
+            base_value=base_value,
+            variations=variations,
+            values=values,
+            npcs=npcs,
+            lcos=lcos,
+            elasticity=base_slope * base_value / base_npc if base_npc else 0.0,
+            base_npc=base_npc,
+            base_lco=base_lco,
+            breakpoints=breakpoints,
+        )
+
     def analyze_tornado(
         self,
         params: List[Dict],
@@ -438,9 +709,9 @@ class SensitivityAnalyzer:
             row = []
             for j, (var2, val2) in enumerate(zip(variations2, values2)):
                 # Create modified config
-                modified_config = copy.deepcopy(self.base_config)
-                self._set_nested_value(modified_config, param1_path, val1)
-                self._set_nested_value(modified_config, param2_path, val2)
+                modified_config = ConfigOverlay(
+                    self.base_config, {param1_path: val1, param2_path: val2}
+                )
 
                 # Run optimization
                 npc, _ = self._run_optimization(modified_config)
@@ -637,8 +908,7 @@ def analyze_pump_rate_sensitivity(
             print(f"\n[INFO] Testing pump rate: {pump_rate} m3/h")
 
         # Create modified config with single pump rate
-        modified_config = copy.deepcopy(config)
-        modified_config["pumps"]["available_flow_rates"] = [pump_rate]
+        modified_config = ConfigOverlay(config, {"pumps.available_flow_rates": [pump_rate]})
 
         # Run optimization
         optimizer = BunkeringOptimizer(modified_config)
@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Optimization Service Module - Long-lived local service with warm caches.
+
+Scripts normally start a fresh interpreter per run, re-import pandas/PuLP,
+re-parse the YAML configs and re-solve everything. The service keeps one
+process alive with:
+
+- Parsed case configs (variations are applied as ConfigOverlay overrides,
+  the cached configs are never modified)
+- Optimization results per (case, overrides, sizes)
+- SensitivityAnalyzer instances (base solves, LP sensitivities) per pair
+- One BreakevenAnalyzer, whose batched evaluators cache every pair solve
+- Stochastic results per (case, scenarios, sizes)
+
+Everything above is dropped when a YAML file in the config directory is
+modified (checked by mtime before each job), so edits to config/base.yaml
+take effect without restarting the service.
+
+Endpoints (JSON over localhost HTTP, POST /<endpoint>):
+- optimize: full shuttle/pump optimization of a case
+- sensitivity: one-parameter sensitivity (re-optimized or parametric)
+- tornado: tornado diagram data for several parameters
+- breakeven: break-even search between two cases
+- stochastic: two-stage stochastic optimization
+- status (GET or POST): cache sizes and uptime
+
+Usage:
+    # Server
+    python scripts/run_service.py --port 8765
+
+    # Client
+    from src.service import ServiceClient
+    client = ServiceClient("http://127.0.0.1:8765")
+    result = client.optimize("case_1", overrides={"economy.discount_rate": 0.05})
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .breakeven_analyzer import BreakevenAnalyzer
+from .config_loader import load_config
+from .config_overlay import ConfigOverlay, _freeze
+from .optimizer import BunkeringOptimizer
+from .sensitivity_analyzer import SensitivityAnalyzer
+from .stochastic_optimizer import StochasticOptimizer
+from .vessel_distribution import VesselDistribution, load_stochastic_config
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def _key(*parts: Any) -> Tuple:
+    """Hashable cache key from JSON-like request parts."""
+    return tuple(_freeze(part) for part in parts)
+
+
+def _to_json(value: Any) -> Any:
+    """json.dumps default for numpy and pandas values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient="records")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OptimizationService:
+    """
+    In-process optimization service holding warm configs and result caches.
+
+    Jobs are serialized by a lock: the analyzers and their caches are not
+    thread-safe, and CBC already runs as a separate process per solve.
+
+    Args:
+        config_dir: Configuration directory for load_config()
+    """
+
+    ENDPOINTS = ("optimize", "sensitivity", "tornado", "breakeven", "stochastic", "status")
+
+    def __init__(self, config_dir: str = "config"):
+        self.config_dir = config_dir
+        self.started = time.time()
+        self.lock = threading.Lock()
+
+        self.jobs = 0
+        self.reloads = 0
+        self._config_version = self._config_files()
+        self._clear_caches()
+
+    def _config_files(self) -> Tuple:
+        """Name and modification time of each YAML file in the config directory."""
+        return tuple(sorted(
+            (path.name, path.stat().st_mtime_ns) for path in Path(self.config_dir).glob("*.yaml")
+        ))
+
+    def _clear_caches(self) -> None:
+        """Drop loaded configs and every cached result."""
+        self._configs: Dict[str, Dict] = {}
+        self._optimize_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._sensitivity_analyzers: Dict[Tuple, SensitivityAnalyzer] = {}
+        self._stochastic_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._breakeven = BreakevenAnalyzer()
+
+    def refresh(self) -> bool:
+        """
+        Drop the caches if a config file was added, removed or modified.
+
+        Returns:
+            True if the caches were dropped
+        """
+        version = self._config_files()
+        if version == self._config_version:
+            return False
+        self._config_version = version
+        self._clear_caches()
+        self.reloads += 1
+        return True
+
+    def config(self, case_id: str, overrides: Optional[Mapping[str, Any]] = None) -> Mapping:
+        """Cached case config, with overrides applied as an overlay."""
+        if case_id not in self._configs:
+            self._configs[case_id] = load_config(case_id, self.config_dir)
+        config = self._configs[case_id]
+        return ConfigOverlay(config, overrides) if overrides else config
+
+    def handle(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run one job.
+
+        Args:
+            endpoint: One of ENDPOINTS
+            params: Keyword arguments of the endpoint method
+
+        Returns:
+            JSON-serializable result
+        """
+        if endpoint not in self.ENDPOINTS:
+            raise ValueError(f"Unknown endpoint: {endpoint}")
+        if endpoint == "status":
+            return self.status()
+        with self.lock:
+            self.refresh()
+            self.jobs += 1
+            return getattr(self, endpoint)(**(params or {}))
+
+    def optimize(
+        self,
+        case_id: str,
+        overrides: Optional[Dict[str, Any]] = None,
+        shuttle_sizes: Optional[List[float]] = None,
+        pump_sizes: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Full shuttle/pump optimization of a case.
+
+        Args:
+            case_id: Case identifier
+            overrides: Dotted-path config overrides
+            shuttle_sizes: Shuttle sizes (default: from config)
+            pump_sizes: Pump sizes (default: from config)
+
+        Returns:
+            Dict with "scenarios" and "yearly" result records
+        """
+        key = _key(case_id, overrides or {}, shuttle_sizes, pump_sizes)
+        if key not in self._optimize_cache:
+            optimizer = BunkeringOptimizer(self.config(case_id, overrides))
+            if shuttle_sizes is not None:
+                optimizer.shuttle_sizes = list(shuttle_sizes)
+            if pump_sizes is not None:
+                optimizer.pump_sizes = list(pump_sizes)
+            scenario_df, yearly_df = optimizer.solve()
+            self._optimize_cache[key] = {
+                "scenarios": scenario_df.to_dict(orient="records"),
+                "yearly": yearly_df.to_dict(orient="records"),
+            }
+        return self._optimize_cache[key]
+
+    def _sensitivity_analyzer(
+        self,
+        case_id: str,
+        shuttle_size: Optional[float],
+        pump_size: Optional[float]
+    ) -> SensitivityAnalyzer:
+        """Cached SensitivityAnalyzer of a case and pair."""
+        key = _key(case_id, shuttle_size, pump_size)
+        analyzer = self._sensitivity_analyzers.get(key)
+        if analyzer is None:
+            analyzer = SensitivityAnalyzer(self.config(case_id), shuttle_size, pump_size)
+            self._sensitivity_analyzers[key] = analyzer
+        return analyzer
+
+    def sensitivity(
+        self,
+        case_id: str,
+        parameter: str,
+        variations: List[float],
+        shuttle_size: Optional[float] = None,
+        pump_size: Optional[float] = None,
+        variation_type: str = "relative",
+        parametric: bool = False
+    ) -> Dict[str, Any]:
+        """
+        One-parameter sensitivity of a case at a fixed shuttle/pump pair.
+
+        Args:
+            case_id: Case identifier
+            parameter: Config path of the parameter
+            variations: Relative or absolute variations
+            shuttle_size: Shuttle size (default: analyzer default)
+            pump_size: Pump size (default: analyzer default)
+            variation_type: "relative" or "absolute"
+            parametric: Use the exact parametric curve (linear cost parameters)
+
+        Returns:
+            Dict with base_npc, base_lco, breakpoints and result records
+        """
+        analyzer = self._sensitivity_analyzer(case_id, shuttle_size, pump_size)
+        if parametric:
+            result = analyzer.analyze_parameter_parametric(
+                parameter, variations, variation_type=variation_type,
+                include_breakpoints=True, verbose=False
+            )
+        else:
+            result = analyzer.analyze_parameter(
+                parameter, variations, variation_type=variation_type, verbose=False
+            )
+        return {
+            "base_npc": result.base_npc,
+            "base_lco": result.base_lco,
+            "breakpoints": list(result.breakpoints),
+            "records": result.to_dataframe().to_dict(orient="records"),
+        }
+
+    def tornado(
+        self,
+        case_id: str,
+        params: List[Dict[str, str]],
+        variation_pct: float = 0.10,
+        shuttle_size: Optional[float] = None,
+        pump_size: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Tornado diagram data of a case at a fixed shuttle/pump pair.
+
+        Args:
+            case_id: Case identifier
+            params: Dicts with "path" and optional "name" keys
+            variation_pct: Symmetric relative variation
+            shuttle_size: Shuttle size (default: analyzer default)
+            pump_size: Pump size (default: analyzer default)
+
+        Returns:
+            Dict with base_npc and result records (sorted by swing)
+        """
+        result = self._sensitivity_analyzer(case_id, shuttle_size, pump_size).analyze_tornado(
+            params, variation_pct=variation_pct, verbose=False
+        )
+        return {
+            "base_npc": result.base_npc,
+            "records": result.to_dataframe().to_dict(orient="records"),
+        }
+
+    def breakeven(
+        self,
+        case1_id: str,
+        case2_id: str,
+        parameter: str = "distance",
+        value_range: Tuple[float, float] = (10, 200),
+        n_points: Optional[int] = None,
+        method: str = "brent",
+        tolerance: float = 0.1,
+        shuttle_size: Optional[float] = None,
+        pump_size: Optional[float] = None,
+        reoptimize: bool = False,
+        case1_shuttle_size: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Break-even search between two cases.
+
+        Args:
+            case1_id: First case identifier
+            case2_id: Second case identifier
+            parameter: "distance", "demand", "vessel_mix" or a config path
+            value_range: (min, max) parameter range
+            n_points: Coarse scan points (default: the analyzer method's default)
+            method: "brent", "illinois" or "scan"
+            tolerance: Break-even tolerance in parameter units
+            shuttle_size: Fixed shuttle size (ignored with reoptimize)
+            pump_size: Fixed pump size (ignored with reoptimize)
+            reoptimize: Re-optimize each case's size grid per point
+            case1_shuttle_size: Case 1 shuttle size for a distance search with
+                per-case sizes (shuttle_size is then Case 2's)
+
+        Returns:
+            Dict with breakeven_value, crossings and result records
+        """
+        analyzer = self._breakeven
+        case1_config = self.config(case1_id)
+        case2_config = self.config(case2_id)
+        options = {"method": method, "tolerance": tolerance, "verbose": False}
+        if n_points is not None:
+            options["n_points"] = n_points
+
+        if reoptimize:
+            result = analyzer.find_breakeven_reoptimized(
+                case1_config, case2_config, parameter, tuple(value_range), **options
+            )
+        else:
+            if parameter not in analyzer.PARAMETER_COLUMNS:
+                raise ValueError(f"Unknown break-even parameter: {parameter}")
+            if case1_shuttle_size is not None and (parameter != "distance" or shuttle_size is None):
+                raise ValueError("case1_shuttle_size needs parameter='distance' and shuttle_size")
+            search = {
+                "distance": analyzer.find_breakeven_distance,
+                "demand": analyzer.find_breakeven_demand,
+                "vessel_mix": analyzer.find_breakeven_vessel_mix,
+            }[parameter]
+            analyzer.shuttle_size, analyzer.pump_size = shuttle_size, pump_size
+            try:
+                if case1_shuttle_size is not None:
+                    result = analyzer.find_breakeven_distance_heterogeneous(
+                        case1_config, case2_config, case1_shuttle_size, shuttle_size,
+                        tuple(value_range), **options
+                    )
+                else:
+                    result = search(case1_config, case2_config, tuple(value_range), **options)
+            finally:
+                analyzer.shuttle_size = analyzer.pump_size = None
+
+        return {
+            "breakeven_value": result.breakeven_value,
+            "crossings": list(result.crossings),
+            "n_evaluations": result.n_evaluations,
+            "records": result.to_dataframe().to_dict(orient="records"),
+        }
+
+    def stochastic(
+        self,
+        case_id: str,
+        n_scenarios: int = 100,
+        shuttle_sizes: Optional[List[float]] = None,
+        pump_sizes: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Two-stage stochastic optimization of a case.
+
+        Args:
+            case_id: Case identifier
+            n_scenarios: Number of Monte Carlo scenarios
+            shuttle_sizes: Shuttle sizes (default: from config)
+            pump_sizes: Pump sizes (default: from config)
+
+        Returns:
+            Dict with the summary (StochasticResult.to_dict()) and scenario records
+        """
+        key = _key(case_id, n_scenarios, shuttle_sizes, pump_sizes)
+        if key not in self._stochastic_cache:
+            config = self.config(case_id)
+            base_calls = config["shipping"]["voyages_per_year"] * config["shipping"]["start_vessels"]
+            stochastic_file = Path(self.config_dir) / "stochastic.yaml"
+            vessel_dist = VesselDistribution(
+                load_stochastic_config(stochastic_file if stochastic_file.exists() else None),
+                base_annual_calls=base_calls
+            )
+            optimizer = StochasticOptimizer(config, vessel_dist, n_scenarios=n_scenarios)
+            result = optimizer.solve(shuttle_sizes, pump_sizes, verbose=False)
+            self._stochastic_cache[key] = {
+                "summary": result.to_dict(),
+                "records": optimizer.get_detailed_results().to_dict(orient="records"),
+            }
+        return self._stochastic_cache[key]
+
+    def status(self) -> Dict[str, Any]:
+        """Uptime, job count and cache sizes."""
+        # status() runs outside the lock: snapshot the evaluators a running
+        # break-even job may be adding to
+        evaluators = dict(self._breakeven._evaluators)
+        return {
+            "uptime_s": time.time() - self.started,
+            "jobs": self.jobs,
+            "reloads": self.reloads,
+            "configs": sorted(self._configs),
+            "optimize_cache": len(self._optimize_cache),
+            "sensitivity_analyzers": len(self._sensitivity_analyzers),
+            "stochastic_cache": len(self._stochastic_cache),
+            "breakeven_evaluators": [evaluator.cache_info() for evaluator in evaluators.values()],
+        }
+
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """HTTP handler: POST /<endpoint> with a JSON object of parameters."""
+
+    service: OptimizationService = None
+
+    def do_GET(self) -> None:
+        self._dispatch(self.path.strip("/"), {})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            self._respond(400, {"ok": False, "error": f"Invalid JSON: {e}"})
+            return
+        self._dispatch(self.path.strip("/"), params)
+
+    def _dispatch(self, endpoint: str, params: Dict[str, Any]) -> None:
+        if endpoint not in self.service.ENDPOINTS:
+            self._respond(404, {"ok": False, "error": f"Unknown endpoint: {endpoint}"})
+            return
+        try:
+            result = self.service.handle(endpoint, params)
+        except (ValueError, KeyError, TypeError) as e:
+            self._respond(400, {"ok": False, "error": f"{type(e).__name__}: {e}"})
+        except Exception as e:
+            self._respond(500, {"ok": False, "error": f"{type(e).__name__}: {e}"})
+        else:
+            self._respond(200, {"ok": True, "result": result})
+
+    def _respond(self, code: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, default=_to_json).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        print(f"  [{self.log_date_time_string()}] {format % args}")
+
+
+def create_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    service: Optional[OptimizationService] = None
+) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) the HTTP server for a service.
+
+    Args:
+        host: Bind address (keep it on localhost; there is no authentication)
+        port: TCP port (0 picks a free port)
+        service: Service instance (default: a new OptimizationService)
+
+    Returns:
+        Server; call serve_forever() to run it
+    """
+    handler = type("ServiceHandler", (_ServiceHandler,), {
+        "service": service or OptimizationService()
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, config_dir: str = "config") -> None:
+    """Run the service until interrupted."""
+    server = create_server(host, port, OptimizationService(config_dir))
+    print(f"[OK] Optimization service listening on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class ServiceClient:
+    """
+    Thin client for a running optimization service.
+
+    Args:
+        url: Service base URL
+        timeout: Request timeout in seconds (None = wait for the job)
+    """
+
+    def __init__(self, url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", timeout: Optional[float] = None):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def call(self, endpoint: str, **params: Any) -> Any:
+        """
+        Submit a job and wait for its result.
+
+        Raises:
+            ValueError: If the service rejects the request
+            RuntimeError: If the job fails in the service
+            ConnectionError: If the service is not reachable
+        """
+        data = json.dumps(params, default=_to_json).encode("utf-8")
+        request = urllib.request.Request(
+            f"{self.url}/{endpoint}", data=data, headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            payload = json.loads(e.read() or b"{}")
+            error = payload.get("error", str(e))
+            if e.code in (400, 404):
+                raise ValueError(error) from None
+            raise RuntimeError(error) from None
+        except urllib.error.URLError as e:
+            raise ConnectionError(f"Optimization service not reachable at {self.url}: {e.reason}") from None
+        return payload["result"]
+
+    def available(self) -> bool:
+        """True if the service answers a status request."""
+        try:
+            request = urllib.request.Request(f"{self.url}/status")
+            with urllib.request.urlopen(request, timeout=2):
+                return True
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def optimize(self, case_id: str, **params: Any) -> Dict[str, Any]:
+        """See OptimizationService.optimize()."""
+        return self.call("optimize", case_id=case_id, **params)
+
+    def sensitivity(self, case_id: str, parameter: str, variations: List[float], **params: Any) -> Dict[str, Any]:
+        """See OptimizationService.sensitivity()."""
+        return self.call("sensitivity", case_id=case_id, parameter=parameter, variations=variations, **params)
+
+    def tornado(self, case_id: str, params: List[Dict[str, str]], **kwargs: Any) -> Dict[str, Any]:
+        """See OptimizationService.tornado()."""
+        return self.call("tornado", case_id=case_id, params=params, **kwargs)
+
+    def breakeven(self, case1_id: str, case2_id: str, **params: Any) -> Dict[str, Any]:
+        """See OptimizationService.breakeven()."""
+        return self.call("breakeven", case1_id=case1_id, case2_id=case2_id, **params)
+
+    def stochastic(self, case_id: str, **params: Any) -> Dict[str, Any]:
+        """See OptimizationService.stochastic()."""
+        return self.call("stochastic", case_id=case_id, **params)
+
+    def status(self) -> Dict[str, Any]:
+        """See OptimizationService.status()."""
+        return self.call("status")
+
+
+def solve_case(
+    case_id: str,
+    overrides: Optional[Dict[str, Any]] = None,
+    client: Optional[ServiceClient] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Optimize a case locally or through a running service.
+
+    Args:
+        case_id: Case identifier
+        overrides: Dotted-path config overrides
+        client: Service client (default: solve in this process)
+
+    Returns:
+        Tuple of (scenario_results_df, yearly_results_df)
+    """
+    if client is not None:
+        result = client.optimize(case_id, overrides=overrides or {})
+        return pd.DataFrame(result["scenarios"]), pd.DataFrame(result["yearly"])
+
+    optimizer = BunkeringOptimizer(load_config(case_id), overrides=overrides)
+    return optimizer.solve()
@@ -3,10 +3,17 @@ Shore Supply Management for ammonia bunkering operations.
 
 Handles loading and unloading operations at shore facilities,
 including pump rate management and time calculations.
+
+With shore_supply.loading_arms set, shuttles share a limited number of
+loading arms and queue for them. The expected wait is estimated with an
+M/G/c approximation (Erlang C with the Allen-Cunneen correction),
+vectorized over fleet sizes; see queue_wait() and fleet_loading_wait().
 """
 
 from typing import Dict, Optional
 
+import numpy as np
+
 
 class ShoreSupply:
     """
@@ -30,6 +37,7 @@ class ShoreSupply:
                 - shore_supply.enabled: bool
                 - shore_supply.pump_rate_m3ph: float (optional, defaults to 700)
                 - shore_supply.loading_time_fixed_hours: float (optional additional fixed time)
+                - shore_supply.loading_arms: int (optional, null = no contention)
         """
         self.config = config
 
@@ -41,6 +49,8 @@ class ShoreSupply:
             self.STANDARD_PUMP_RATE_M3PH
         )
         self.fixed_time_hours = shore_config.get("loading_time_fixed_hours", 0.0)
+        # None = every shuttle loads at its own arm (no contention)
+        self.loading_arms = shore_config.get("loading_arms")
 
     def is_enabled(self) -> bool:
         """Check if shore supply is enabled in configuration."""
@@ -129,10 +139,112 @@ class ShoreSupply:
 
         Returns:
         --------
-        float : Annual capacity in m³
+        float : Annual capacity in m³ (all loading arms)
         """
         annual_hours = 8000.0
-        return annual_hours * self.pump_rate_m3ph
+        return annual_hours * self.pump_rate_m3ph * (self.loading_arms or 1)
+
+    def queue_wait(self, arrival_rate_per_h, shuttle_size_m3, service_cv: float = 0.0):
+        """
+        Expected wait for a free loading arm (M/G/c approximation).
+
+        Erlang C waiting time of an M/M/c queue scaled by (1 + cv²) / 2
+        (Allen-Cunneen). Exact for a single arm (Pollaczek-Khinchine).
+
+        Parameters:
+        -----------
+        arrival_rate_per_h : float or array
+            Shuttle arrivals at the terminal per hour
+        shuttle_size_m3 : float or array
+            Volume loaded per shuttle (broadcast against arrival_rate_per_h)
+        service_cv : float
+            Coefficient of variation of the loading time (0 = deterministic)
+
+        Returns:
+        --------
+        float or array : Expected wait in hours (inf when the arms are
+        saturated; 0 without loading_arms)
+        """
+        load_time = np.asarray(self.load_shuttle(np.asarray(shuttle_size_m3, dtype=float)), dtype=float)
+        rate = np.asarray(arrival_rate_per_h, dtype=float)
+        rate, load_time = np.broadcast_arrays(rate, load_time)
+        if self.loading_arms is None:
+            wait = np.zeros(rate.shape)
+            return wait if wait.ndim else float(wait)
+
+        arms = int(self.loading_arms)
+        offered = rate * load_time
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wait = np.where(
+                offered < arms,
+                erlang_c(arms, offered) * load_time / (arms - offered) * (1.0 + service_cv ** 2) / 2.0,
+                np.inf,
+            )
+        return wait if wait.ndim else float(wait)
+
+    def fleet_loading_wait(
+        self,
+        n_shuttles,
+        shuttle_size_m3,
+        cycle_hours,
+        busy_fraction: float = 1.0,
+        service_cv: float = 0.0
+    ):
+        """
+        Expected loading wait per trip for a fleet cycling through the terminal.
+
+        Each shuttle arrives once per cycle_hours + wait while busy, so the
+        wait is the fixed point W = queue_wait(λ(W)) with
+        λ(W) = (n - 1) × busy_fraction / (cycle_hours + W): an arriving
+        shuttle only meets the other n - 1 shuttles. Solved by bisection for
+        all elements at once; the fixed point is finite for every fleet size.
+
+        Parameters:
+        -----------
+        n_shuttles : int or array
+            Fleet sizes (broadcast against the other arguments)
+        shuttle_size_m3 : float or array
+            Shuttle capacity in m³
+        cycle_hours : float or array
+            Cycle duration without waiting (includes shore loading)
+        busy_fraction : float
+            Share of the year each shuttle is cycling
+        service_cv : float
+            Coefficient of variation of the loading time
+
+        Returns:
+        --------
+        float or array : Expected wait per trip in hours (0 without loading_arms)
+        """
+        fleet = np.asarray(n_shuttles, dtype=float)
+        cycle = np.asarray(cycle_hours, dtype=float)
+        size = np.asarray(shuttle_size_m3, dtype=float)
+        fleet, cycle, size = np.broadcast_arrays(fleet, cycle, size)
+        if self.loading_arms is None:
+            wait = np.zeros(fleet.shape)
+            return wait if wait.ndim else float(wait)
+
+        others = np.maximum(fleet - 1.0, 0.0) * busy_fraction
+
+        def excess(wait):
+            return wait - self.queue_wait(others / (cycle + wait), size, service_cv)
+
+        # Bracket the root: below lo the arms are saturated (excess = -inf)
+        load_time = np.asarray(self.load_shuttle(size), dtype=float)
+        lo = np.maximum(others * load_time / self.loading_arms - cycle, 0.0)
+        hi = lo + cycle
+        for _ in range(64):
+            low = excess(hi) < 0
+            if not low.any():
+                break
+            hi = np.where(low, 2.0 * hi, hi)
+        for _ in range(60):
+            mid = 0.5 * (lo + hi)
+            low = excess(mid) < 0
+            lo = np.where(low, mid, lo)
+            hi = np.where(low, hi, mid)
+        wait = np.where(others > 0, hi, 0.0)
+        return wait if wait.ndim else float(wait)
 
     def validate_configuration(self) -> bool:
         """
@@ -152,6 +264,14 @@ class ShoreSupply:
                 "Must be positive number."
             )
 
+        if self.loading_arms is not None and (
+            not isinstance(self.loading_arms, int) or self.loading_arms < 1
+        ):
+            raise ValueError(
+                f"Invalid number of loading arms: {self.loading_arms}. "
+                "Must be a positive integer or null."
+            )
+
         if self.fixed_time_hours < 0:
             raise ValueError(
                 f"Invalid fixed loading time: {self.fixed_time_hours} hours. "
@@ -163,8 +283,31 @@ class ShoreSupply:
     def __repr__(self) -> str:
         """String representation of shore supply configuration."""
         status = "Enabled" if self.enabled else "Disabled"
+        arms = f", arms={self.loading_arms}" if self.loading_arms is not None else ""
         return (
             f"ShoreSupply({status}, "
             f"pump_rate={self.pump_rate_m3ph} m³/h, "
-            f"fixed_time={self.fixed_time_hours}h)"
+            f"fixed_time={self.fixed_time_hours}h{arms})"
         )
+
+
+def erlang_c(servers: int, offered_load):
+    """
+    Erlang C probability that an arrival has to wait (vectorized).
+
+    Args:
+        servers: Number of servers c
+        offered_load: Offered load a = λ / μ (scalar or array, a < c)
+
+    Returns:
+        Probability of waiting (1 where a >= c)
+    """
+    load = np.asarray(offered_load, dtype=float)
+    # Erlang B by recurrence, then Erlang C
+    blocking = np.ones_like(load)
+    for k in range(1, servers + 1):
+        blocking = load * blocking / (k + load * blocking)
+    rho = load / servers
+    with np.errstate(divide="ignore", invalid="ignore"):
+        waiting = blocking / (1.0 - rho * (1.0 - blocking))
+    return np.where(rho < 1.0, waiting, 1.0)
@@ -13,6 +13,8 @@ This module extracts the core shuttle operation logic independent of shore suppl
 
 from typing import Dict
 
+import numpy as np
+
 
 class ShuttleRoundTripCalculator:
     """
@@ -160,6 +162,96 @@ class ShuttleRoundTripCalculator:
             'has_storage_at_busan': has_storage_at_busan,
         }
 
+    def calculate_batch(
+        self,
+        shuttle_size_m3,
+        pump_size_m3ph,
+        bunker_volume_per_call_m3: float = 5000.0,
+        num_vessels=1,
+        is_round_trip: bool = True,
+        has_storage_at_busan: bool = True
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate() over arrays of shuttle sizes, pump rates and vessel counts.
+
+        shuttle_size_m3, pump_size_m3ph and num_vessels are broadcast against
+        each other; every returned array has the broadcast shape. Values are
+        identical to calling calculate() element by element (same operations
+        in the same order, float64).
+
+        Returns:
+        --------
+        dict with the same keys as calculate(), holding float64 arrays
+        """
+        shuttle = np.asarray(shuttle_size_m3, dtype=float)
+        pump = np.asarray(pump_size_m3ph, dtype=float)
+        vessels = np.asarray(num_vessels, dtype=float)
+        shuttle, pump, vessels = np.broadcast_arrays(shuttle, pump, vessels)
+        shape = shuttle.shape
+
+        def full(value):
+            return np.full(shape, float(value))
+
+        travel_outbound = full(self.travel_time_hours)
+        travel_return = full(self.travel_time_hours if is_round_trip else 0.0)
+
+        # Case 1: limited by shuttle capacity; Case 2: by ship demand
+        if has_storage_at_busan:
+            pumping_per_vessel = shuttle / pump
+        else:
+            pumping_per_vessel = bunker_volume_per_call_m3 / pump
+
+        setup_inbound = full(self.setup_time_hours)
+        setup_outbound = full(self.setup_time_hours)
+
+        port_entry = full(1.0 if not has_storage_at_busan else 0.0)
+        port_exit = full(1.0 if not has_storage_at_busan else 0.0)
+
+        movement_per_vessel = full(1.0 if not has_storage_at_busan else 0.0)
+        movement_total = movement_per_vessel * vessels
+
+        time_per_vessel_at_destination = setup_inbound + pumping_per_vessel + setup_outbound
+        if not has_storage_at_busan:
+            time_per_vessel_at_destination = movement_per_vessel + time_per_vessel_at_destination
+
+        time_all_vessels_at_destination = time_per_vessel_at_destination * vessels
+
+        basic_cycle_duration = (
+            travel_outbound +
+            port_entry +
+            time_all_vessels_at_destination +
+            port_exit +
+            travel_return
+        )
+
+        # Same ceiling division as calculate(): -(-volume // shuttle)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            trips_multi = np.maximum(1.0, -np.floor_divide(-bunker_volume_per_call_m3, shuttle))
+            trips_per_call = np.where(
+                shuttle >= bunker_volume_per_call_m3, 1.0 / vessels, trips_multi
+            )
+
+        return {
+            'travel_outbound_h': travel_outbound,
+            'travel_return_h': travel_return,
+            'port_entry_h': port_entry,
+            'port_exit_h': port_exit,
+            'movement_per_vessel_h': movement_per_vessel,
+            'movement_total_h': movement_total,
+            'setup_inbound_h': setup_inbound,
+            'setup_outbound_h': setup_outbound,
+            'pumping_per_vessel_h': pumping_per_vessel,
+            'pumping_total_h': pumping_per_vessel * vessels,
+            'time_per_vessel_at_destination_h': time_per_vessel_at_destination,
+            'time_all_vessels_at_destination_h': time_all_vessels_at_destination,
+            'basic_cycle_duration_h': basic_cycle_duration,
+            'trips_per_call': trips_per_call,
+            'vessels_per_trip': vessels,
+            'shuttle_size_m3': shuttle,
+            'pump_size_m3ph': pump,
+            'has_storage_at_busan': has_storage_at_busan,
+        }
+
     def calculate_call_duration(
         self,
         shuttle_size_m3: float,
@@ -40,6 +40,7 @@ from .vessel_distribution import VesselDistribution, MonteCarloScenario
 from .cost_calculator import CostCalculator
 from .cycle_time_calculator import CycleTimeCalculator
 from .config_loader import load_config
+from .config_overlay import ConfigOverlay
 
 
 @dataclass
@@ -298,15 +299,13 @@ class StochasticOptimizer:
 
         return npcs
 
-    def _create_scenario_config(self, mc_scenario: MonteCarloScenario) -> Dict:
+    def _create_scenario_config(self, mc_scenario: MonteCarloScenario) -> ConfigOverlay:
         """
         Create modified config for a specific Monte Carlo scenario.
 
         This adjusts the demand based on the scenario's vessel call distribution.
+        Returns a copy-on-write overlay over the shared base config.
         """
-        import copy
-        scenario_config = copy.deepcopy(self.config)
-
         # Calculate average bunker volume for this scenario
         if mc_scenario.vessel_calls:
             total_volume = sum(vol for _, vol in mc_scenario.vessel_calls)
@@ -315,7 +314,9 @@ class StochasticOptimizer:
             avg_volume = self.config["bunkering"]["bunker_volume_per_call_m3"]
 
         # Update config with scenario-specific volume
-        scenario_config["bunkering"]["bunker_volume_per_call_m3"] = avg_volume
+        scenario_config = ConfigOverlay(
+            self.config, {"bunkering.bunker_volume_per_call_m3": avg_volume}
+        )
 
         # Adjust for total annual demand variation
         # The number of calls is fixed, but volume per call varies
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Surrogate Module - Gaussian-process surrogate of NPC for what-if queries.
+
+Answers questions such as "NPC at fuel price 750 and 8 h travel time" for a
+fixed shuttle/pump pair without running the optimizer:
+
+- Inputs are dotted config paths (the same paths SensitivityAnalyzer uses),
+  each with a (low, high) training range.
+- Training data come from BunkeringOptimizer evaluations through
+  BatchEvaluator, so points shared with other analyses are reused.
+- A Gaussian process (anisotropic RBF kernel, hyperparameters by maximum
+  marginal likelihood) gives a prediction and its standard deviation.
+- refine() adds optimizer evaluations where the predictive standard deviation
+  is largest; query() falls back to the optimizer (and learns the point)
+  when a prediction is more uncertain than the requested tolerance.
+
+Fleet sizes are integers, so NPC has small steps in capacity-related inputs
+(travel time, max hours, bunker volume). The GP smooths them and the noise
+term of the kernel absorbs the step height; std reflects that.
+
+Usage:
+    from src.surrogate import NPCSurrogate
+    surrogate = NPCSurrogate(config, {
+        "economy.fuel_price_usd_per_ton": (400, 1000),
+        "operations.travel_time_hours": (1.0, 10.0),   # distance / speed
+    }, shuttle_size=5000, pump_size=500)
+    surrogate.fit(n_initial=40)
+    surrogate.refine(target_std=0.5)
+    result = surrogate.query({"economy.fuel_price_usd_per_ton": 750,
+                              "operations.travel_time_hours": 120 / 15})
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .batch_evaluator import BatchEvaluator
+from .sensitivity_analyzer import SensitivityAnalyzer
+
+
+class GaussianProcess:
+    """
+    Gaussian-process regression with an anisotropic RBF kernel.
+
+    Inputs are expected in the unit hypercube; outputs are standardized
+    internally. Length scales and the noise level are chosen by coordinate
+    search on the log marginal likelihood. Predictive std is calibrated with
+    closed-form leave-one-out residuals, so it is not overconfident where the
+    response has steps the smooth kernel cannot follow.
+
+    Args:
+        length_scale_grid: Candidate length scales per input dimension
+        noise_grid: Candidate noise variances (relative to output variance)
+    """
+
+    def __init__(
+        self,
+        length_scale_grid: Optional[np.ndarray] = None,
+        noise_grid: Optional[np.ndarray] = None
+    ):
+        self.length_scale_grid = (
+            np.geomspace(0.05, 5.0, 15) if length_scale_grid is None else np.asarray(length_scale_grid)
+        )
+        self.noise_grid = (
+            np.array([1e-8, 1e-6, 1e-4, 1e-3, 1e-2, 3e-2, 1e-1]) if noise_grid is None else np.asarray(noise_grid)
+        )
+        self.length_scales: Optional[np.ndarray] = None
+        self.noise = 1e-6
+
+        self._X: Optional[np.ndarray] = None
+        self._y_mean = 0.0
+        self._y_std = 1.0
+        self._alpha: Optional[np.ndarray] = None
+        self._K_inv: Optional[np.ndarray] = None
+        self.std_scale = 1.0
+
+    def _kernel(self, A: np.ndarray, B: np.ndarray, length_scales: np.ndarray) -> np.ndarray:
+        """RBF kernel matrix with unit signal variance."""
+        diff = (A[:, np.newaxis, :] - B[np.newaxis, :, :]) / length_scales
+        return np.exp(-0.5 * np.sum(diff ** 2, axis=-1))
+
+    def _log_likelihood(self, X: np.ndarray, y: np.ndarray, length_scales: np.ndarray, noise: float) -> float:
+        """Log marginal likelihood of standardized outputs."""
+        K = self._kernel(X, X, length_scales) + (noise + 1e-10) * np.eye(len(X))
+        try:
+            L = np.linalg.cholesky(K)
+        except np.linalg.LinAlgError:
+            return -np.inf
+        alpha = np.linalg.solve(L.T, np.linalg.solve(L, y))
+        return float(-0.5 * y @ alpha - np.sum(np.log(np.diag(L))))
+
+    def fit(self, X: np.ndarray, y: np.ndarray, optimize: bool = True) -> "GaussianProcess":
+        """
+        Fit the GP to training data.
+
+        Args:
+            X: Inputs in the unit hypercube, shape (n, d)
+            y: Outputs, shape (n,)
+            optimize: Re-select hyperparameters (False keeps the current ones)
+
+        Returns:
+            self
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self._y_mean = float(np.mean(y))
+        self._y_std = float(np.std(y)) or 1.0
+        y_std = (y - self._y_mean) / self._y_std
+
+        if self.length_scales is None or len(self.length_scales) != X.shape[1]:
+            self.length_scales = np.full(X.shape[1], 0.5)
+            optimize = True
+
+        if optimize:
+            best = self._log_likelihood(X, y_std, self.length_scales, self.noise)
+            for _ in range(2):
+                for dim in range(X.shape[1]):
+                    for scale in self.length_scale_grid:
+                        trial = self.length_scales.copy()
+                        trial[dim] = scale
+                        value = self._log_likelihood(X, y_std, trial, self.noise)
+                        if value > best:
+                            best, self.length_scales = value, trial
+                for noise in self.noise_grid:
+                    value = self._log_likelihood(X, y_std, self.length_scales, noise)
+                    if value > best:
+                        best, self.noise = value, noise
+
+        K = self._kernel(X, X, self.length_scales) + (self.noise + 1e-10) * np.eye(len(X))
+        self._K_inv = np.linalg.inv(K)
+        self._alpha = self._K_inv @ y_std
+        self._X = X
+
+        # Leave-one-out calibration: residual_i = alpha_i / Kinv_ii,
+        # LOO variance_i = 1 / Kinv_ii (Rasmussen & Williams, eq. 5.12)
+        diag = np.diag(self._K_inv)
+        loo_z = self._alpha / np.sqrt(diag)
+        self.std_scale = max(1.0, float(np.sqrt(np.mean(loo_z ** 2))))
+        return self
+
+    def predict(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict mean and standard deviation.
+
+        Args:
+            X: Inputs in the unit hypercube, shape (m, d)
+
+        Returns:
+            Tuple of (mean, std), each of shape (m,)
+        """
+        k = self._kernel(np.atleast_2d(X), self._X, self.length_scales)
+        mean = k @ self._alpha
+        variance = 1.0 + self.noise - np.einsum("ij,jk,ik->i", k, self._K_inv, k)
+        std = np.sqrt(np.maximum(variance, 0.0)) * self.std_scale
+        return mean * self._y_std + self._y_mean, std * self._y_std
+
+
+class NPCSurrogate:
+    """
+    Surrogate of NPC/LCO over config parameters for one shuttle/pump pair.
+
+    Args:
+        base_config: Base configuration dictionary
+        parameters: Mapping of config path -> (low, high) training range
+        shuttle_size: Shuttle size (default: first available)
+        pump_size: Pump rate (default: first available)
+        output: "npc" (USD millions) or "lco" (USD/ton)
+        evaluator: Shared BatchEvaluator (default: new serial evaluator)
+        seed: Random seed for designs and candidate pools
+    """
+
+    def __init__(
+        self,
+        base_config: Dict,
+        parameters: Mapping[str, Tuple[float, float]],
+        shuttle_size: Optional[float] = None,
+        pump_size: Optional[float] = None,
+        output: str = "npc",
+        evaluator: Optional[BatchEvaluator] = None,
+        seed: Optional[int] = 42
+    ):
+        if output not in ("npc", "lco"):
+            raise ValueError(f"Unknown output: {output}")
+        if not parameters:
+            raise ValueError("At least one input parameter is required")
+        for path, (low, high) in parameters.items():
+            if not low < high:
+                raise ValueError(f"{path}: range needs low < high")
+
+        self.base_config = base_config
+        self.paths = list(parameters)
+        self.lower = np.array([parameters[p][0] for p in self.paths], dtype=float)
+        self.upper = np.array([parameters[p][1] for p in self.paths], dtype=float)
+        self.output = output
+
+        # Reuse the one-at-a-time analyzer for defaults and override building
+        self._local = SensitivityAnalyzer(base_config, shuttle_size, pump_size)
+        self.shuttle_size = self._local.shuttle_size
+        self.pump_size = self._local.pump_size
+        self._base_values = [self._local._get_nested_value(base_config, p) for p in self.paths]
+
+        self.evaluator = evaluator or BatchEvaluator(base_config, num_jobs=1)
+        self.rng = np.random.default_rng(seed)
+        self.gp = GaussianProcess()
+
+        self._U = np.empty((0, len(self.paths)))
+        self._y = np.empty(0)
+
+    # ========== TRAINING ==========
+
+    @property
+    def n_training(self) -> int:
+        """Number of optimizer evaluations in the training set."""
+        return len(self._y)
+
+    def _to_unit(self, X: np.ndarray) -> np.ndarray:
+        return (X - self.lower) / (self.upper - self.lower)
+
+    def _from_unit(self, U: np.ndarray) -> np.ndarray:
+        return self.lower + U * (self.upper - self.lower)
+
+    def _evaluate(self, U: np.ndarray) -> np.ndarray:
+        """Run the optimizer (through the evaluator cache) at unit-box points."""
+        overrides_list = []
+        for row in self._from_unit(U):
+            overrides: Dict[str, Any] = {}
+            for path, base_value, value in zip(self.paths, self._base_values, row):
+                overrides.update(self._local._variation_overrides(path, base_value, float(value)))
+            overrides_list.append(overrides)
+        values = self.evaluator.evaluate_batch(overrides_list, self.shuttle_size, self.pump_size)
+        return values[:, 0 if self.output == "npc" else 1]
+
+    def _add_points(self, U: np.ndarray, optimize: bool = True) -> int:
+        """Evaluate points, keep feasible ones and refit. Returns points added."""
+        y = self._evaluate(U)
+        feasible = np.isfinite(y)
+        self._U = np.vstack([self._U, U[feasible]])
+        self._y = np.concatenate([self._y, y[feasible]])
+        if self.n_training < 2:
+            raise ValueError("Too few feasible training points for the surrogate")
+        self.gp.fit(self._U, self._y, optimize=optimize)
+        return int(feasible.sum())
+
+    def _latin_hypercube(self, n: int) -> np.ndarray:
+        """Latin hypercube design in the unit box."""
+        d = len(self.paths)
+        strata = np.column_stack([self.rng.permutation(n) for _ in range(d)])
+        return (strata + self.rng.random((n, d))) / n
+
+    def fit(self, n_initial: Optional[int] = None) -> "NPCSurrogate":
+        """
+        Train on an initial Latin hypercube design (plus box corners).
+
+        Args:
+            n_initial: Number of design points (default: 10 per input)
+
+        Returns:
+            self
+        """
+        d = len(self.paths)
+        n_initial = n_initial or 10 * d
+        U = self._latin_hypercube(n_initial)
+        if d <= 4:
+            corners = np.array(np.meshgrid(*[[0.0, 1.0]] * d)).reshape(d, -1).T
+            U = np.vstack([U, corners])
+        self._add_points(U)
+        return self
+
+    def refine(
+        self,
+        target_std: Optional[float] = None,
+        max_points: int = 50,
+        batch_size: int = 5,
+        n_candidates: int = 2000,
+        verbose: bool = False
+    ) -> Dict[str, float]:
+        """
+        Adaptive resampling where the surrogate is most uncertain.
+
+        Each round predicts on a random candidate pool, evaluates the
+        batch_size candidates with the largest std (spread out by refitting
+        between rounds) and stops when the largest std is below target_std or
+        max_points optimizer evaluations have been made. Infeasible points are
+        not added to the training set (their std stays high), so they count
+        toward max_points like any other evaluation.
+
+        Args:
+            target_std: Stop once max predictive std falls below this (output units)
+            max_points: Maximum optimizer evaluations (feasible or not)
+            batch_size: Points evaluated per round
+            n_candidates: Candidate pool size per round
+            verbose: Print progress
+
+        Returns:
+            Dict with points_added, evaluations and max_std (after refinement)
+        """
+        if self.n_training == 0:
+            self.fit()
+
+        added = 0
+        evaluations = 0
+        max_std = float("inf")
+        while True:
+            candidates = self.rng.random((n_candidates, len(self.paths)))
+            _, std = self.gp.predict(candidates)
+            max_std = float(std.max())
+            if verbose:
+                print(f"  Surrogate: {self.n_training} points, max std={max_std:.4g}")
+            if (target_std is not None and max_std <= target_std) or evaluations >= max_points:
+                break
+            take = min(batch_size, max_points - evaluations)
+            picks = candidates[np.argsort(std)[-take:]]
+            added += self._add_points(picks, optimize=False)
+            evaluations += take
+
+        # Re-select hyperparameters on the enlarged training set
+        self.gp.fit(self._U, self._y, optimize=True)
+        return {"points_added": added, "evaluations": evaluations, "max_std": max_std}
+
+    # ========== QUERIES ==========
+
+    def _query_point(self, values: Mapping[str, float]) -> np.ndarray:
+        unknown = [p for p in values if p not in self.paths]
+        if unknown:
+            raise ValueError(f"Not a surrogate input: {unknown}")
+        row = np.array([values.get(p, base) for p, base in zip(self.paths, self._base_values)],
+                       dtype=float)
+        return self._to_unit(row)
+
+    def predict(self, values: Mapping[str, float]) -> Tuple[float, float]:
+        """
+        Surrogate prediction (no optimizer call).
+
+        Args:
+            values: Mapping of input path -> value (missing inputs use base values)
+
+        Returns:
+            Tuple of (prediction, standard deviation) in output units
+        """
+        mean, std = self.gp.predict(self._query_point(values)[np.newaxis, :])
+        return float(mean[0]), float(std[0])
+
+    def query(
+        self,
+        values: Mapping[str, float],
+        tolerance: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Answer a what-if query, falling back to the optimizer when uncertain.
+
+        Args:
+            values: Mapping of input path -> value (missing inputs use base values)
+            tolerance: Max acceptable std; more uncertain or out-of-range
+                queries are evaluated exactly and added to the training set
+
+        Returns:
+            Dict with value, std, source ("surrogate" or "optimizer") and
+            in_range (whether the query lies inside the training box)
+        """
+        u = self._query_point(values)
+        in_range = bool(np.all((u >= 0.0) & (u <= 1.0)))
+        mean, std = self.gp.predict(u[np.newaxis, :])
+        result = {"value": float(mean[0]), "std": float(std[0]),
+                  "source": "surrogate", "in_range": in_range}
+
+        if tolerance is not None and (result["std"] > tolerance or not in_range):
+            exact = float(self._evaluate(u[np.newaxis, :])[0])
+            if np.isfinite(exact) and in_range:
+                self._U = np.vstack([self._U, u])
+                self._y = np.append(self._y, exact)
+                self.gp.fit(self._U, self._y, optimize=False)
+            result.update({"value": exact, "std": 0.0, "source": "optimizer"})
+        return result
+
+    def validate(self, n_points: int = 50) -> Dict[str, float]:
+        """
+        Error estimate on fresh random points (evaluated, not added).
+
+        Args:
+            n_points: Number of validation points
+
+        Returns:
+            Dict with rmse, max_abs_error, mean_std and coverage (fraction of
+            errors within 2 predicted std)
+        """
+        U = self.rng.random((n_points, len(self.paths)))
+        exact = self._evaluate(U)
+        feasible = np.isfinite(exact)
+        mean, std = self.gp.predict(U[feasible])
+        errors = mean - exact[feasible]
+        return {
+            "rmse": float(np.sqrt(np.mean(errors ** 2))),
+            "max_abs_error": float(np.max(np.abs(errors))),
+            "mean_std": float(np.mean(std)),
+            "coverage": float(np.mean(np.abs(errors) <= 2 * std + 1e-12)),
+        }
+
+    def training_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Training inputs (config units) and outputs."""
+        return self._from_unit(self._U), self._y.copy()
+
+
+def build_surrogates(
+    base_config: Dict,
+    parameters: Mapping[str, Tuple[float, float]],
+    pairs: Optional[List[Tuple[float, float]]] = None,
+    output: str = "npc",
+    n_initial: Optional[int] = None,
+    target_std: Optional[float] = None,
+    max_points: int = 50,
+    num_jobs: Optional[int] = None,
+    verbose: bool = True
+) -> Dict[Tuple[float, float], NPCSurrogate]:
+    """
+    Build one surrogate per shuttle/pump pair with a shared evaluator cache.
+
+    Args:
+        base_config: Base configuration dictionary
+        parameters: Mapping of config path -> (low, high) training range
+        pairs: (shuttle, pump) pairs (default: all configured combinations)
+        output: "npc" or "lco"
+        n_initial: Initial design size per pair (default: 10 per input)
+        target_std: Refinement target std (None: no refinement)
+        max_points: Max refinement points per pair
+        num_jobs: Worker processes for evaluation (optional)
+        verbose: Print progress
+
+    Returns:
+        Dict mapping (shuttle, pump) to fitted NPCSurrogate
+    """
+    if pairs is None:
+        pairs = [
+            (s, p)
+            for s in base_config["shuttle"]["available_sizes_cbm"]
+            for p in base_config["pumps"]["available_flow_rates"]
+        ]
+
+    evaluator = BatchEvaluator(base_config, num_jobs=num_jobs)
+    surrogates = {}
+    for shuttle, pump in pairs:
+        surrogate = NPCSurrogate(base_config, parameters, shuttle, pump,
+                                 output=output, evaluator=evaluator)
+        try:
+            surrogate.fit(n_initial)
+        except ValueError as e:
+            if verbose:
+                print(f"  [WARN] {shuttle} m3 / {pump} m3/h: {e}")
+            continue
+        if target_std is not None:
+            surrogate.refine(target_std=target_std, max_points=max_points)
+        surrogates[(shuttle, pump)] = surrogate
+        if verbose:
+            print(f"  [OK] {shuttle} m3 / {pump} m3/h: {surrogate.n_training} training points")
+    return surrogates
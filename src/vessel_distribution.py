@@ -342,6 +342,51 @@ class VesselDistribution:
 
         return calls
 
+    def sample_call_volumes(
+        self,
+        scenario_name: str,
+        n_calls: int,
+        rng: np.random.Generator = None,
+        method: str = None
+    ) -> np.ndarray:
+        """
+        Vectorized bunkering volumes for a stream of vessel calls.
+
+        Same type selection and volume rules as generate_vessel_call_sequence,
+        drawn in one pass per vessel type for long call streams.
+
+        Args:
+            scenario_name: Distribution scenario to use
+            n_calls: Number of calls to generate
+            rng: NumPy random generator (default: this distribution's generator)
+            method: Sampling method (default: from config)
+
+        Returns:
+            Array of bunkering volumes (m3), one per call
+        """
+        if rng is None:
+            rng = self.rng
+        if method is None:
+            method = self.sampling_method
+
+        scenario = self.distribution_scenarios.get(scenario_name)
+        if scenario is None:
+            raise ValueError(f"Unknown scenario: {scenario_name}")
+
+        type_names = list(scenario.shares)
+        shares = np.array([scenario.shares[name] for name in type_names], dtype=float)
+        type_idx = rng.choice(len(type_names), size=n_calls, p=shares / shares.sum())
+
+        volumes = np.empty(n_calls)
+        for i, type_name in enumerate(type_names):
+            mask = type_idx == i
+            vtype = self.vessel_types[type_name]
+            if method == "discrete":
+                volumes[mask] = vtype.mean_volume
+            else:
+                volumes[mask] = vtype.sample(int(mask.sum()), method=self.continuous_distribution, rng=rng)
+        return volumes
+
     def generate_monte_carlo_scenarios(
         self,
         n_scenarios: int = None,
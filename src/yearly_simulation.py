@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yearly Simulation Module - Vectorized 20-year simulation over shuttle/pump pairs.
+
+Computes the yearly_simulation run mode (fleet sized by working time,
+cycles, utilization, costs, annualized CAPEX and LCOAmmonia to date) for
+every (pair, year) at once as 2-D arrays of shape (pairs, years), instead
+of one pair and one year at a time.
+
+Values are identical to the per-pair, per-year loop that
+runner.run_yearly_simulation used, so the full grid can be checked against
+the MILP results (CalculationVerifier.verify_simulation_consistency).
+
+Usage:
+    from src.yearly_simulation import simulate_yearly
+    result = simulate_yearly(config)           # all configured pairs
+    df = result.to_dataframe()                 # run_yearly_simulation columns
+    lco = result.final_lco()                   # LCOAmmonia per pair (USD/ton)
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .cost_tables import CostTables
+from .utils import calculate_vessel_growth, calculate_annual_demand
+
+
+# Output columns -> (field, scale, decimals); decimals None = unrounded
+_COLUMNS = [
+    ("Cycle_Duration_Hours", "cycle_duration", 1.0, 2),
+    ("Shore_Loading_Hours", "shore_loading", 1.0, 2),
+    ("Pumping_Per_Trip_Hours", "pumping_per_vessel", 1.0, 2),
+    ("Travel_Outbound_Hours", "travel_outbound", 1.0, 4),
+    ("Travel_Return_Hours", "travel_return", 1.0, 4),
+    ("Setup_Total_Hours", "setup_total", 1.0, 4),
+    ("Trips_Per_Call", "trips_per_call", 1.0, 4),
+    ("Vessels_Per_Trip", "vessels_per_trip", 1.0, 4),
+    ("Time_Per_Vessel_Call_Hours", "time_per_vessel_call", 1.0, 2),
+    ("Annual_Calls", "annual_calls", 1.0, 1),
+    ("Annual_Cycles", "total_trips", 1.0, None),
+    ("Supply_m3", "supply_m3", 1.0, None),
+    ("Demand_m3", "demand_m3", 1.0, None),
+    ("Cycles_Available", "cycles_available", 1.0, 1),
+    ("Utilization_Rate", "utilization_rate", 1.0, 4),
+    ("Total_Hours_Needed", "total_hours_needed", 1.0, 0),
+    ("Total_Hours_Available", "total_hours_available", 1.0, 0),
+    ("Hours_Per_Shuttle_Used", "hours_per_shuttle_used", 1.0, 0),
+    ("Cycles_Per_Shuttle", "cycles_per_shuttle", 1.0, 1),
+    ("CAPEX_Shuttle_USDm", "capex_shuttle", 1e6, None),
+    ("CAPEX_Pump_USDm", "capex_pump", 1e6, None),
+    ("CAPEX_Tank_USDm", "capex_tank", 1e6, None),
+    ("CAPEX_Total_USDm", "capex_total", 1e6, None),
+    ("FixedOPEX_Shuttle_USDm", "fopex_shuttle", 1e6, None),
+    ("FixedOPEX_Pump_USDm", "fopex_pump", 1e6, None),
+    ("FixedOPEX_Tank_USDm", "fopex_tank", 1e6, None),
+    ("FixedOPEX_Total_USDm", "fopex_total", 1e6, None),
+    ("VariableOPEX_Shuttle_USDm", "vopex_shuttle", 1e6, None),
+    ("VariableOPEX_Pump_USDm", "vopex_pump", 1e6, None),
+    ("VariableOPEX_Tank_USDm", "vopex_tank", 1e6, None),
+    ("VariableOPEX_Total_USDm", "vopex_total", 1e6, None),
+    ("Total_OPEX_USDm", "opex_total", 1e6, None),
+    ("Annualized_CAPEX_Shuttle_USDm", "annualized_capex_shuttle", 1e6, None),
+    ("Annualized_CAPEX_Pump_USDm", "annualized_capex_pump", 1e6, None),
+    ("Annualized_CAPEX_Tank_USDm", "annualized_capex_tank", 1e6, None),
+    ("Annualized_CAPEX_Total_USDm", "annualized_capex_total", 1e6, None),
+    ("Total_Year_Cost_USDm", "annualized_total_cost", 1e6, None),
+    ("Cumulative_Supply_m3", "cumulative_supply_m3", 1.0, 0),
+    ("Cumulative_Supply_ton", "cumulative_supply_ton", 1.0, 2),
+    ("Cumulative_Cost_USDm", "cumulative_cost", 1e6, 2),
+    ("LCOAmmonia_USD_per_ton", "lco_ammonia", 1.0, 2),
+    ("Discount_Factor", "discount_factor", 1.0, None),
+]
+
+
+@dataclass
+class YearlySimulationResult:
+    """
+    Yearly simulation for many shuttle/pump pairs.
+
+    Attributes:
+        shuttle_sizes: Shuttle size of each pair (m3), shape (pairs,)
+        pump_sizes: Pump flow rate of each pair (m3/h), shape (pairs,)
+        years: Simulated years, shape (years,)
+        fields: Per (pair, year) arrays, shape (pairs, years), keyed by
+            quantity (e.g. "total_shuttles", "utilization_rate",
+            "annualized_capex_total", "lco_ammonia"); costs in USD
+        integer_trips: Whether annual cycles are whole trips (direct supply)
+    """
+    shuttle_sizes: np.ndarray
+    pump_sizes: np.ndarray
+    years: np.ndarray
+    fields: Dict[str, np.ndarray] = field(default_factory=dict)
+    integer_trips: bool = False
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.fields[name]
+
+    def pair_index(self, shuttle_size: float, pump_size: float) -> int:
+        """Row of a shuttle/pump pair; raises ValueError if not simulated."""
+        matches = np.flatnonzero(
+            (self.shuttle_sizes == float(shuttle_size)) & (self.pump_sizes == float(pump_size))
+        )
+        if len(matches) == 0:
+            raise ValueError(f"Pair ({shuttle_size}, {pump_size}) was not simulated")
+        return int(matches[0])
+
+    def final_lco(self) -> np.ndarray:
+        """LCOAmmonia at the last year for each pair (USD/ton, unrounded)."""
+        return self.fields["lco_ammonia"][:, -1]
+
+    def to_dataframe(self, rows: Optional[Sequence[int]] = None):
+        """
+        Convert to the long format written by run_yearly_simulation.
+
+        Args:
+            rows: Pair indices to include (default: all pairs)
+
+        Returns:
+            DataFrame with one row per (pair, year)
+        """
+        import pandas as pd
+
+        rows = range(len(self.shuttle_sizes)) if rows is None else list(rows)
+        n_years = len(self.years)
+        records: Dict[str, List] = {
+            "Shuttle_Size_cbm": [], "Pump_Size_m3ph": [], "Year": [],
+            "New_Shuttles": [], "Total_Shuttles": [],
+        }
+        for column, _, _, _ in _COLUMNS:
+            records[column] = []
+
+        for row in rows:
+            records["Shuttle_Size_cbm"].extend([int(self.shuttle_sizes[row])] * n_years)
+            records["Pump_Size_m3ph"].extend([int(self.pump_sizes[row])] * n_years)
+            records["Year"].extend(self.years.tolist())
+            records["New_Shuttles"].extend(self.fields["new_shuttles"][row].astype(int).tolist())
+            records["Total_Shuttles"].extend(self.fields["total_shuttles"][row].astype(int).tolist())
+            for column, name, scale, decimals in _COLUMNS:
+                values = self.fields[name][row]
+                if name == "total_trips" and self.integer_trips:
+                    values = values.astype(int)
+                elif scale != 1.0:
+                    values = values / scale
+                values = values.tolist()
+                # Python round() to match the scalar output exactly
+                if decimals is not None:
+                    values = [round(v, decimals) for v in values]
+                records[column].extend(values)
+
+        return pd.DataFrame(records)
+
+    def pair_dataframe(self, shuttle_size: float, pump_size: float):
+        """Yearly DataFrame for one pair (same as run_yearly_simulation)."""
+        return self.to_dataframe([self.pair_index(shuttle_size, pump_size)])
+
+
+def simulate_yearly(
+    config: Mapping,
+    shuttle_sizes: Optional[Sequence[float]] = None,
+    pump_sizes: Optional[Sequence[float]] = None,
+    pairs: Optional[Sequence[Sequence[float]]] = None
+) -> YearlySimulationResult:
+    """
+    Simulate every year for many shuttle/pump pairs in one pass.
+
+    Args:
+        config: Configuration dictionary or ConfigOverlay
+        shuttle_sizes: Shuttle sizes (default: shuttle.available_sizes_cbm)
+        pump_sizes: Pump flow rates (default: pumps.available_flow_rates)
+        pairs: Explicit (shuttle, pump) pairs; overrides the size grid
+
+    Returns:
+        YearlySimulationResult with (pairs, years) arrays; pairs are ordered
+        shuttle-major like the optimizer grid
+    """
+    if pairs is None:
+        if shuttle_sizes is None:
+            shuttle_sizes = config["shuttle"]["available_sizes_cbm"]
+        if pump_sizes is None:
+            pump_sizes = config["pumps"]["available_flow_rates"]
+        pairs = [(s, p) for s in shuttle_sizes for p in pump_sizes]
+    if len(pairs) == 0:
+        raise ValueError("No shuttle/pump pairs to simulate")
+
+    tables = CostTables.for_config(config)
+
+    start_year = config["time_period"]["start_year"]
+    end_year = config["time_period"]["end_year"]
+    years = np.arange(start_year, end_year + 1)
+    max_annual_hours = config["operations"]["max_annual_hours_per_vessel"]
+    bunker_volume = config["bunkering"]["bunker_volume_per_call_m3"]
+    has_storage_at_busan = config["operations"].get("has_storage_at_busan", True)
+    shore_supply_enabled = config.get("shore_supply", {}).get("enabled", False)
+    tank_active = config["tank_storage"]["enabled"] and shore_supply_enabled
+    density_storage = config["ammonia"]["density_storage_ton_m3"]
+
+    vessel_growth = calculate_vessel_growth(
+        start_year, end_year,
+        config["shipping"]["start_vessels"], config["shipping"]["end_vessels"]
+    )
+    annual_demand = calculate_annual_demand(
+        vessel_growth, bunker_volume, config["shipping"]["voyages_per_year"]
+    )
+
+    # ----- Per-pair quantities, shape (pairs, 1) -----
+    def column(values):
+        return np.asarray(values, dtype=float).reshape(-1, 1)
+
+    cycle_infos = [tables.cycle_info(s, p) for s, p in pairs]
+    costs = [tables.component_costs(s, p) for s, p in pairs]
+    shuttle = column([s for s, _ in pairs])
+    pump = column([p for _, p in pairs])
+
+    cycle_duration = column([info["cycle_duration"] for info in cycle_infos])
+    trips_per_call = column([info.get("trips_per_call", 1) for info in cycle_infos])
+    if has_storage_at_busan:
+        vessels_per_trip = np.ones_like(shuttle)
+    else:
+        vessels_per_trip = np.maximum(1.0, np.floor_divide(shuttle, bunker_volume))
+
+    shuttle_capex = column([c["shuttle_capex"] for c in costs])
+    bunk_capex = column([c["bunkering_capex"] for c in costs])
+    shuttle_fixed_opex = column([c["shuttle_fixed_opex"] for c in costs])
+    bunk_fixed_opex = column([c["bunkering_fixed_opex"] for c in costs])
+    pump_power = column([c["pump_power"] for c in costs])
+
+    tank_capex = tables.tank_capex if tank_active else 0.0
+    tank_fixed_opex = tables.tank_fixed_opex if tank_active else 0.0
+    tank_variable_opex = tables.tank_variable_opex if tank_active else 0.0
+
+    # Fuel: raw MCR map and default SFOC, as in the yearly simulation mode
+    mcr_map = config["shuttle"]["mcr_map_kw"]
+    mcr = column([mcr_map.get(int(s), 0) for s, _ in pairs])
+    sfoc = config["propulsion"]["sfoc_g_per_kwh"]
+    fuel_price = config["economy"]["fuel_price_usd_per_ton"]
+    travel_time_hours = config["operations"]["travel_time_hours"]
+    travel_factor = 1.0 if has_storage_at_busan else 2.0
+    shuttle_fuel_cost_per_cycle = (mcr * sfoc * travel_factor * travel_time_hours) / 1e6 * fuel_price
+    pumping_time_hr_call = bunker_volume / pump
+    pump_fuel_cost_per_event = (pump_power * pumping_time_hr_call * sfoc) / 1e6 * fuel_price
+
+    # ----- Per-year quantities, shape (1, years) -----
+    demand_m3 = np.array([annual_demand[int(y)] for y in years], dtype=float).reshape(1, -1)
+    annual_calls = demand_m3 / bunker_volume if bunker_volume > 0 else np.zeros_like(demand_m3)
+
+    # ----- Fleet (working-time sizing; fleet follows the requirement) -----
+    # Saturated shore loading arms give an infinite cycle: such a pair needs
+    # an infinite fleet from the first year on (inf - inf would be NaN)
+    feasible = np.isfinite(cycle_duration)
+    total_hours_needed_fleet = (annual_calls * trips_per_call) * np.where(feasible, cycle_duration, 0.0)
+    sized_shuttles = np.ceil(total_hours_needed_fleet / max_annual_hours)
+    previous = np.concatenate([np.zeros((len(pairs), 1)), sized_shuttles[:, :-1]], axis=1)
+    new_shuttles = np.maximum(0.0, sized_shuttles - previous)
+    new_shuttles[~feasible[:, 0], 0] = np.inf
+    total_shuttles = np.where(feasible, sized_shuttles, np.inf)
+    shape = total_shuttles.shape
+
+    def grid(values):
+        return np.broadcast_to(values, shape).astype(float)
+
+    # Tank bought with the first fleet addition
+    if tank_active:
+        tank_purchased = np.cumsum(new_shuttles > 0, axis=1) > 0
+        new_tank = (tank_purchased & ~np.concatenate(
+            [np.zeros((len(pairs), 1), dtype=bool), tank_purchased[:, :-1]], axis=1
+        )).astype(float)
+    else:
+        tank_purchased = np.zeros(shape, dtype=bool)
+        new_tank = np.zeros(shape)
+
+    disc_factor = 1.0  # No discounting applied
+
+    capex_shuttle = disc_factor * shuttle_capex * new_shuttles
+    capex_pump = disc_factor * bunk_capex * new_shuttles
+    capex_tank = disc_factor * tank_capex * new_tank
+    capex_total = capex_shuttle + capex_pump + capex_tank
+
+    fopex_shuttle = disc_factor * shuttle_fixed_opex * total_shuttles
+    fopex_pump = disc_factor * bunk_fixed_opex * total_shuttles
+    fopex_tank = np.where(tank_purchased, disc_factor * tank_fixed_opex, 0.0)
+    fopex_total = fopex_shuttle + fopex_pump + fopex_tank
+
+    if has_storage_at_busan:
+        total_trips = annual_calls * trips_per_call
+    else:
+        total_trips = np.ceil(annual_calls / vessels_per_trip)
+
+    vopex_shuttle = disc_factor * shuttle_fuel_cost_per_cycle * total_trips
+    vopex_pump = disc_factor * pump_fuel_cost_per_event * annual_calls
+    vopex_tank = np.where(tank_purchased, disc_factor * tank_variable_opex, 0.0)
+    vopex_total = vopex_shuttle + vopex_pump + vopex_tank
+
+    # Annualized CAPEX of the assets owned each year
+    annualize = tables.calculate_annualized_capex_yearly
+    annualized_capex_shuttle = grid(annualize(total_shuttles * shuttle_capex))
+    annualized_capex_pump = grid(annualize(total_shuttles * bunk_capex))
+    annualized_capex_tank = grid(annualize(np.where(tank_purchased, tank_capex, 0.0)))
+    annualized_capex_total = annualized_capex_shuttle + annualized_capex_pump + annualized_capex_tank
+
+    # Utilization
+    with np.errstate(divide="ignore", invalid="ignore"):
+        supply_m3 = annual_calls * bunker_volume
+        cycles_available = np.where(
+            feasible & (cycle_duration > 0), total_shuttles * (max_annual_hours / cycle_duration), 0.0
+        )
+        utilization_rate = np.where(cycles_available > 0, total_trips / cycles_available, 0.0)
+        total_hours_needed = total_trips * cycle_duration
+        total_hours_available = total_shuttles * max_annual_hours
+        hours_per_shuttle_used = np.where(
+            feasible & (total_shuttles > 0), total_hours_needed / total_shuttles, 0.0
+        )
+        cycles_per_shuttle = np.where(total_shuttles > 0, total_trips / total_shuttles, 0.0)
+
+        # LCOAmmonia to date (sequential cumulative sums, as the yearly loop)
+        cumulative_supply_m3 = np.cumsum(grid(supply_m3), axis=1)
+        cumulative_supply_ton = np.cumsum(grid(supply_m3 * density_storage), axis=1)
+        annualized_total_cost = annualized_capex_total + fopex_total + vopex_total
+        cumulative_annualized_capex = np.cumsum(annualized_capex_total, axis=1)
+        cumulative_opex = np.cumsum(fopex_total + vopex_total, axis=1)
+        cumulative_cost = cumulative_annualized_capex + cumulative_opex
+        lco_ammonia = np.where(cumulative_supply_ton > 0, cumulative_cost / cumulative_supply_ton, 0.0)
+
+    fields = {
+        "demand_m3": grid(demand_m3),
+        "annual_calls": grid(annual_calls),
+        "new_shuttles": new_shuttles,
+        "total_shuttles": total_shuttles,
+        "new_tank": new_tank,
+        "cycle_duration": grid(cycle_duration),
+        "shore_loading": grid(column([i["shore_loading"] for i in cycle_infos])),
+        "pumping_per_vessel": grid(column([i["pumping_per_vessel"] for i in cycle_infos])),
+        "travel_outbound": grid(column([i["travel_outbound"] for i in cycle_infos])),
+        "travel_return": grid(column([i["travel_return"] for i in cycle_infos])),
+        "setup_total": grid(column([i["setup_inbound"] + i["setup_outbound"] for i in cycle_infos])),
+        "trips_per_call": grid(trips_per_call),
+        "vessels_per_trip": grid(vessels_per_trip),
+        "time_per_vessel_call": grid(cycle_duration * trips_per_call),
+        "total_trips": total_trips,
+        "supply_m3": grid(supply_m3),
+        "cycles_available": cycles_available,
+        "utilization_rate": utilization_rate,
+        "total_hours_needed": total_hours_needed,
+        "total_hours_available": total_hours_available,
+        "hours_per_shuttle_used": hours_per_shuttle_used,
+        "cycles_per_shuttle": cycles_per_shuttle,
+        "capex_shuttle": capex_shuttle,
+        "capex_pump": capex_pump,
+        "capex_tank": capex_tank,
+        "capex_total": capex_total,
+        "fopex_shuttle": fopex_shuttle,
+        "fopex_pump": fopex_pump,
+        "fopex_tank": fopex_tank,
+        "fopex_total": fopex_total,
+        "vopex_shuttle": vopex_shuttle,
+        "vopex_pump": vopex_pump,
+        "vopex_tank": vopex_tank,
+        "vopex_total": vopex_total,
+        "opex_total": fopex_total + vopex_total,
+        "annualized_capex_shuttle": annualized_capex_shuttle,
+        "annualized_capex_pump": annualized_capex_pump,
+        "annualized_capex_tank": annualized_capex_tank,
+        "annualized_capex_total": annualized_capex_total,
+        "annualized_total_cost": annualized_total_cost,
+        "cumulative_supply_m3": cumulative_supply_m3,
+        "cumulative_supply_ton": cumulative_supply_ton,
+        "cumulative_cost": cumulative_cost,
+        "lco_ammonia": lco_ammonia,
+        "discount_factor": np.full(shape, disc_factor),
+    }
+
+    return YearlySimulationResult(
+        shuttle_sizes=shuttle.ravel(),
+        pump_sizes=pump.ravel(),
+        years=years,
+        fields=fields,
+        integer_trips=not has_storage_at_busan,
+    )
@@ -0,0 +1,128 @@
+"""
+Timing fixtures for the benchmark suite.
+
+Benchmarks only run when GC_BENCHMARK is set:
+
+    GC_BENCHMARK=1 python -m pytest -q tests/benchmarks      # compare with baseline
+    GC_BENCHMARK=save python -m pytest -q tests/benchmarks   # (re)write baseline
+
+Timings are written to <GC_BENCHMARK_DIR>/latest.json (default:
+results/benchmarks). A benchmark fails as a regression when its best time
+exceeds the baseline by more than GC_BENCHMARK_THRESHOLD (default 0.25 =
+25%) and by more than 10 ms. Baselines are machine-specific and are not
+committed.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+BENCHMARK_MODE = os.environ.get("GC_BENCHMARK", "").lower()
+THRESHOLD = float(os.environ.get("GC_BENCHMARK_THRESHOLD", "0.25"))
+BENCHMARK_DIR = Path(os.environ.get("GC_BENCHMARK_DIR", project_root / "results" / "benchmarks"))
+
+# Timing differences below this are noise, whatever the ratio
+MIN_DELTA_S = 0.010
+
+
+class BenchmarkLog:
+    """Benchmark timings of one session, compared against a JSON baseline."""
+
+    def __init__(self, directory: Path, threshold: float, save: bool):
+        self.directory = directory
+        self.threshold = threshold
+        self.save = save
+        self.baseline_file = directory / "baseline.json"
+        self.baseline: Dict[str, Dict] = {}
+        if self.baseline_file.exists():
+            self.baseline = json.loads(self.baseline_file.read_text(encoding="utf-8"))["benchmarks"]
+        self.results: Dict[str, Dict] = {}
+
+    def record(self, name: str, times: List[float]) -> Optional[str]:
+        """Store one benchmark's timings; returns a message if it regressed."""
+        entry = {
+            "min_s": min(times),
+            "median_s": statistics.median(times),
+            "rounds": len(times),
+        }
+        base = self.baseline.get(name)
+        message = None
+        if base is not None:
+            entry["baseline_s"] = base["min_s"]
+            entry["ratio"] = entry["min_s"] / base["min_s"] if base["min_s"] > 0 else float("inf")
+            regressed = (
+                entry["min_s"] > base["min_s"] * (1.0 + self.threshold)
+                and entry["min_s"] - base["min_s"] > MIN_DELTA_S
+            )
+            entry["regressed"] = regressed and not self.save
+            if entry["regressed"]:
+                message = (
+                    f"{name} regressed: {entry['min_s']:.3f}s vs baseline {base['min_s']:.3f}s "
+                    f"({entry['ratio']:.2f}x > {1.0 + self.threshold:.2f}x)"
+                )
+        self.results[name] = entry
+        return message
+
+    def write(self) -> None:
+        """Write latest.json and, in save mode, merge the timings into the baseline."""
+        if not self.results:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        machine = {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        }
+        latest = {"machine": machine, "threshold": self.threshold, "benchmarks": self.results}
+        (self.directory / "latest.json").write_text(json.dumps(latest, indent=2), encoding="utf-8")
+        if self.save:
+            merged = {**self.baseline}
+            for name, entry in self.results.items():
+                merged[name] = {key: entry[key] for key in ("min_s", "median_s", "rounds")}
+            baseline = {"machine": machine, "benchmarks": merged}
+            self.baseline_file.write_text(json.dumps(baseline, indent=2), encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def benchmark_log():
+    log = BenchmarkLog(BENCHMARK_DIR, THRESHOLD, save=BENCHMARK_MODE == "save")
+    yield log
+    log.write()
+
+
+@pytest.fixture
+def bench(request, benchmark_log) -> Callable:
+    """
+    Time a callable over several rounds (output silenced) and check the baseline.
+
+    Usage: result = bench(func, *args, rounds=3, setup=None, **kwargs)
+    """
+    def run(func: Callable, *args, rounds: int = 3, setup: Optional[Callable] = None, **kwargs):
+        times = []
+        result = None
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                result = func(*args, **kwargs)
+                times.append(time.perf_counter() - start)
+        message = benchmark_log.record(request.node.nodeid.split("::", 1)[-1], times)
+        if message:
+            pytest.fail(message)
+        return result
+
+    return run
@@ -0,0 +1,101 @@
+"""
+Benchmarks of the optimizer, stochastic, sensitivity and figure hot paths.
+
+Opt-in (slow): GC_BENCHMARK=1 python -m pytest -q tests/benchmarks
+"""
+
+import contextlib
+import io
+import os
+
+import pytest
+
+import matplotlib
+matplotlib.use("Agg")
+
+from src.breakeven_analyzer import BreakevenAnalyzer
+from src.config_loader import load_config
+from src.cost_tables import CostTables
+from src.optimizer import BunkeringOptimizer
+from src.paper_figures import PaperFigureGenerator
+from src.runner import run_single_case
+from src.sensitivity_analyzer import SensitivityAnalyzer
+from src.stochastic_optimizer import StochasticOptimizer
+from src.vessel_distribution import VesselDistribution, load_stochastic_config
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("GC_BENCHMARK"), reason="benchmarks run with GC_BENCHMARK=1 (or =save)"
+)
+
+TORNADO_PARAMS = [
+    {"path": "economy.fuel_price_usd_per_ton", "name": "Fuel Price"},
+    {"path": "operations.max_annual_hours_per_vessel", "name": "Max Hours"},
+    {"path": "operations.travel_time_hours", "name": "Travel Time"},
+    {"path": "bunkering.bunker_volume_per_call_m3", "name": "Bunker Volume"},
+    {"path": "propulsion.sfoc_g_per_kwh", "name": "SFOC"},
+]
+
+
+class TestOptimizerBenchmarks:
+    """Deterministic MILP optimization per case."""
+
+    @pytest.mark.parametrize("case_id", ["case_1", "case_2", "case_3"])
+    def test_solve(self, bench, case_id):
+        config = load_config(case_id)
+        # Cold cost tables each round: the full solve as run by main.py
+        scenario_df, yearly_df = bench(
+            lambda: BunkeringOptimizer(config).solve(), rounds=3, setup=CostTables.invalidate
+        )
+        assert not scenario_df.empty and not yearly_df.empty
+
+
+class TestStochasticBenchmarks:
+    """Two-stage stochastic optimization and scenario generation."""
+
+    @pytest.mark.parametrize("n_scenarios", [50, 200])
+    def test_solve(self, bench, n_scenarios):
+        config = load_config("case_1")
+        distribution = VesselDistribution(load_stochastic_config())
+        result = bench(
+            lambda: StochasticOptimizer(config, distribution, n_scenarios).solve(verbose=False), rounds=1
+        )
+        # Scenarios infeasible for the chosen combination are dropped
+        assert 0 < len(result.npc_by_scenario) <= n_scenarios
+
+    def test_vessel_distribution(self, bench):
+        stochastic_config = load_stochastic_config()
+        scenarios = bench(
+            lambda: VesselDistribution(stochastic_config).generate_monte_carlo_scenarios(n_scenarios=1000)
+        )
+        assert len(scenarios) == 1000
+
+
+class TestAnalysisBenchmarks:
+    """Sensitivity tornado and break-even curves."""
+
+    def test_tornado(self, bench):
+        analyzer = SensitivityAnalyzer(load_config("case_1"), 2500, 500)
+        result = bench(analyzer.analyze_tornado, TORNADO_PARAMS, verbose=False)
+        assert len(result.to_dataframe()) == len(TORNADO_PARAMS)
+
+    def test_breakeven_distance(self, bench):
+        case1, case3 = load_config("case_1"), load_config("case_3")
+        result = bench(
+            lambda: BreakevenAnalyzer().find_breakeven_distance(case1, case3, verbose=False),
+            setup=CostTables.invalidate,
+        )
+        assert len(result.to_dataframe()) > 0
+
+
+class TestFigureBenchmarks:
+    """Rendering all paper figures from one case's results."""
+
+    def test_generate_all(self, bench, tmp_path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_single_case(load_config("case_1"), tmp_path)
+        results = bench(
+            lambda: PaperFigureGenerator(str(tmp_path)).generate_all(str(tmp_path / "figures")),
+            rounds=1,
+        )
+        assert results and all(result.ok for result in results.values())
+        assert any((tmp_path / "figures").glob("*.png"))
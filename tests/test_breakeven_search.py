@@ -0,0 +1,204 @@
+"""
+Tests for root-finding and re-optimized break-even search.
+"""
+
+import io
+import contextlib
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.breakeven_analyzer import BreakevenAnalyzer
+from src.config_loader import load_config
+from src.config_overlay import ConfigOverlay
+from src.optimizer import BunkeringOptimizer
+
+
+class TestFindRoot:
+    """Test the bracketing root finders on analytic functions."""
+
+    @pytest.mark.parametrize("method", ["brent", "illinois"])
+    def test_smooth_function(self, method):
+        analyzer = BreakevenAnalyzer()
+        func = lambda x: x ** 3 - 2 * x - 5
+        root = analyzer._find_root(func, 2.0, 3.0, func(2.0), func(3.0), 1e-9, method)
+
+        assert root == pytest.approx(2.0945514815, abs=1e-8)
+
+    @pytest.mark.parametrize("method", ["brent", "illinois"])
+    def test_step_function(self, method):
+        # Fleet-size jumps make the NPC difference discontinuous
+        analyzer = BreakevenAnalyzer()
+        func = lambda x: -1.0 + 0.01 * x if x < 42.3 else 2.0 + 0.01 * x
+        root = analyzer._find_root(func, 0.0, 100.0, func(0.0), func(100.0), 0.01, method)
+
+        assert root == pytest.approx(42.3, abs=0.01)
+
+    def test_infinite_end_falls_back_to_bisection(self):
+        analyzer = BreakevenAnalyzer()
+        func = lambda x: np.inf if x > 80 else x - 30.0
+        root = analyzer._find_root(func, 0.0, 100.0, func(0.0), func(100.0), 1e-6, "brent")
+
+        assert root == pytest.approx(30.0, abs=1e-6)
+
+
+@pytest.fixture(scope="module")
+def distance_configs():
+    return load_config("case_1"), load_config("case_3")
+
+
+class TestBreakevenSearch:
+    """Root finding must match a dense scan with far fewer solves."""
+
+    def _run(self, configs, **kwargs):
+        analyzer = BreakevenAnalyzer(shuttle_size=10000, pump_size=500)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return analyzer.find_breakeven_distance(
+                *configs, distance_range=(1, 300), verbose=False, **kwargs
+            )
+
+    @pytest.mark.parametrize("method", ["brent", "illinois"])
+    def test_sign_change_within_tolerance(self, distance_configs, method):
+        tolerance = 0.1
+        result = self._run(distance_configs, n_points=3, method=method, tolerance=tolerance)
+        assert result.n_evaluations < 15
+        assert result.param_values == sorted(result.param_values)
+
+        # The NPC difference must change sign across breakeven +/- tolerance
+        case1_config, case3_config = distance_configs
+        analyzer = BreakevenAnalyzer(shuttle_size=10000, pump_size=500)
+        speed = case3_config["operations"].get("distance_nm", 86) / case3_config["operations"]["travel_time_hours"]
+        case1_npc = result.case1_npcs[0]
+        diffs = []
+        for dist in (result.breakeven_value - tolerance, result.breakeven_value + tolerance):
+            overlay = ConfigOverlay(case3_config, {"operations.travel_time_hours": dist / speed})
+            with contextlib.redirect_stdout(io.StringIO()):
+                npc, _ = analyzer._run_optimization(overlay)
+            diffs.append(case1_npc - npc)
+
+        assert diffs[0] * diffs[1] <= 0
+
+    def test_scan_keeps_interpolation(self, distance_configs):
+        result = self._run(distance_configs, n_points=20, method="scan")
+
+        assert result.n_evaluations == 20
+        assert result.crossings == [result.breakeven_value]
+
+    def test_default_scan_points(self, distance_configs):
+        assert self._run(distance_configs, method="scan").n_evaluations == 10
+
+    def test_unknown_method(self, distance_configs):
+        with pytest.raises(ValueError):
+            self._run(distance_configs, method="newton")
+
+
+@pytest.fixture(scope="module")
+def reoptimized_configs():
+    # A long Case 1 transit makes Case 2 competitive at short distances
+    case1 = ConfigOverlay(load_config("case_1"), {"operations.travel_time_hours": 8.0})
+    return case1, load_config("case_2")
+
+
+@pytest.fixture(scope="module")
+def reoptimized_result(reoptimized_configs):
+    analyzer = BreakevenAnalyzer()
+    return analyzer.find_breakeven_reoptimized(
+        *reoptimized_configs, parameter="distance", value_range=(5, 200), n_points=4, verbose=False
+    )
+
+
+class TestReoptimizedBreakeven:
+    """Full-grid re-optimization per point, with warm starts and pruning."""
+
+    def _grid_optimum(self, config, overrides):
+        optimizer = BunkeringOptimizer(ConfigOverlay(config, overrides))
+        best = (float("inf"), None)
+        for shuttle in config["shuttle"]["available_sizes_cbm"]:
+            for pump in config["pumps"]["available_flow_rates"]:
+                evaluation = optimizer.evaluate_combination(shuttle, pump)
+                if evaluation is not None and evaluation["npc_usdm"] < best[0]:
+                    best = (evaluation["npc_usdm"], (float(shuttle), float(pump)))
+        return best
+
+    def test_matches_full_grid(self, reoptimized_configs, reoptimized_result):
+        analyzer = BreakevenAnalyzer()
+        for i, dist in enumerate(reoptimized_result.param_values):
+            overrides1, overrides2 = analyzer._case_overrides("distance", dist, *reoptimized_configs)
+            npc1, _ = self._grid_optimum(reoptimized_configs[0], overrides1)
+            npc2, pair2 = self._grid_optimum(reoptimized_configs[1], overrides2)
+
+            assert reoptimized_result.case1_npcs[i] == pytest.approx(npc1)
+            assert reoptimized_result.case2_npcs[i] == pytest.approx(npc2)
+            assert reoptimized_result.case2_optima[i] == pair2
+
+    def test_crossing_and_pruning(self, reoptimized_configs, reoptimized_result):
+        assert reoptimized_result.breakeven_value is not None
+        assert reoptimized_result.case1_better_below is False
+
+        pairs = sum(
+            len(config["shuttle"]["available_sizes_cbm"]) * len(config["pumps"]["available_flow_rates"])
+            for config in reoptimized_configs
+        )
+        assert reoptimized_result.pair_evaluations < reoptimized_result.n_evaluations * pairs / 2
+
+    def test_dataframe_reports_optima(self, reoptimized_result):
+        df = reoptimized_result.to_dataframe()
+
+        assert "Distance_nm" in df.columns
+        shuttle_cols = [c for c in df.columns if c.endswith("_Shuttle_m3")]
+        assert len(shuttle_cols) == 2
+        assert df[shuttle_cols].notna().all().all()
+
+
+class TestCaseComparison:
+    """Multi-case comparison over full size grids through the shared cache."""
+
+    def test_full_grids_match_solve(self):
+        analyzer = BreakevenAnalyzer()
+        result = analyzer.compare_all_cases(case_ids=["case_1", "case_2"], verbose=False)
+
+        for case_id in ("case_1", "case_2"):
+            config = load_config(case_id)
+            evaluated = [key for key in result.npc_matrix if key[0] == case_id]
+            assert len(evaluated) == (
+                len(config["shuttle"]["available_sizes_cbm"]) * len(config["pumps"]["available_flow_rates"])
+            )
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                scenario_df, _ = BunkeringOptimizer(config).solve()
+            best = scenario_df.loc[scenario_df["NPC_Total_USDm"].idxmin()]
+            optimal = result.optimal_by_case[case_id]
+
+            assert optimal["npc"] == pytest.approx(best["NPC_Total_USDm"], abs=0.01)
+            assert optimal["shuttle_size"] == best["Shuttle_Size_cbm"]
+
+    def test_repeated_solves_are_cached(self):
+        analyzer = BreakevenAnalyzer()
+        analyzer.compare_all_cases(case_ids=["case_1"], verbose=False)
+        evaluator, _ = analyzer._evaluator(analyzer._load_case("case_1"))
+        misses = evaluator.cache_info()["misses"]
+
+        analyzer.compare_all_cases(case_ids=["case_1"], verbose=False)
+        analyzer._run_optimization(analyzer._load_case("case_1"), 1000, 500)
+
+        assert evaluator.cache_info()["misses"] == misses
+
+    def test_in_place_config_edits_are_not_stale(self):
+        analyzer = BreakevenAnalyzer()
+        config = load_config("case_1")
+        with contextlib.redirect_stdout(io.StringIO()):
+            before, _ = analyzer._run_optimization(config, 2500, 500)
+            config["economy"]["fuel_price_usd_per_ton"] *= 2
+            after, _ = analyzer._run_optimization(config, 2500, 500)
+            expected, _ = BreakevenAnalyzer()._run_optimization(load_config("case_1"), 2500, 500)
+
+        assert after > before
+        # A fresh config with the original contents reuses the unmodified cache
+        assert before == pytest.approx(expected)
+        assert len(analyzer._evaluators) == 2
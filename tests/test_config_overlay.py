@@ -0,0 +1,126 @@
+"""
+Unit tests for ConfigOverlay (copy-on-write config variations).
+"""
+
+import io
+import contextlib
+import copy
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config_loader import load_config
+from src.config_overlay import ConfigOverlay
+from src.optimizer import BunkeringOptimizer
+
+
+BASE = {
+    "economy": {"fuel_price_usd_per_ton": 600.0, "discount_rate": 0.0},
+    "operations": {"travel_time_hours": 1.0},
+    "sfoc_map_g_per_kwh": {500: 505, 1000: 505},
+    "pumps": {"available_flow_rates": [500]},
+}
+
+
+class TestConfigOverlayReading:
+    """Test read access through overlays."""
+
+    def test_override_value(self):
+        overlay = ConfigOverlay(BASE, {"economy.fuel_price_usd_per_ton": 720.0})
+
+        assert overlay["economy"]["fuel_price_usd_per_ton"] == 720.0
+        assert overlay["economy"]["discount_rate"] == 0.0
+        assert overlay["economy"].get("missing", 1) == 1
+
+    def test_base_unchanged(self):
+        snapshot = copy.deepcopy(BASE)
+        ConfigOverlay(BASE, {"economy.fuel_price_usd_per_ton": 720.0})["economy"]
+
+        assert BASE == snapshot
+
+    def test_untouched_subtree_is_shared(self):
+        overlay = ConfigOverlay(BASE, {"economy.fuel_price_usd_per_ton": 720.0})
+
+        assert overlay["sfoc_map_g_per_kwh"] is BASE["sfoc_map_g_per_kwh"]
+
+    def test_new_path_is_created(self):
+        overlay = ConfigOverlay(BASE, {"route.distance_nm": 120.0})
+
+        assert overlay["route"]["distance_nm"] == 120.0
+        assert "route" in overlay
+        assert set(overlay) == set(BASE) | {"route"}
+
+    def test_stacked_overlays_share_root(self):
+        first = ConfigOverlay(BASE, {"economy.fuel_price_usd_per_ton": 720.0})
+        second = first.with_overrides({"operations.travel_time_hours": 2.0})
+
+        assert second.base is BASE
+        assert second["economy"]["fuel_price_usd_per_ton"] == 720.0
+        assert second["operations"]["travel_time_hours"] == 2.0
+
+    def test_deeper_override_edits_copy_of_parent(self):
+        overlay = ConfigOverlay(BASE, {"economy": {"fuel_price_usd_per_ton": 1.0}})
+        overlay = overlay.with_overrides({"economy.discount_rate": 0.05})
+
+        assert overlay["economy"] == {"fuel_price_usd_per_ton": 1.0, "discount_rate": 0.05}
+
+    def test_to_dict_materializes(self):
+        overlay = ConfigOverlay(BASE, {"operations.travel_time_hours": 5.73})
+        plain = overlay.to_dict()
+
+        assert isinstance(plain["operations"], dict)
+        assert plain["operations"]["travel_time_hours"] == 5.73
+        assert plain == overlay
+
+
+class TestConfigOverlayHashing:
+    """Test hashing and equality for cache keys."""
+
+    def test_equal_overlays_hash_equal(self):
+        a = ConfigOverlay(BASE, {"pumps.available_flow_rates": [700]})
+        b = ConfigOverlay(BASE, {"pumps.available_flow_rates": [700]})
+
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+
+    def test_different_overrides_differ(self):
+        a = ConfigOverlay(BASE, {"economy.fuel_price_usd_per_ton": 700.0})
+        b = ConfigOverlay(BASE, {"economy.fuel_price_usd_per_ton": 800.0})
+
+        assert a != b
+
+    def test_pickle_roundtrip(self):
+        overlay = ConfigOverlay(BASE, {"economy.fuel_price_usd_per_ton": 700.0})
+        restored = pickle.loads(pickle.dumps(overlay))
+
+        assert restored.to_dict() == overlay.to_dict()
+
+
+class TestOptimizerWithOverlay:
+    """BunkeringOptimizer must accept overlays natively."""
+
+    def _npc(self, config, **kwargs):
+        optimizer = BunkeringOptimizer(config, **kwargs)
+        optimizer.shuttle_sizes = [2500]
+        optimizer.pump_sizes = [500]
+        with contextlib.redirect_stdout(io.StringIO()):
+            scenario_df, _ = optimizer.solve()
+        return scenario_df["NPC_Total_USDm"].iloc[0]
+
+    def test_overlay_matches_deepcopy(self):
+        config = load_config("case_1")
+
+        modified = copy.deepcopy(config)
+        modified["economy"]["fuel_price_usd_per_ton"] = 720.0
+        expected = self._npc(modified)
+
+        overlay = ConfigOverlay(config, {"economy.fuel_price_usd_per_ton": 720.0})
+        assert self._npc(overlay) == pytest.approx(expected)
+        assert self._npc(config, overrides={"economy.fuel_price_usd_per_ton": 720.0}) == pytest.approx(expected)
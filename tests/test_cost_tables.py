@@ -0,0 +1,134 @@
+"""
+Tests for the precomputed per-config cost and cycle-time tables.
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config_loader import load_config
+from src.config_overlay import ConfigOverlay
+from src.cost_calculator import CostCalculator
+from src.cost_tables import CostTables
+from src.cycle_time_calculator import CycleTimeCalculator
+from src.verification import CalculationVerifier
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    CostTables.invalidate()
+    yield
+    CostTables.invalidate()
+
+
+class TestCostTables:
+    """Test table values, caching and invalidation."""
+
+    @pytest.mark.parametrize("case_id", ["case_1", "case_2", "case_3"])
+    def test_values_match_scalar_calculators(self, case_id):
+        config = load_config(case_id)
+        tables = CostTables.for_config(config)
+        cost_calc = CostCalculator(config)
+        cycle_calc = CycleTimeCalculator(case_id, config)
+
+        for i, shuttle in enumerate(config["shuttle"]["available_sizes_cbm"]):
+            assert tables.shuttle_capex[i] == cost_calc.calculate_shuttle_capex(shuttle)
+            num_vessels = int(cycle_calc.vessels_per_trip(shuttle))
+            for j, pump in enumerate(config["pumps"]["available_flow_rates"]):
+                assert tables.index(shuttle, pump) == (i, j)
+                assert tables.bunkering_capex[i, j] == cost_calc.calculate_bunkering_capex(shuttle, pump)
+                assert tables.bunkering_fixed_opex[i, j] == cost_calc.calculate_bunkering_fixed_opex(shuttle, pump)
+                assert tables.cycle_info(shuttle, pump) == cycle_calc.calculate_single_cycle(shuttle, pump, num_vessels)
+
+        assert tables.annuity_factor == cost_calc.get_annuity_factor()
+        assert tables.calculate_annualized_capex_yearly(1e7) == cost_calc.calculate_annualized_capex_yearly(1e7)
+
+    def test_off_grid_combination_is_calculated(self):
+        config = load_config("case_2")
+        tables = CostTables.for_config(config)
+        shuttle = config["shuttle"]["available_sizes_cbm"][-1]
+
+        assert tables.index(shuttle, 447.5) is None
+        cost_calc = CostCalculator(config)
+        costs = tables.component_costs(shuttle, 447.5)
+        assert costs["bunkering_capex"] == cost_calc.calculate_bunkering_capex(shuttle, 447.5)
+        assert costs["pump_power"] == cost_calc.calculate_pump_power(447.5)
+        assert tables.cycle_info(shuttle, 447.5)["cycle_duration"] > 0
+
+    def test_shore_contention_extends_cycles(self):
+        config = copy.deepcopy(load_config("case_1"))
+        base = CostTables(config)
+        config["shore_supply"]["loading_arms"] = 24
+        tables = CostTables(config)
+
+        wait = tables.cycles["shore_wait"]
+        assert (base.cycles["shore_wait"] == 0).all()
+        assert (wait >= 0).all() and wait.max() > 0
+        assert (tables.cycles["cycle_duration"] == base.cycles["cycle_duration"] + wait).all()
+        # Saturated combinations have no design fleet
+        fleet = tables.cycles["design_fleet"]
+        assert (np.isnan(fleet) == np.isinf(wait)).all()
+        assert (fleet[np.isfinite(wait)] >= 1).all()
+
+        info = tables.cycle_info(1000, 500)
+        assert info["cycle_duration"] == pytest.approx(base.cycle_info(1000, 500)["cycle_duration"] + info["shore_wait"])
+        off_grid = tables.cycle_info(1200, 500)
+        assert off_grid["shore_wait"] > 0
+
+        # Trips beyond the arms' loading capacity make a combination infeasible
+        config["shore_supply"]["loading_arms"] = 2
+        assert CostTables(config).cycle_info(1000, 500)["call_duration"] == float("inf")
+
+    def test_cached_per_fingerprint(self):
+        config = load_config("case_1")
+        tables = CostTables.for_config(config)
+
+        assert CostTables.for_config(copy.deepcopy(config)) is tables
+        assert CostTables.for_config(ConfigOverlay(config, {})) is tables
+
+        overlay = ConfigOverlay(config, {"economy.fuel_price_usd_per_ton": 900.0})
+        other = CostTables.for_config(overlay)
+        assert other is not tables
+        assert (other.pump_fuel_cost_per_call > tables.pump_fuel_cost_per_call).all()
+
+        # A mutated config has a new fingerprint
+        config["shuttle"]["ref_capex_usd"] *= 2
+        mutated = CostTables.for_config(config)
+        assert mutated is not tables
+        assert mutated.shuttle_capex[0] == pytest.approx(2 * tables.shuttle_capex[0])
+
+    def test_invalidate(self):
+        config = load_config("case_1")
+        tables = CostTables.for_config(config)
+        CostTables.for_config(load_config("case_2"))
+        assert CostTables.cached_count() == 2
+
+        assert CostTables.invalidate(config) == 1
+        assert CostTables.invalidate(config) == 0
+        assert CostTables.for_config(config) is not tables
+        assert CostTables.invalidate() == 2
+        assert CostTables.cached_count() == 0
+
+    def test_verifier_checks_tables_independently(self):
+        config = load_config("case_1")
+        verifier = CalculationVerifier(config)
+        shuttle = config["shuttle"]["available_sizes_cbm"][0]
+        pump = config["pumps"]["available_flow_rates"][0]
+        no_manual_check = {"cycle_duration": 0}
+
+        assert verifier.verify_cycle_time(shuttle, pump, no_manual_check).passed
+
+        # A stale table entry must not verify against itself
+        tables = CostTables.for_config(config)
+        tables.cycles["cycle_duration"][tables.index(shuttle, pump)] *= 1.1
+        tables._cycle_info_cache.clear()
+        result = verifier.verify_cycle_time(shuttle, pump, no_manual_check)
+        assert not result.passed
+        assert "Tabulated" in result.message
@@ -255,5 +255,42 @@ class TestEdgeCases:
         assert result["shore_loading"] > 0
 
 
+class TestCalculateCycles:
+    """Test the vectorized grid calculation against the scalar path."""
+
+    SHUTTLES = [500.0, 1000.0, 3000.0, 5000.0, 7500.0, 10000.0, 25000.0]
+    PUMPS = [400.0, 500.0, 1000.0, 1117.3, 2000.0]
+
+    @pytest.mark.parametrize("config", [CASE1_CONFIG, CASE2_ULSAN_CONFIG, CASE2_YEOSU_CONFIG])
+    def test_grid_matches_scalar_exactly(self, config):
+        calc = CycleTimeCalculator("case", config)
+        cycles = calc.calculate_cycles(self.SHUTTLES, self.PUMPS)
+
+        assert cycles["cycle_duration"].shape == (len(self.SHUTTLES), len(self.PUMPS))
+        for i, shuttle in enumerate(self.SHUTTLES):
+            num_vessels = int(calc.vessels_per_trip(shuttle))
+            for j, pump in enumerate(self.PUMPS):
+                scalar = calc.calculate_single_cycle(shuttle, pump, num_vessels)
+                for key, value in scalar.items():
+                    if isinstance(value, (str, bool)):
+                        continue
+                    assert cycles[key][i, j] == value, key
+
+    def test_explicit_vessel_counts(self):
+        calc = CycleTimeCalculator("case_2", CASE2_ULSAN_CONFIG)
+        cycles = calc.calculate_cycles([25000.0, 50000.0], [1000.0], num_vessels=[5, 10])
+
+        assert cycles["call_duration"][0, 0] == calc.calculate_single_cycle(25000.0, 1000.0, 5)["call_duration"]
+        assert cycles["call_duration"][1, 0] == calc.calculate_single_cycle(50000.0, 1000.0, 10)["call_duration"]
+
+    def test_dataframe_output(self):
+        calc = CycleTimeCalculator("case_1", CASE1_CONFIG)
+        df = calc.calculate_cycles(self.SHUTTLES, self.PUMPS, as_dataframe=True)
+
+        assert len(df) == len(self.SHUTTLES) * len(self.PUMPS)
+        row = df[(df["shuttle_size_m3"] == 3000.0) & (df["pump_size_m3ph"] == 1000.0)].iloc[0]
+        assert row["cycle_duration"] == calc.calculate_single_cycle(3000.0, 1000.0)["cycle_duration"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
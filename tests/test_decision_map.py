@@ -0,0 +1,144 @@
+"""
+Tests for adaptive two-parameter decision boundary mapping.
+"""
+
+import io
+import contextlib
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.breakeven_analyzer import BreakevenAnalyzer
+from src.config_loader import load_config
+
+
+def _synthetic_case(name):
+    """Minimal config for the synthetic NPC model."""
+    return {
+        "case": name,
+        "operations": {"travel_time_hours": 6.0, "distance_nm": 90.0},
+        "shipping": {"start_vessels": 50, "end_vessels": 100},
+    }
+
+
+def _synthetic_npc(config, shuttle_size=None, pump_size=None):
+    """Case 1 grows with demand, Case 2 with distance (straight boundary)."""
+    demand = config["shipping"]["start_vessels"]
+    if config["case"] == "case1":
+        return 20.0 + 0.8 * demand, 0.0
+    distance = config["operations"]["travel_time_hours"] * 15.0
+    return 10.0 + 0.5 * distance, 0.0
+
+
+@pytest.fixture
+def synthetic_analyzer(monkeypatch):
+    analyzer = BreakevenAnalyzer()
+    monkeypatch.setattr(analyzer, "_run_optimization", _synthetic_npc)
+    return analyzer
+
+
+class TestDecisionMap:
+    """Test BreakevenAnalyzer.map_decision_boundary."""
+
+    def _map(self, analyzer, **kwargs):
+        return analyzer.map_decision_boundary(
+            _synthetic_case("case1"), _synthetic_case("case2"),
+            x_parameter="distance", x_range=(0, 200),
+            y_parameter="demand", y_range=(0, 160),
+            verbose=False, **kwargs
+        )
+
+    def test_matches_dense_grid(self, synthetic_analyzer):
+        result = self._map(synthetic_analyzer, resolution=32, initial_cells=4)
+
+        xx, yy = np.meshgrid(result.x_values, result.y_values)
+        case1 = 20.0 + 0.8 * yy.astype(int)
+        case2 = 10.0 + 0.5 * xx
+        expected = np.where(case1 < case2, 1, 2)
+
+        assert (result.preferred == expected).all()
+        assert result.n_evaluations < result.dense_evaluations / 2
+        # Case 1 ignores distance, so it is optimized once per demand value
+        assert result.n_optimizations < 2 * result.n_evaluations
+
+    def test_boundary_follows_crossing(self, synthetic_analyzer):
+        result = self._map(synthetic_analyzer, resolution=32, initial_cells=4)
+
+        assert len(result.boundary) == 1
+        line = result.boundary[0]
+        assert len(line) > 10
+        # Crossing: 20 + 0.8 * demand == 10 + 0.5 * distance (demand is an integer)
+        demand_at_crossing = (10.0 + 0.5 * line[:, 0] - 20.0) / 0.8
+        assert np.abs(demand_at_crossing - line[:, 1]).max() <= 160 / 32
+
+    def test_dataframes(self, synthetic_analyzer):
+        result = self._map(synthetic_analyzer, resolution=8, initial_cells=2,
+                           case1_name="Storage", case2_name="Direct")
+
+        df = result.to_dataframe()
+        assert len(df) == 81
+        assert set(df["Preferred_Case"]) <= {"Storage", "Direct"}
+        assert df["Evaluated"].sum() == result.n_evaluations
+
+        boundary_df = result.boundary_dataframe()
+        assert list(boundary_df.columns) == ["Segment", "distance", "demand"]
+
+    def test_invalid_resolution(self, synthetic_analyzer):
+        with pytest.raises(ValueError):
+            self._map(synthetic_analyzer, resolution=24, initial_cells=4)
+
+    def test_real_optimizer(self):
+        # Case 1 vs Case 3 at shuttle 10000 m3 cross near 110 nm
+        analyzer = BreakevenAnalyzer(shuttle_size=10000, pump_size=500)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = analyzer.map_decision_boundary(
+                load_config("case_1"), load_config("case_3"),
+                x_parameter="distance", x_range=(20, 200),
+                y_parameter="economy.fuel_price_usd_per_ton", y_range=(500, 700),
+                resolution=4, initial_cells=2, verbose=False
+            )
+
+        assert result.preferred[:, 0].tolist() == [2] * 5
+        assert result.preferred[:, -1].tolist() == [1] * 5
+        assert result.boundary
+
+
+class TestTraceBoundary:
+    """Test boundary tracing in cells that mix infeasible nodes with both cases."""
+
+    X = np.array([0.0, 1.0])
+    Y = np.array([0.0, 1.0])
+
+    def _trace(self, corners):
+        # corners: (bottom-left, bottom-right, top-right, top-left)
+        bl, br, tr, tl = corners
+        preferred = np.array([[bl, br], [tl, tr]])
+        difference = np.where(preferred == 0, np.nan, np.where(preferred == 1, -1.0, 1.0))
+        return BreakevenAnalyzer._trace_boundary([(0, 0)], self.X, self.Y, preferred, difference)
+
+    def test_three_classes_meet_at_junction(self):
+        polylines = self._trace((1, 2, 0, 0))
+
+        points = {tuple(p) for line in polylines for p in line}
+        crossings = {(0.5, 0.0), (1.0, 0.5), (0.0, 0.5)}  # bottom 1|2, right 2|0, left 1|0
+        assert crossings <= points
+        assert sum(len(line) - 1 for line in polylines) == 3
+
+        (junction,) = points - crossings
+        assert 0.0 < junction[0] < 1.0 and 0.0 < junction[1] < 1.0
+
+    def test_crossings_paired_by_transition(self):
+        # The lone Case 1 and infeasible corners are each cut off
+        polylines = self._trace((1, 2, 0, 2))
+
+        segments = {frozenset(map(tuple, line)) for line in polylines}
+        assert segments == {
+            frozenset({(0.5, 0.0), (0.0, 0.5)}),
+            frozenset({(1.0, 0.5), (0.5, 1.0)}),
+        }
@@ -0,0 +1,104 @@
+"""
+Tests for the in-memory and streaming Excel exporters.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config_loader import load_config
+from src.export_excel import ExcelExporter
+
+
+@pytest.fixture(scope="module")
+def config():
+    return load_config("case_1")
+
+
+@pytest.fixture
+def scenario_df():
+    shuttles = [1000, 2500, 5000, 7500, 10000]
+    return pd.DataFrame({
+        "Shuttle_Size_cbm": shuttles,
+        "Pump_Size_m3ph": [500] * len(shuttles),
+        "NPC_Total_USDm": [310.5, 290.25, 275.0, 280.75, 300.125],
+        "LCOAmmonia_USD_per_ton": [12.5, 11.75, 11.0, 11.25, 12.0],
+        "Cycle_Duration_hr": [10.0, 12.5, 15.0, 17.5, 20.0],
+        "Basic_Cycle_Duration_hr": [8.0, 10.0, 12.0, 14.0, 16.0],
+        "Shore_Loading_hr": [2.0, 2.5, 3.0, 3.5, 4.0],
+        "Travel_Outbound_hr": [2.0] * len(shuttles),
+        "Setup_Inbound_hr": [1.0] * len(shuttles),
+        "Pumping_Per_Vessel_hr": [2.0, 3.0, 4.0, 5.0, 6.0],
+        "Setup_Outbound_hr": [1.0] * len(shuttles),
+        "Travel_Return_hr": [2.0] * len(shuttles),
+        "Annual_Cycles_Max": [800.0, 640.0, 533.3, 457.1, 400.0],
+        "Annual_Supply_m3": [8.0e5, 1.6e6, 2.67e6, 3.43e6, 4.0e6],
+        "Time_Utilization_Ratio_percent": [95.0, 90.0, 85.5, 80.0, 75.0],
+    })
+
+
+@pytest.fixture
+def yearly_df():
+    years = list(range(2030, 2051))
+    return pd.DataFrame({
+        "Year": years,
+        "Shuttle_Size_cbm": [5000] * len(years),
+        "Pump_Size_m3ph": [500] * len(years),
+        "New_Shuttles": [1 if year % 4 == 0 else 0 for year in years],
+        "Annual_Demand_ton": [1000.0 * (i + 1) / 3 for i in range(len(years))],
+        "Annual_OPEX_USDm": [0.125 * i for i in range(len(years))],
+    })
+
+
+def _export(config, scenario_df, yearly_df, output_dir, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ExcelExporter(config).export_results(scenario_df, yearly_df, output_dir, **kwargs)
+
+
+def _cell_state(cell):
+    return (cell.value, cell.number_format, repr(cell.font), repr(cell.fill), repr(cell.alignment))
+
+
+class TestStreamingExport:
+    """Test that the write-only exporter matches the in-memory workbook."""
+
+    def test_streaming_matches_in_memory(self, config, scenario_df, yearly_df, tmp_path):
+        expected = openpyxl.load_workbook(
+            _export(config, scenario_df, yearly_df, tmp_path / "memory", streaming=False))
+        actual = openpyxl.load_workbook(
+            _export(config, scenario_df, yearly_df, tmp_path / "stream", streaming=True))
+
+        assert actual.sheetnames == expected.sheetnames == [
+            "Summary", "Yearly Results", "Configuration", "Time Breakdown"]
+        for name in expected.sheetnames:
+            ws_expected, ws_actual = expected[name], actual[name]
+            assert ws_actual.dimensions == ws_expected.dimensions, name
+            assert ws_actual.freeze_panes == ws_expected.freeze_panes
+            assert set(map(str, ws_actual.merged_cells.ranges)) == set(map(str, ws_expected.merged_cells.ranges))
+            for row_expected, row_actual in zip(ws_expected.iter_rows(), ws_actual.iter_rows()):
+                for cell_expected, cell_actual in zip(row_expected, row_actual):
+                    assert _cell_state(cell_actual) == _cell_state(cell_expected), (name, cell_expected.coordinate)
+
+        assert "number" in actual.named_styles
+
+    def test_time_breakdown_can_be_skipped(self, config, scenario_df, yearly_df, tmp_path):
+        for streaming in (False, True):
+            path = _export(config, scenario_df, yearly_df, tmp_path / str(streaming),
+                           streaming=streaming, include_time_breakdown=False)
+            assert openpyxl.load_workbook(path, read_only=True).sheetnames == [
+                "Summary", "Yearly Results", "Configuration"]
+
+    def test_large_tables_stream_by_default(self, config, scenario_df, yearly_df, tmp_path, monkeypatch):
+        monkeypatch.setattr(ExcelExporter, "STREAMING_ROW_THRESHOLD", len(yearly_df))
+        path = _export(config, scenario_df, yearly_df, tmp_path)
+
+        assert "number" in openpyxl.load_workbook(path).named_styles
@@ -0,0 +1,118 @@
+"""
+Tests for batched evaluation and Sobol global sensitivity analysis.
+"""
+
+import io
+import contextlib
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.batch_evaluator import BatchEvaluator
+from src.config_loader import load_config
+from src.global_sensitivity import (
+    GlobalSensitivityAnalyzer,
+    ParameterDistribution,
+    sobol_indices,
+)
+from src.optimizer import BunkeringOptimizer
+
+
+@pytest.fixture(scope="module")
+def config():
+    return load_config("case_1")
+
+
+class TestClosedFormEvaluation:
+    """The closed-form minimal plan must reproduce the MILP."""
+
+    @pytest.mark.parametrize("case_id", ["case_1", "case_2", "case_3"])
+    def test_matches_milp_for_all_combinations(self, case_id):
+        optimizer = BunkeringOptimizer(load_config(case_id))
+        with contextlib.redirect_stdout(io.StringIO()):
+            scenario_df, _ = optimizer.solve()
+
+        for _, row in scenario_df.iterrows():
+            shuttle, pump = row["Shuttle_Size_cbm"], row["Pump_Size_m3ph"]
+            closed = optimizer.evaluate_combination(shuttle, pump, "closed_form")
+            milp = optimizer.evaluate_combination(shuttle, pump, "milp")
+
+            assert closed["fleet"] == milp["fleet"]
+            assert closed["npc_usdm"] == pytest.approx(milp["npc_usdm"], rel=1e-9)
+            assert closed["npc_usdm"] == pytest.approx(row["NPC_Total_USDm"], abs=0.01)
+
+
+class TestBatchEvaluator:
+    """Test caching and parallel evaluation."""
+
+    def test_cache_hits(self, config):
+        evaluator = BatchEvaluator(config, num_jobs=1)
+        points = [{"economy.fuel_price_usd_per_ton": p} for p in (500, 600, 500, 700)]
+
+        first = evaluator.evaluate_batch(points, 2500, 500)
+        assert evaluator.cache_info() == {"hits": 1, "misses": 3, "size": 3}
+        assert first[0, 0] == first[2, 0]
+
+        second = evaluator.evaluate_batch(points, 2500, 500)
+        assert np.array_equal(first, second)
+        assert evaluator.cache_info()["misses"] == 3
+
+    def test_parallel_matches_serial(self, config):
+        points = [{"operations.travel_time_hours": 1.0 + 0.1 * i} for i in range(12)]
+        serial = BatchEvaluator(config, num_jobs=1).evaluate_batch(points, 2500, 500)
+        parallel = BatchEvaluator(config, num_jobs=2, chunk_size=4).evaluate_batch(points, 2500, 500)
+
+        assert np.allclose(serial, parallel)
+
+
+class TestSobolIndices:
+    """Test estimators and the analyzer."""
+
+    def test_additive_function(self):
+        # f = x1 + 2 * x2 with uniform inputs: S1 = ST = (1/5, 4/5)
+        rng = np.random.default_rng(0)
+        n = 20000
+        a, b = rng.random((n, 2)), rng.random((n, 2))
+        f = lambda x: x[:, 0] + 2 * x[:, 1]
+        f_ab = []
+        for i in range(2):
+            ab = a.copy()
+            ab[:, i] = b[:, i]
+            f_ab.append(f(ab))
+
+        first, total = sobol_indices(f(a), f(b), np.array(f_ab))
+
+        assert first == pytest.approx([0.2, 0.8], abs=0.03)
+        assert total == pytest.approx([0.2, 0.8], abs=0.03)
+
+    def test_triangular_ppf(self):
+        dist = ParameterDistribution("x", "triangular", low=0.0, mode=1.0, high=4.0)
+        values = dist.ppf(np.array([0.0, 0.25, 1.0]))
+
+        assert values[0] == pytest.approx(0.0)
+        assert values[1] == pytest.approx(1.0)
+        assert values[2] == pytest.approx(4.0)
+
+    def test_invalid_distribution(self):
+        with pytest.raises(ValueError):
+            ParameterDistribution("x", "uniform", low=2.0, high=1.0)
+
+    def test_single_linear_parameter(self, config):
+        # Fuel price alone explains all NPC variance
+        analyzer = GlobalSensitivityAnalyzer(config, 2500, 500, num_jobs=1)
+        result = analyzer.analyze(
+            [ParameterDistribution("economy.fuel_price_usd_per_ton", low=400, high=800)],
+            n_samples=256, n_bootstrap=100, verbose=False
+        )
+
+        assert result.n_evaluations == 256 * 3
+        assert result.first_order[0] == pytest.approx(1.0, abs=0.05)
+        assert result.total_order[0] == pytest.approx(1.0, abs=0.05)
+        low, high = result.total_order_ci[0]
+        assert low <= result.total_order[0] <= high
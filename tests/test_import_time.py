@@ -0,0 +1,81 @@
+"""
+Import-time budget tests for the lazily loaded package.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import src
+
+# Libraries that quick cycle-time queries must not pay for
+HEAVY_MODULES = ("pandas", "pulp", "matplotlib", "openpyxl", "docx", "scipy")
+
+# Wall-clock budget for `single_scenario`-style imports (seconds)
+IMPORT_BUDGET_S = 1.0
+
+
+def _import_in_subprocess(statement):
+    """Run ``statement`` in a fresh interpreter; return (seconds, loaded heavy modules)."""
+    code = textwrap.dedent(f"""
+        import json, sys, time
+        start = time.perf_counter()
+        {statement}
+        elapsed = time.perf_counter() - start
+        heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+        print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+    """)
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=str(project_root),
+        capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["elapsed"], result["heavy"]
+
+
+class TestLazyImports:
+    """Test that the package defers heavy imports until they are used."""
+
+    def test_package_import_is_light(self):
+        _, heavy = _import_in_subprocess("import src")
+        assert heavy == []
+
+    def test_single_scenario_import_budget(self):
+        elapsed, heavy = _import_in_subprocess(
+            "from src import load_config, run_single_scenario, CycleTimeCalculator"
+        )
+        assert heavy == []
+        assert elapsed < IMPORT_BUDGET_S
+
+    @pytest.mark.parametrize("script", [
+        "run_demand_scenarios.py",
+        "run_discount_rate_analysis.py",
+        "run_deterministic_sensitivity.py",
+        "run_breakeven_analysis.py",
+        "run_stochastic_analysis.py",
+    ])
+    def test_scripts_import_service_only_for_service_runs(self, script):
+        path = project_root / "scripts" / script
+        code = f"import runpy, sys; runpy.run_path({str(path)!r}); print('src.service' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=str(project_root),
+            capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip().splitlines()[-1] == "False"
+
+    def test_all_public_names_resolve(self):
+        for name in src.__all__:
+            assert getattr(src, name) is not None
+        assert set(src.__all__) <= set(dir(src))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            src.not_a_public_name
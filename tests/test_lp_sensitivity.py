@@ -0,0 +1,184 @@
+"""
+Tests for dual-based (fixed-integer LP) sensitivity analysis.
+"""
+
+import io
+import contextlib
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config_loader import load_config
+from src.cost_tables import CostTables
+from src.optimizer import BunkeringOptimizer
+from src.sensitivity_analyzer import SensitivityAnalyzer
+
+
+SHUTTLE = 2500
+PUMP = 500
+
+
+def _solve_npc(config, overrides=None):
+    """Full re-optimization NPC for the test pair."""
+    optimizer = BunkeringOptimizer(config, overrides=overrides)
+    optimizer.shuttle_sizes = [SHUTTLE]
+    optimizer.pump_sizes = [PUMP]
+    with contextlib.redirect_stdout(io.StringIO()):
+        scenario_df, _ = optimizer.solve()
+    return scenario_df["NPC_Total_USDm"].iloc[0]
+
+
+@pytest.fixture(scope="module")
+def config():
+    return load_config("case_1")
+
+
+@pytest.fixture(scope="module")
+def lp_result(config):
+    optimizer = BunkeringOptimizer(config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return optimizer.analyze_lp_sensitivity(SHUTTLE, PUMP)
+
+
+class TestLPSensitivity:
+    """Test BunkeringOptimizer.analyze_lp_sensitivity."""
+
+    def test_base_npc_matches_solve(self, config, lp_result):
+        assert lp_result["npc_usdm"] == pytest.approx(_solve_npc(config), abs=0.01)
+
+    def test_fuel_price_derivative_matches_finite_difference(self, config, lp_result):
+        info = lp_result["parameters"]["economy.fuel_price_usd_per_ton"]
+        base = info["base_value"]
+        step = 0.05 * base
+        assert info["valid_range"][0] <= base - step
+        assert base + step <= info["valid_range"][1]
+
+        npc_up = _solve_npc(config, {"economy.fuel_price_usd_per_ton": base + step})
+        npc_down = _solve_npc(config, {"economy.fuel_price_usd_per_ton": base - step})
+        finite_diff = (npc_up - npc_down) / (2 * step)
+
+        assert info["derivative_usdm_per_unit"] == pytest.approx(finite_diff, abs=1e-3)
+
+    def test_valid_ranges_contain_base(self, lp_result):
+        for path, info in lp_result["parameters"].items():
+            low, high = info["valid_range"]
+            assert low <= info["base_value"] <= high, path
+
+    def test_working_time_range_keeps_fleet(self, config, lp_result):
+        info = lp_result["parameters"]["operations.max_annual_hours_per_vessel"]
+        assert info["derivative_usdm_per_unit"] == 0.0
+
+        low, high = info["valid_range"]
+        inside = (low + high) / 2
+        npc_inside = _solve_npc(config, {"operations.max_annual_hours_per_vessel": inside})
+        assert npc_inside == pytest.approx(lp_result["npc_usdm"], abs=0.01)
+
+    def test_capex_derivative_matches_finite_difference(self, config, lp_result):
+        info = lp_result["parameters"]["shuttle.ref_capex_usd"]
+        step = 0.05 * info["base_value"]
+        npc_up = _solve_npc(config, {"shuttle.ref_capex_usd": info["base_value"] + step})
+        npc_down = _solve_npc(config, {"shuttle.ref_capex_usd": info["base_value"] - step})
+
+        assert info["derivative_usdm_per_unit"] == pytest.approx((npc_up - npc_down) / (2 * step), rel=1e-3)
+
+    def test_no_perturbed_cost_tables(self, config):
+        optimizer = BunkeringOptimizer(config)
+        optimizer.tables
+        cached = CostTables.cached_count()
+        with contextlib.redirect_stdout(io.StringIO()):
+            optimizer.analyze_lp_sensitivity(SHUTTLE, PUMP)
+        assert CostTables.cached_count() == cached
+
+    def test_unsupported_parameter(self, config):
+        optimizer = BunkeringOptimizer(config)
+        with pytest.raises(ValueError):
+            optimizer.analyze_lp_sensitivity(SHUTTLE, PUMP, ["operations.travel_time_hours"])
+
+
+class TestAnalyticSensitivityAnalyzer:
+    """Test SensitivityAnalyzer analytic API."""
+
+    def test_linear_parameters_single_solve(self, config):
+        analyzer = SensitivityAnalyzer(config, SHUTTLE, PUMP)
+        df = analyzer.analyze_linear_parameters(verbose=False)
+
+        assert len(df) == len(BunkeringOptimizer.LINEAR_PARAMETERS)
+        assert (df["Valid_Range_Low"] <= df["Base_Value"]).all()
+        assert (df["Base_Value"] <= df["Valid_Range_High"]).all()
+
+    def test_npc_at_outside_range(self, config):
+        analyzer = SensitivityAnalyzer(config, SHUTTLE, PUMP)
+        result = analyzer.analyze_parameter_analytic(
+            "economy.fuel_price_usd_per_ton", verbose=False
+        )
+
+        assert result.npc_at(result.base_value) == pytest.approx(result.base_npc)
+        if result.valid_high != float("inf"):
+            assert result.npc_at(result.valid_high * 2) is None
+
+    def test_nonlinear_parameter_rejected(self, config):
+        analyzer = SensitivityAnalyzer(config, SHUTTLE, PUMP)
+        with pytest.raises(ValueError):
+            analyzer.analyze_parameter_analytic("operations.travel_time_hours")
+
+
+class TestParametricCurve:
+    """Test exact piecewise-linear NPC curves over a cost parameter."""
+
+    FUEL = "economy.fuel_price_usd_per_ton"
+
+    def _curve_npc(self, curve, value):
+        for piece in curve:
+            if value <= piece["value_high"]:
+                frac = (value - piece["value_low"]) / (piece["value_high"] - piece["value_low"])
+                return piece["npc_low_usdm"] + frac * (piece["npc_high_usdm"] - piece["npc_low_usdm"])
+        return None
+
+    def test_positive_prices_single_piece(self, config):
+        optimizer = BunkeringOptimizer(config)
+        curve = optimizer.parametric_npc_curve(SHUTTLE, PUMP, self.FUEL, 300, 1200)
+
+        assert len(curve) == 1
+        assert curve[0]["npc_slope_usdm_per_unit"] > 0
+
+    def test_breakpoints_match_reoptimization(self, config):
+        # Negative fuel prices reward extra calls, so the fleet plan changes
+        optimizer = BunkeringOptimizer(config)
+        curve = optimizer.parametric_npc_curve(SHUTTLE, PUMP, self.FUEL, -2000, 600)
+
+        assert len(curve) > 1
+        assert curve[0]["value_low"] == -2000
+        assert curve[-1]["value_high"] == 600
+        for left, right in zip(curve, curve[1:]):
+            assert left["value_high"] == right["value_low"]
+
+        for value in (-1800, -1200, -500, 450):
+            expected = _solve_npc(config, {self.FUEL: value})
+            assert self._curve_npc(curve, value) == pytest.approx(expected, abs=0.01)
+
+    def test_constraint_parameter_rejected(self, config):
+        optimizer = BunkeringOptimizer(config)
+        with pytest.raises(ValueError):
+            optimizer.parametric_npc_curve(
+                SHUTTLE, PUMP, "operations.max_annual_hours_per_vessel", 4000, 8000
+            )
+
+    def test_analyzer_parametric_matches_reoptimization(self, config):
+        analyzer = SensitivityAnalyzer(config, SHUTTLE, PUMP)
+        prices = [300, 600, 900]
+        with contextlib.redirect_stdout(io.StringIO()):
+            parametric = analyzer.analyze_parameter_parametric(
+                self.FUEL, prices, variation_type="absolute", verbose=False
+            )
+            reoptimized = analyzer.analyze_parameter(
+                self.FUEL, prices, variation_type="absolute", verbose=False
+            )
+
+        assert parametric.breakpoints == []
+        assert parametric.npcs == pytest.approx(reoptimized.npcs, abs=0.01)
+        assert parametric.lcos == pytest.approx(reoptimized.lcos, abs=0.01)
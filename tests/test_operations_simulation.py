@@ -0,0 +1,131 @@
+"""
+Tests for the discrete-event shuttle operations simulation.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config_loader import load_config
+from src.cycle_time_calculator import CycleTimeCalculator
+from src.operations_simulation import OperationsSimulator, fleet_plan, simulate_operations, HOURS_PER_YEAR
+from src.vessel_distribution import VesselDistribution, load_stochastic_config
+
+
+def _plan(shuttles, calls, start_year=2030):
+    return pd.DataFrame({
+        "Shuttle_Size_cbm": 2500,
+        "Pump_Size_m3ph": 1000,
+        "Year": range(start_year, start_year + len(shuttles)),
+        "Total_Shuttles": shuttles,
+        "Annual_Calls": calls,
+    })
+
+
+class TestOperationsSimulator:
+    """Test single-year event timing against the deterministic cycle model."""
+
+    def test_full_trip_matches_cycle_duration(self):
+        config = load_config("case_1")
+        cycle = CycleTimeCalculator("case_1", config).calculate_single_cycle(1000, 500)
+        simulator = OperationsSimulator(config, 1000, 500)
+
+        stats, waits = simulator.run_year(1, np.array([0.0]), np.array([1000.0]))
+
+        assert stats["trips"] == 1
+        assert stats["shuttle_utilization"] * HOURS_PER_YEAR == pytest.approx(cycle["cycle_duration"])
+        assert waits[0] == pytest.approx(cycle["shore_loading"] + cycle["travel_outbound"])
+
+    def test_large_call_is_served_by_shuttles_in_sequence(self):
+        config = load_config("case_1")
+        cycle = CycleTimeCalculator("case_1", config).calculate_single_cycle(1000, 500)
+        simulator = OperationsSimulator(config, 1000, 500)
+
+        stats, waits = simulator.run_year(10, np.array([0.0]), np.array([5000.0]))
+
+        # Each next shuttle is dispatched when the previous one starts bunkering
+        response = cycle["shore_loading"] + cycle["travel_outbound"]
+        leg = cycle["setup_inbound"] + cycle["pumping_per_vessel"] + cycle["setup_outbound"]
+        assert stats["trips"] == cycle["trips_per_call"] == 5
+        assert waits[0] == pytest.approx(response)
+        assert stats["mean_turnaround"] == pytest.approx(5 * response + leg)
+
+    def test_direct_supply_serves_several_calls_per_trip(self):
+        config = load_config("case_2")
+        simulator = OperationsSimulator(config, 10000, 1000)
+
+        stats, waits = simulator.run_year(1, np.array([0.0, 0.0]), np.array([5000.0, 5000.0]))
+
+        assert stats["trips"] == 1
+        assert waits[1] > waits[0]
+
+    def test_shore_berths_limit_concurrent_loading(self):
+        config = load_config("case_1")
+        arrivals, volumes = np.zeros(4), np.full(4, 1000.0)
+
+        unlimited, _ = OperationsSimulator(config, 1000, 500).run_year(4, arrivals, volumes)
+        one_berth, _ = OperationsSimulator(config, 1000, 500, shore_berths=1).run_year(4, arrivals, volumes)
+
+        assert unlimited["mean_shore_wait"] == 0.0
+        assert one_berth["mean_shore_wait"] > 0.0
+        assert one_berth["mean_wait"] > unlimited["mean_wait"]
+        with pytest.raises(ValueError):
+            OperationsSimulator(config, 1000, 500, shore_berths=0)
+
+
+class TestSimulateOperations:
+    """Test replaying a yearly fleet plan."""
+
+    def test_replay_is_reproducible(self):
+        config = load_config("case_1")
+        plan = _plan([2, 3], [150, 200])
+        dist = VesselDistribution(load_stochastic_config())
+
+        first = simulate_operations(config, plan, distribution=dist, seed=7)
+        second = simulate_operations(config, plan, distribution=dist, seed=7)
+
+        assert list(first.years) == [2030, 2031]
+        assert list(first["calls"]) == [150, 200]
+        assert first.events == second.events > 0
+        np.testing.assert_array_equal(np.concatenate(first.waits), np.concatenate(second.waits))
+
+        df = first.to_dataframe(wait_target_hours=24.0)
+        assert len(df) == 2 and df["Service_Level"].between(0, 1).all()
+
+    def test_larger_fleet_waits_less(self):
+        config = load_config("case_1")
+        small = simulate_operations(config, _plan([2], [250]), seed=1)
+        large = simulate_operations(config, _plan([6], [250]), seed=1)
+
+        assert large["mean_wait"][0] < small["mean_wait"][0]
+        assert large.service_level(12.0)[0] >= small.service_level(12.0)[0]
+
+    def test_fleet_plan_selection(self):
+        plan = pd.concat([_plan([1], [10]), _plan([2], [10]).assign(Shuttle_Size_cbm=5000)])
+
+        assert fleet_plan(plan, 5000, 1000)["Total_Shuttles"].tolist() == [2]
+        with pytest.raises(ValueError):
+            fleet_plan(plan)
+        with pytest.raises(ValueError):
+            fleet_plan(plan, 1234, 1000)
+
+
+class TestSampleCallVolumes:
+    """Test vectorized call volume sampling."""
+
+    def test_discrete_volumes_follow_shares(self):
+        dist = VesselDistribution(load_stochastic_config())
+        volumes = dist.sample_call_volumes("balanced", 20000, rng=np.random.default_rng(0), method="discrete")
+
+        means = {vtype.mean_volume for vtype in dist.get_vessel_types()}
+        assert set(np.unique(volumes)) <= means
+        assert volumes.mean() == pytest.approx(dist.get_weighted_average_volume("balanced"), rel=0.03)
+        with pytest.raises(ValueError):
+            dist.sample_call_volumes("unknown", 10)
@@ -0,0 +1,141 @@
+"""
+Tests for serial and parallel paper figure rendering.
+"""
+
+import contextlib
+import inspect
+import io
+import multiprocessing
+import re
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use("Agg")
+
+from src.config_loader import load_config
+from src.paper_figures import (
+    PaperFigureGenerator, FIGURE_METHODS, FIGURE_GROUPS, FIGURE_DATASETS, DATASET_FILES,
+    DATASET_LOADERS, FIGURE_MANIFEST, _method_closure,
+)
+from src.runner import run_single_case
+
+FIGURES = ["D1", "D7", "D9"]
+
+# Generator attributes -> dataset names in FIGURE_DATASETS
+ATTRIBUTE_DATASETS = {
+    "det_scenarios": "det_scenarios",
+    "det_yearly": "det_yearly",
+    "stoch_summary": "stoch_summary",
+    "stoch_scenarios": "stoch_scenarios",
+    "tornado_data": "tornado",
+}
+
+
+@pytest.fixture(scope="module")
+def results_dir(tmp_path_factory):
+    path = tmp_path_factory.mktemp("results")
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_single_case(load_config("case_1"), path)
+    return path
+
+
+def _generate(results_dir, output_dir, fig_ids, jobs, incremental=False):
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = PaperFigureGenerator(str(results_dir))
+        return generator.generate_figures(fig_ids, str(output_dir), jobs=jobs, incremental=incremental)
+
+
+class TestFigureRendering:
+    """Test figure registry, parallel output and per-figure error collection."""
+
+    def test_groups_cover_registered_figures(self):
+        grouped = [fig_id for _, _, _, fig_ids in FIGURE_GROUPS for fig_id in fig_ids]
+        assert sorted(grouped) == sorted(FIGURE_METHODS)
+        assert all(hasattr(PaperFigureGenerator, name) for name in FIGURE_METHODS.values())
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                        reason="parallel rendering needs fork")
+    def test_parallel_output_matches_serial(self, results_dir, tmp_path):
+        serial = _generate(results_dir, tmp_path / "serial", FIGURES, jobs=1)
+        parallel = _generate(results_dir, tmp_path / "parallel", FIGURES, jobs=2)
+
+        assert list(parallel) == FIGURES
+        assert all(result.ok for result in {**serial, **parallel}.values())
+        files = sorted(p.name for p in (tmp_path / "serial").glob("*.png"))
+        assert files
+        for name in files:
+            assert (tmp_path / "serial" / name).read_bytes() == (tmp_path / "parallel" / name).read_bytes()
+
+    def test_errors_are_collected_per_figure(self, results_dir, tmp_path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator = PaperFigureGenerator(str(results_dir))
+            generator.fig_d7_cycle_time = None
+            results = generator.generate_figures(FIGURES, str(tmp_path), jobs=2)
+
+        assert not results["D7"].ok
+        assert "TypeError" in results["D7"].error
+        assert results["D1"].ok and results["D9"].ok
+        assert all(result.duration_s >= 0 for result in results.values())
+
+        with pytest.raises(ValueError):
+            generator.generate_figures(["D99"], str(tmp_path))
+
+
+class TestIncrementalRendering:
+    """Test manifest-driven skipping of up-to-date figures."""
+
+    def test_declared_datasets_cover_figure_code(self):
+        assert set(FIGURE_DATASETS) == set(FIGURE_METHODS)
+        for fig_id, method in FIGURE_METHODS.items():
+            used = set()
+            for name in _method_closure(method):
+                source = inspect.getsource(getattr(PaperFigureGenerator, name))
+                used |= {ATTRIBUTE_DATASETS[ref] for ref in re.findall(r"self\.(\w+)", source)
+                         if ref in ATTRIBUTE_DATASETS}
+                used |= set(re.findall(r"self\._dataset\('(\w+)'\)", source))
+            assert used <= set(FIGURE_DATASETS[fig_id]), fig_id
+            assert set(FIGURE_DATASETS[fig_id]) <= set(DATASET_FILES) == set(DATASET_LOADERS)
+
+    def test_only_changed_figures_rerender(self, results_dir, tmp_path):
+        data_dir = tmp_path / "results"
+        shutil.copytree(results_dir, data_dir)
+        output_dir = tmp_path / "figures"
+        fig_ids = ["D1", "D45_CASES"]
+
+        first = _generate(data_dir, output_dir, fig_ids, jobs=1)
+        assert not any(result.skipped for result in first.values())
+        assert (output_dir / FIGURE_MANIFEST).exists()
+        assert "D4_case1.png" in first["D45_CASES"].outputs
+
+        second = _generate(data_dir, output_dir, fig_ids, jobs=1, incremental=True)
+        assert all(result.skipped for result in second.values())
+
+        # Yearly results feed D45_CASES only
+        yearly = data_dir / "MILP_per_year_results_case_1.csv"
+        yearly.write_text(yearly.read_text() + "\n")
+        third = _generate(data_dir, output_dir, fig_ids, jobs=1, incremental=True)
+        assert third["D1"].skipped and not third["D45_CASES"].skipped
+
+        # A deleted output is redrawn
+        (output_dir / first["D1"].outputs[0]).unlink()
+        fourth = _generate(data_dir, output_dir, fig_ids, jobs=1, incremental=True)
+        assert not fourth["D1"].skipped and fourth["D45_CASES"].skipped
+        assert (output_dir / first["D1"].outputs[0]).exists()
+
+    def test_only_needed_datasets_are_loaded(self, results_dir, tmp_path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator = PaperFigureGenerator(str(results_dir))
+            assert not any(generator.catalog.is_loaded(name) for name in DATASET_LOADERS)
+
+            generator.generate_figures(["D1"], str(tmp_path))
+
+        loaded = {name for name in DATASET_LOADERS if generator.catalog.is_loaded(name)}
+        assert loaded == {"det_scenarios"}
@@ -0,0 +1,142 @@
+"""
+Tests for the incremental analysis pipeline.
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.pipeline import Pipeline, Stage
+
+
+# Stage script: writes its arguments' outputs and appends to a run log.
+# Usage: stage.py <name> <input file> <output file>... [--targets ids...]
+STAGE_SCRIPT = textwrap.dedent("""
+    import sys, time
+    from pathlib import Path
+    argv = sys.argv[1:]
+    targets = argv[argv.index("--targets") + 1:] if "--targets" in argv else []
+    if targets:
+        argv = argv[:argv.index("--targets")]
+    name, source, outputs = argv[0], argv[1], argv[2:]
+    with open("runs.log", "a") as log:
+        log.write(f"{name} {time.time()} {' '.join(targets)}\\n")
+    if name == "fail":
+        sys.exit(3)
+    content = Path(source).read_text()
+    for output in outputs:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text(content)
+""")
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "stage.py").write_text(STAGE_SCRIPT)
+    (tmp_path / "figs.py").write_text(STAGE_SCRIPT)
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "a.yaml").write_text("a: 1\n")
+    (tmp_path / "config" / "b.yaml").write_text("b: 1\n")
+    return tmp_path
+
+
+def _runs(root):
+    log = root / "runs.log"
+    if not log.exists():
+        return []
+    return [line.split()[0] for line in log.read_text().splitlines()]
+
+
+def _pipeline(root):
+    return Pipeline([
+        Stage("a", "stage.py", args=["a", "config/a.yaml", "out/a.csv"],
+              inputs=["config/a.yaml"], outputs=["out/a.csv"]),
+        Stage("b", "stage.py", args=["b", "config/b.yaml", "out/b.csv"],
+              inputs=["config/b.yaml"], outputs=["out/b.csv"]),
+        Stage("figs", "figs.py", args=["figs", "out/a.csv", "figs/all.png"],
+              outputs=["figs/*.png"], depends_on=["a", "b"],
+              targets={"FA": ["out/a.csv"], "FB": ["out/b.csv"]}, target_arg="--targets"),
+    ], root=str(root))
+
+
+class TestPipeline:
+    """Test incremental, dependency-aware stage execution."""
+
+    def test_second_run_skips(self, root):
+        pipeline = _pipeline(root)
+        first = pipeline.run(verbose=False)
+        assert [first[name].status for name in ("a", "b", "figs")] == ["ran"] * 3
+
+        second = pipeline.run(verbose=False)
+        assert {r.status for r in second.values()} == {"skipped"}
+        assert sorted(_runs(root)) == ["a", "b", "figs"]
+
+    def test_partial_rebuild_of_changed_targets(self, root):
+        pipeline = _pipeline(root)
+        pipeline.run(verbose=False)
+
+        (root / "config" / "b.yaml").write_text("b: 2\n")
+        results = pipeline.run(verbose=False)
+
+        assert results["a"].status == "skipped"
+        assert results["b"].status == "ran"
+        assert results["figs"].status == "partial"
+        assert results["figs"].targets == ["FB"]
+        assert (root / "runs.log").read_text().splitlines()[-1].split()[2:] == ["FB"]
+
+    def test_identical_outputs_do_not_propagate(self, root):
+        pipeline = _pipeline(root)
+        pipeline.run(verbose=False)
+
+        # Script change re-runs a and b, but their outputs are unchanged
+        (root / "stage.py").write_text(STAGE_SCRIPT + "\n# comment\n")
+        results = pipeline.run(verbose=False)
+
+        assert results["a"].status == "ran"
+        assert results["b"].status == "ran"
+        assert results["figs"].status == "skipped"
+
+    def test_modified_output_reruns(self, root):
+        pipeline = _pipeline(root)
+        pipeline.run(verbose=False)
+
+        (root / "figs" / "all.png").write_text("edited")
+        results = pipeline.run(verbose=False)
+        assert results["figs"].status == "ran"
+
+    def test_failure_blocks_dependents(self, root):
+        pipeline = Pipeline([
+            Stage("fail", "stage.py", args=["fail", "config/a.yaml"], inputs=["config/a.yaml"]),
+            Stage("after", "stage.py", args=["after", "config/a.yaml"], depends_on=["fail"]),
+        ], root=str(root))
+        results = pipeline.run(verbose=False)
+
+        assert results["fail"].status == "failed"
+        assert results["fail"].returncode == 3
+        assert results["after"].status == "blocked"
+        assert pipeline.plan()["fail"][0] == "run"
+
+    def test_independent_stages_run_concurrently(self, root):
+        slow = STAGE_SCRIPT.replace("import sys, time", "import sys, time\ntime.sleep(1.0)")
+        (root / "stage.py").write_text(slow)
+        pipeline = _pipeline(root)
+        results = pipeline.run(only=["a", "b"], jobs=2, verbose=False)
+
+        assert results["a"].duration_s + results["b"].duration_s > 2.0
+        starts = [float(line.split()[1]) for line in (root / "runs.log").read_text().splitlines()]
+        assert abs(starts[0] - starts[1]) < 0.9
+
+    def test_invalid_definitions(self, root):
+        with pytest.raises(ValueError):
+            Pipeline([Stage("a", "stage.py", depends_on=["missing"])], root=str(root))
+        with pytest.raises(ValueError):
+            Pipeline([
+                Stage("a", "stage.py", depends_on=["b"]),
+                Stage("b", "stage.py", depends_on=["a"]),
+            ], root=str(root))
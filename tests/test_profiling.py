@@ -0,0 +1,126 @@
+"""
+Tests for per-stage profiling hooks.
+"""
+
+import contextlib
+import io
+import pstats
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.profiling import profile_settings, profile_stage, run_profiled
+
+
+def _config(profile, **execution):
+    return {"execution": {"profile": profile, **execution}}
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(200))
+    return total
+
+
+def _collapsed(path):
+    stacks = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        stack, value = line.rsplit(" ", 1)
+        stacks[stack] = int(value)
+    return stacks
+
+
+class TestProfileSettings:
+    """Test parsing of execution.profile."""
+
+    def test_modes(self):
+        assert profile_settings({}) is None
+        assert profile_settings(_config(None)) is None
+        assert profile_settings(_config(False)) is None
+        assert profile_settings(_config(True))["mode"] == "cprofile"
+        assert profile_settings(_config("sampling", profile_interval_ms=2))["interval_s"] == 0.002
+        with pytest.raises(ValueError):
+            profile_settings(_config("perf"))
+
+
+class TestProfileStage:
+    """Test profile and collapsed-stack output."""
+
+    def test_disabled_writes_nothing(self, tmp_path):
+        with profile_stage("stage", _config(None), tmp_path):
+            _busy(0.01)
+        assert not (tmp_path / "profiles").exists()
+
+    def test_cprofile_output(self, tmp_path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            with profile_stage("single case_1", _config("cprofile"), tmp_path):
+                _busy(0.05)
+                # Nested stages are covered by the outer profile
+                with profile_stage("inner", _config("cprofile"), tmp_path):
+                    _busy(0.01)
+
+        profiles = tmp_path / "profiles"
+        assert sorted(p.name for p in profiles.iterdir()) == ["single_case_1.collapsed", "single_case_1.prof"]
+        stats = pstats.Stats(str(profiles / "single_case_1.prof"))
+        stacks = _collapsed(profiles / "single_case_1.collapsed")
+
+        # Self times of all stacks add up to the profiled time (microseconds)
+        assert sum(stacks.values()) == pytest.approx(stats.total_tt * 1e6, rel=0.02)
+        busy = sum(value for stack, value in stacks.items() if "_busy (test_profiling.py" in stack)
+        assert busy / sum(stacks.values()) > 0.9
+        assert all(stack.startswith("_busy") for stack in stacks if "sum" in stack.split(";")[-1])
+
+    def test_sampling_output(self, tmp_path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_profiled(lambda: _busy(0.2), "script", _config("sampling", profile_interval_ms=2), tmp_path)
+
+        assert result > 0
+        stacks = _collapsed(tmp_path / "profiles" / "script.collapsed")
+        samples = sum(stacks.values())
+        busy = sum(value for stack, value in stacks.items() if "_busy (test_profiling.py" in stack)
+        assert samples > 10 and busy / samples > 0.9
+
+
+class TestRunProfiled:
+    """Test the default configuration of run_profiled()."""
+
+    @pytest.fixture
+    def stage_configs(self, monkeypatch):
+        configs = []
+
+        @contextlib.contextmanager
+        def record_stage(stage, config, output_dir=None):
+            configs.append(config)
+            yield
+
+        monkeypatch.setattr("src.profiling.profile_stage", record_stage)
+        return configs
+
+    def test_config_found_from_any_directory(self, tmp_path, monkeypatch, stage_configs):
+        monkeypatch.chdir(tmp_path)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert run_profiled(lambda: 42, "script") == 42
+
+        assert "execution" in stage_configs[0]
+        assert "[WARN]" not in output.getvalue()
+
+    def test_missing_config_warns(self, monkeypatch, stage_configs):
+        def missing(*args, **kwargs):
+            raise FileNotFoundError("Config file not found: config/base.yaml")
+
+        monkeypatch.setattr("src.config_loader.load_config", missing)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert run_profiled(lambda: 42, "script") == 42
+
+        assert stage_configs == [{}]
+        assert "[WARN] Profiling disabled for script" in output.getvalue()
@@ -0,0 +1,115 @@
+"""
+Tests for independent DES replications with confidence intervals.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config_loader import load_config
+from src.operations_simulation import simulate_operations
+from src.replication_manager import ReplicationManager, RunningStats, t_quantile
+from src.vessel_distribution import VesselDistribution, load_stochastic_config
+
+
+PLAN = pd.DataFrame({
+    "Shuttle_Size_cbm": 2500,
+    "Pump_Size_m3ph": 1000,
+    "Year": [2030, 2031],
+    "Total_Shuttles": [2, 3],
+    "Annual_Calls": [150, 250],
+})
+
+
+@pytest.fixture(scope="module")
+def config():
+    return load_config("case_1")
+
+
+class TestRunningStats:
+    """Test the online mean/variance accumulator."""
+
+    def test_matches_batch_statistics(self):
+        values = np.random.default_rng(3).normal(5.0, 2.0, size=(25, 2, 3))
+        first, second = RunningStats((2, 3)), RunningStats((2, 3))
+        for x in values[:10]:
+            first.update(x)
+        for x in values[10:]:
+            second.update(x)
+        first.merge(second)
+
+        assert first.count == 25
+        np.testing.assert_allclose(first.mean, values.mean(axis=0))
+        np.testing.assert_allclose(first.variance, values.var(axis=0, ddof=1))
+        np.testing.assert_allclose(
+            first.half_width(0.95), 2.0639 * values.std(axis=0, ddof=1) / 5.0, rtol=1e-3
+        )
+        assert t_quantile(0.975, 9) == pytest.approx(2.2622, rel=1e-3)
+
+    @pytest.mark.parametrize("probability, dof, expected", [
+        (0.975, 1, 12.7062), (0.975, 2, 4.3027), (0.995, 4, 4.6041),
+        (0.95, 29, 1.6991), (0.975, 30, 2.0423), (0.025, 5, -2.5706),
+    ])
+    def test_t_quantile_small_dof(self, probability, dof, expected):
+        assert t_quantile(probability, dof) == pytest.approx(expected, rel=1e-4)
+
+
+class TestReplicationManager:
+    """Test seeding, parallel aggregation and the stopping rule."""
+
+    def test_replications_use_spawned_seeds(self, config):
+        dist = VesselDistribution(load_stochastic_config())
+        manager = ReplicationManager(config, PLAN, distribution=dist, wait_target_hours=12.0, num_jobs=1)
+        result = manager.run(min_replications=4, max_replications=4)
+
+        assert manager.seed == dist.random_seed
+        seeds = np.random.SeedSequence(dist.random_seed).spawn(4)
+        runs = [simulate_operations(config, PLAN, distribution=dist, seed=seed) for seed in seeds]
+        waits = np.array([run["mean_wait"] for run in runs])
+        np.testing.assert_allclose(result["mean_wait"], waits.mean(axis=0))
+        np.testing.assert_allclose(result.std[result.kpis.index("mean_wait")], waits.std(axis=0, ddof=1))
+        np.testing.assert_allclose(
+            result["service_level"], np.mean([run.service_level(12.0) for run in runs], axis=0)
+        )
+
+    def test_parallel_matches_serial(self, config):
+        serial = ReplicationManager(config, PLAN, num_jobs=1, chunk_size=3).run(
+            min_replications=5, max_replications=11, batch_size=6, relative_precision=0.0
+        )
+        parallel = ReplicationManager(config, PLAN, num_jobs=2, chunk_size=3).run(
+            min_replications=5, max_replications=11, batch_size=6, relative_precision=0.0
+        )
+
+        assert serial.replications == parallel.replications == 11
+        np.testing.assert_array_equal(serial.mean, parallel.mean)
+        np.testing.assert_array_equal(serial.half_width, parallel.half_width)
+
+    def test_stops_when_precision_is_met(self, config):
+        manager = ReplicationManager(config, PLAN, num_jobs=1)
+
+        loose = manager.run(min_replications=10, relative_precision=0.2)
+        assert loose.converged and loose.replications == 10
+        low, high = loose.interval("mean_wait")
+        assert np.all(low < loose["mean_wait"]) and np.all(loose["mean_wait"] < high)
+
+        tight = manager.run(min_replications=10, max_replications=30, relative_precision=0.001)
+        assert not tight.converged and tight.replications == 30
+        assert np.all(tight.half_width[0] <= loose.half_width[0] * 1.5)
+
+        df = loose.to_dataframe()
+        assert list(df["Year"]) == [2030, 2031]
+        assert "Mean_Wait_Hours_CI" in df and (df["Replications"] == 10).all()
+
+    def test_invalid_arguments(self, config):
+        manager = ReplicationManager(config, PLAN, num_jobs=1)
+        with pytest.raises(ValueError):
+            manager.run(min_replications=1)
+        with pytest.raises(ValueError):
+            manager.run(target_kpis=["service_level"])
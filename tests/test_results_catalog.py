@@ -0,0 +1,77 @@
+"""
+Tests for the results catalog.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.results_catalog import ResultsCatalog
+
+
+@pytest.fixture
+def results(tmp_path):
+    files = [
+        "MILP_scenario_summary_case_1.csv",
+        "deterministic/scenarios_case_2.csv",
+        "stochastic_case2/deterministic_scenarios_case_2.csv",
+        "sensitivity/breakeven_distance_ulsan.csv",
+        "sensitivity/breakeven_distance_optimal_ulsan.csv",
+        "sensitivity/demand_scenarios_summary.csv",
+        "sensitivity/notes.txt",
+        ".pipeline/state_case_1.csv",
+    ]
+    for name in files:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"file,value\n{name},1\n")
+    return tmp_path
+
+
+class TestResultsCatalog:
+    """Test indexing, lookup priority and memoized loading."""
+
+    def test_index(self, results):
+        catalog = ResultsCatalog(str(results))
+
+        assert len(catalog) == 6
+        assert catalog.find("MILP_scenario_summary", "case_1") == "MILP_scenario_summary_case_1.csv"
+        assert catalog.find("sensitivity/breakeven_distance", "ulsan") == "sensitivity/breakeven_distance_ulsan.csv"
+        assert catalog.find("sensitivity/breakeven_distance_optimal", "ulsan") is not None
+        assert catalog.find("sensitivity/demand_scenarios_summary") is not None
+        assert catalog.find("sensitivity/notes") is None
+        assert not catalog.exists(".pipeline/state_case_1.csv")
+        assert catalog.match(["sensitivity/breakeven_distance_*.csv"]) == [
+            "sensitivity/breakeven_distance_optimal_ulsan.csv",
+            "sensitivity/breakeven_distance_ulsan.csv",
+        ]
+
+    def test_first_follows_priority(self, results):
+        catalog = ResultsCatalog(str(results))
+        analyses = ["MILP_scenario_summary", "deterministic/scenarios", "stochastic_case2/deterministic_scenarios"]
+
+        assert catalog.first(analyses, "case_2") == "deterministic/scenarios_case_2.csv"
+        assert catalog.first(analyses, "case_3") is None
+
+    def test_reads_are_memoized(self, results):
+        catalog = ResultsCatalog(str(results))
+        path = catalog.find("MILP_scenario_summary", "case_1")
+
+        assert catalog.read_csv(path) is catalog.read_csv(path)
+        calls = []
+        for _ in range(2):
+            catalog.dataset("summary", lambda: calls.append(1) or {"x": 1})
+        assert calls == [1] and catalog.is_loaded("summary")
+
+        catalog.refresh()
+        assert not catalog.is_loaded("summary")
+
+    def test_missing_directory(self, tmp_path):
+        catalog = ResultsCatalog(str(tmp_path / "missing"))
+        assert len(catalog) == 0
+        assert catalog.find("MILP_scenario_summary", "case_1") is None
@@ -0,0 +1,138 @@
+"""
+Tests for the local optimization service and its client.
+"""
+
+import io
+import contextlib
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.breakeven_analyzer import BreakevenAnalyzer
+from src.config_loader import load_config
+from src.service import OptimizationService, ServiceClient, create_server, solve_case
+
+
+@pytest.fixture(scope="module")
+def client():
+    service = OptimizationService(str(project_root / "config"))
+    server = create_server("127.0.0.1", 0, service)
+    server.RequestHandlerClass.log_message = lambda *args: None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield ServiceClient(f"http://127.0.0.1:{server.server_port}")
+    server.shutdown()
+    server.server_close()
+
+
+class TestOptimizationService:
+    """Test the HTTP endpoints through ServiceClient."""
+
+    def test_optimize_matches_local_and_is_cached(self, client):
+        overrides = {"economy.discount_rate": 0.05}
+        with contextlib.redirect_stdout(io.StringIO()):
+            remote = client.optimize("case_1", overrides=overrides, shuttle_sizes=[1000, 2500])
+            client.optimize("case_1", overrides=overrides, shuttle_sizes=[1000, 2500])
+            local_df, _ = solve_case("case_1", overrides)
+
+        npcs = {row["Shuttle_Size_cbm"]: row["NPC_Total_USDm"] for row in remote["scenarios"]}
+        for shuttle in (1000, 2500):
+            expected = local_df.loc[local_df["Shuttle_Size_cbm"] == shuttle, "NPC_Total_USDm"].iloc[0]
+            assert npcs[shuttle] == pytest.approx(expected)
+
+        assert client.status()["optimize_cache"] == 1
+
+    def test_sensitivity(self, client):
+        result = client.sensitivity(
+            "case_1", "economy.fuel_price_usd_per_ton", [-0.1, 0.0, 0.1],
+            shuttle_size=2500, pump_size=500, parametric=True
+        )
+
+        npcs = [row["NPC_USDm"] for row in result["records"]]
+        assert npcs == sorted(npcs)
+        assert npcs[1] == pytest.approx(result["base_npc"], abs=0.01)
+
+    def test_breakeven(self, client):
+        result = client.breakeven(
+            "case_1", "case_3", parameter="distance", value_range=[1, 300],
+            shuttle_size=10000, pump_size=500
+        )
+
+        assert result["breakeven_value"] == pytest.approx(110.7, abs=0.5)
+        assert len(result["records"]) == result["n_evaluations"]
+        # Configs come from the service's config directory (and its cache)
+        assert {"case_1", "case_3"} <= set(client.status()["configs"])
+
+    def test_tornado(self, client):
+        params = [
+            {"path": "economy.fuel_price_usd_per_ton", "name": "Fuel Price"},
+            {"path": "propulsion.sfoc_g_per_kwh", "name": "SFOC"},
+        ]
+        result = client.tornado("case_1", params, variation_pct=0.2, shuttle_size=2500, pump_size=500)
+
+        assert {row["Parameter"] for row in result["records"]} == {"Fuel Price", "SFOC"}
+        swings = [row["Swing_USDm"] for row in result["records"]]
+        assert swings == sorted(swings, reverse=True) and swings[0] > 0
+
+    def test_breakeven_with_per_case_shuttles(self, client):
+        result = client.breakeven(
+            "case_1", "case_3", parameter="distance", value_range=[10, 200], n_points=5,
+            shuttle_size=5000, pump_size=500, case1_shuttle_size=1000
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            local = BreakevenAnalyzer(pump_size=500).find_breakeven_distance_heterogeneous(
+                load_config("case_1"), load_config("case_3"), 1000, 5000,
+                distance_range=(10, 200), n_points=5, verbose=False
+            )
+
+        assert result["breakeven_value"] == pytest.approx(local.breakeven_value)
+        with pytest.raises(ValueError):
+            client.breakeven("case_1", "case_3", parameter="demand", shuttle_size=5000, case1_shuttle_size=1000)
+
+    def test_errors(self, client):
+        with pytest.raises(ValueError):
+            client.call("unknown")
+        with pytest.raises(ValueError):
+            client.optimize("case_1", not_a_parameter=1)
+
+    def test_unreachable(self):
+        client = ServiceClient("http://127.0.0.1:9", timeout=2)
+        assert not client.available()
+        with pytest.raises(ConnectionError):
+            client.status()
+
+
+class TestConfigReload:
+    """Test that cached results follow edits of the config files."""
+
+    def test_modified_config_drops_caches(self, tmp_path):
+        config_dir = tmp_path / "config"
+        shutil.copytree(project_root / "config", config_dir)
+        service = OptimizationService(str(config_dir))
+        params = {"case_id": "case_1", "shuttle_sizes": [2500], "pump_sizes": [500]}
+        with contextlib.redirect_stdout(io.StringIO()):
+            before = service.handle("optimize", params)["scenarios"][0]["NPC_Total_USDm"]
+            assert service.handle("optimize", params)["scenarios"][0]["NPC_Total_USDm"] == before
+            assert service.status()["reloads"] == 0
+
+            base = config_dir / "base.yaml"
+            base.write_text(
+                base.read_text(encoding="utf-8").replace(
+                    "fuel_price_usd_per_ton: 600.0", "fuel_price_usd_per_ton: 900.0"
+                ),
+                encoding="utf-8",
+            )
+            stat = base.stat()
+            os.utime(base, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            after = service.handle("optimize", params)["scenarios"][0]["NPC_Total_USDm"]
+
+        assert after > before
+        assert service.status()["reloads"] == 1
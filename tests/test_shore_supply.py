@@ -6,11 +6,13 @@ import pytest
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.shore_supply import ShoreSupply
+from src.shore_supply import ShoreSupply, erlang_c
 
 
 # Test configurations
@@ -297,5 +299,65 @@ class TestShoreSupplyStandardPump:
         assert ss.pump_rate_m3ph == ShoreSupply.STANDARD_PUMP_RATE_M3PH
 
 
+class TestShoreSupplyContention:
+    """Test the loading arm queueing model."""
+
+    def arms(self, n):
+        return ShoreSupply({"shore_supply": {"pump_rate_m3ph": 700.0,
+                                             "loading_time_fixed_hours": 4.0,
+                                             "loading_arms": n}})
+
+    def test_single_arm_matches_pollaczek_khinchine(self):
+        ss = self.arms(1)
+        load_time = ss.load_shuttle(1000.0)
+        rate = 0.7 / load_time
+
+        # M/D/1: Wq = rho * S / (2 * (1 - rho))
+        assert ss.queue_wait(rate, 1000.0) == pytest.approx(0.7 * load_time / (2 * 0.3))
+        assert ss.queue_wait(1.0 / load_time, 1000.0) == np.inf
+        assert erlang_c(2, 1.0) == pytest.approx(1.0 / 3.0)
+
+    def test_fleet_wait_grows_with_fleet_size(self):
+        fleet = np.arange(1, 41)
+        one_arm = self.arms(1).fleet_loading_wait(fleet, 1000.0, 13.43, busy_fraction=8000 / 8760)
+        three_arms = self.arms(3).fleet_loading_wait(fleet, 1000.0, 13.43, busy_fraction=8000 / 8760)
+
+        assert one_arm[0] == three_arms[0] == 0.0
+        assert np.all(np.diff(one_arm) > 0) and np.all(three_arms[1:] < one_arm[1:])
+        assert np.isfinite(one_arm).all()
+
+        # The wait is a fixed point of the queue at the fleet's own arrival rate
+        rate = (fleet - 1) * (8000 / 8760) / (13.43 + one_arm)
+        np.testing.assert_allclose(self.arms(1).queue_wait(rate, 1000.0), one_arm, rtol=1e-6)
+
+    def test_no_arms_means_no_contention(self):
+        ss = ShoreSupply(SHORE_SUPPLY_ENABLED)
+        assert ss.loading_arms is None
+        assert ss.queue_wait(10.0, 1000.0) == 0.0
+        assert np.all(ss.fleet_loading_wait([1, 10, 100], 1000.0, 10.0) == 0.0)
+
+    def test_capacity_and_validation(self):
+        assert self.arms(3).get_annual_loading_capacity() == 3 * 8000.0 * 700.0
+        with pytest.raises(ValueError):
+            self.arms(0).validate_configuration()
+
+    def test_simulated_wait_matches_approximation(self):
+        from src.config_loader import load_config
+        from src.operations_simulation import OperationsSimulator
+
+        config = load_config("case_1")
+        config["shore_supply"]["loading_arms"] = 2
+        ss = ShoreSupply(config)
+        rate = 2 * 0.75 / ss.load_shuttle(1000.0)
+
+        # One full shuttle per call, so shuttles reach the terminal as a Poisson stream
+        rng = np.random.default_rng(5)
+        horizon = 8760.0 * 10
+        arrivals = np.sort(rng.uniform(0.0, horizon, int(rate * horizon)))
+        stats, _ = OperationsSimulator(config, 1000, 500).run_year(60, arrivals, np.full(len(arrivals), 1000.0))
+
+        assert stats["mean_shore_wait"] == pytest.approx(ss.queue_wait(rate, 1000.0), rel=0.15)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
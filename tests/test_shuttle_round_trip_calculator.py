@@ -247,5 +247,30 @@ class TestEdgeCases:
         assert pytest.approx(result['pumping_per_vessel_h']) == 1.0
 
 
+class TestCalculateBatch:
+    """Test the vectorized calculate_batch() against calculate()."""
+
+    @pytest.mark.parametrize("has_storage", [True, False])
+    @pytest.mark.parametrize("is_round_trip", [True, False])
+    def test_matches_scalar(self, has_storage, is_round_trip):
+        calc = ShuttleRoundTripCalculator(travel_time_hours=1.67, setup_time_hours=2.0)
+        shuttles = [[500.0], [3000.0], [7500.0], [25000.0]]
+        pumps = [400.0, 1000.0, 1117.3]
+        batch = calc.calculate_batch(
+            shuttles, pumps, num_vessels=2,
+            is_round_trip=is_round_trip, has_storage_at_busan=has_storage
+        )
+
+        for i, (shuttle,) in enumerate(shuttles):
+            for j, pump in enumerate(pumps):
+                scalar = calc.calculate(
+                    shuttle, pump, num_vessels=2,
+                    is_round_trip=is_round_trip, has_storage_at_busan=has_storage
+                )
+                for key, value in scalar.items():
+                    if key != 'has_storage_at_busan':
+                        assert batch[key][i, j] == value, key
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
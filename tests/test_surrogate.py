@@ -0,0 +1,111 @@
+"""
+Tests for the Gaussian-process NPC surrogate.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.batch_evaluator import BatchEvaluator
+from src.config_loader import load_config
+from src.surrogate import GaussianProcess, NPCSurrogate
+
+
+FUEL = "economy.fuel_price_usd_per_ton"
+DISCOUNT = "economy.discount_rate"
+
+
+@pytest.fixture(scope="module")
+def config():
+    return load_config("case_1")
+
+
+class TestGaussianProcess:
+    """Test the GP regressor on a smooth function."""
+
+    def test_smooth_function(self):
+        X = np.linspace(0, 1, 15)[:, np.newaxis]
+        y = np.sin(3 * X[:, 0])
+        gp = GaussianProcess().fit(X, y)
+
+        mean, std = gp.predict(np.array([[0.33], [0.71]]))
+
+        assert mean == pytest.approx(np.sin(3 * np.array([0.33, 0.71])), abs=1e-3)
+        assert np.all(std < 0.01)
+
+    def test_std_grows_away_from_data(self):
+        X = np.linspace(0, 0.5, 10)[:, np.newaxis]
+        gp = GaussianProcess().fit(X, X[:, 0] ** 2)
+
+        _, std = gp.predict(np.array([[0.25], [1.0]]))
+
+        assert std[1] > std[0]
+
+
+class TestNPCSurrogate:
+    """Test training, queries and adaptive refinement."""
+
+    def _exact(self, config, values):
+        evaluator = BatchEvaluator(config, num_jobs=1)
+        return evaluator.evaluate(values, 2500, 500)[0]
+
+    def test_predicts_optimizer_npc(self, config):
+        surrogate = NPCSurrogate(config, {FUEL: (400, 800), DISCOUNT: (0.0, 0.08)}, 2500, 500)
+        surrogate.fit()
+
+        query = {FUEL: 750, DISCOUNT: 0.05}
+        value, std = surrogate.predict(query)
+        exact = self._exact(config, query)
+
+        assert value == pytest.approx(exact, abs=max(3 * std, 0.5))
+
+    def test_validate_reports_errors(self, config):
+        surrogate = NPCSurrogate(config, {FUEL: (400, 800)}, 2500, 500).fit()
+        stats = surrogate.validate(n_points=20)
+
+        assert stats["rmse"] < 0.05
+        assert 0.0 <= stats["coverage"] <= 1.0
+
+    def test_refine_adds_points(self, config):
+        surrogate = NPCSurrogate(config, {FUEL: (400, 800), DISCOUNT: (0.0, 0.08)}, 2500, 500)
+        surrogate.fit(n_initial=6)
+        n_before = surrogate.n_training
+
+        result = surrogate.refine(max_points=10, batch_size=5)
+
+        assert result["points_added"] > 0
+        assert surrogate.n_training == n_before + result["points_added"]
+
+    def test_refine_stops_with_infeasible_region(self, config):
+        # Travel times above ~12 h are infeasible for this combination
+        surrogate = NPCSurrogate(config, {"operations.travel_time_hours": (1.0, 40.0)}, 2500, 500)
+        surrogate.fit(n_initial=8)
+        n_before = surrogate.n_training
+
+        result = surrogate.refine(target_std=0.0, max_points=10, batch_size=5)
+
+        assert result["evaluations"] == 10
+        assert result["points_added"] < 10
+        assert surrogate.n_training == n_before + result["points_added"]
+
+    def test_query_falls_back_to_optimizer(self, config):
+        surrogate = NPCSurrogate(config, {FUEL: (400, 800)}, 2500, 500).fit()
+
+        inside = surrogate.query({FUEL: 600}, tolerance=1e3)
+        assert inside["source"] == "surrogate"
+
+        outside = surrogate.query({FUEL: 1200}, tolerance=1e3)
+        assert outside["source"] == "optimizer"
+        assert not outside["in_range"]
+        assert outside["value"] == pytest.approx(self._exact(config, {FUEL: 1200}))
+
+    def test_unknown_input_rejected(self, config):
+        surrogate = NPCSurrogate(config, {FUEL: (400, 800)}, 2500, 500).fit()
+        with pytest.raises(ValueError):
+            surrogate.predict({"operations.travel_time_hours": 2.0})
@@ -0,0 +1,99 @@
+"""
+Tests for the vectorized yearly simulation engine.
+"""
+
+import contextlib
+import io
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config_loader import load_config
+from src.config_overlay import ConfigOverlay
+from src.runner import run_yearly_simulation
+from src.verification import CalculationVerifier
+from src.yearly_simulation import simulate_yearly
+
+
+class TestSimulateYearly:
+    """Test the (pair, year) grid against the per-pair yearly simulation."""
+
+    @pytest.mark.parametrize("case_id", ["case_1", "case_2"])
+    def test_grid_rows_match_single_pair_runs(self, case_id, tmp_path):
+        config = load_config(case_id)
+        shuttles = config["shuttle"]["available_sizes_cbm"][::3]
+        pumps = config["pumps"]["available_flow_rates"][:2]
+        result = simulate_yearly(config, shuttles, pumps)
+
+        n_years = config["time_period"]["end_year"] - config["time_period"]["start_year"] + 1
+        assert result["lco_ammonia"].shape == (len(shuttles) * len(pumps), n_years)
+
+        grid_df = result.to_dataframe()
+        for shuttle in shuttles:
+            for pump in pumps:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    expected = run_yearly_simulation(config, shuttle, pump, tmp_path)
+                actual = grid_df[
+                    (grid_df["Shuttle_Size_cbm"] == int(shuttle)) & (grid_df["Pump_Size_m3ph"] == int(pump))
+                ].reset_index(drop=True)
+                pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+    def test_fleet_never_shrinks_and_tank_bought_once(self):
+        config = load_config("case_1")
+        result = simulate_yearly(config)
+
+        assert (result["new_shuttles"] >= 0).all()
+        assert (result["new_shuttles"].sum(axis=1) == result["total_shuttles"][:, -1]).all()
+        assert (result["new_tank"].sum(axis=1) <= 1).all()
+
+    def test_saturated_loading_arms_are_infeasible(self):
+        # Eight shared arms saturate for most, but not all, pairs
+        config = ConfigOverlay(load_config("case_1"), {"shore_supply.loading_arms": 8})
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            result = simulate_yearly(config)
+
+        infeasible = np.isinf(result["cycle_duration"][:, 0])
+        assert 0 < infeasible.sum() < len(infeasible)
+        assert not any(np.isnan(values).any() for values in result.fields.values())
+        assert np.isinf(result["total_shuttles"][infeasible]).all()
+        assert np.isinf(result.final_lco()[infeasible]).all()
+        assert np.isfinite(result.final_lco()[~infeasible]).all()
+
+    def test_pair_lookup(self):
+        config = load_config("case_1")
+        result = simulate_yearly(config, pairs=[(2500, 500), (5000, 1000)])
+
+        assert result.pair_index(5000, 1000) == 1
+        assert len(result.pair_dataframe(2500, 500)) == len(result.years)
+        with pytest.raises(ValueError):
+            result.pair_index(1234, 500)
+        with pytest.raises(ValueError):
+            simulate_yearly(config, pairs=[])
+
+
+class TestSimulationConsistency:
+    """Test the grid-wide MILP vs simulation LCO check."""
+
+    def test_one_result_per_scenario(self):
+        config = load_config("case_1")
+        scenario_df = pd.DataFrame({
+            "Shuttle_Size_cbm": [2500, 5000],
+            "Pump_Size_m3ph": [500, 1000],
+        })
+        lco = simulate_yearly(config, pairs=[(2500, 500), (5000, 1000)]).final_lco()
+        scenario_df["LCOAmmonia_USD_per_ton"] = [lco[0], lco[1] * 1.5]
+
+        results = CalculationVerifier(config).verify_simulation_consistency(scenario_df)
+
+        assert [r.passed for r in results] == [True, False]
+        assert "2500" in results[0].name
+        assert CalculationVerifier(config).verify_simulation_consistency(scenario_df.iloc[:0]) == []